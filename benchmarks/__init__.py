@@ -0,0 +1,7 @@
+"""
+Paquete de benchmarks.
+
+Este paquete contiene scripts para medir el rendimiento de distintas partes
+de la aplicación. Se ejecutan como módulos desde la raíz del proyecto, por ejemplo:
+`python -m benchmarks.translation_reload`.
+"""
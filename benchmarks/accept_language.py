@@ -0,0 +1,96 @@
+"""
+Benchmark de la negociación de idioma.
+
+Simula una mezcla realista de headers Accept-Language y compara el parseo
+anterior (repetido tres veces por petición) con la negociación cacheada
+por header y guardada en el estado de la petición.
+"""
+
+import random
+import time
+from typing import Callable, List
+
+from starlette.requests import Request
+
+from src.infrastructure.i18n import I18nConfig
+from src.infrastructure.translation_service import translation_service
+
+HEADER_MIX = [
+    ("es-ES,es;q=0.9", 30),
+    ("es-ES,es;q=0.9,en;q=0.8", 20),
+    ("en-US,en;q=0.9", 20),
+    ("en-GB,en-US;q=0.9,en;q=0.8", 8),
+    ("es-419,es;q=0.9,en;q=0.8", 6),
+    ("fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7", 5),
+    ("de-DE,de;q=0.9,en;q=0.8,es;q=0.7", 4),
+    ("pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7", 4),
+    ("*", 2),
+    ("", 1),
+]
+REQUESTS = 50_000
+CALLS_PER_REQUEST = 3
+
+
+def legacy_language(request: Request) -> str:
+    """Negociación anterior: parseo sin pesos q en cada llamada."""
+    lang = request.query_params.get("lang")
+    if lang and lang in I18nConfig.SUPPORTED_LANGUAGES:
+        return lang
+    cookie_lang = request.cookies.get(I18nConfig.LANGUAGE_COOKIE_NAME)
+    if cookie_lang and cookie_lang in I18nConfig.SUPPORTED_LANGUAGES:
+        return cookie_lang
+    accept_language = request.headers.get("accept-language")
+    if accept_language:
+        languages = [
+            lang.split(";")[0].strip()[:2] for lang in accept_language.split(",")
+        ]
+        for lang in languages:
+            if lang in I18nConfig.SUPPORTED_LANGUAGES:
+                return lang
+    return I18nConfig.DEFAULT_LANGUAGE
+
+
+def build_requests() -> List[Request]:
+    """Genera peticiones con headers distribuidos según la mezcla."""
+    headers, weights = zip(*HEADER_MIX)
+    random.seed(7)
+    return [
+        Request(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/",
+                "query_string": b"",
+                "headers": [(b"accept-language", header.encode())] if header else [],
+            }
+        )
+        for header in random.choices(headers, weights=weights, k=REQUESTS)
+    ]
+
+
+def measure(negotiate: Callable[[Request], str]) -> float:
+    """
+    Mide los microsegundos por petición con varias llamadas por petición.
+
+    Args:
+        negotiate: Función de negociación a medir
+
+    Returns:
+        float: Microsegundos por petición
+    """
+    requests = build_requests()
+    start = time.perf_counter()
+    for request in requests:
+        for _ in range(CALLS_PER_REQUEST):
+            negotiate(request)
+    return (time.perf_counter() - start) / REQUESTS * 1e6
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    print(f"anterior:  {measure(legacy_language):.2f} µs/petición")
+    print(f"cacheada:  {measure(translation_service.get_language_from_request):.2f} µs/petición")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark de la carga de datos del creador de personajes.
+
+Compara las nueve peticiones que hacía `data-manager.js` en cada visita a
+`/create-character` con la petición única a `/api/catalog`.
+"""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from src.index import app
+from src.infrastructure.web.character_controller import CATALOG_COLLECTIONS
+
+VISITS = 300
+
+
+def measure_separate(client: TestClient) -> float:
+    """Mide las visitas por segundo pidiendo cada colección por separado."""
+    start = time.perf_counter()
+    for _ in range(VISITS):
+        for name in CATALOG_COLLECTIONS:
+            client.get(f"/api/{name}")
+    return VISITS / (time.perf_counter() - start)
+
+
+def measure_catalog(client: TestClient) -> float:
+    """Mide las visitas por segundo pidiendo el catálogo agregado."""
+    client.get("/api/catalog?game_type=custom")
+    start = time.perf_counter()
+    for _ in range(VISITS):
+        client.get("/api/catalog?game_type=custom")
+    return VISITS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    client = TestClient(app)
+    separate = measure_separate(client)
+    catalog = measure_catalog(client)
+    print(f"9 endpoints:   {separate:7.1f} visitas/s ({len(CATALOG_COLLECTIONS)} peticiones)")
+    print(f"/api/catalog:  {catalog:7.1f} visitas/s (1 petición)")
+
+
+if __name__ == "__main__":
+    main()
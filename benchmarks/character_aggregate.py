@@ -0,0 +1,158 @@
+"""
+Benchmark de la lectura de fichas completas de personajes.
+
+Crea 500 personajes con sus datos asociados en una base de datos SQLite en
+disco y compara, para 1, 50 y 500 personajes, la carga perezosa relación a
+relación (N+1) con CharacterAggregateRepository, contando consultas y
+tiempo.
+"""
+
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.infrastructure.db.character_aggregate import CharacterAggregateRepository
+from src.infrastructure.db.engine import LONG_RUNNING, create_engine_for
+from src.infrastructure.db.models import (
+    AttributeModel,
+    CharacterItemModel,
+    CharacterLanguageModel,
+    CharacterModel,
+    CharacterProficiencyModel,
+    CharacterSkillModel,
+    CharacterSpellModel,
+    ItemModel,
+    LanguageModel,
+    ProficiencyModel,
+    RaceModel,
+    SkillModel,
+    SpellModel,
+    UserModel,
+)
+from src.infrastructure.db.models.base import Base
+
+CHARACTERS = 500
+SIZES = (1, 50, 500)
+RUNS = 5
+# Filas asociadas por personaje: (tabla de relación, tabla de referencia, filas)
+CHILDREN = [
+    (CharacterSkillModel, SkillModel, "skill_id", 6, {"proficiency_bonus": 2}),
+    (CharacterLanguageModel, LanguageModel, "language_id", 3, {}),
+    (CharacterProficiencyModel, ProficiencyModel, "proficiency_id", 4, {}),
+    (CharacterSpellModel, SpellModel, "spell_id", 6, {"level_slot": 1}),
+    (CharacterItemModel, ItemModel, "item_id", 8, {"quantity": 1}),
+]
+
+
+async def seed(engine: AsyncEngine) -> List[uuid.UUID]:
+    """Crea el esquema, los datos de referencia y los personajes."""
+    random.seed(21)
+    user_id = uuid.uuid4()
+    races = [{"id": uuid.uuid4(), "name": f"race-{index}"} for index in range(9)]
+    ids = [uuid.uuid4() for _ in range(CHARACTERS)]
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(insert(UserModel), [{
+            "id": user_id, "username": "bench", "email": "bench@localhost", "password_hash": "",
+        }])
+        await connection.execute(insert(RaceModel), races)
+        await connection.execute(insert(CharacterModel), [
+            {"id": character_id, "user_id": user_id, "name": f"pj-{index}", "level": 1,
+             "race_id": random.choice(races)["id"]}
+            for index, character_id in enumerate(ids)
+        ])
+        await connection.execute(insert(AttributeModel), [
+            {"character_id": character_id, "strength": 10, "dexterity": 10, "constitution": 10,
+             "intelligence": 10, "wisdom": 10, "charisma": 10}
+            for character_id in ids
+        ])
+        for join_model, reference_model, column, rows, extra in CHILDREN:
+            references = [{"id": uuid.uuid4(), "name": f"{reference_model.__tablename__}-{index}"}
+                          for index in range(60)]
+            await connection.execute(insert(reference_model), references)
+            await connection.execute(insert(join_model), [
+                {"character_id": character_id, column: reference["id"], **extra}
+                for character_id in ids
+                for reference in random.sample(references, rows)
+            ])
+    return ids
+
+
+def load_lazily(session: Any, ids: List[uuid.UUID]) -> List[Dict[str, Any]]:
+    """Carga con el ORM sin opciones: cada relación se consulta al acceder a ella."""
+    characters = session.scalars(select(CharacterModel).where(CharacterModel.id.in_(ids))).all()
+    return [
+        {
+            "race": character.race and character.race.name,
+            "attributes": character.attributes and character.attributes.strength,
+            "skills": [(entry.skill.name, entry.proficiency_bonus) for entry in character.skills],
+            "languages": [entry.language.name for entry in character.languages],
+            "proficiencies": [entry.proficiency.name for entry in character.proficiencies],
+            "spells": [(entry.spell.name, entry.level_slot) for entry in character.spells],
+            "items": [(entry.item.name, entry.quantity) for entry in character.items],
+        }
+        for character in characters
+    ]
+
+
+async def measure(
+    engine: AsyncEngine, load: Callable[[AsyncSession], Any]
+) -> Tuple[float, int]:
+    """Mide la mediana en milisegundos y las consultas de una carga con sesión nueva."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    timings = []
+    for _ in range(RUNS):
+        statements.clear()
+        async with AsyncSession(engine) as session:
+            start = time.perf_counter()
+            await load(session)
+            timings.append((time.perf_counter() - start) * 1000)
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+    return statistics.median(timings), len(statements)
+
+
+async def run() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine_for(
+            f"sqlite+aiosqlite:///{Path(directory) / 'aggregate.db'}", LONG_RUNNING
+        )
+        ids = await seed(engine)
+        rows: Dict[str, int] = {model.__tablename__: count for model, _, _, count, _ in CHILDREN}
+        print(f"{CHARACTERS} personajes; filas asociadas por personaje: {rows}")
+
+        for size in SIZES:
+            subset = ids[:size]
+            lazy_ms, lazy_queries = await measure(
+                engine, lambda session: session.run_sync(load_lazily, subset)
+            )
+            eager_ms, eager_queries = await measure(
+                engine, lambda session: CharacterAggregateRepository(session).get_many(subset)
+            )
+            print(
+                f"{size:>4} personajes  perezosa {lazy_ms:8.2f} ms ({lazy_queries:>5} consultas)  "
+                f"agregado {eager_ms:7.2f} ms ({eager_queries} consultas)"
+            )
+        await engine.dispose()
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
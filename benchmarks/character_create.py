@@ -0,0 +1,124 @@
+"""
+Benchmark de la creación de personajes.
+
+Crea personajes con 40 filas asociadas (habilidades, idiomas, competencias,
+conjuros y objetos, además de la fila de atributos) en una base de datos
+SQLite en disco y compara tres estrategias: una inserción y un commit por
+fila (comportamiento anterior de repositorios en autocommit), una inserción
+por fila en una sola transacción y `create_many` en una sola transacción.
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.application.character_use_cases import (
+    CreateCharacterRequest,
+    CreateCharacterUseCase,
+)
+from src.infrastructure.db.models.base import Base
+from src.infrastructure.db.repositories import build_character_repositories
+
+CHARACTERS = 10
+CHILD_ROWS = {"skills": 10, "languages": 8, "proficiencies": 8, "spells": 8, "items": 6}
+
+
+def build_request() -> CreateCharacterRequest:
+    """Petición de un personaje con 40 filas asociadas y sus seis atributos."""
+    return CreateCharacterRequest(
+        name="Benchmark",
+        race_id=uuid.uuid4(),
+        background_id=uuid.uuid4(),
+        alignment_id=uuid.uuid4(),
+        level=5,
+        attributes={"strength": 12, "dexterity": 14, "constitution": 13,
+                    "intelligence": 10, "wisdom": 15, "charisma": 8},
+        **{field: [uuid.uuid4() for _ in range(rows)] for field, rows in CHILD_ROWS.items()},
+    )
+
+
+class RowByRow:
+    """Repositorio que inserta fila a fila, con commit opcional tras cada una."""
+
+    def __init__(self, repository, session: AsyncSession, commit: bool):
+        self._repository = repository
+        self._session = session
+        self._commit = commit
+
+    async def create(self, entity):
+        created = await self._repository.create(entity)
+        if self._commit:
+            await self._session.commit()
+        return created
+
+    async def create_many(self, entities):
+        return [await self.create(entity) for entity in entities]
+
+
+async def create_row_by_row(session: AsyncSession, commit: bool) -> None:
+    """Crea un personaje insertando cada fila por separado."""
+    repositories = build_character_repositories(session, uuid.uuid4())
+    unit_of_work = repositories.pop("unit_of_work")
+    # Los atributos son una sola fila por personaje en cualquier estrategia
+    wrapped = {
+        name: repo if name == "attribute_repository" else RowByRow(repo, session, commit)
+        for name, repo in repositories.items()
+    }
+    if commit:
+        await CreateCharacterUseCase(**wrapped).execute(build_request())
+    else:
+        await CreateCharacterUseCase(**wrapped, unit_of_work=unit_of_work).execute(build_request())
+
+
+async def create_batched(session: AsyncSession) -> None:
+    """Crea un personaje con una inserción por tabla y un solo commit."""
+    repositories = build_character_repositories(session, uuid.uuid4())
+    await CreateCharacterUseCase(**repositories).execute(build_request())
+
+
+async def measure(database: Path, create: Callable[[AsyncSession], Awaitable[None]]) -> List[float]:
+    """Mide la latencia en milisegundos de cada creación sobre una base de datos nueva."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    timings = []
+    async with AsyncSession(engine) as session:
+        for _ in range(CHARACTERS):
+            start = time.perf_counter()
+            await create(session)
+            timings.append((time.perf_counter() - start) * 1000)
+    await engine.dispose()
+    return timings
+
+
+async def run() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    strategies = [
+        ("fila + commit", lambda session: create_row_by_row(session, commit=True)),
+        ("fila, 1 tx", lambda session: create_row_by_row(session, commit=False)),
+        ("create_many", create_batched),
+    ]
+    print(f"{CHARACTERS} personajes con {sum(CHILD_ROWS.values())} filas asociadas")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, create in strategies:
+            timings = await measure(Path(directory) / f"{len(name)}.db", create)
+            print(
+                f"{name:<14} p50 {statistics.median(timings):7.2f} ms  "
+                f"p95 {statistics.quantiles(timings, n=20)[-1]:7.2f} ms"
+            )
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
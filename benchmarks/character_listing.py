@@ -0,0 +1,148 @@
+"""
+Benchmark de la paginación de los listados de personajes.
+
+Genera una tabla sintética de un millón de personajes en una base de datos
+SQLite en disco, construye su proyección `character_summaries` (la tabla que
+leen los listados) y compara la latencia de la página 1 y la página 10 000
+con paginación por cursor (keyset) y con OFFSET.
+"""
+
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.db.character_listing import (
+    LIST_COLUMNS,
+    CharacterListRepository,
+    encode_cursor,
+)
+from src.infrastructure.db.character_summaries import CharacterSummaryRepository
+from src.infrastructure.db.engine import LONG_RUNNING, create_engine_for
+from src.infrastructure.db.models import CharacterModel, CharacterSummaryModel
+from src.infrastructure.db.models.base import Base
+
+ROWS = 1_000_000
+PAGE_SIZE = 20
+PAGES = (1, 10_000)
+RUNS = 20
+BATCH = 50_000
+
+
+def seed(database: Path) -> None:
+    """
+    Crea ROWS personajes y sus resúmenes, con los índices creados al final.
+
+    Los resúmenes se generan con `CharacterSummaryRepository.rebuild`, igual
+    que en un backfill tras las migraciones.
+    """
+    engine = create_engine(f"sqlite:///{database}")
+    tables = [CharacterModel.__table__, CharacterSummaryModel.__table__]
+    indexes = {table: list(table.indexes) for table in tables}
+    for table in tables:
+        table.indexes.clear()
+    try:
+        Base.metadata.create_all(engine)
+    finally:
+        for table in tables:
+            table.indexes.update(indexes[table])
+
+    random.seed(22)
+    users = [uuid.uuid4() for _ in range(1000)]
+    start = datetime(2024, 1, 1)
+    characters = CharacterModel.__table__
+    with engine.begin() as connection:
+        for offset in range(0, ROWS, BATCH):
+            connection.execute(insert(characters), [
+                {"id": uuid.uuid4(), "user_id": random.choice(users), "name": f"pj-{index}",
+                 "level": 1 + index % 20, "experience": 0,
+                 "created_at": start + timedelta(seconds=index // 3),
+                 "updated_at": start}
+                for index in range(offset, min(offset + BATCH, ROWS))
+            ])
+
+    asyncio.run(rebuild_summaries(database))
+
+    with engine.begin() as connection:
+        for table in tables:
+            for index in indexes[table]:
+                index.create(connection)
+    engine.dispose()
+
+
+async def rebuild_summaries(database: Path) -> int:
+    """Genera la proyección de los listados a partir de los personajes."""
+    engine = create_engine_for(f"sqlite+aiosqlite:///{database}", LONG_RUNNING)
+    async with AsyncSession(engine) as session:
+        written = await CharacterSummaryRepository(session).rebuild()
+    await engine.dispose()
+    return written
+
+
+async def offset_page(session: AsyncSession, page: int) -> List[Any]:
+    """Paginación anterior con OFFSET."""
+    result = await session.execute(
+        select(*LIST_COLUMNS)
+        .order_by(
+            CharacterSummaryModel.created_at.desc(), CharacterSummaryModel.character_id.desc()
+        )
+        .offset((page - 1) * PAGE_SIZE)
+        .limit(PAGE_SIZE)
+    )
+    return result.all()
+
+
+async def cursor_for_page(session: AsyncSession, page: int) -> Optional[str]:
+    """Cursor que apunta al inicio de una página (se calcula fuera de la medición)."""
+    if page == 1:
+        return None
+    rows = await offset_page(session, page - 1)
+    return encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+async def measure(run: Callable[[], Awaitable[Any]]) -> List[float]:
+    """Mide la latencia en milisegundos de cada ejecución."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def run(database: Path) -> None:
+    """Mide las páginas con cada estrategia e imprime los resultados."""
+    engine = create_engine_for(f"sqlite+aiosqlite:///{database}", LONG_RUNNING)
+    async with AsyncSession(engine) as session:
+        repository = CharacterListRepository(session)
+        for page in PAGES:
+            cursor = await cursor_for_page(session, page)
+            keyset = await measure(lambda: repository.list_page(cursor=cursor, limit=PAGE_SIZE))
+            offset = await measure(lambda: offset_page(session, page))
+            print(
+                f"página {page:>6}  keyset p50 {statistics.median(keyset):8.2f} ms  "
+                f"OFFSET p50 {statistics.median(offset):8.2f} ms"
+            )
+    await engine.dispose()
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "listing.db"
+        start = time.perf_counter()
+        seed(database)
+        print(f"{ROWS} personajes generados en {time.perf_counter() - start:.1f} s")
+        asyncio.run(run(database))
+
+
+if __name__ == "__main__":
+    main()
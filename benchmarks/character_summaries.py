@@ -0,0 +1,157 @@
+"""
+Benchmark de la proyección de resúmenes de personajes.
+
+Genera 200 000 personajes con raza, clase, trasfondo y alineamiento en una
+base de datos SQLite en disco y compara la primera página del listado de un
+usuario y una búsqueda por prefijo del nombre leyendo las tablas de origen
+con JOIN frente a leer solo `character_summaries`. Mide también la
+regeneración completa, la comprobación de consistencia y el coste que
+añade mantener la proyección al crear un personaje.
+"""
+
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List
+
+from sqlalchemy import create_engine, func, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.character_use_cases import CreateCharacterRequest, CreateCharacterUseCase
+from src.infrastructure.db.character_listing import CharacterListRepository
+from src.infrastructure.db.character_summaries import SUMMARY_SOURCE, CharacterSummaryRepository
+from src.infrastructure.db.engine import LONG_RUNNING, create_engine_for
+from src.infrastructure.db.models import (
+    AlignmentModel,
+    BackgroundModel,
+    CharacterModel,
+    ClassModel,
+    RaceModel,
+    UserModel,
+)
+from src.infrastructure.db.models.base import Base
+from src.infrastructure.db.repositories import build_character_repositories
+
+ROWS = 200_000
+USERS = 200
+PAGE_SIZE = 20
+RUNS = 20
+CREATES = 20
+BATCH = 50_000
+SEARCH = "pj-1234"
+
+
+def seed(database: Path) -> List[uuid.UUID]:
+    """Crea el esquema, los datos de referencia y los personajes; devuelve los usuarios."""
+    engine = create_engine(f"sqlite:///{database}")
+    Base.metadata.create_all(engine)
+    random.seed(23)
+    users = [uuid.uuid4() for _ in range(USERS)]
+    references = {
+        model: [{"id": uuid.uuid4(), "name": f"{model.__tablename__}-{index}"} for index in range(12)]
+        for model in (RaceModel, ClassModel, BackgroundModel, AlignmentModel)
+    }
+    start = datetime(2024, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(insert(UserModel), [
+            {"id": user, "username": f"u{index}", "email": f"u{index}@localhost", "password_hash": ""}
+            for index, user in enumerate(users)
+        ])
+        for model, rows in references.items():
+            connection.execute(insert(model), rows)
+        for offset in range(0, ROWS, BATCH):
+            connection.execute(insert(CharacterModel), [
+                {"id": uuid.uuid4(), "user_id": random.choice(users), "name": f"pj-{index}",
+                 "level": 1 + index % 20, "experience": 0,
+                 "race_id": random.choice(references[RaceModel])["id"],
+                 "class_id": random.choice(references[ClassModel])["id"],
+                 "background_id": random.choice(references[BackgroundModel])["id"],
+                 "alignment_id": random.choice(references[AlignmentModel])["id"],
+                 "created_at": start + timedelta(seconds=index), "updated_at": start}
+                for index in range(offset, min(offset + BATCH, ROWS))
+            ])
+    engine.dispose()
+    return users
+
+
+async def measure(run: Callable[[], Awaitable[Any]], runs: int = RUNS) -> float:
+    """Mediana de la latencia en milisegundos."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+async def run(database: Path, users: List[uuid.UUID]) -> None:
+    """Mide cada operación e imprime los resultados."""
+    engine = create_engine_for(f"sqlite+aiosqlite:///{database}", LONG_RUNNING)
+    async with AsyncSession(engine) as session:
+        projection = CharacterSummaryRepository(session)
+        start = time.perf_counter()
+        written = await projection.rebuild()
+        print(f"rebuild: {written} resúmenes en {time.perf_counter() - start:.1f} s")
+        start = time.perf_counter()
+        report = await projection.check()
+        print(f"check:   {report.summary()} en {time.perf_counter() - start:.1f} s")
+        await session.commit()
+
+        listing = CharacterListRepository(session)
+        user = users[0]
+        ordered = SUMMARY_SOURCE.order_by(
+            CharacterModel.created_at.desc(), CharacterModel.id.desc()
+        ).limit(PAGE_SIZE + 1)
+
+        async def joined_page():
+            return (await session.execute(ordered.where(CharacterModel.user_id == user))).all()
+
+        async def joined_search():
+            return (await session.execute(
+                ordered.where(func.lower(CharacterModel.name).startswith(SEARCH))
+            )).all()
+
+        results = {
+            "listado de un usuario": (
+                await measure(joined_page),
+                await measure(lambda: listing.list_page(user_id=user, limit=PAGE_SIZE)),
+            ),
+            f"búsqueda '{SEARCH}'": (
+                await measure(joined_search, runs=5),
+                await measure(lambda: listing.list_page(search=SEARCH, limit=PAGE_SIZE), runs=5),
+            ),
+        }
+        for label, (joined, summary) in results.items():
+            print(f"{label:<24} JOIN p50 {joined:8.2f} ms  proyección p50 {summary:8.2f} ms")
+
+        for label, with_projection in (("sin proyección", False), ("con proyección", True)):
+            async def create():
+                options = {"summary_projection": projection} if with_projection else {}
+                use_case = CreateCharacterUseCase(
+                    **build_character_repositories(session, user), **options
+                )
+                await use_case.execute(CreateCharacterRequest(
+                    name="nuevo", race_id=None, background_id=None, alignment_id=None, level=1,
+                    skills=[uuid.uuid4() for _ in range(4)],
+                ))
+            print(f"crear personaje {label}: p50 {await measure(create, CREATES):.2f} ms")
+    await engine.dispose()
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "summaries.db"
+        start = time.perf_counter()
+        users = seed(database)
+        print(f"{ROWS} personajes generados en {time.perf_counter() - start:.1f} s")
+        asyncio.run(run(database, users))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark de la exportación e importación de personajes en NDJSON.
+
+Genera un fichero NDJSON con 100 000 fichas (raza, atributos, habilidades y
+objetos) y mide, cada fase en un proceso nuevo para que el pico de memoria
+(ru_maxrss) sea solo suyo:
+
+- la importación personaje a personaje (una transacción por línea, como
+  hacer un POST por personaje) sobre una muestra;
+- la importación por lotes de `import_ndjson` de todo el fichero;
+- la exportación de `export_ndjson` con cursor del servidor frente a cargar
+  todas las fichas en memoria antes de escribirlas.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import random
+import resource
+import tempfile
+import time
+import uuid
+from dataclasses import asdict
+from pathlib import Path
+from typing import AsyncIterator, Dict, Tuple
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.db.engine import LONG_RUNNING, create_engine_for
+from src.infrastructure.db.models import CharacterModel, ItemModel, RaceModel, SkillModel
+from src.infrastructure.db.models.base import Base
+
+ROWS = 100_000
+SAMPLE = 200
+BATCH_SIZE = 500
+CHUNK_BYTES = 64 * 1024
+
+
+def seed(database: Path, source: Path) -> None:
+    """Crea el esquema y los datos de referencia y escribe el fichero NDJSON."""
+    engine = create_engine(f"sqlite:///{database}")
+    Base.metadata.create_all(engine)
+    random.seed(24)
+    races = [{"id": uuid.uuid4(), "name": f"raza-{index}"} for index in range(12)]
+    skills = [{"id": uuid.uuid4(), "name": f"habilidad-{index}"} for index in range(18)]
+    items = [{"id": uuid.uuid4(), "name": f"objeto-{index}"} for index in range(50)]
+    with engine.begin() as connection:
+        connection.execute(insert(RaceModel), races)
+        connection.execute(insert(SkillModel), skills)
+        connection.execute(insert(ItemModel), items)
+    engine.dispose()
+
+    with source.open("w", encoding="utf-8") as output:
+        for index in range(ROWS):
+            output.write(json.dumps({
+                "name": f"pj-{index}",
+                "level": 1 + index % 20,
+                "experience": index,
+                "player_name": f"jugador-{index % 300}",
+                "race": {"id": str(random.choice(races)["id"])},
+                "attributes": {"strength": random.randint(3, 18), "dexterity": random.randint(3, 18)},
+                "skills": [str(skill["id"]) for skill in random.sample(skills, 4)],
+                "items": [
+                    {"id": str(item["id"]), "quantity": random.randint(1, 5)}
+                    for item in random.sample(items, 3)
+                ],
+            }) + "\n")
+
+
+async def read_chunks(source: Path, limit: int) -> AsyncIterator[bytes]:
+    """Lee las primeras `limit` líneas del fichero en fragmentos, como el cuerpo de una petición."""
+    chunk = b""
+    with source.open("rb") as data:
+        for _, line in zip(range(limit), data):
+            chunk += line
+            if len(chunk) >= CHUNK_BYTES:
+                yield chunk
+                chunk = b""
+    if chunk:
+        yield chunk
+
+
+async def run_phase(phase: str, database: Path, source: Path) -> Tuple[int, float]:
+    """Ejecuta una fase y devuelve el número de personajes y los segundos."""
+    from src.infrastructure.db.character_aggregate import CharacterAggregateRepository
+    from src.infrastructure.db.character_transfer import encode_line, export_ndjson, import_ndjson
+
+    engine = create_engine_for(f"sqlite+aiosqlite:///{database}", LONG_RUNNING)
+    start = time.perf_counter()
+    async with AsyncSession(engine) as session:
+        if phase == "importar 1 por transacción":
+            report = await import_ndjson(session, read_chunks(source, SAMPLE), uuid.uuid4(), 1)
+            count = report.imported
+        elif phase == "importar por lotes":
+            report = await import_ndjson(session, read_chunks(source, ROWS), uuid.uuid4(), BATCH_SIZE)
+            count = report.imported
+        elif phase == "exportar por lotes":
+            count = 0
+            async for chunk in export_ndjson(session):
+                count += chunk.count(b"\n")
+        else:
+            ids = list((await session.execute(select(CharacterModel.id))).scalars())
+            sheets = await CharacterAggregateRepository(session).get_many(ids)
+            count = len(b"".join(encode_line(asdict(sheet)) for sheet in sheets).splitlines())
+    await engine.dispose()
+    return count, time.perf_counter() - start
+
+
+def measure(phase: str, database: Path, source: Path) -> Dict[str, float]:
+    """Ejecuta una fase en el proceso actual y añade el pico de memoria en MiB."""
+    count, seconds = asyncio.run(run_phase(phase, database, source))
+    return {
+        "count": count,
+        "seconds": seconds,
+        "peak_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "transfer.db"
+        source = Path(directory) / "characters.ndjson"
+        start = time.perf_counter()
+        seed(database, source)
+        size = source.stat().st_size / 1024 / 1024
+        print(f"{ROWS} fichas ({size:.1f} MiB) generadas en {time.perf_counter() - start:.1f} s")
+
+        phases = (
+            "importar 1 por transacción",
+            "importar por lotes",
+            "exportar por lotes",
+            "exportar todo en memoria",
+        )
+        for phase in phases:
+            with context.Pool(1) as pool:
+                result = pool.apply(measure, (phase, database, source))
+            rate = result["count"] / result["seconds"]
+            print(
+                f"{phase:<28} {int(result['count']):>7} personajes en {result['seconds']:7.1f} s "
+                f"({rate:8.0f}/s)  pico RSS {result['peak_mib']:6.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
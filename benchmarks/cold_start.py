@@ -0,0 +1,66 @@
+"""
+Benchmark del arranque en frío de la aplicación.
+
+Mide el tiempo de importar `src.index` en un proceso nuevo cargando las
+traducciones en modo desarrollo (.po/.mo) y desde la instantánea de build.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RUNS = 10
+PROBE = (
+    "import sys, time; start = time.perf_counter(); import src.index; "
+    "print(time.perf_counter() - start, 'babel.messages' in sys.modules)"
+)
+
+
+def measure(env_overrides: Dict[str, str]) -> List[float]:
+    """
+    Mide el tiempo de importación en varios procesos nuevos.
+
+    Args:
+        env_overrides: Variables de entorno del escenario
+
+    Returns:
+        List[float]: Tiempos de importación en segundos
+    """
+    env = {**os.environ, **env_overrides}
+    timings: List[float] = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip().splitlines()[-1]
+        elapsed, babel_loaded = output.split()
+        timings.append(float(elapsed))
+    print(f"  babel.messages importado: {babel_loaded}")
+    return timings
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    scenarios = {
+        "desarrollo (.po/.mo)": {"TRANSLATIONS_DEV_MODE": "true", "TRANSLATIONS_RELOAD": "false"},
+        "instantánea": {"TRANSLATIONS_DEV_MODE": "false", "TRANSLATIONS_RELOAD": "false"},
+    }
+    for name, env_overrides in scenarios.items():
+        print(f"{name}:")
+        timings = measure(env_overrides)
+        print(
+            f"  mediana {statistics.median(timings) * 1000:.1f} ms, "
+            f"mínimo {min(timings) * 1000:.1f} ms ({RUNS} ejecuciones)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark de rendimiento del pool de conexiones.
+
+Ejecuta una carga concurrente de lecturas (tablas de datos de referencia) y
+escrituras (creación de personajes) sobre una base de datos SQLite en disco
+y compara abrir una conexión por sesión (NullPool) con los pools de los
+modos serverless y de larga duración.
+"""
+
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import List, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.application.character_use_cases import CreateCharacterRequest, CreateCharacterUseCase
+from src.infrastructure.db.engine import LONG_RUNNING, SERVERLESS, create_engine_for
+from src.infrastructure.db.models.base import Base
+from src.infrastructure.db.repositories import (
+    REFERENCE_MODELS,
+    ReferenceRepository,
+    build_character_repositories,
+)
+
+WORKERS = 16
+OPERATIONS = 400
+WRITE_RATIOS = (0.0, 0.1)
+ROWS_PER_TABLE = 100
+
+
+async def prepare(database: Path) -> None:
+    """Crea el esquema y rellena las tablas de datos de referencia."""
+    engine = create_engine_for(f"sqlite+aiosqlite:///{database}", LONG_RUNNING)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        for model in REFERENCE_MODELS.values():
+            await connection.execute(insert(model), [
+                {"id": uuid.uuid4(), "name": f"{model.__tablename__}-{index}"}
+                for index in range(ROWS_PER_TABLE)
+            ])
+    await engine.dispose()
+
+
+async def run_workload(
+    url: str, profile: str, pooled: bool, write_ratio: float
+) -> Tuple[float, List[float]]:
+    """
+    Ejecuta la carga concurrente con una configuración del motor.
+
+    Returns:
+        Tuple[float, List[float]]: Operaciones por segundo y latencias en milisegundos
+    """
+    engine = create_engine_for(url, profile, pooled=pooled)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    readers = [ReferenceRepository(session_factory, model) for model in REFERENCE_MODELS.values()]
+    random.seed(20)
+    plan = [random.random() < write_ratio for _ in range(OPERATIONS)]
+    queue: asyncio.Queue = asyncio.Queue()
+    for is_write in plan:
+        queue.put_nowait(is_write)
+    timings: List[float] = []
+
+    async def write() -> None:
+        async with session_factory() as session:
+            repositories = build_character_repositories(session, uuid.uuid4())
+            await CreateCharacterUseCase(**repositories).execute(CreateCharacterRequest(
+                name="Benchmark", race_id=None, background_id=None, alignment_id=None,
+                level=1, skills=[uuid.uuid4() for _ in range(5)],
+            ))
+
+    async def worker() -> None:
+        while not queue.empty():
+            is_write = queue.get_nowait()
+            start = time.perf_counter()
+            if is_write:
+                await write()
+            else:
+                await random.choice(readers).get_all()
+            timings.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(WORKERS)))
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return OPERATIONS / elapsed, timings
+
+
+async def run() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    configurations = [
+        ("sin pool", LONG_RUNNING, False),
+        (SERVERLESS, SERVERLESS, True),
+        (LONG_RUNNING, LONG_RUNNING, True),
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "pool.db"
+        await prepare(database)
+        for write_ratio in WRITE_RATIOS:
+            print(
+                f"{WORKERS} tareas concurrentes, {OPERATIONS} operaciones "
+                f"({write_ratio:.0%} escrituras)"
+            )
+            for name, profile, pooled in configurations:
+                throughput, timings = await run_workload(
+                    f"sqlite+aiosqlite:///{database}", profile, pooled, write_ratio
+                )
+                print(
+                    f"  {name:<13} {throughput:7.1f} op/s  "
+                    f"p50 {statistics.median(timings):7.2f} ms  "
+                    f"p95 {statistics.quantiles(timings, n=20)[-1]:7.2f} ms"
+                )
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
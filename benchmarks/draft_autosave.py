@@ -0,0 +1,93 @@
+"""
+Benchmark del guardado automático de borradores.
+
+Simula 50 usuarios rellenando el formulario de creación a la vez: cada uno
+envía 40 parches parciales a su borrador, uno cada 25 ms, sobre una base de
+datos SQLite en disco. Compara guardar cada edición al momento
+(`flush_interval=0`) con el búfer de escritura diferida a distintos
+intervalos: transacciones escritas, ediciones por escritura, latencia de
+cada parche y duración de cada vaciado.
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.application.draft_buffer import DraftBuffer
+from src.infrastructure.db.character_drafts import CharacterDraftRepository
+from src.infrastructure.db.models import UserModel
+from src.infrastructure.db.models.base import Base
+
+USERS = 50
+EDITS = 40
+TYPING_DELAY = 0.025
+INTERVALS = (0.0, 0.25, 1.0)
+
+
+async def run(database: Path, flush_interval: float) -> None:
+    """Ejecuta la simulación con un intervalo de vaciado e imprime los resultados."""
+    # SQLite admite un solo escritor: una conexión evita los errores "database is locked"
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{database}", pool_size=1, max_overflow=0, pool_timeout=600
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    users = [uuid.uuid4() for _ in range(USERS)]
+    async with engine.begin() as connection:
+        await connection.execute(insert(UserModel), [
+            {"id": user, "username": f"u{user.hex}", "email": f"{user.hex}@localhost",
+             "password_hash": ""}
+            for user in users
+        ])
+
+    buffer = DraftBuffer(
+        CharacterDraftRepository(async_sessionmaker(engine)), flush_interval=flush_interval
+    )
+    latencies: List[float] = []
+
+    async def typist(user: uuid.UUID) -> None:
+        draft = await buffer.create(user, {"character_name": ""})
+        for edit in range(EDITS):
+            await asyncio.sleep(TYPING_DELAY)
+            start = time.perf_counter()
+            await buffer.patch(draft.id, user, {
+                "character_name": f"pj-{edit}", "strength": str(8 + edit % 10),
+            })
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    buffer.start()
+    await asyncio.gather(*(typist(user) for user in users))
+    await buffer.close()
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+
+    stats = buffer.get_stats()
+    latencies.sort()
+    label = "al momento" if flush_interval == 0 else f"cada {flush_interval:g} s"
+    print(
+        f"{label:<11} {elapsed:5.1f} s  escrituras {stats['flushes']:5}  "
+        f"filas {stats['written']:5}  ediciones/fila {stats['coalescing_ratio']:6.1f}  "
+        f"parche p50 {statistics.median(latencies):8.2f} ms  "
+        f"p95 {latencies[int(len(latencies) * 0.95)]:8.2f} ms  "
+        f"vaciado p50 {stats['flush_ms']['p50']:6.1f} ms"
+    )
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    print(f"{USERS} usuarios x {EDITS} parches cada {TYPING_DELAY * 1000:g} ms")
+    for flush_interval in INTERVALS:
+        with tempfile.TemporaryDirectory() as directory:
+            asyncio.run(run(Path(directory) / "drafts.db", flush_interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark del índice de facetas.
+
+Genera un catálogo sintético de decenas de miles de conjuros y objetos, mide
+la construcción de los bitsets y compara la latencia de filtros combinados
+(con recuentos por faceta) frente a un recorrido lineal de la colección.
+"""
+
+import random
+import statistics
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List
+
+from src.infrastructure.facet_index import FacetIndex, parse_conditions
+
+DOCUMENTS = 50_000
+RUNS = 200
+SCHOOLS = [
+    "Abjuration", "Conjuration", "Divination", "Enchantment",
+    "Evocation", "Illusion", "Necromancy", "Transmutation",
+]
+QUERIES = [
+    "level<=3&school=Evocation",
+    "level=9",
+    "school=Illusion,Enchantment&level>=5",
+    "level>0&school!=Necromancy",
+]
+
+
+def build_catalog() -> List[Dict[str, Any]]:
+    """Genera conjuros sintéticos con nivel y escuela aleatorios."""
+    random.seed(17)
+    return [
+        {"id": doc_id, "level": random.randint(0, 9), "school": random.choice(SCHOOLS)}
+        for doc_id in range(DOCUMENTS)
+    ]
+
+
+def linear_filter(documents: List[Dict[str, Any]], query: str) -> Dict[str, Any]:
+    """Filtrado anterior: evaluar cada condición sobre cada documento y contar."""
+    index = FacetIndex([], ("level", "school"))
+    conditions = parse_conditions(query, index.facets)
+    checks = {"=": lambda a, b: a == b, "!=": lambda a, b: a != b, "<": lambda a, b: a < b,
+              "<=": lambda a, b: a <= b, ">": lambda a, b: a > b, ">=": lambda a, b: a >= b}
+
+    def matches(document: Dict[str, Any]) -> bool:
+        for condition in conditions:
+            value = document[condition.facet]
+            targets = [int(raw) if isinstance(value, int) else raw for raw in condition.values]
+            if not any(checks[condition.operator](value, target) for target in targets):
+                return False
+        return True
+
+    matched = [document for document in documents if matches(document)]
+    return {
+        "ids": [document["id"] for document in matched],
+        "counts": {facet: Counter(document[facet] for document in matched) for facet in ("level", "school")},
+    }
+
+
+def measure(run: Callable[[str], Any]) -> List[float]:
+    """Mide la latencia en milisegundos de cada consulta."""
+    timings = []
+    for attempt in range(RUNS):
+        query = QUERIES[attempt % len(QUERIES)]
+        start = time.perf_counter()
+        run(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    documents = build_catalog()
+    start = time.perf_counter()
+    index = FacetIndex(documents, ("level", "school"))
+    print(f"{DOCUMENTS} documentos, bitsets en {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    indexed = measure(lambda query: index.filter(parse_conditions(query, index.facets)))
+    linear = measure(lambda query: linear_filter(documents, query))
+    for name, timings in [("bitsets", indexed), ("lineal", linear)]:
+        print(
+            f"{name:<8} p50 {statistics.median(timings):6.2f} ms  "
+            f"p95 {statistics.quantiles(timings, n=20)[-1]:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark del middleware de internacionalización.
+
+Compara el middleware anterior basado en `BaseHTTPMiddleware`, que añadía la
+cookie de idioma en todas las respuestas, con el middleware ASGI puro que
+solo la añade cuando cambia. Mide peticiones por segundo en `/health` y
+`/api/races` con un cliente que ya tiene la cookie.
+"""
+
+import time
+from typing import Dict
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from src.index import I18nMiddleware, create_app
+from src.infrastructure.i18n import I18nConfig
+from src.infrastructure.translation_service import translation_service
+
+PATHS = ["/health", "/api/races"]
+REQUESTS_PER_PATH = 2_000
+
+
+class LegacyI18nMiddleware(BaseHTTPMiddleware):
+    """Middleware anterior: tarea y envoltorio extra y cookie en cada respuesta."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        response = await call_next(request)
+        selected_lang = translation_service.get_language_from_request(request)
+        if selected_lang:
+            response.set_cookie(
+                key=I18nConfig.LANGUAGE_COOKIE_NAME,
+                value=selected_lang,
+                max_age=I18nConfig.LANGUAGE_COOKIE_MAX_AGE,
+                httponly=True,
+                samesite="lax",
+            )
+        return response
+
+
+def create_legacy_app() -> FastAPI:
+    """Crea la aplicación sustituyendo el middleware ASGI por el anterior."""
+    app = create_app()
+    app.user_middleware = [
+        Middleware(LegacyI18nMiddleware) if middleware.cls is I18nMiddleware else middleware
+        for middleware in app.user_middleware
+    ]
+    return app
+
+
+def measure(app: FastAPI, path: str) -> float:
+    """
+    Mide las peticiones por segundo de una ruta con la cookie de idioma ya fijada.
+
+    Args:
+        app: Aplicación a medir
+        path: Ruta a medir
+
+    Returns:
+        float: Peticiones por segundo
+    """
+    client = TestClient(app)
+    client.cookies.set(I18nConfig.LANGUAGE_COOKIE_NAME, I18nConfig.DEFAULT_LANGUAGE)
+    client.get(path)
+    start = time.perf_counter()
+    for _ in range(REQUESTS_PER_PATH):
+        client.get(path)
+    return REQUESTS_PER_PATH / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    results: Dict[str, Dict[str, float]] = {
+        "BaseHTTPMiddleware": {path: measure(create_legacy_app(), path) for path in PATHS},
+        "ASGI": {path: measure(create_app(), path) for path in PATHS},
+    }
+    for name, by_path in results.items():
+        formatted = "  ".join(f"{path}: {rps:7.1f} rps" for path, rps in by_path.items())
+        print(f"{name:<19} {formatted}")
+
+
+if __name__ == "__main__":
+    main()
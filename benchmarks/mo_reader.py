@@ -0,0 +1,98 @@
+"""
+Benchmark del lector de catálogos .mo.
+
+Compara `gettext.GNUTranslations` con `MappedTranslations` en memoria asignada
+por Python al cargar todos los catálogos y en velocidad de consulta de todas
+sus claves (primera pasada y pasadas siguientes).
+"""
+
+import gettext
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from src.infrastructure.mapped_catalog import MappedTranslations
+from src.infrastructure.translation_service import discover_mo_files
+
+LOOKUP_PASSES = 200
+
+
+def load_gnu(path: Path) -> gettext.NullTranslations:
+    """Carga un catálogo con el lector estándar de gettext."""
+    with open(path, "rb") as f:
+        return gettext.GNUTranslations(f)
+
+
+def measure_loader(
+    loader: Callable[[Path], gettext.NullTranslations], mo_files: List[Path]
+) -> Tuple[List[gettext.NullTranslations], int]:
+    """
+    Carga todos los catálogos midiendo la memoria asignada por Python.
+
+    Args:
+        loader: Función que carga un catálogo
+        mo_files: Archivos .mo a cargar
+
+    Returns:
+        Tuple: Catálogos cargados y bytes asignados
+    """
+    tracemalloc.start()
+    catalogs = [loader(path) for path in mo_files]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return catalogs, allocated
+
+
+def measure_lookups(
+    catalogs: List[gettext.NullTranslations], keys: List[List[str]]
+) -> Tuple[float, float]:
+    """
+    Mide el tiempo medio por consulta en la primera pasada y en las siguientes.
+
+    Args:
+        catalogs: Catálogos cargados
+        keys: Claves de cada catálogo
+
+    Returns:
+        Tuple[float, float]: Microsegundos por consulta (primera pasada, siguientes)
+    """
+    total = sum(len(catalog_keys) for catalog_keys in keys)
+
+    start = time.perf_counter()
+    for catalog, catalog_keys in zip(catalogs, keys):
+        for key in catalog_keys:
+            catalog.gettext(key)
+    first = (time.perf_counter() - start) / total * 1e6
+
+    start = time.perf_counter()
+    for _ in range(LOOKUP_PASSES):
+        for catalog, catalog_keys in zip(catalogs, keys):
+            for key in catalog_keys:
+                catalog.gettext(key)
+    warm = (time.perf_counter() - start) / (total * LOOKUP_PASSES) * 1e6
+    return first, warm
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    mo_files = [path for paths in discover_mo_files().values() for path in paths]
+    keys = [
+        [key for key in load_gnu(path)._catalog if isinstance(key, str) and key]
+        for path in mo_files
+    ]
+
+    results: Dict[str, Tuple[int, float, float]] = {}
+    for name, loader in (("GNUTranslations", load_gnu), ("MappedTranslations", MappedTranslations)):
+        catalogs, allocated = measure_loader(loader, mo_files)
+        first, warm = measure_lookups(catalogs, keys)
+        results[name] = (allocated, first, warm)
+
+    print(f"{len(mo_files)} catálogos, {sum(len(k) for k in keys)} claves")
+    print(f"{'lector':<20}{'memoria':>12}{'1ª consulta':>16}{'consultas':>14}")
+    for name, (allocated, first, warm) in results.items():
+        print(f"{name:<20}{allocated / 1024:>9.1f} KiB{first:>13.2f} µs{warm:>11.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
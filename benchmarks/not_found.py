@@ -0,0 +1,81 @@
+"""
+Benchmark de las respuestas a rutas desconocidas.
+
+Simula una ráfaga de peticiones de bots a rutas aleatorias y compara la
+redirección anterior a `/404` (dos peticiones y un renderizado por fallo)
+con la página 404 servida directamente desde la caché por idioma.
+"""
+
+import random
+import string
+import time
+from typing import List, Tuple
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.responses import RedirectResponse
+
+from src.index import create_app, custom_404_handler
+
+REQUESTS = 1_000
+
+
+def create_legacy_app() -> FastAPI:
+    """Crea la aplicación con el handler anterior, que redirigía a `/404`."""
+    app = create_app()
+
+    async def redirect_to_not_found(request, exc):
+        return RedirectResponse(url="/404")
+
+    app.add_exception_handler(404, redirect_to_not_found)
+    return app
+
+
+def create_current_app() -> FastAPI:
+    """Crea la aplicación con el handler actual."""
+    app = create_app()
+    app.add_exception_handler(404, custom_404_handler)
+    return app
+
+
+def random_paths() -> List[str]:
+    """Genera rutas aleatorias como las que prueban los bots."""
+    random.seed(404)
+    return [
+        "/" + "".join(random.choices(string.ascii_lowercase, k=8)) + random.choice(
+            ["", ".php", "/wp-login.php", "/.env", "/admin"]
+        )
+        for _ in range(REQUESTS)
+    ]
+
+
+def measure(app: FastAPI) -> Tuple[float, float]:
+    """
+    Mide las peticiones por segundo y las peticiones HTTP reales de la ráfaga.
+
+    Args:
+        app: Aplicación a medir
+
+    Returns:
+        Tuple[float, float]: Rutas por segundo y peticiones HTTP por ruta
+    """
+    client = TestClient(app)
+    paths = random_paths()
+    client.get(paths[0])
+    round_trips = 0
+    start = time.perf_counter()
+    for path in paths:
+        response = client.get(path)
+        round_trips += 1 + len(response.history)
+    return REQUESTS / (time.perf_counter() - start), round_trips / REQUESTS
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    for name, app in [("redirección", create_legacy_app()), ("en el sitio", create_current_app())]:
+        rps, round_trips = measure(app)
+        print(f"{name:<12} {rps:7.1f} rutas/s  {round_trips:.0f} peticiones HTTP por ruta")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark de la caché de páginas renderizadas.
+
+Mide las peticiones por segundo de las páginas HTML sin caché, con caché
+y con revalidación condicional (`If-None-Match` que responde 304).
+"""
+
+import time
+from typing import Dict, Optional
+
+from fastapi.testclient import TestClient
+
+from src.index import app
+from src.infrastructure.template_helpers import page_cache
+
+PATHS = ["/", "/create-character", "/404"]
+REQUESTS_PER_PATH = 300
+
+
+def measure(client: TestClient, path: str, etag: Optional[str] = None) -> float:
+    """
+    Mide las peticiones por segundo de una ruta.
+
+    Args:
+        client: Cliente de pruebas de la aplicación
+        path: Ruta a medir
+        etag: ETag a enviar en If-None-Match (opcional)
+
+    Returns:
+        float: Peticiones por segundo
+    """
+    headers = {"If-None-Match": etag} if etag else {}
+    client.get(path, headers=headers)
+    start = time.perf_counter()
+    for _ in range(REQUESTS_PER_PATH):
+        client.get(path, headers=headers)
+    return REQUESTS_PER_PATH / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    client = TestClient(app)
+    results: Dict[str, Dict[str, float]] = {}
+
+    page_cache.configure(enabled=False)
+    results["sin caché"] = {path: measure(client, path) for path in PATHS}
+
+    page_cache.configure(enabled=True)
+    results["con caché"] = {path: measure(client, path) for path in PATHS}
+    results["304"] = {
+        path: measure(client, path, client.get(path).headers["etag"]) for path in PATHS
+    }
+
+    for strategy, by_path in results.items():
+        formatted = "  ".join(f"{path}: {rps:7.1f} rps" for path, rps in by_path.items())
+        print(f"{strategy:<10} {formatted}")
+
+
+if __name__ == "__main__":
+    main()
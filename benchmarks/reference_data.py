@@ -0,0 +1,86 @@
+"""
+Benchmark de las respuestas de datos de referencia.
+
+Compara `/api/spells` sirviendo el JSON precodificado (con y sin
+revalidación 304) con el comportamiento anterior: reconstruir la lista en
+cada petición y serializarla con `jsonable_encoder` y `json.dumps`.
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from src.index import create_app
+from src.infrastructure.reference_data import reference_data
+
+REQUESTS = 2_000
+
+
+def create_benchmark_app() -> FastAPI:
+    """Crea la aplicación con una ruta que reproduce el endpoint anterior."""
+    app = create_app()
+
+    @app.get("/legacy/spells")
+    async def legacy_spells() -> List[Dict[str, Any]]:
+        return [dict(item) for item in reference_data.get_items("spells")]
+
+    return app
+
+
+def measure(client: TestClient, path: str, etag: Optional[str] = None) -> float:
+    """
+    Mide las peticiones por segundo de una ruta.
+
+    Args:
+        client: Cliente de pruebas de la aplicación
+        path: Ruta a medir
+        etag: ETag a enviar en If-None-Match (opcional)
+
+    Returns:
+        float: Peticiones por segundo
+    """
+    headers = {"If-None-Match": etag} if etag else {}
+    client.get(path, headers=headers)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.get(path, headers=headers)
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def measure_serialization(build: Callable[[], Any]) -> float:
+    """
+    Mide los microsegundos que cuesta generar el cuerpo de la respuesta.
+
+    Args:
+        build: Función que genera la respuesta
+
+    Returns:
+        float: Microsegundos por respuesta
+    """
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        build()
+    return (time.perf_counter() - start) / REQUESTS * 1e6
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    client = TestClient(create_benchmark_app())
+    etag = client.get("/api/spells").headers["etag"]
+    print(f"anterior:       {measure(client, '/legacy/spells'):7.1f} rps")
+    print(f"precodificado:  {measure(client, '/api/spells'):7.1f} rps")
+    print(f"304:            {measure(client, '/api/spells', etag):7.1f} rps")
+
+    legacy = measure_serialization(
+        lambda: json.dumps(jsonable_encoder(list(reference_data.get_items("spells")))).encode()
+    )
+    current = measure_serialization(lambda: reference_data.build_response("spells", None))
+    print(f"serialización:  anterior {legacy:.1f} µs, precodificado {current:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark de la carga de datos de referencia de GetCharacterDataUseCase.
+
+Simula ocho repositorios con la latencia de una consulta remota y compara la
+carga secuencial anterior con la carga concurrente en frío y las llamadas
+servidas desde la caché.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, List
+
+from src.application.character_use_cases import (
+    GetCharacterDataRequest,
+    GetCharacterDataUseCase,
+)
+from src.application.reference_data_cache import ReferenceDataCache
+
+RUNS = 30
+# Latencia simulada de cada colección en milisegundos (spells e items son las más grandes)
+LATENCIES_MS = {
+    "races": 6, "backgrounds": 6, "alignments": 4, "skills": 6,
+    "languages": 5, "proficiencies": 8, "spells": 18, "items": 14,
+}
+
+
+class SimulatedRepository:
+    """Repositorio que tarda lo mismo que una consulta remota."""
+
+    def __init__(self, name: str, latency_ms: float):
+        self._items = [{"id": index, "name": f"{name}-{index}"} for index in range(200)]
+        self._latency = latency_ms / 1000
+
+    async def get_all(self) -> List[Any]:
+        await asyncio.sleep(self._latency)
+        return list(self._items)
+
+
+def build_use_case(cache: ReferenceDataCache) -> GetCharacterDataUseCase:
+    """Crea el caso de uso con repositorios simulados."""
+    repositories = [SimulatedRepository(name, ms) for name, ms in LATENCIES_MS.items()]
+    return GetCharacterDataUseCase(*repositories, cache=cache)
+
+
+async def sequential(use_case: GetCharacterDataUseCase) -> None:
+    """Carga anterior: una consulta tras otra y sin caché."""
+    for loader in use_case._loaders().values():
+        await loader()
+
+
+async def measure(run: Callable[[], Awaitable[Any]]) -> List[float]:
+    """Mide la latencia en milisegundos de cada ejecución."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def run() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    request = GetCharacterDataRequest()
+    cache = ReferenceDataCache()
+    use_case = build_use_case(cache)
+
+    async def cold() -> None:
+        cache.invalidate()
+        await use_case.execute(request)
+
+    results = [
+        ("secuencial", await measure(lambda: sequential(use_case))),
+        ("concurrente", await measure(cold)),
+        ("caché", await measure(lambda: use_case.execute(request))),
+    ]
+    print(
+        f"suma de latencias {sum(LATENCIES_MS.values())} ms, "
+        f"más lenta {max(LATENCIES_MS.values())} ms"
+    )
+    for name, timings in results:
+        print(
+            f"{name:<12} p50 {statistics.median(timings):7.3f} ms  "
+            f"p95 {statistics.quantiles(timings, n=20)[-1]:7.3f} ms"
+        )
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
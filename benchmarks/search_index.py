@@ -0,0 +1,87 @@
+"""
+Benchmark del índice de búsqueda a escala SRD.
+
+Genera un catálogo sintético del tamaño del SRD completo (unos 320 conjuros y
+600 objetos con descripciones largas), mide el tiempo de construcción del
+índice y la latencia de consultas exactas, por prefijo, sin acentos y con
+erratas, comparada con un filtrado lineal por subcadena como el que hacía el
+navegador.
+"""
+
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from src.infrastructure.search_index import SearchIndex, normalize
+
+SPELLS = 320
+ITEMS = 600
+DESCRIPTION_WORDS = 80
+RUNS = 2_000
+WORDS = (
+    "fire cold acid lightning thunder radiant necrotic psychic force poison "
+    "bolt ray sphere wall storm shield ward blade arrow missile orb cone "
+    "creature target ally enemy range damage saving throw dexterity wisdom "
+    "charisma strength constitution intelligence spell slot level concentration "
+    "minute hour round radius feet cube line sight magic arcane divine healing "
+    "potion ring wand staff rod cloak boots gloves amulet armor weapon sword"
+).split()
+QUERIES = ["fire bolt", "heal", "conc", "lightnin", "dexterity saving", "misile", "pocion"]
+
+
+def build_catalog(count: int, seed: int) -> List[Dict[str, Any]]:
+    """Genera documentos con nombre y descripción aleatorios."""
+    random.seed(seed)
+    return [
+        {
+            "id": doc_id,
+            "name": " ".join(random.choices(WORDS, k=random.randint(2, 3))).title(),
+            "description": " ".join(random.choices(WORDS, k=DESCRIPTION_WORDS)),
+        }
+        for doc_id in range(count)
+    ]
+
+
+def linear_search(documents: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+    """Filtrado anterior: subcadena sobre nombre y descripción de cada documento."""
+    needle = normalize(query)
+    return [
+        document for document in documents
+        if needle in normalize(document["name"]) or needle in normalize(document["description"])
+    ][:10]
+
+
+def measure(search: Callable[[str], Any]) -> List[float]:
+    """Mide la latencia en microsegundos de cada consulta."""
+    timings = []
+    for run in range(RUNS):
+        query = QUERIES[run % len(QUERIES)]
+        start = time.perf_counter()
+        search(query)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    for name, documents in [
+        ("conjuros", build_catalog(SPELLS, 1)),
+        ("objetos", build_catalog(ITEMS, 2)),
+    ]:
+        start = time.perf_counter()
+        index = SearchIndex(documents, "en")
+        build_ms = (time.perf_counter() - start) * 1000
+
+        indexed = measure(lambda query: index.search(query, 10))
+        linear = measure(lambda query: linear_search(documents, query))
+        print(
+            f"{name:<9} {len(documents)} documentos, índice en {build_ms:.1f} ms | "
+            f"índice p50 {statistics.median(indexed):.0f} µs "
+            f"p95 {statistics.quantiles(indexed, n=20)[-1]:.0f} µs | "
+            f"lineal p50 {statistics.median(linear):.0f} µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
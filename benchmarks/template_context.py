@@ -0,0 +1,133 @@
+"""
+Micro-benchmark del contexto de traducción de los templates.
+
+Compara el contexto anterior, reconstruido en cada petición (tres closures de
+traducción, `url_for` con su diccionario de rutas y la lista de dominios),
+con el contexto inmutable por idioma: objetos y bytes reservados por
+petición y tiempo de renderizado completo de `home.html`.
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from starlette.requests import Request
+
+from src.infrastructure import template_helpers
+from src.infrastructure.template_helpers import (
+    get_translation_context,
+    render_template_with_translations,
+)
+from src.infrastructure.templating import templates
+from src.infrastructure.translation_service import translation_service
+
+REQUESTS = 2_000
+RENDERS = 500
+LANGUAGE = "en"
+
+
+def legacy_translation_context(language: str, domain: str = "home") -> dict:
+    """Contexto anterior: closures, rutas y dominios nuevos en cada llamada."""
+
+    def create_translation_function(language: str, domain: str) -> Callable[..., str]:
+        def translate(key: str, forced_domain: str | None = None) -> str:
+            if not hasattr(translation_service, "_translations") or not translation_service._translations:
+                translation_service.reload_translations()
+            return translation_service.get_translation(key, language, forced_domain or domain)
+
+        return translate
+
+    def url_for(name: str, **path_params) -> str:
+        route_map = {
+            "home": "/",
+            "create_character": "/create-character",
+            "character_detail": "/character/{character_id}",
+            "browse_characters": "/browse",
+            "user_characters": "/characters",
+            "help": "/help",
+            "contact": "/contact",
+            "feedback": "/feedback",
+            "privacy": "/privacy",
+            "terms": "/terms",
+        }
+        url = route_map.get(name, f"/{name}")
+        for param, value in path_params.items():
+            url = url.replace(f"{{{param}}}", str(value))
+        return url
+
+    return {
+        "_": create_translation_function(language, domain),
+        "_header": create_translation_function(language, "header"),
+        "_footer": create_translation_function(language, "footer"),
+        "language": language,
+        "current_lang": language,
+        "available_domains": translation_service.get_available_domains(),
+        "get_locale": lambda: language,
+        "url_for": url_for,
+    }
+
+
+def measure_allocations(build_context: Callable[[str, str], dict]) -> Tuple[float, float]:
+    """
+    Cuenta los objetos y bytes que quedan reservados por cada contexto de petición.
+
+    Args:
+        build_context: Función que construye el contexto de traducción
+
+    Returns:
+        Tuple[float, float]: Objetos y bytes por petición
+    """
+    contexts: List[Dict] = []
+    gc.collect()
+    objects_before = len(gc.get_objects())
+    tracemalloc.start()
+    for _ in range(REQUESTS):
+        contexts.append({**build_context(LANGUAGE, "home"), "request": None, "lang_query": ""})
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    objects = len(gc.get_objects()) - objects_before
+    return objects / REQUESTS, allocated / REQUESTS
+
+
+def measure_render(build_context: Callable[[str, str], dict]) -> float:
+    """
+    Mide el tiempo de renderizado completo de `home.html` con un contexto dado.
+
+    Args:
+        build_context: Función que construye el contexto de traducción
+
+    Returns:
+        float: Microsegundos por petición
+    """
+    request = Request(
+        {"type": "http", "method": "GET", "path": "/", "query_string": b"lang=en", "headers": []}
+    )
+    original = template_helpers.get_translation_context
+    template_helpers.get_translation_context = build_context
+    try:
+        render_template_with_translations(templates, "home.html", request)
+        start = time.perf_counter()
+        for _ in range(RENDERS):
+            render_template_with_translations(templates, "home.html", request)
+        return (time.perf_counter() - start) / RENDERS * 1e6
+    finally:
+        template_helpers.get_translation_context = original
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    for name, build_context in [
+        ("anterior", legacy_translation_context),
+        ("inmutable", get_translation_context),
+    ]:
+        objects, allocated = measure_allocations(build_context)
+        render = measure_render(build_context)
+        print(
+            f"{name:<10} {objects:5.1f} objetos/petición  {allocated:7.0f} B/petición  "
+            f"render {render:6.1f} µs/petición"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark del entorno de templates.
+
+Mide en un proceso nuevo el tiempo del primer renderizado de todas las páginas
+y la memoria reservada por Jinja2 con un entorno independiente por controlador
+(comportamiento anterior), con el entorno compartido sin caché,
+con caché de bytecode y con templates precompilados.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RUNS = 10
+PAGES = ["home.html", "create-character.html", "404.html"]
+PROBE = """
+import sys, time, tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from jinja2 import Environment, FileSystemLoader
+from src.infrastructure.template_helpers import get_translation_context
+from src.infrastructure.templating import create_environment
+
+scenario, cache_dir, compiled_dir = sys.argv[1], sys.argv[2], Path(sys.argv[3])
+pages = {pages!r}
+context = {{**get_translation_context("es"), "lang_query": "",
+            "request": SimpleNamespace(url=SimpleNamespace(path="/"))}}
+tracemalloc.start()
+start = time.perf_counter()
+if scenario == "separados":
+    environments = [Environment(loader=FileSystemLoader("templates/html"), autoescape=True)
+                    for _ in pages]
+else:
+    environment = create_environment(
+        compiled_dir=compiled_dir, bytecode_cache_dir=cache_dir,
+        auto_reload=scenario != "precompilados")
+    environments = [environment] * len(pages)
+for environment, page in zip(environments, pages):
+    environment.get_template(page).render(context)
+elapsed = time.perf_counter() - start
+print(elapsed, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def measure(scenario: str, cache_dir: str, compiled_dir: Path) -> Tuple[List[float], int]:
+    """
+    Ejecuta el escenario en varios procesos nuevos.
+
+    Args:
+        scenario: Nombre del escenario
+        cache_dir: Directorio de la caché de bytecode ("" sin caché)
+        compiled_dir: Directorio de templates precompilados
+
+    Returns:
+        Tuple[List[float], int]: Tiempos en segundos y memoria reservada en bytes
+    """
+    timings: List[float] = []
+    memory = 0
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(pages=PAGES), scenario, cache_dir, str(compiled_dir)],
+            cwd=PROJECT_ROOT,
+            env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip().splitlines()[-1]
+        elapsed, allocated = output.split()
+        timings.append(float(elapsed))
+        memory = int(allocated)
+    return timings, memory
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    from src.infrastructure.templating import compile_templates
+
+    with tempfile.TemporaryDirectory() as workdir:
+        cache_dir = str(Path(workdir) / "bytecode")
+        compiled_dir = Path(workdir) / "compiled"
+        compile_templates(output=compiled_dir)
+
+        scenarios = [
+            ("separados", "", compiled_dir),
+            ("compartido", "", compiled_dir),
+            ("bytecode", cache_dir, compiled_dir),
+            ("precompilados", "", compiled_dir),
+        ]
+        for scenario, scenario_cache, scenario_compiled in scenarios:
+            timings, memory = measure(scenario, scenario_cache, scenario_compiled)
+            print(
+                f"{scenario:<14} mediana {statistics.median(timings) * 1000:6.1f} ms  "
+                f"memoria {memory / 1024:7.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark de la especialización de templates por idioma.
+
+Compara el renderizado de `home.html` y `create-character.html` resolviendo
+las traducciones en cada llamada a `_()` con el renderizado de los templates
+especializados, y cuenta las búsquedas de traducción por renderizado.
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Tuple
+
+from fastapi.templating import Jinja2Templates
+
+from src.infrastructure.template_helpers import get_translation_context
+from src.infrastructure.templating import specialized_templates, templates
+from src.infrastructure.translation_service import translation_service
+
+PAGES = [("home.html", "home"), ("create-character.html", "create-character")]
+LANGUAGE = "en"
+RENDERS = 500
+
+
+def measure(source: Jinja2Templates, page: str, domain: str) -> Tuple[float, int]:
+    """
+    Mide el tiempo medio de renderizado y las búsquedas de traducción por renderizado.
+
+    Args:
+        source: Templates con los que renderizar
+        page: Nombre del template
+        domain: Dominio de traducción de la página
+
+    Returns:
+        Tuple[float, int]: Microsegundos por renderizado y búsquedas por renderizado
+    """
+    template = source.get_template(page)
+    context = {
+        **get_translation_context(LANGUAGE, domain),
+        "request": SimpleNamespace(url=SimpleNamespace(path="/")),
+        "lang_query": "",
+        "current_lang": LANGUAGE,
+    }
+    template.render(context)
+
+    lookups = 0
+    original = translation_service.get_translation
+
+    def counting(*args, **kwargs) -> str:
+        nonlocal lookups
+        lookups += 1
+        return original(*args, **kwargs)
+
+    translation_service.get_translation = counting
+    try:
+        start = time.perf_counter()
+        for _ in range(RENDERS):
+            template.render(context)
+        elapsed = time.perf_counter() - start
+    finally:
+        del translation_service.get_translation
+    return elapsed / RENDERS * 1e6, lookups // RENDERS
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    for page, domain in PAGES:
+        plain, plain_lookups = measure(templates, page, domain)
+        specialized = specialized_templates.get(templates, LANGUAGE, domain)
+        inlined, inlined_lookups = measure(specialized, page, domain)
+        print(
+            f"{page:<22} dinámico {plain:7.1f} µs ({plain_lookups} búsquedas)  "
+            f"especializado {inlined:7.1f} µs ({inlined_lookups} búsquedas)"
+        )
+
+
+if __name__ == "__main__":
+    main()
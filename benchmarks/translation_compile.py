@@ -0,0 +1,54 @@
+"""
+Benchmark del pipeline de compilación de traducciones.
+
+Genera idiomas sintéticos copiando los .po del idioma por defecto y mide la
+compilación completa en serie y en paralelo, y una segunda ejecución sin
+cambios que debe omitir todos los catálogos.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List
+
+from src.infrastructure.i18n import I18nConfig
+from src.infrastructure.translation_compiler import compile_catalogs, discover_po_files
+
+SYNTHETIC_LANGUAGES = 20
+
+
+def create_catalogs(target_dir: Path) -> List[Path]:
+    """
+    Crea catálogos sintéticos a partir de los .po del idioma por defecto.
+
+    Args:
+        target_dir: Directorio temporal de traducciones
+
+    Returns:
+        List[Path]: Archivos .po generados
+    """
+    source_files = discover_po_files()[I18nConfig.DEFAULT_LANGUAGE]
+    po_files: List[Path] = []
+    for index in range(SYNTHETIC_LANGUAGES):
+        lang_dir = target_dir / f"x{index:02d}"
+        lang_dir.mkdir(parents=True)
+        for source in source_files:
+            shutil.copy(source, lang_dir / source.name)
+            po_files.append(lang_dir / source.name)
+    return po_files
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    for workers in (1, os.cpu_count() or 1):
+        with tempfile.TemporaryDirectory() as temporary_dir:
+            po_files = create_catalogs(Path(temporary_dir))
+            cold = compile_catalogs(po_files, workers=workers)
+            warm = compile_catalogs(po_files, workers=workers)
+        print(f"{workers} procesos, en frío: {cold.summary()}")
+        print(f"{workers} procesos, sin cambios: {warm.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Benchmark del coste de las traducciones no encontradas.
+
+Compara el tiempo por llamada de `get_translation` para claves existentes y
+para claves sin traducción, que se resuelven mediante la caché negativa.
+"""
+
+import timeit
+
+from src.infrastructure.translation_service import translation_service
+
+CALLS = 200_000
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    cases = {
+        "clave existente": ("header.nav.home", "en", "header"),
+        "clave inexistente": ("header.nav.missing", "en", "header"),
+    }
+    for name, (key, language, domain) in cases.items():
+        translation_service.get_translation(key, language, domain)
+        elapsed = timeit.timeit(
+            lambda: translation_service.get_translation(key, language, domain),
+            number=CALLS,
+        )
+        print(f"{name:<20}{elapsed / CALLS * 1e9:>10.1f} ns/llamada")
+
+
+if __name__ == "__main__":
+    main()
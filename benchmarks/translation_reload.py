@@ -0,0 +1,69 @@
+"""
+Benchmark de la recarga de traducciones.
+
+Mide las peticiones por segundo de `/` y `/create-character` con tres estrategias:
+recarga completa en cada petición (comportamiento anterior), recarga por cambios
+y recarga desactivada.
+"""
+
+import time
+from typing import Callable, Dict
+
+from fastapi.testclient import TestClient
+
+from src.index import app
+from src.infrastructure.translation_service import translation_service
+
+PATHS = ["/", "/create-character"]
+REQUESTS_PER_PATH = 300
+
+
+def measure(client: TestClient, path: str, before_request: Callable[[], None]) -> float:
+    """
+    Mide las peticiones por segundo de una ruta.
+
+    Args:
+        client: Cliente de pruebas de la aplicación
+        path: Ruta a medir
+        before_request: Acción ejecutada antes de cada petición
+
+    Returns:
+        float: Peticiones por segundo
+    """
+    client.get(path)
+    start = time.perf_counter()
+    for _ in range(REQUESTS_PER_PATH):
+        before_request()
+        client.get(path)
+    return REQUESTS_PER_PATH / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    client = TestClient(app)
+    results: Dict[str, Dict[str, float]] = {}
+
+    translation_service.configure_reload(enabled=False)
+    results["full reload"] = {
+        path: measure(client, path, translation_service.reload_translations)
+        for path in PATHS
+    }
+
+    translation_service.configure_reload(enabled=True, interval=0.0)
+    results["changed only"] = {path: measure(client, path, lambda: None) for path in PATHS}
+
+    translation_service.configure_reload(enabled=True, interval=1.0)
+    results["changed only (1s)"] = {
+        path: measure(client, path, lambda: None) for path in PATHS
+    }
+
+    translation_service.configure_reload(enabled=False)
+    results["disabled"] = {path: measure(client, path, lambda: None) for path in PATHS}
+
+    print(f"{'modo':<20}" + "".join(f"{path:>20}" for path in PATHS))
+    for mode, by_path in results.items():
+        print(f"{mode:<20}" + "".join(f"{by_path[path]:>16.1f} rps" for path in PATHS))
+
+
+if __name__ == "__main__":
+    main()
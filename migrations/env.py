@@ -0,0 +1,67 @@
+"""
+Entorno de Alembic.
+
+Las migraciones se ejecutan con el motor asíncrono de la aplicación sobre la
+conexión directa (sin pooler), ya que PgBouncer en modo transacción no es
+adecuado para cambios de esquema.
+"""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure.db.engine import LONG_RUNNING, resolve_database_url
+from src.infrastructure.db.models import *  # noqa: F401,F403 - registra todas las tablas
+from src.infrastructure.db.models.base import Base
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def get_url() -> str:
+    """URL de la migración: la de alembic.ini si se indica, o la de la aplicación."""
+    return config.get_main_option("sqlalchemy.url") or resolve_database_url(LONG_RUNNING)
+
+
+def run_migrations_offline() -> None:
+    """Genera el SQL de las migraciones sin conectarse a la base de datos."""
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    """Ejecuta las migraciones sobre una conexión abierta."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """Ejecuta las migraciones con el motor asíncrono."""
+    engine = create_async_engine(get_url(), poolclass=NullPool)
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,135 @@
+"""Esquema inicial
+
+Crea las tablas de usuarios, de datos de referencia, de personajes y de sus
+relaciones tal como estaban antes de la primera migración de índices, de
+modo que `alembic upgrade head` funciona sobre una base de datos vacía.
+
+Las bases de datos cuyo esquema se creó antes con `create_all` conservan
+sus tablas: solo se crean las que faltan.
+
+Revision ID: 1f0c6b3a8e25
+Revises:
+Create Date: 2026-10-17 09:00:00
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+revision: str = "1f0c6b3a8e25"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def uuid_column(name: str, *args, **kwargs) -> sa.Column:
+    """Columna UUID con el mismo tipo que los modelos."""
+    return sa.Column(name, PG_UUID(as_uuid=True), *args, **kwargs)
+
+
+def reference_table(name: str, name_length: int, *columns: sa.Column) -> tuple:
+    """Tabla de datos de referencia: ID, nombre y columnas propias."""
+    return (
+        name,
+        uuid_column("id", primary_key=True),
+        sa.Column("name", sa.String(name_length), nullable=False),
+        *columns,
+    )
+
+
+def character_relation(name: str, reference: str, column: str, *columns: sa.Column) -> tuple:
+    """Tabla de relación entre un personaje y un dato de referencia."""
+    return (
+        name,
+        uuid_column("character_id", sa.ForeignKey("characters.id"), primary_key=True),
+        uuid_column(column, sa.ForeignKey(f"{reference}.id"), primary_key=True),
+        *columns,
+    )
+
+
+def build_tables() -> list:
+    """
+    Tablas en orden de creación (las referenciadas antes que las que las referencian).
+
+    Se construyen en cada llamada porque una columna solo puede pertenecer a
+    una tabla.
+    """
+    return [
+        (
+            "users",
+            uuid_column("id", primary_key=True),
+            sa.Column("username", sa.String(50), nullable=False, unique=True),
+            sa.Column("email", sa.String(100), nullable=False, unique=True),
+            sa.Column("password_hash", sa.String(255), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        ),
+        reference_table("alignments", 50),
+        reference_table("races", 50, sa.Column("trait_json", sa.JSON())),
+        reference_table(
+            "classes", 50, sa.Column("hit_die", sa.Integer(), nullable=False)
+        ),
+        reference_table("backgrounds", 50, sa.Column("feature", sa.Text())),
+        reference_table("skills", 50, sa.Column("description", sa.Text())),
+        reference_table("languages", 50, sa.Column("description", sa.Text())),
+        reference_table("proficiencies", 50, sa.Column("description", sa.Text())),
+        reference_table("items", 100, sa.Column("description", sa.Text())),
+        reference_table("spells", 100, sa.Column("description", sa.Text())),
+        (
+            "characters",
+            uuid_column("id", primary_key=True),
+            uuid_column("user_id", sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("name", sa.String(100), nullable=False),
+            sa.Column("player_name", sa.String(100)),
+            sa.Column("level", sa.Integer(), nullable=False),
+            uuid_column("alignment_id", sa.ForeignKey("alignments.id")),
+            uuid_column("race_id", sa.ForeignKey("races.id")),
+            uuid_column("class_id", sa.ForeignKey("classes.id")),
+            uuid_column("background_id", sa.ForeignKey("backgrounds.id")),
+            sa.Column("experience", sa.BigInteger(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        ),
+        (
+            "character_attributes",
+            uuid_column("character_id", sa.ForeignKey("characters.id"), primary_key=True),
+            *(
+                sa.Column(attribute, sa.Integer(), nullable=False)
+                for attribute in (
+                    "strength", "dexterity", "constitution",
+                    "intelligence", "wisdom", "charisma",
+                )
+            ),
+        ),
+        character_relation(
+            "character_skills", "skills", "skill_id",
+            sa.Column("proficiency_bonus", sa.Integer(), nullable=False),
+        ),
+        character_relation("character_languages", "languages", "language_id"),
+        character_relation("character_proficiencies", "proficiencies", "proficiency_id"),
+        character_relation(
+            "character_spells", "spells", "spell_id",
+            sa.Column("level_slot", sa.Integer(), nullable=False),
+            sa.Column("prepared_flag", sa.Boolean(), nullable=False),
+        ),
+        character_relation(
+            "character_items", "items", "item_id",
+            sa.Column("quantity", sa.Integer(), nullable=False),
+            sa.Column("equipped_flag", sa.Boolean(), nullable=False),
+        ),
+    ]
+
+
+def upgrade() -> None:
+    existing = set()
+    if not op.get_context().as_sql:
+        existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for name, *columns in build_tables():
+        if name not in existing:
+            op.create_table(name, *columns)
+
+
+def downgrade() -> None:
+    for name, *_ in reversed(build_tables()):
+        op.drop_table(name)
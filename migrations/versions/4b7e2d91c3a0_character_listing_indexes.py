@@ -0,0 +1,49 @@
+"""Índices de los listados de personajes y de las claves foráneas de las tablas de relación
+
+Añade los índices compuestos de la paginación por (created_at, id) del
+listado general y del listado por usuario, y un índice por la clave
+foránea secundaria de cada tabla de relación (la primera columna de la
+clave primaria ya cubre character_id).
+
+En Postgres los índices se crean con CONCURRENTLY, fuera de la transacción
+de la migración, para no bloquear las escrituras en tablas grandes.
+
+Revision ID: 4b7e2d91c3a0
+Revises: 1f0c6b3a8e25
+Create Date: 2026-10-17 10:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "4b7e2d91c3a0"
+down_revision: Union[str, None] = "1f0c6b3a8e25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nombre del índice, tabla, columnas)
+INDEXES = [
+    ("ix_characters_created_at_id", "characters", ["created_at", "id"]),
+    ("ix_characters_user_id_created_at_id", "characters", ["user_id", "created_at", "id"]),
+    ("ix_character_skills_skill_id", "character_skills", ["skill_id"]),
+    ("ix_character_languages_language_id", "character_languages", ["language_id"]),
+    ("ix_character_proficiencies_proficiency_id", "character_proficiencies", ["proficiency_id"]),
+    ("ix_character_spells_spell_id", "character_spells", ["spell_id"]),
+    ("ix_character_items_item_id", "character_items", ["item_id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, if_not_exists=True, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, if_exists=True, postgresql_concurrently=True
+            )
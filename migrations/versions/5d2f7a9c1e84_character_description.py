@@ -0,0 +1,26 @@
+"""Columna description de los personajes
+
+La descripción del formulario de creación se guarda con el personaje en
+lugar de descartarse.
+
+Revision ID: 5d2f7a9c1e84
+Revises: e3a8c4f07b12
+Create Date: 2026-10-17 22:00:00
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "5d2f7a9c1e84"
+down_revision: Union[str, None] = "e3a8c4f07b12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("characters", sa.Column("description", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("characters", "description")
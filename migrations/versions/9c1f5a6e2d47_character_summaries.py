@@ -0,0 +1,59 @@
+"""Proyección character_summaries de los listados de personajes
+
+Crea la tabla desnormalizada que leen los listados y la búsqueda por
+nombre, con los nombres de raza, clase, trasfondo y alineamiento ya
+resueltos. La tabla se crea vacía: tras aplicar la migración hay que
+rellenarla con `python -m src.infrastructure.cli rebuild-summaries`.
+
+Revision ID: 9c1f5a6e2d47
+Revises: 4b7e2d91c3a0
+Create Date: 2026-10-17 12:00:00
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+revision: str = "9c1f5a6e2d47"
+down_revision: Union[str, None] = "4b7e2d91c3a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "character_summaries",
+        sa.Column(
+            "character_id", PG_UUID(as_uuid=True),
+            sa.ForeignKey("characters.id", ondelete="CASCADE"), primary_key=True,
+        ),
+        sa.Column("user_id", PG_UUID(as_uuid=True), nullable=False),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("search_name", sa.String(100), nullable=False),
+        sa.Column("player_name", sa.String(100)),
+        sa.Column("level", sa.Integer(), nullable=False),
+        sa.Column("race_name", sa.String(50)),
+        sa.Column("class_name", sa.String(50)),
+        sa.Column("background_name", sa.String(50)),
+        sa.Column("alignment_name", sa.String(50)),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_character_summaries_created_at_id",
+        "character_summaries", ["created_at", "character_id"],
+    )
+    op.create_index(
+        "ix_character_summaries_user_id_created_at_id",
+        "character_summaries", ["user_id", "created_at", "character_id"],
+    )
+    op.create_index(
+        "ix_character_summaries_search_name", "character_summaries", ["search_name"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_character_summaries_search_name", "character_summaries")
+    op.drop_index("ix_character_summaries_user_id_created_at_id", "character_summaries")
+    op.drop_index("ix_character_summaries_created_at_id", "character_summaries")
+    op.drop_table("character_summaries")
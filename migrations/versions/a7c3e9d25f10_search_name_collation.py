@@ -0,0 +1,38 @@
+"""Intercalación "C" de character_summaries.search_name en Postgres
+
+La búsqueda por prefijo filtra con `search_name >= prefijo AND
+search_name < prefijo || U+10FFFF`, que solo es correcto si la columna se
+ordena por código de carácter. Con la intercalación de la base de datos
+(p. ej. en_US.UTF-8) el rango puede dejar fuera nombres que empiezan por el
+prefijo, así que la columna y su índice pasan a la intercalación "C". En
+SQLite la intercalación por defecto (BINARY) ya ordena por bytes.
+
+Revision ID: a7c3e9d25f10
+Revises: 5d2f7a9c1e84
+Create Date: 2026-10-17 23:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "a7c3e9d25f10"
+down_revision: Union[str, None] = "5d2f7a9c1e84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    # Postgres reconstruye el índice ix_character_summaries_search_name
+    op.execute(
+        'ALTER TABLE character_summaries ALTER COLUMN search_name TYPE VARCHAR(100) COLLATE "C"'
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute(
+        'ALTER TABLE character_summaries ALTER COLUMN search_name TYPE VARCHAR(100) COLLATE "default"'
+    )
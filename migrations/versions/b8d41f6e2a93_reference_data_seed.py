@@ -0,0 +1,35 @@
+"""Datos de referencia incorporados
+
+Siembra las razas, clases, trasfondos, alineamientos, habilidades, idiomas,
+competencias, conjuros y objetos del catálogo que sirve /api/catalog con sus
+UUID fijos, de modo que los IDs que envía el formulario de creación existen
+en las tablas de referencia. Las filas que ya existen no se modifican.
+
+Revision ID: b8d41f6e2a93
+Revises: a7c3e9d25f10
+Create Date: 2026-10-18 10:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.infrastructure.db.reference_seed import build_seed_statements, seed_reference_data
+
+revision: str = "b8d41f6e2a93"
+down_revision: Union[str, None] = "a7c3e9d25f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    context = op.get_context()
+    if context.as_sql:
+        for statement in build_seed_statements(context.dialect.name):
+            op.execute(statement)
+    else:
+        seed_reference_data(op.get_bind())
+
+
+def downgrade() -> None:
+    # Las filas sembradas pueden estar referenciadas por personajes; se conservan
+    pass
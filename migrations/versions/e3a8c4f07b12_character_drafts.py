@@ -0,0 +1,42 @@
+"""Tabla character_drafts de los borradores de personajes
+
+Guarda el contenido del formulario de creación de cada borrador como JSON,
+escrito por el búfer de escritura diferida (DraftBuffer).
+
+Revision ID: e3a8c4f07b12
+Revises: 9c1f5a6e2d47
+Create Date: 2026-10-17 18:00:00
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+revision: str = "e3a8c4f07b12"
+down_revision: Union[str, None] = "9c1f5a6e2d47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "character_drafts",
+        sa.Column("id", PG_UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "user_id", PG_UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_character_drafts_user_id_updated_at",
+        "character_drafts", ["user_id", "updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_character_drafts_user_id_updated_at", "character_drafts")
+    op.drop_table("character_drafts")
@@ -13,39 +13,25 @@ from pathlib import Path
 # Agregar src al path para importar módulos
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.infrastructure.translation_service import discover_po_files, compile_po_to_mo, get_mo_path_for_po
+from src.infrastructure.translation_compiler import compile_catalogs
 
 
 def compile_translations():
     """
-    Compila todas las traducciones .po a .mo en desarrollo local.
+    Compila las traducciones .po a .mo cuyo contenido ha cambiado en desarrollo local.
     """
     print("🔄 Compilando traducciones...")
-    
-    po_files_by_lang = discover_po_files()
-    
-    if not po_files_by_lang:
+
+    report = compile_catalogs()
+
+    if not report.compiled and not report.skipped and not report.failed:
         print("⚠️  No se encontraron archivos .po para compilar")
         return
-    
-    compiled_count = 0
-    
-    for lang_code, po_files in po_files_by_lang.items():
-        for po_file in po_files:
-            mo_file = get_mo_path_for_po(po_file)
-            
-            # Verificar si necesita compilación
-            should_compile = True
-            if mo_file.exists():
-                po_mtime = po_file.stat().st_mtime
-                mo_mtime = mo_file.stat().st_mtime
-                should_compile = po_mtime > mo_mtime
-            
-            if should_compile:
-                compile_po_to_mo(po_file, mo_file)
-                compiled_count += 1
-    
-    print(f"✅ Compilación completada: {compiled_count} archivos compilados")
+
+    for po_file, error in report.failed.items():
+        print(f"✗ Error compilando {po_file}: {error}")
+
+    print(f"✅ Compilación completada: {report.summary()}")
 
 
 def main():
@@ -5,8 +5,11 @@ Este módulo contiene los casos de uso para la gestión de personajes,
 incluyendo creación, edición y visualización de personajes.
 """
 
+import asyncio
+import uuid
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+from typing import AsyncContextManager, Dict, List, Any, Optional, Sequence, Tuple
 
 from src.application.interfaces import (
     CharacterInterface,
@@ -15,7 +18,14 @@ from src.application.interfaces import (
     CharacterProficiencyInterface,
     CharacterSkillInterface,
     CharacterSpellInterface,
-    CharacterItemInterface
+    CharacterItemInterface,
+    CharacterSummaryProjection,
+    UnitOfWork
+)
+from src.application.reference_data_cache import (
+    Loader,
+    ReferenceDataCache,
+    reference_data_cache
 )
 
 
@@ -29,17 +39,21 @@ class GetCharacterDataRequest:
 class CreateCharacterRequest:
     """Clase para solicitar la creación de un nuevo personaje."""
     name: str
-    race_id: int
-    background_id: int
-    alignment_id: int
+    race_id: Optional[uuid.UUID]
+    background_id: Optional[uuid.UUID]
+    alignment_id: Optional[uuid.UUID]
     level: int
     description: Optional[str] = None
     attributes: Optional[Dict[str, int]] = None
-    skills: Optional[List[int]] = None
-    languages: Optional[List[int]] = None
-    proficiencies: Optional[List[int]] = None
-    spells: Optional[List[int]] = None
-    items: Optional[List[int]] = None
+    skills: Optional[List[uuid.UUID]] = None
+    languages: Optional[List[uuid.UUID]] = None
+    proficiencies: Optional[List[uuid.UUID]] = None
+    spells: Optional[List[uuid.UUID]] = None
+    items: Optional[List[uuid.UUID]] = None
+    class_id: Optional[uuid.UUID] = None
+    player_name: Optional[str] = None
+    experience: int = 0
+    item_quantities: Optional[Dict[uuid.UUID, int]] = None
     
     def __post_init__(self):
         """Inicializa campos que son None como colecciones vacías."""
@@ -55,6 +69,8 @@ class CreateCharacterRequest:
             self.spells = []
         if self.items is None:
             self.items = []
+        if self.item_quantities is None:
+            self.item_quantities = {}
 
 
 class GetCharacterDataUseCase:
@@ -62,7 +78,8 @@ class GetCharacterDataUseCase:
     
     def __init__(self, race_repository, background_repository, alignment_repository,
                  skill_repository, language_repository, proficiency_repository,
-                 spell_repository, item_repository):
+                 spell_repository, item_repository, class_repository=None,
+                 cache: Optional[ReferenceDataCache] = None):
         self.race_repository = race_repository
         self.background_repository = background_repository
         self.alignment_repository = alignment_repository
@@ -71,36 +88,72 @@ class GetCharacterDataUseCase:
         self.proficiency_repository = proficiency_repository
         self.spell_repository = spell_repository
         self.item_repository = item_repository
+        self.class_repository = class_repository
+        self.cache = cache or reference_data_cache
+    
+    def _loaders(self) -> Dict[str, Loader]:
+        """Función de carga de cada colección de datos de referencia."""
+        loaders = {
+            "races": self.race_repository.get_all,
+            "backgrounds": self.background_repository.get_all,
+            "alignments": self.alignment_repository.get_all,
+            "skills": self.skill_repository.get_all,
+            "languages": self.language_repository.get_all,
+            "proficiencies": self.proficiency_repository.get_all,
+            "spells": self.spell_repository.get_all,
+            "items": self.item_repository.get_all,
+        }
+        if self.class_repository is not None:
+            loaders["classes"] = self.class_repository.get_all
+        return loaders
     
-    async def execute(self, request: GetCharacterDataRequest) -> Dict[str, List[Any]]:
+    def collections(self) -> Tuple[str, ...]:
+        """Nombres de las colecciones que sirve el caso de uso."""
+        return tuple(self._loaders())
+    
+    async def execute(self, request: GetCharacterDataRequest) -> Dict[str, Tuple[Any, ...]]:
         """
         Obtiene todos los datos necesarios para crear un personaje.
         
+        Las colecciones se leen de la caché compartida; las que no están
+        cacheadas se cargan de forma concurrente.
+        
         Args:
             request: Solicitud para obtener los datos
             
         Returns:
-            Dict[str, List[Any]]: Diccionario con todos los datos necesarios
+            Dict[str, Tuple[Any, ...]]: Colecciones de solo lectura, compartidas
+            con la caché
+        """
+        loaders = self._loaders()
+        results = await asyncio.gather(
+            *(self.cache.get_or_load(name, loader) for name, loader in loaders.items())
+        )
+        return dict(zip(loaders, results))
+    
+    async def get_collection(self, name: str) -> Tuple[Any, ...]:
         """
-        races = await self.race_repository.get_all()
-        backgrounds = await self.background_repository.get_all()
-        alignments = await self.alignment_repository.get_all()
-        skills = await self.skill_repository.get_all()
-        languages = await self.language_repository.get_all()
-        proficiencies = await self.proficiency_repository.get_all()
-        spells = await self.spell_repository.get_all()
-        items = await self.item_repository.get_all()
+        Obtiene una sola colección de datos de referencia.
         
-        return {
-            "races": races,
-            "backgrounds": backgrounds,
-            "alignments": alignments,
-            "skills": skills,
-            "languages": languages,
-            "proficiencies": proficiencies,
-            "spells": spells,
-            "items": items
-        }
+        Args:
+            name: Nombre de la colección (p. ej. "races")
+            
+        Returns:
+            Tuple[Any, ...]: Colección de solo lectura, compartida con la caché
+            
+        Raises:
+            KeyError: Si el caso de uso no sirve esa colección
+        """
+        return await self.cache.get_or_load(name, self._loaders()[name])
+    
+    async def warm_up(self) -> int:
+        """
+        Carga en la caché todas las colecciones, p. ej. al arrancar.
+        
+        Returns:
+            int: Número de colecciones cacheadas
+        """
+        return await self.cache.warm_up(self._loaders())
 
 
 class CreateCharacterUseCase:
@@ -109,7 +162,8 @@ class CreateCharacterUseCase:
     def __init__(self, character_repository, attribute_repository,
                  character_skill_repository, character_language_repository,
                  character_proficiency_repository, character_spell_repository,
-                 character_item_repository):
+                 character_item_repository, unit_of_work: Optional[UnitOfWork] = None,
+                 summary_projection: Optional[CharacterSummaryProjection] = None):
         self.character_repository = character_repository
         self.attribute_repository = attribute_repository
         self.character_skill_repository = character_skill_repository
@@ -117,92 +171,132 @@ class CreateCharacterUseCase:
         self.character_proficiency_repository = character_proficiency_repository
         self.character_spell_repository = character_spell_repository
         self.character_item_repository = character_item_repository
+        self.unit_of_work = unit_of_work
+        self.summary_projection = summary_projection
+    
+    def _transaction(self) -> AsyncContextManager[None]:
+        """Transacción de la unidad de trabajo, si se ha configurado."""
+        if self.unit_of_work is None:
+            return nullcontext()
+        return self.unit_of_work.transaction()
+    
+    def _child_repositories(self) -> Tuple[Any, ...]:
+        """Repositorios de los datos asociados, en el orden de `_build_children`."""
+        return (
+            self.attribute_repository,
+            self.character_skill_repository,
+            self.character_language_repository,
+            self.character_proficiency_repository,
+            self.character_spell_repository,
+            self.character_item_repository,
+        )
+    
+    def _build_children(
+        self, request: CreateCharacterRequest, character_id: Any
+    ) -> List[List[Any]]:
+        """Datos asociados de un personaje, una lista por repositorio."""
+        return [
+            [
+                AttributeInterface(id=None, character_id=character_id, name=name, value=value)
+                for name, value in request.attributes.items()
+            ],
+            [
+                CharacterSkillInterface(
+                    id=None, character_id=character_id, skill_id=skill_id, proficiency=True
+                )
+                for skill_id in request.skills
+            ],
+            [
+                CharacterLanguageInterface(
+                    id=None, character_id=character_id, language_id=language_id
+                )
+                for language_id in request.languages
+            ],
+            [
+                CharacterProficiencyInterface(
+                    id=None, character_id=character_id, proficiency_id=proficiency_id
+                )
+                for proficiency_id in request.proficiencies
+            ],
+            [
+                CharacterSpellInterface(id=None, character_id=character_id, spell_id=spell_id)
+                for spell_id in request.spells
+            ],
+            [
+                CharacterItemInterface(
+                    id=None, character_id=character_id, item_id=item_id,
+                    quantity=request.item_quantities.get(item_id, 1)
+                )
+                for item_id in request.items
+            ],
+        ]
     
     async def execute(self, request: CreateCharacterRequest) -> CharacterInterface:
         """
         Crea un nuevo personaje con todos sus datos asociados.
         
+        El personaje y sus datos asociados se guardan en una única transacción,
+        con una inserción de varias filas por tabla en lugar de una por dato.
+        El resumen de los listados se actualiza en esa misma transacción.
+        
         Args:
             request: Datos del personaje a crear
             
         Returns:
             Character: El personaje creado
         """
-        # Crear el personaje principal
-        character = CharacterInterface(
-            id=None,  # ID generado por la BD
-            name=request.name,
-            race_id=request.race_id,
-            background_id=request.background_id,
-            alignment_id=request.alignment_id,
-            level=request.level,
-            description=request.description or ""
-        )
-        
-        # Guardar el personaje para obtener el ID
-        created_character = await self.character_repository.create(character)
-        
-        # Crear y guardar los atributos
-        if request.attributes:
-            for name, value in request.attributes.items():
-                attribute = AttributeInterface(
-                    id=None,
-                    character_id=created_character.id,
-                    name=name,
-                    value=value
-                )
-                await self.attribute_repository.create(attribute)
-        
-        # Crear y guardar las habilidades
-        if request.skills:
-            for skill_id in request.skills:
-                character_skill = CharacterSkillInterface(
-                    id=None,
-                    character_id=created_character.id,
-                    skill_id=skill_id,
-                    proficiency=True
-                )
-                await self.character_skill_repository.create(character_skill)
-        
-        # Crear y guardar los idiomas
-        if request.languages:
-            for language_id in request.languages:
-                character_language = CharacterLanguageInterface(
-                    id=None,
-                    character_id=created_character.id,
-                    language_id=language_id
-                )
-                await self.character_language_repository.create(character_language)
+        return (await self.execute_many([request]))[0]
+    
+    async def execute_many(
+        self, requests: Sequence[CreateCharacterRequest]
+    ) -> List[CharacterInterface]:
+        """
+        Crea varios personajes en una única transacción.
         
-        # Crear y guardar las competencias
-        if request.proficiencies:
-            for proficiency_id in request.proficiencies:
-                character_proficiency = CharacterProficiencyInterface(
-                    id=None,
-                    character_id=created_character.id,
-                    proficiency_id=proficiency_id
-                )
-                await self.character_proficiency_repository.create(character_proficiency)
+        Los datos de todo el lote se agrupan por tabla, de modo que cada tabla
+        recibe una inserción de varias filas para todos los personajes.
         
-        # Crear y guardar los hechizos
-        if request.spells:
-            for spell_id in request.spells:
-                character_spell = CharacterSpellInterface(
-                    id=None,
-                    character_id=created_character.id,
-                    spell_id=spell_id
-                )
-                await self.character_spell_repository.create(character_spell)
+        Args:
+            requests: Datos de los personajes a crear
+            
+        Returns:
+            List[Character]: Los personajes creados, en el mismo orden
+        """
+        characters = [
+            CharacterInterface(
+                id=None,  # ID generado por el repositorio
+                name=request.name,
+                race_id=request.race_id,
+                background_id=request.background_id,
+                alignment_id=request.alignment_id,
+                level=request.level,
+                description=request.description or "",
+                class_id=request.class_id,
+                player_name=request.player_name,
+                experience=request.experience,
+            )
+            for request in requests
+        ]
+        if not characters:
+            return []
         
-        # Crear y guardar los objetos
-        if request.items:
-            for item_id in request.items:
-                character_item = CharacterItemInterface(
-                    id=None,
-                    character_id=created_character.id,
-                    item_id=item_id,
-                    quantity=1  # Valor por defecto
-                )
-                await self.character_item_repository.create(character_item)
+        async with self._transaction():
+            # Guardar los personajes para obtener sus IDs
+            created = await self.character_repository.create_many(characters)
+            
+            # Preparar los datos asociados de cada tabla para todo el lote
+            repositories = self._child_repositories()
+            children: List[List[Any]] = [[] for _ in repositories]
+            for request, character in zip(requests, created):
+                for batch, entities in zip(children, self._build_children(request, character.id)):
+                    batch.extend(entities)
+            
+            # Una inserción por tabla
+            for repository, entities in zip(repositories, children):
+                if entities:
+                    await repository.create_many(entities)
+            
+            if self.summary_projection is not None:
+                await self.summary_projection.refresh([character.id for character in created])
         
-        return created_character
+        return created
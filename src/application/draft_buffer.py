@@ -0,0 +1,327 @@
+"""
+Búfer de escritura diferida de los borradores de personajes.
+
+El formulario de creación envía un parche JSON por cada cambio, así que un
+mismo borrador recibe muchas escrituras seguidas. El búfer aplica cada
+parche en memoria y guarda los borradores modificados de forma periódica,
+de modo que todas las ediciones de un borrador entre dos vaciados se
+escriben una sola vez. Al enviar un borrador o al apagar la aplicación se
+vacía lo pendiente; si un vaciado falla, los borradores vuelven al búfer
+para el siguiente intento.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.application.interfaces import DraftInterface, DraftStore
+
+logger = logging.getLogger(__name__)
+
+# Vaciados recientes cuya duración se conserva para las métricas
+FLUSH_SAMPLES = 100
+
+
+def merge_patch(document: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Aplica un parche JSON Merge Patch (RFC 7386) sin modificar el documento.
+
+    Las claves con valor null se eliminan, los objetos se combinan de forma
+    recursiva y cualquier otro valor reemplaza al anterior.
+
+    Args:
+        document: Documento actual
+        patch: Cambios a aplicar
+
+    Returns:
+        Dict[str, Any]: Documento nuevo con los cambios aplicados
+    """
+    merged = dict(document)
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, dict):
+            current = merged.get(key)
+            merged[key] = merge_patch(current if isinstance(current, dict) else {}, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def document_size(data: Dict[str, Any]) -> int:
+    """Tamaño en bytes del documento codificado en JSON."""
+    return len(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+class DraftBuffer:
+    """
+    Búfer en memoria que agrupa las ediciones de cada borrador.
+
+    Los borradores pendientes se guardan cada `flush_interval` segundos (con
+    `start()`), cuando hay `max_pending` borradores pendientes o al llamar a
+    `flush()`. Con `flush_interval` igual a 0 cada edición se guarda al
+    momento, lo que conviene en serverless, donde no hay tareas en segundo
+    plano entre peticiones.
+    """
+
+    def __init__(
+        self,
+        store: DraftStore,
+        flush_interval: float = 2.0,
+        max_pending: int = 500,
+        max_draft_bytes: int = 64 * 1024,
+    ) -> None:
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_draft_bytes = max_draft_bytes
+        self._pending: Dict[Any, DraftInterface] = {}
+        self._flushing: Dict[Any, DraftInterface] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._edits = 0
+        self._written = 0
+        self._flushes = 0
+        self._forced_flushes = 0
+        self._errors = 0
+        self._flush_ms: List[float] = []
+
+    def _flush_lock(self) -> asyncio.Lock:
+        """Candado que serializa los vaciados, uno por bucle de eventos."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        return self._lock
+
+    def _buffered(self, draft_id: Any) -> Optional[DraftInterface]:
+        """Versión en memoria de un borrador, incluida la que se está guardando."""
+        return self._pending.get(draft_id) or self._flushing.get(draft_id)
+
+    async def _lookup(self, draft_id: Any, user_id: Any) -> Optional[DraftInterface]:
+        """Borrador del usuario, desde el búfer o desde el almacenamiento."""
+        draft = self._buffered(draft_id)
+        if draft is None:
+            loaded = await self.store.get(draft_id)
+            # Otra petición pudo dejarlo en el búfer mientras se leía
+            draft = self._buffered(draft_id) or loaded
+        if draft is None or draft.user_id != user_id:
+            return None
+        return draft
+
+    def _check_size(self, data: Dict[str, Any]) -> None:
+        """Rechaza los borradores mayores que `max_draft_bytes`."""
+        if document_size(data) > self.max_draft_bytes:
+            raise ValueError(f"El borrador supera {self.max_draft_bytes} bytes")
+
+    async def _enqueue(self, draft: DraftInterface) -> DraftInterface:
+        """Marca un borrador como pendiente y vacía el búfer si hace falta."""
+        self._pending[draft.id] = draft
+        self._edits += 1
+        if self.flush_interval <= 0:
+            await self.flush([draft.id])
+        elif len(self._pending) >= self.max_pending:
+            self._forced_flushes += 1
+            await self.flush()
+        return draft
+
+    async def create(self, user_id: Any, data: Dict[str, Any]) -> DraftInterface:
+        """
+        Crea un borrador nuevo; se guarda en el siguiente vaciado.
+
+        Args:
+            user_id: Propietario del borrador
+            data: Contenido inicial
+
+        Returns:
+            DraftInterface: El borrador creado
+
+        Raises:
+            ValueError: Si el contenido supera `max_draft_bytes`
+        """
+        self._check_size(data)
+        now = datetime.now(timezone.utc)
+        draft = DraftInterface(
+            id=uuid.uuid4(), user_id=user_id, data=dict(data), created_at=now, updated_at=now
+        )
+        return await self._enqueue(draft)
+
+    async def get(self, draft_id: Any, user_id: Any) -> Optional[DraftInterface]:
+        """
+        Obtiene la versión más reciente de un borrador.
+
+        Args:
+            draft_id: ID del borrador
+            user_id: Usuario que lo solicita
+
+        Returns:
+            Optional[DraftInterface]: El borrador, o None si no existe o es de otro usuario
+        """
+        return await self._lookup(draft_id, user_id)
+
+    async def list_by_user(self, user_id: Any, limit: int) -> List[DraftInterface]:
+        """
+        Obtiene los borradores más recientes de un usuario, incluidos los pendientes.
+
+        Args:
+            user_id: Propietario de los borradores
+            limit: Número máximo de borradores
+
+        Returns:
+            List[DraftInterface]: Borradores ordenados del más reciente al más antiguo
+        """
+        drafts = {draft.id: draft for draft in await self.store.list_by_user(user_id, limit)}
+        for draft in (*self._flushing.values(), *self._pending.values()):
+            if draft.user_id == user_id:
+                drafts[draft.id] = draft
+        ordered = sorted(drafts.values(), key=lambda draft: draft.updated_at, reverse=True)
+        return ordered[:limit]
+
+    async def patch(
+        self, draft_id: Any, user_id: Any, changes: Dict[str, Any]
+    ) -> Optional[DraftInterface]:
+        """
+        Aplica un parche parcial a un borrador.
+
+        El parche se aplica en memoria; el borrador se guarda en el siguiente
+        vaciado junto con el resto de sus ediciones.
+
+        Args:
+            draft_id: ID del borrador
+            user_id: Usuario que lo edita
+            changes: Parche JSON Merge Patch
+
+        Returns:
+            Optional[DraftInterface]: El borrador actualizado, o None si no existe
+
+        Raises:
+            ValueError: Si el resultado supera `max_draft_bytes`
+        """
+        draft = await self._lookup(draft_id, user_id)
+        if draft is None:
+            return None
+        data = merge_patch(draft.data, changes)
+        self._check_size(data)
+        updated = replace(draft, data=data, updated_at=datetime.now(timezone.utc))
+        return await self._enqueue(updated)
+
+    async def remove(self, draft_id: Any, user_id: Any) -> bool:
+        """
+        Elimina un borrador del búfer y del almacenamiento.
+
+        Args:
+            draft_id: ID del borrador
+            user_id: Usuario que lo elimina
+
+        Returns:
+            bool: False si el borrador no existía o es de otro usuario
+        """
+        if await self._lookup(draft_id, user_id) is None:
+            return False
+        # Tras el vaciado en curso, para que no vuelva a escribir el borrador
+        async with self._flush_lock():
+            buffered = self._pending.pop(draft_id, None)
+            return await self.store.delete(draft_id) or buffered is not None
+
+    async def flush(self, draft_ids: Optional[Iterable[Any]] = None) -> int:
+        """
+        Guarda los borradores pendientes en una sola transacción.
+
+        Args:
+            draft_ids: Borradores a guardar (None: todos los pendientes)
+
+        Returns:
+            int: Número de borradores guardados
+
+        Raises:
+            Exception: El error del almacenamiento; los borradores vuelven al búfer
+        """
+        async with self._flush_lock():
+            if draft_ids is None:
+                self._flushing, self._pending = self._pending, {}
+            else:
+                self._flushing = {
+                    draft_id: self._pending.pop(draft_id)
+                    for draft_id in draft_ids
+                    if draft_id in self._pending
+                }
+            if not self._flushing:
+                return 0
+
+            start = time.perf_counter()
+            try:
+                written = await self.store.save_many(list(self._flushing.values()))
+            except Exception:
+                self._errors += 1
+                # Las ediciones posteriores al inicio del vaciado tienen prioridad
+                for draft_id, draft in self._flushing.items():
+                    self._pending.setdefault(draft_id, draft)
+                raise
+            finally:
+                self._flushing = {}
+
+            self._flush_ms = [*self._flush_ms[1 - FLUSH_SAMPLES:], (time.perf_counter() - start) * 1000]
+            self._flushes += 1
+            self._written += written
+            return written
+
+    async def _run(self) -> None:
+        """Vacía el búfer periódicamente hasta que se cancela la tarea."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Error al guardar los borradores pendientes")
+
+    def start(self) -> None:
+        """Inicia el vaciado periódico en el bucle de eventos actual."""
+        if self.flush_interval > 0 and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Detiene el vaciado periódico y guarda todo lo pendiente."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Se han perdido %s borradores al cerrar", len(self._pending))
+            self._pending = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Información de monitorización del búfer.
+
+        Returns:
+            Dict[str, Any]: Configuración, pendientes, ediciones por escritura
+            (`coalescing_ratio`) y latencia de los últimos vaciados
+        """
+        timings = sorted(self._flush_ms)
+        return {
+            "flush_interval": self.flush_interval,
+            "max_pending": self.max_pending,
+            "max_draft_bytes": self.max_draft_bytes,
+            "pending": len(self._pending),
+            "edits": self._edits,
+            "written": self._written,
+            "coalescing_ratio": round(self._edits / self._written, 2) if self._written else None,
+            "flushes": self._flushes,
+            "forced_flushes": self._forced_flushes,
+            "errors": self._errors,
+            "flush_ms": {
+                "last": round(self._flush_ms[-1], 2) if timings else None,
+                "p50": round(timings[len(timings) // 2], 2) if timings else None,
+                "max": round(timings[-1], 2) if timings else None,
+            },
+        }
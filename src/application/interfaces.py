@@ -5,8 +5,9 @@ Este módulo contiene las interfaces que utiliza la capa de aplicación
 para interactuar con las entidades del dominio.
 """
 
-from typing import Optional
-from dataclasses import dataclass
+from typing import Any, AsyncContextManager, Dict, List, Optional, Protocol, Sequence, TypeVar
+from dataclasses import dataclass, field
+from datetime import datetime
 
 
 @dataclass
@@ -19,6 +20,9 @@ class CharacterInterface:
     alignment_id: int
     level: int
     description: str
+    class_id: Optional[int] = None
+    player_name: Optional[str] = None
+    experience: int = 0
 
 
 @dataclass
@@ -70,3 +74,108 @@ class CharacterItemInterface:
     character_id: int
     item_id: int
     quantity: int
+
+
+@dataclass(frozen=True)
+class CharacterAggregate:
+    """Ficha completa de un personaje con sus datos asociados ya resueltos."""
+    id: Any
+    name: str
+    level: int
+    experience: int = 0
+    player_name: Optional[str] = None
+    description: Optional[str] = None
+    race: Optional[Dict[str, Any]] = None
+    character_class: Optional[Dict[str, Any]] = None
+    background: Optional[Dict[str, Any]] = None
+    alignment: Optional[Dict[str, Any]] = None
+    attributes: Dict[str, int] = field(default_factory=dict)
+    skills: List[Dict[str, Any]] = field(default_factory=list)
+    languages: List[Dict[str, Any]] = field(default_factory=list)
+    proficiencies: List[Dict[str, Any]] = field(default_factory=list)
+    spells: List[Dict[str, Any]] = field(default_factory=list)
+    items: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CharacterPage:
+    """Página de un listado de personajes con el cursor de la siguiente."""
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DraftInterface:
+    """Interfaz para el borrador de un personaje en creación."""
+    id: Any
+    user_id: Any
+    data: Dict[str, Any]
+    created_at: datetime
+    updated_at: datetime
+
+
+T = TypeVar("T")
+
+
+class WriteRepository(Protocol[T]):
+    """Interfaz de escritura de un repositorio de la capa de aplicación."""
+
+    async def create(self, entity: T) -> T:
+        """Crea una entidad y la devuelve con su ID."""
+        ...
+
+    async def create_many(self, entities: Sequence[T]) -> List[T]:
+        """Crea varias entidades con una sola inserción."""
+        ...
+
+
+class UnitOfWork(Protocol):
+    """Interfaz de una unidad de trabajo transaccional."""
+
+    def transaction(self) -> AsyncContextManager[None]:
+        """Abre una transacción que se confirma al salir sin errores."""
+        ...
+
+
+class CharacterAggregateReader(Protocol):
+    """Interfaz de lectura de fichas completas de personajes."""
+
+    async def get(self, character_id: Any) -> Optional[CharacterAggregate]:
+        """Obtiene la ficha de un personaje, o None si no existe."""
+        ...
+
+    async def get_many(self, character_ids: Sequence[Any]) -> List[CharacterAggregate]:
+        """Obtiene las fichas de varios personajes con las mismas consultas."""
+        ...
+
+
+class CharacterSummaryProjection(Protocol):
+    """Interfaz de la proyección de resúmenes de los listados de personajes."""
+
+    async def refresh(self, character_ids: Sequence[Any]) -> int:
+        """Recalcula los resúmenes de varios personajes en la transacción actual."""
+        ...
+
+    async def remove(self, character_ids: Sequence[Any]) -> int:
+        """Elimina los resúmenes de varios personajes en la transacción actual."""
+        ...
+
+
+class DraftStore(Protocol):
+    """Interfaz del almacenamiento persistente de los borradores."""
+
+    async def get(self, draft_id: Any) -> Optional[DraftInterface]:
+        """Obtiene un borrador, o None si no existe."""
+        ...
+
+    async def list_by_user(self, user_id: Any, limit: int) -> List[DraftInterface]:
+        """Obtiene los borradores más recientes de un usuario."""
+        ...
+
+    async def save_many(self, drafts: Sequence[DraftInterface]) -> int:
+        """Guarda varios borradores en una transacción, reemplazando los existentes."""
+        ...
+
+    async def delete(self, draft_id: Any) -> bool:
+        """Elimina un borrador; devuelve False si no existía."""
+        ...
@@ -0,0 +1,168 @@
+"""
+Caché de lectura de los datos de referencia.
+
+Este módulo contiene una caché compartida para las colecciones que casi
+nunca cambian (razas, trasfondos, conjuros...). La primera petición carga
+cada colección desde su repositorio y el resto la sirven desde memoria; las
+peticiones concurrentes de una colección que se está cargando esperan a esa
+misma carga en lugar de lanzar otra consulta. Las entradas se invalidan
+subiendo la versión de la caché.
+
+Las colecciones se guardan inmutables (tuplas de filas de solo lectura) y se
+devuelven sin copiar: todos los llamantes comparten el mismo objeto, que no
+cambia mientras la entrada siga vigente.
+"""
+
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+Loader = Callable[[], Awaitable[List[Any]]]
+
+
+def freeze(value: Any) -> Any:
+    """
+    Convierte un valor en una versión de solo lectura.
+
+    Los diccionarios pasan a `MappingProxyType` y las listas a tuplas, de
+    forma recursiva; el resto de valores se devuelven tal cual.
+
+    Args:
+        value: Fila o valor leído del repositorio
+
+    Returns:
+        Any: Valor que no puede modificarse
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class ReferenceDataCache:
+    """Caché de lectura por colección con invalidación por versión."""
+
+    def __init__(self) -> None:
+        self._version = 0
+        self._generations: Dict[str, int] = {}
+        self._entries: Dict[str, Tuple[Tuple[int, int], Tuple[Any, ...]]] = {}
+        self._loading: Dict[str, "asyncio.Future[Tuple[Any, ...]]"] = {}
+        self._load_times: Dict[str, float] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._errors = 0
+
+    @property
+    def version(self) -> int:
+        """Versión actual de los datos cacheados."""
+        return self._version
+
+    def _stamp(self, name: str) -> Tuple[int, int]:
+        """Versión global y generación de una colección."""
+        return self._version, self._generations.get(name, 0)
+
+    async def get_or_load(self, name: str, loader: Loader) -> Tuple[Any, ...]:
+        """
+        Obtiene una colección de la caché o la carga con `loader`.
+
+        Args:
+            name: Nombre de la colección
+            loader: Función asíncrona que lee la colección del repositorio
+
+        Returns:
+            Tuple[Any, ...]: Colección cacheada, con filas de solo lectura
+        """
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == self._stamp(name):
+            self._hits += 1
+            return entry[1]
+
+        pending = self._loading.get(name)
+        if pending is not None:
+            self._coalesced += 1
+            return await asyncio.shield(pending)
+
+        self._misses += 1
+        future: "asyncio.Future[Tuple[Any, ...]]" = asyncio.get_running_loop().create_future()
+        self._loading[name] = future
+        stamp = self._stamp(name)
+        start = time.perf_counter()
+        try:
+            items = tuple(freeze(item) for item in await loader())
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            self._errors += 1
+            future.set_exception(error)
+            # Evita el aviso de excepción no recuperada si nadie más esperaba
+            future.exception()
+            raise
+        finally:
+            if self._loading.get(name) is future:
+                del self._loading[name]
+
+        self._load_times[name] = (time.perf_counter() - start) * 1000
+        # Una invalidación durante la carga descarta el resultado
+        if stamp == self._stamp(name):
+            self._entries[name] = (stamp, items)
+        future.set_result(items)
+        return items
+
+    async def warm_up(self, loaders: Mapping[str, Loader]) -> int:
+        """
+        Carga por adelantado varias colecciones de forma concurrente.
+
+        Args:
+            loaders: Función de carga de cada colección
+
+        Returns:
+            int: Número de colecciones cacheadas
+        """
+        await asyncio.gather(
+            *(self.get_or_load(name, loader) for name, loader in loaders.items())
+        )
+        return len(self._entries)
+
+    def invalidate(self, name: Optional[str] = None) -> int:
+        """
+        Invalida una colección o, sin nombre, todas.
+
+        Args:
+            name: Colección a invalidar (opcional)
+
+        Returns:
+            int: Nueva versión de la caché
+        """
+        if name is None:
+            self._version += 1
+            self._entries = {}
+        else:
+            self._generations[name] = self._generations.get(name, 0) + 1
+            self._entries.pop(name, None)
+        return self._version
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Información de monitorización de la caché.
+
+        Returns:
+            Dict[str, Any]: Versión, entradas, aciertos, fallos y tiempos de carga
+        """
+        return {
+            "version": self._version,
+            "entries": {name: len(items) for name, (_, items) in self._entries.items()},
+            "loading": sorted(self._loading),
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "errors": self._errors,
+            "load_ms": {name: round(ms, 2) for name, ms in self._load_times.items()},
+        }
+
+
+# Instancia compartida por todos los casos de uso
+reference_data_cache = ReferenceDataCache()
@@ -7,55 +7,114 @@ de gestión de personajes de rol.
 """
 
 import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator
 from pathlib import Path
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response, RedirectResponse
+from starlette.responses import Response
 from starlette.requests import Request as StarletteRequest
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import uvicorn
 
 from .infrastructure.translation_service import translation_service
 from src.infrastructure.i18n import I18nConfig
 from src.infrastructure.config import settings
+from src.infrastructure.db.character_drafts import draft_buffer
+from src.infrastructure.db.engine import database
 from src.infrastructure.web.home_controller import router as home_router
 from src.infrastructure.web.status_controller import router as status_router
-from src.infrastructure.web.not_found_controller import router as not_found_router
-from src.infrastructure.web.character_controller import router as character_router
+from src.infrastructure.web.not_found_controller import render_not_found_page, router as not_found_router
+from src.infrastructure.web.character_controller import character_data, router as character_router
+from src.infrastructure.web.draft_controller import router as draft_router
+from src.infrastructure.web.search_controller import router as search_router
 
 
-class I18nMiddleware(BaseHTTPMiddleware):
-    """Middleware para configurar el contexto de internacionalización."""
+@lru_cache(maxsize=None)
+def build_language_cookie(language: str) -> bytes:
+    """
+    Genera una sola vez el header Set-Cookie de cada idioma.
+
+    Args:
+        language: Código de idioma
+
+    Returns:
+        bytes: Valor del header Set-Cookie
+    """
+    response = Response()
+    response.set_cookie(
+        key=I18nConfig.LANGUAGE_COOKIE_NAME,
+        value=language,
+        max_age=I18nConfig.LANGUAGE_COOKIE_MAX_AGE,
+        httponly=True,
+        samesite="lax"
+    )
+    return response.headers["set-cookie"].encode("latin-1")
+
+
+class I18nMiddleware:
+    """
+    Middleware ASGI para configurar el contexto de internacionalización.
+
+    Resuelve el idioma una vez por petición, lo deja en el estado del scope
+    (`request.state.language`) y solo añade la cookie de idioma cuando su
+    valor cambia.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Procesa la petición y configura el contexto de idioma.
 
         Args:
-            request: Petición HTTP
-            call_next: Siguiente middleware en la cadena
-
-        Returns:
-            Response: Respuesta HTTP procesada con cookie de idioma configurada
+            scope: Scope ASGI de la petición
+            receive: Canal de recepción de mensajes
+            send: Canal de envío de mensajes
         """
-        # Procesar la petición
-        response = await call_next(request)
-        
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = StarletteRequest(scope)
         selected_lang = translation_service.get_language_from_request(request)
-        
-        # Si hay un idioma seleccionado, configurar la cookie
-        if selected_lang:
-            response.set_cookie(
-                key=I18nConfig.LANGUAGE_COOKIE_NAME,
-                value=selected_lang,
-                max_age=I18nConfig.LANGUAGE_COOKIE_MAX_AGE,
-                httponly=True,
-                samesite="lax"
-            )
-            
-        return response
+
+        # La cookie ya tiene el idioma seleccionado: no hay nada que añadir
+        if request.cookies.get(I18nConfig.LANGUAGE_COOKIE_NAME) == selected_lang:
+            await self.app(scope, receive, send)
+            return
+
+        cookie = build_language_cookie(selected_lang)
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Ciclo de vida de la aplicación: prepara la base de datos, carga en la
+    caché los datos de referencia, vacía periódicamente los borradores
+    pendientes y, al apagar, guarda los que queden antes de cerrar el pool.
+
+    Args:
+        app: Aplicación FastAPI
+    """
+    await database.connect()
+    await character_data.warm_up()
+    draft_buffer.start()
+    yield
+    await draft_buffer.close()
+    await database.dispose()
 
 
 def create_app() -> FastAPI:
@@ -69,6 +128,7 @@ def create_app() -> FastAPI:
         title=settings.app_name,
         description="Aplicación web para crear y gestionar personajes de rol",
         version=settings.app_version,
+        lifespan=lifespan,
         # docs_url="/docs",
         # redoc_url="/redoc",
     )
@@ -90,6 +150,8 @@ def create_app() -> FastAPI:
     app.include_router(status_router, tags=["Health"])
     app.include_router(not_found_router, tags=["NotFound"])
     app.include_router(character_router, tags=["Characters"])
+    app.include_router(draft_router, tags=["Characters API"])
+    app.include_router(search_router, tags=["Characters API"])
 
     # Configurar archivos estáticos solo en desarrollo
     if not os.getenv("VERCEL"):
@@ -107,9 +169,14 @@ app = create_app()
 @app.exception_handler(404)
 async def custom_404_handler(request: StarletteRequest, exc: StarletteHTTPException):
     """
-    Handler global para redirigir a la página /404 personalizada en caso de error 404.
+    Handler global que responde con la página 404 traducida, sin redirigir.
+
+    Las rutas de la API conservan la respuesta JSON de FastAPI con el
+    detalle del error.
     """
-    return RedirectResponse(url="/404")
+    if request.url.path == "/api" or request.url.path.startswith("/api/"):
+        return await http_exception_handler(request, exc)
+    return render_not_found_page(request)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,189 @@
+"""
+Comandos de línea de órdenes de la aplicación.
+
+Este módulo agrupa las tareas de build y mantenimiento que se ejecutan
+fuera del servidor web, por ejemplo:
+`python -m src.infrastructure.cli build-translations`.
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from typing import Any, List, Optional
+
+
+def build_translations(args: argparse.Namespace) -> int:
+    """
+    Genera la instantánea de traducciones para producción.
+
+    Args:
+        args: Argumentos de la línea de órdenes
+
+    Returns:
+        int: Código de salida
+    """
+    from src.infrastructure.translation_service import build_translation_snapshot
+
+    build_translation_snapshot(output=args.output)
+    return 0
+
+
+def compile_translations(args: argparse.Namespace) -> int:
+    """
+    Compila los catálogos .po modificados a .mo e informa del resultado.
+
+    Args:
+        args: Argumentos de la línea de órdenes
+
+    Returns:
+        int: Código de salida (1 si algún catálogo falla)
+    """
+    from src.infrastructure.translation_compiler import compile_catalogs
+
+    report = compile_catalogs(workers=args.workers, force=args.force)
+    for po_file, error in report.failed.items():
+        print(f"✗ Error compilando {po_file}: {error}")
+    print(f"✅ Compilación completada: {report.summary()}")
+    return 1 if report.failed else 0
+
+
+def compile_templates(args: argparse.Namespace) -> int:
+    """
+    Precompila los templates HTML a módulos de Python.
+
+    Args:
+        args: Argumentos de la línea de órdenes
+
+    Returns:
+        int: Código de salida
+    """
+    from src.infrastructure.templating import compile_templates as compile_all
+
+    count = compile_all(output=args.output)
+    print(f"✅ {count} templates precompilados")
+    return 0
+
+
+async def _run_summaries(command: str, batch_size: int) -> Any:
+    """Ejecuta una operación de la proyección de resúmenes con la base de datos configurada."""
+    from src.infrastructure.db.character_summaries import CharacterSummaryRepository
+    from src.infrastructure.db.engine import database
+
+    try:
+        async with database.session() as session:
+            repository = CharacterSummaryRepository(session)
+            if command == "rebuild":
+                return await repository.rebuild(batch_size)
+            return await repository.check(batch_size)
+    finally:
+        await database.dispose()
+
+
+def rebuild_summaries(args: argparse.Namespace) -> int:
+    """
+    Regenera la proyección de resúmenes de personajes (backfill).
+
+    Args:
+        args: Argumentos de la línea de órdenes
+
+    Returns:
+        int: Código de salida
+    """
+    written = asyncio.run(_run_summaries("rebuild", args.batch_size))
+    print(f"✅ {written} resúmenes de personajes regenerados")
+    return 0
+
+
+def check_summaries(args: argparse.Namespace) -> int:
+    """
+    Comprueba que la proyección de resúmenes coincide con las tablas de origen.
+
+    Args:
+        args: Argumentos de la línea de órdenes
+
+    Returns:
+        int: Código de salida (1 si hay diferencias)
+    """
+    report = asyncio.run(_run_summaries("check", args.batch_size))
+    for label, character_ids in (
+        ("Sin resumen", report.missing),
+        ("Desactualizado", report.stale),
+        ("Huérfano", report.orphaned),
+    ):
+        for character_id in character_ids:
+            print(f"✗ {label}: {character_id}")
+    print(f"{'✅' if report.consistent else '✗'} {report.summary()}")
+    return 0 if report.consistent else 1
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Crea el parser de argumentos con todos los subcomandos disponibles.
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.infrastructure.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    translations_parser = subparsers.add_parser(
+        "build-translations",
+        help="Compila todos los catálogos .po en una instantánea versionada",
+    )
+    translations_parser.add_argument(
+        "--output", type=Path, default=None, help="Ruta del fichero de instantánea"
+    )
+    translations_parser.set_defaults(handler=build_translations)
+
+    compile_parser = subparsers.add_parser(
+        "compile-translations",
+        help="Compila a .mo los catálogos .po cuyo contenido ha cambiado",
+    )
+    compile_parser.add_argument(
+        "--workers", type=int, default=0, help="Procesos a usar (0: todos los CPU)"
+    )
+    compile_parser.add_argument(
+        "--force", action="store_true", help="Recompilar aunque no haya cambios"
+    )
+    compile_parser.set_defaults(handler=compile_translations)
+
+    templates_parser = subparsers.add_parser(
+        "compile-templates",
+        help="Precompila los templates de Jinja2 a módulos de Python",
+    )
+    templates_parser.add_argument(
+        "--output", type=Path, default=None, help="Directorio de salida"
+    )
+    templates_parser.set_defaults(handler=compile_templates)
+
+    for name, handler, help_text in (
+        ("rebuild-summaries", rebuild_summaries,
+         "Regenera la proyección character_summaries desde las tablas de origen"),
+        ("check-summaries", check_summaries,
+         "Comprueba que character_summaries coincide con las tablas de origen"),
+    ):
+        summaries_parser = subparsers.add_parser(name, help=help_text)
+        summaries_parser.add_argument(
+            "--batch-size", type=int, default=5000, help="Personajes por lote"
+        )
+        summaries_parser.set_defaults(handler=handler)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de órdenes.
+
+    Args:
+        argv: Argumentos a procesar (por defecto los del proceso)
+
+    Returns:
+        int: Código de salida
+    """
+    args = create_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
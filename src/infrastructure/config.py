@@ -6,6 +6,7 @@ utilizadas por la aplicación de gestión de personajes de rol.
 """
 
 import os
+import tempfile
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -40,6 +41,10 @@ class Settings:
     postgres_database: str = os.getenv("POSTGRES_DATABASE", "postgres")
     postgres_prisma_url: Optional[str] = os.getenv("POSTGRES_PRISMA_URL")
     postgres_url_non_pooling: Optional[str] = os.getenv("POSTGRES_URL_NON_POOLING")
+    database_url: Optional[str] = os.getenv("DATABASE_URL")
+    database_pool_profile: str = os.getenv(
+        "DATABASE_POOL_PROFILE", "serverless" if os.getenv("VERCEL") else "long-running"
+    ).lower()
 
     # Configuración Supabase
     supabase_url: str = os.getenv(
@@ -79,6 +84,57 @@ class Settings:
     allowed_languages: list[str] = ["es", "en"]
     default_locale: str = "es"
 
+    # Configuración de recarga de traducciones
+    translations_reload: bool = (
+        os.getenv("TRANSLATIONS_RELOAD", "false" if os.getenv("VERCEL") else "true")
+        .lower()
+        == "true"
+    )
+    translations_reload_interval: float = float(
+        os.getenv("TRANSLATIONS_RELOAD_INTERVAL", "1.0")
+    )
+    translations_catalog_loader: str = os.getenv(
+        "TRANSLATIONS_CATALOG_LOADER", "gettext"
+    ).lower()
+    translations_compile_workers: int = int(
+        os.getenv("TRANSLATIONS_COMPILE_WORKERS", "0")
+    )
+    translations_miss_limit: int = int(os.getenv("TRANSLATIONS_MISS_LIMIT", "1000"))
+    translations_dev_mode: bool = (
+        os.getenv("TRANSLATIONS_DEV_MODE", "false" if os.getenv("VERCEL") else "true")
+        .lower()
+        == "true"
+    )
+
+    # Configuración de templates y caché de páginas
+    templates_reload: bool = (
+        os.getenv("TEMPLATES_RELOAD", "false" if os.getenv("VERCEL") else "true")
+        .lower()
+        == "true"
+    )
+    templates_reload_interval: float = float(
+        os.getenv("TEMPLATES_RELOAD_INTERVAL", "1.0")
+    )
+    templates_bytecode_cache_dir: str = os.getenv(
+        "TEMPLATES_BYTECODE_CACHE_DIR",
+        os.path.join(tempfile.gettempdir(), "roleplaying-characters-jinja"),
+    )
+    templates_inline_translations: bool = (
+        os.getenv("TEMPLATES_INLINE_TRANSLATIONS", "true").lower() == "true"
+    )
+    page_cache: bool = os.getenv("PAGE_CACHE", "true").lower() == "true"
+    page_cache_max_entries: int = int(os.getenv("PAGE_CACHE_MAX_ENTRIES", "256"))
+
+    # Caché HTTP de los datos de referencia de la API (segundos)
+    api_cache_max_age: int = int(os.getenv("API_CACHE_MAX_AGE", "300"))
+
+    # Borradores de personajes: vaciado del búfer de escritura (segundos, 0 = al momento)
+    drafts_flush_interval: float = float(
+        os.getenv("DRAFTS_FLUSH_INTERVAL", "0" if os.getenv("VERCEL") else "2.0")
+    )
+    drafts_max_pending: int = int(os.getenv("DRAFTS_MAX_PENDING", "500"))
+    drafts_max_bytes: int = int(os.getenv("DRAFTS_MAX_BYTES", "65536"))
+
 
 # Instancia global de configuración
 settings = Settings()
@@ -0,0 +1,6 @@
+"""
+Paquete de base de datos de infraestructura.
+
+Este paquete contiene los modelos de SQLAlchemy y las implementaciones de
+los repositorios que usan los casos de uso de la capa de aplicación.
+"""
@@ -0,0 +1,196 @@
+"""
+Lectura de fichas completas de personajes sin consultas N+1.
+
+Este módulo carga un personaje (o muchos) con sus atributos, habilidades,
+idiomas, competencias, conjuros y objetos en un número fijo de consultas:
+una para los personajes con su raza, clase, trasfondo y alineamiento
+(LEFT JOIN), una para los atributos y una por cada tabla de relación con su
+tabla de referencia (JOIN), todas filtradas con `IN` sobre el lote de IDs.
+
+Es un modelo de lectura: las filas se leen con SQLAlchemy Core y se agrupan
+en diccionarios, sin construir objetos del ORM ni pasar por el identity
+map, que con cientos de personajes cuesta más que las propias consultas.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces import CharacterAggregate
+from src.infrastructure.db.models import (
+    AlignmentModel,
+    AttributeModel,
+    BackgroundModel,
+    CharacterItemModel,
+    CharacterLanguageModel,
+    CharacterModel,
+    CharacterProficiencyModel,
+    CharacterSkillModel,
+    CharacterSpellModel,
+    ClassModel,
+    ItemModel,
+    LanguageModel,
+    ProficiencyModel,
+    RaceModel,
+    SkillModel,
+    SpellModel,
+)
+from src.infrastructure.db.repositories import ATTRIBUTE_NAMES
+
+# IDs por consulta, por debajo del límite de parámetros de los drivers
+MAX_IDS_PER_QUERY = 500
+
+# Referencias de un personaje: campo de la ficha, columna y tabla de referencia
+CHARACTER_REFERENCES: Tuple[Tuple[str, str, Table], ...] = (
+    ("race", "race_id", RaceModel.__table__),
+    ("character_class", "class_id", ClassModel.__table__),
+    ("background", "background_id", BackgroundModel.__table__),
+    ("alignment", "alignment_id", AlignmentModel.__table__),
+)
+
+# Tablas de relación: campo de la ficha, tabla, columna de la referencia,
+# tabla de referencia y columnas adicionales (nombre en la ficha, columna)
+CHARACTER_COLLECTIONS: Tuple[Tuple[str, Table, str, Table, Tuple[Tuple[str, str], ...]], ...] = (
+    ("skills", CharacterSkillModel.__table__, "skill_id", SkillModel.__table__,
+     (("proficiency_bonus", "proficiency_bonus"),)),
+    ("languages", CharacterLanguageModel.__table__, "language_id", LanguageModel.__table__, ()),
+    ("proficiencies", CharacterProficiencyModel.__table__, "proficiency_id",
+     ProficiencyModel.__table__, ()),
+    ("spells", CharacterSpellModel.__table__, "spell_id", SpellModel.__table__,
+     (("level_slot", "level_slot"), ("prepared", "prepared_flag"))),
+    ("items", CharacterItemModel.__table__, "item_id", ItemModel.__table__,
+     (("quantity", "quantity"), ("equipped", "equipped_flag"))),
+)
+
+
+def chunks(values: Sequence[Any], size: Optional[int] = None) -> List[Sequence[Any]]:
+    """Divide los IDs en lotes de como mucho `size` elementos (por defecto MAX_IDS_PER_QUERY)."""
+    size = size or MAX_IDS_PER_QUERY
+    return [values[start:start + size] for start in range(0, len(values), size)]
+
+
+class CharacterAggregateRepository:
+    """Repositorio de lectura de fichas completas de personajes."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, character_id: Any) -> Optional[CharacterAggregate]:
+        """
+        Obtiene la ficha de un personaje.
+
+        Args:
+            character_id: ID del personaje
+
+        Returns:
+            Optional[CharacterAggregate]: Ficha del personaje o None si no existe
+        """
+        aggregates = await self.get_many([character_id])
+        return aggregates[0] if aggregates else None
+
+    async def get_many(self, character_ids: Sequence[Any]) -> List[CharacterAggregate]:
+        """
+        Obtiene las fichas de varios personajes con las mismas consultas que uno.
+
+        Se ejecutan 7 consultas por cada lote de hasta MAX_IDS_PER_QUERY IDs.
+
+        Args:
+            character_ids: IDs de los personajes
+
+        Returns:
+            List[CharacterAggregate]: Fichas en el orden de los IDs, sin los que no existen
+        """
+        sheets: Dict[Any, Dict[str, Any]] = {}
+        for batch in chunks(list(dict.fromkeys(character_ids))):
+            await self._load_characters(batch, sheets)
+            found = [character_id for character_id in batch if character_id in sheets]
+            if found:
+                await self._load_attributes(found, sheets)
+                for collection in CHARACTER_COLLECTIONS:
+                    await self._load_collection(found, sheets, *collection)
+
+        return [
+            CharacterAggregate(**sheets[character_id])
+            for character_id in character_ids
+            if character_id in sheets
+        ]
+
+    async def _load_characters(
+        self, character_ids: Sequence[Any], sheets: Dict[Any, Dict[str, Any]]
+    ) -> None:
+        """Lee los personajes con sus referencias en una consulta con LEFT JOIN."""
+        characters = CharacterModel.__table__
+        columns = [characters.c.id, characters.c.name, characters.c.level,
+                   characters.c.experience, characters.c.player_name,
+                   characters.c.description]
+        query = select(*columns)
+        for field, column, table in CHARACTER_REFERENCES:
+            alias = table.alias(field)
+            query = query.add_columns(
+                alias.c.id.label(f"{field}_id"), alias.c.name.label(f"{field}_name")
+            ).outerjoin(alias, alias.c.id == characters.c[column])
+
+        result = await self.session.execute(query.where(characters.c.id.in_(character_ids)))
+        for row in result.mappings():
+            sheet = {
+                "id": row["id"],
+                "name": row["name"],
+                "level": row["level"],
+                "experience": row["experience"] or 0,
+                "player_name": row["player_name"],
+                "description": row["description"],
+            }
+            for field, _, _ in CHARACTER_REFERENCES:
+                reference_id = row[f"{field}_id"]
+                sheet[field] = (
+                    {"id": reference_id, "name": row[f"{field}_name"]}
+                    if reference_id is not None else None
+                )
+            for field, *_ in CHARACTER_COLLECTIONS:
+                sheet[field] = []
+            sheet["attributes"] = {}
+            sheets[row["id"]] = sheet
+
+    async def _load_attributes(
+        self, character_ids: Sequence[Any], sheets: Dict[Any, Dict[str, Any]]
+    ) -> None:
+        """Lee los atributos de todos los personajes del lote."""
+        table = AttributeModel.__table__
+        result = await self.session.execute(
+            select(table).where(table.c.character_id.in_(character_ids))
+        )
+        for row in result.mappings():
+            sheets[row["character_id"]]["attributes"] = {
+                name: row[name] for name in ATTRIBUTE_NAMES
+            }
+
+    async def _load_collection(
+        self,
+        character_ids: Sequence[Any],
+        sheets: Dict[Any, Dict[str, Any]],
+        field: str,
+        table: Table,
+        reference_column: str,
+        reference: Table,
+        extra: Tuple[Tuple[str, str], ...],
+    ) -> None:
+        """Lee una tabla de relación con su tabla de referencia para todo el lote."""
+        query = (
+            select(
+                table.c.character_id,
+                reference.c.id,
+                reference.c.name,
+                *(table.c[column].label(name) for name, column in extra),
+            )
+            .join(reference, reference.c.id == table.c[reference_column])
+            .where(table.c.character_id.in_(character_ids))
+            .order_by(table.c.character_id, reference.c.name)
+        )
+        result = await self.session.execute(query)
+        for row in result.mappings():
+            sheets[row["character_id"]][field].append({
+                "id": row["id"],
+                "name": row["name"],
+                **{name: row[name] for name, _ in extra},
+            })
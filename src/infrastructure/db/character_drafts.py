@@ -0,0 +1,147 @@
+"""
+Almacenamiento de los borradores de personajes.
+
+Los borradores se escriben a través de `draft_buffer`, que agrupa en
+memoria las ediciones de cada borrador y las guarda periódicamente con
+`CharacterDraftRepository.save_many`: una transacción por vaciado que
+reemplaza las filas con un DELETE y un INSERT ejecutado como executemany.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, AsyncContextManager, Callable, List, Mapping, Optional, Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.draft_buffer import DraftBuffer
+from src.application.interfaces import DraftInterface
+from src.infrastructure.config import settings
+from src.infrastructure.db.character_aggregate import chunks
+from src.infrastructure.db.engine import database
+from src.infrastructure.db.models import CharacterDraftModel
+
+drafts = CharacterDraftModel.__table__
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+def as_utc(value: datetime) -> datetime:
+    """Añade la zona UTC a las fechas que SQLite devuelve sin zona."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def to_draft(row: Mapping[str, Any]) -> DraftInterface:
+    """
+    Convierte una fila de `character_drafts` en un borrador.
+
+    Args:
+        row: Fila de la tabla
+
+    Returns:
+        DraftInterface: Borrador con las fechas en UTC
+    """
+    return DraftInterface(
+        id=row["id"],
+        user_id=row["user_id"],
+        data=row["data"],
+        created_at=as_utc(row["created_at"]),
+        updated_at=as_utc(row["updated_at"]),
+    )
+
+
+class CharacterDraftRepository:
+    """
+    Repositorio de borradores de personajes.
+
+    Abre una sesión propia en cada operación, ya que el búfer guarda los
+    borradores desde una tarea en segundo plano, fuera de cualquier petición.
+    """
+
+    def __init__(self, session_factory: SessionFactory):
+        self.session_factory = session_factory
+
+    async def get(self, draft_id: uuid.UUID) -> Optional[DraftInterface]:
+        """
+        Obtiene un borrador.
+
+        Args:
+            draft_id: ID del borrador
+
+        Returns:
+            Optional[DraftInterface]: El borrador, o None si no existe
+        """
+        async with self.session_factory() as session:
+            row = (await session.execute(
+                select(drafts).where(drafts.c.id == draft_id)
+            )).mappings().first()
+        return to_draft(row) if row is not None else None
+
+    async def list_by_user(self, user_id: uuid.UUID, limit: int) -> List[DraftInterface]:
+        """
+        Obtiene los borradores más recientes de un usuario.
+
+        Args:
+            user_id: Propietario de los borradores
+            limit: Número máximo de borradores
+
+        Returns:
+            List[DraftInterface]: Borradores del más reciente al más antiguo
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(drafts).where(drafts.c.user_id == user_id)
+                .order_by(drafts.c.updated_at.desc()).limit(limit)
+            )
+            return [to_draft(row) for row in result.mappings()]
+
+    async def save_many(self, items: Sequence[DraftInterface]) -> int:
+        """
+        Guarda varios borradores en una transacción, reemplazando los existentes.
+
+        Args:
+            items: Borradores a guardar
+
+        Returns:
+            int: Número de borradores guardados
+        """
+        rows = [
+            {
+                "id": draft.id,
+                "user_id": draft.user_id,
+                "data": draft.data,
+                "created_at": draft.created_at,
+                "updated_at": draft.updated_at,
+            }
+            for draft in items
+        ]
+        async with self.session_factory() as session, session.begin():
+            for batch in chunks(rows):
+                await session.execute(
+                    delete(drafts).where(drafts.c.id.in_([row["id"] for row in batch]))
+                )
+                await session.execute(insert(drafts), batch)
+        return len(rows)
+
+    async def delete(self, draft_id: uuid.UUID) -> bool:
+        """
+        Elimina un borrador.
+
+        Args:
+            draft_id: ID del borrador
+
+        Returns:
+            bool: False si el borrador no existía
+        """
+        async with self.session_factory() as session, session.begin():
+            result = await session.execute(delete(drafts).where(drafts.c.id == draft_id))
+        return result.rowcount > 0
+
+
+# Búfer compartido por todas las peticiones; se vacía en el ciclo de vida de la aplicación
+draft_buffer = DraftBuffer(
+    CharacterDraftRepository(database.session),
+    flush_interval=settings.drafts_flush_interval,
+    max_pending=settings.drafts_max_pending,
+    max_draft_bytes=settings.drafts_max_bytes,
+)
@@ -0,0 +1,161 @@
+"""
+Listados paginados de personajes.
+
+Este módulo pagina los listados por clave (keyset) sobre `(created_at, id)`
+en orden descendente: cada página continúa desde la última fila de la
+anterior con `WHERE (created_at, id) < (:created_at, :id)`, que recorre el
+índice compuesto desde ese punto. A diferencia de OFFSET, el coste de una
+página no depende de cuántas haya antes.
+
+Los listados leen solo la proyección `character_summaries` (ver
+character_summaries), que ya incluye los nombres de la raza, la clase, el
+trasfondo y el alineamiento, en lugar de unir `characters` con sus tablas
+de referencia en cada petición.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces import CharacterPage
+from src.infrastructure.db.models import CharacterSummaryModel
+from src.infrastructure.search_index import normalize
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Mayor carácter Unicode: cota superior de los nombres que empiezan por un prefijo
+MAX_CHARACTER = "\U0010ffff"
+
+# Columnas que muestra el listado
+LIST_COLUMNS = (
+    CharacterSummaryModel.character_id.label("id"),
+    CharacterSummaryModel.name,
+    CharacterSummaryModel.player_name,
+    CharacterSummaryModel.level,
+    CharacterSummaryModel.race_name,
+    CharacterSummaryModel.class_name,
+    CharacterSummaryModel.background_name,
+    CharacterSummaryModel.alignment_name,
+    CharacterSummaryModel.created_at,
+)
+
+
+def encode_cursor(created_at: datetime, character_id: uuid.UUID) -> str:
+    """
+    Codifica la posición de la última fila de una página.
+
+    Args:
+        created_at: Fecha de creación de la fila
+        character_id: ID de la fila
+
+    Returns:
+        str: Cursor opaco apto para URLs
+    """
+    payload = json.dumps([created_at.isoformat(), character_id.hex], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decodifica un cursor generado por `encode_cursor`.
+
+    Args:
+        cursor: Cursor recibido en la petición
+
+    Returns:
+        Tuple[datetime, uuid.UUID]: Fecha de creación e ID de la última fila vista
+
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, character_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), uuid.UUID(character_id)
+    except (binascii.Error, json.JSONDecodeError, TypeError, ValueError):
+        raise ValueError("Cursor de paginación no válido") from None
+
+
+class CharacterListRepository:
+    """Repositorio de listados paginados de personajes."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_page(
+        self,
+        user_id: Optional[uuid.UUID] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        search: Optional[str] = None,
+    ) -> CharacterPage:
+        """
+        Obtiene una página de personajes, del más reciente al más antiguo.
+
+        Args:
+            user_id: Limita el listado a los personajes de un usuario (opcional)
+            cursor: Cursor devuelto por la página anterior (None: primera página)
+            limit: Número de personajes por página (entre 1 y MAX_PAGE_SIZE)
+            search: Prefijo del nombre, sin distinguir mayúsculas ni acentos (opcional)
+
+        Returns:
+            CharacterPage: Personajes de la página y cursor de la siguiente
+
+        Raises:
+            ValueError: Si el cursor no es válido
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        query = select(*LIST_COLUMNS)
+        if user_id is not None:
+            query = query.where(CharacterSummaryModel.user_id == user_id)
+        prefix = normalize(search or "").strip()
+        if prefix:
+            # Rango en lugar de LIKE para que pueda usarse el índice de search_name;
+            # la columna usa una intercalación por bytes (ver CharacterSummaryModel)
+            query = query.where(
+                CharacterSummaryModel.search_name >= prefix,
+                CharacterSummaryModel.search_name < prefix + MAX_CHARACTER,
+            )
+        if cursor:
+            created_at, character_id = decode_cursor(cursor)
+            query = query.where(
+                tuple_(CharacterSummaryModel.created_at, CharacterSummaryModel.character_id)
+                < tuple_(created_at, character_id)
+            )
+        query = query.order_by(
+            CharacterSummaryModel.created_at.desc(), CharacterSummaryModel.character_id.desc()
+        ).limit(limit + 1)
+
+        rows = (await self.session.execute(query)).mappings().all()
+        items = [dict(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(last["created_at"], last["id"])
+        return CharacterPage(items=items, next_cursor=next_cursor)
+
+
+def page_to_dict(page: CharacterPage) -> Dict[str, Any]:
+    """
+    Convierte una página en la respuesta JSON de los listados.
+
+    Args:
+        page: Página de personajes
+
+    Returns:
+        Dict[str, Any]: Personajes y cursor de la siguiente página
+    """
+    return {
+        "items": [
+            {**item, "id": str(item["id"]), "created_at": item["created_at"].isoformat()}
+            for item in page.items
+        ],
+        "next_cursor": page.next_cursor,
+    }
@@ -0,0 +1,225 @@
+"""
+Proyección de resúmenes de personajes para los listados.
+
+La tabla `character_summaries` guarda, por personaje, los campos que
+muestran los listados con los nombres de la raza, la clase, el trasfondo y
+el alineamiento ya resueltos, de modo que los listados y la búsqueda por
+nombre leen una sola tabla sin JOIN. Los resúmenes se recalculan en la
+misma transacción que escribe el personaje; `rebuild` los regenera por
+lotes para los backfills y `check` los compara con las tablas de origen.
+"""
+
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.db.character_aggregate import chunks
+from src.infrastructure.db.models import (
+    AlignmentModel,
+    BackgroundModel,
+    CharacterModel,
+    CharacterSummaryModel,
+    ClassModel,
+    RaceModel,
+)
+from src.infrastructure.search_index import normalize
+
+# Personajes por transacción al regenerar o comprobar la proyección
+REBUILD_BATCH_SIZE = 5000
+
+# Resúmenes calculados a partir de las tablas de origen
+SUMMARY_SOURCE = (
+    select(
+        CharacterModel.id.label("character_id"),
+        CharacterModel.user_id,
+        CharacterModel.name,
+        CharacterModel.player_name,
+        CharacterModel.level,
+        RaceModel.name.label("race_name"),
+        ClassModel.name.label("class_name"),
+        BackgroundModel.name.label("background_name"),
+        AlignmentModel.name.label("alignment_name"),
+        CharacterModel.created_at,
+    )
+    .select_from(CharacterModel)
+    .outerjoin(RaceModel, RaceModel.id == CharacterModel.race_id)
+    .outerjoin(ClassModel, ClassModel.id == CharacterModel.class_id)
+    .outerjoin(BackgroundModel, BackgroundModel.id == CharacterModel.background_id)
+    .outerjoin(AlignmentModel, AlignmentModel.id == CharacterModel.alignment_id)
+)
+
+summaries = CharacterSummaryModel.__table__
+
+
+def to_summary_row(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Convierte una fila de SUMMARY_SOURCE en una fila de la proyección.
+
+    Args:
+        row: Fila con los campos del personaje y los nombres de sus referencias
+
+    Returns:
+        Dict[str, Any]: Valores de la fila de `character_summaries`
+    """
+    return {**row, "search_name": normalize(row["name"])}
+
+
+@dataclass
+class SummaryReport:
+    """Resultado de comprobar la proyección contra las tablas de origen."""
+
+    checked: int = 0
+    missing: List[uuid.UUID] = field(default_factory=list)
+    stale: List[uuid.UUID] = field(default_factory=list)
+    orphaned: List[uuid.UUID] = field(default_factory=list)
+
+    @property
+    def consistent(self) -> bool:
+        """Indica si la proyección coincide con las tablas de origen."""
+        return not (self.missing or self.stale or self.orphaned)
+
+    def summary(self) -> str:
+        """Resumen legible de la comprobación."""
+        return (
+            f"{self.checked} personajes comprobados: {len(self.missing)} sin resumen, "
+            f"{len(self.stale)} desactualizados, {len(self.orphaned)} huérfanos"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representación serializable del informe."""
+        return {
+            "consistent": self.consistent,
+            "checked": self.checked,
+            "missing": [str(character_id) for character_id in self.missing],
+            "stale": [str(character_id) for character_id in self.stale],
+            "orphaned": [str(character_id) for character_id in self.orphaned],
+        }
+
+
+class CharacterSummaryRepository:
+    """Repositorio de la proyección `character_summaries`."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _expected(self, character_ids: Sequence[Any]) -> List[Dict[str, Any]]:
+        """Resúmenes calculados a partir de las tablas de origen."""
+        result = await self.session.execute(
+            SUMMARY_SOURCE.where(CharacterModel.id.in_(character_ids))
+        )
+        return [to_summary_row(row) for row in result.mappings()]
+
+    async def refresh(self, character_ids: Sequence[Any]) -> int:
+        """
+        Recalcula los resúmenes de varios personajes.
+
+        Reemplaza las filas existentes (DELETE + INSERT) dentro de la
+        transacción abierta, así que sirve igual tras crear o editar un
+        personaje; si un personaje ya no existe, su resumen desaparece. El
+        INSERT se ejecuta como executemany, cuya sentencia compilada se
+        reutiliza entre lotes.
+
+        Args:
+            character_ids: IDs de los personajes
+
+        Returns:
+            int: Número de resúmenes escritos
+        """
+        written = 0
+        for batch in chunks(list(character_ids)):
+            rows = await self._expected(batch)
+            await self.session.execute(delete(summaries).where(summaries.c.character_id.in_(batch)))
+            if rows:
+                await self.session.execute(insert(summaries), rows)
+            written += len(rows)
+        return written
+
+    async def remove(self, character_ids: Sequence[Any]) -> int:
+        """
+        Elimina los resúmenes de varios personajes.
+
+        Args:
+            character_ids: IDs de los personajes borrados
+
+        Returns:
+            int: Número de resúmenes eliminados
+        """
+        removed = 0
+        for batch in chunks(list(character_ids)):
+            result = await self.session.execute(
+                delete(summaries).where(summaries.c.character_id.in_(batch))
+            )
+            removed += result.rowcount
+        return removed
+
+    async def _next_batch(self, last_id: Optional[uuid.UUID], size: int) -> List[uuid.UUID]:
+        """IDs de los siguientes `size` personajes tras `last_id`, en orden de ID."""
+        query = select(CharacterModel.id).order_by(CharacterModel.id).limit(size)
+        if last_id is not None:
+            query = query.where(CharacterModel.id > last_id)
+        return list((await self.session.execute(query)).scalars())
+
+    def _orphans(self):
+        """Condición de los resúmenes cuyo personaje ya no existe."""
+        return ~exists().where(CharacterModel.id == summaries.c.character_id)
+
+    async def rebuild(self, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+        """
+        Regenera toda la proyección a partir de las tablas de origen.
+
+        Cada lote se confirma en su propia transacción para no mantener
+        bloqueada la tabla durante un backfill largo; como `refresh` es
+        idempotente, las escrituras concurrentes no dejan datos incorrectos.
+
+        Args:
+            batch_size: Personajes por transacción
+
+        Returns:
+            int: Número de resúmenes escritos
+        """
+        written, last_id = 0, None
+        while True:
+            async with self.session.begin():
+                batch = await self._next_batch(last_id, batch_size)
+                written += await self.refresh(batch)
+            if not batch:
+                break
+            last_id = batch[-1]
+        async with self.session.begin():
+            await self.session.execute(delete(summaries).where(self._orphans()))
+        return written
+
+    async def check(self, batch_size: int = REBUILD_BATCH_SIZE) -> SummaryReport:
+        """
+        Compara la proyección con los resúmenes calculados desde las tablas de origen.
+
+        Args:
+            batch_size: Personajes comparados por consulta
+
+        Returns:
+            SummaryReport: Personajes sin resumen, desactualizados y resúmenes huérfanos
+        """
+        report, last_id = SummaryReport(), None
+        while batch := await self._next_batch(last_id, batch_size):
+            last_id = batch[-1]
+            actual = {
+                row["character_id"]: dict(row)
+                for row in (await self.session.execute(
+                    select(summaries).where(summaries.c.character_id.in_(batch))
+                )).mappings()
+            }
+            for expected in await self._expected(batch):
+                stored = actual.get(expected["character_id"])
+                if stored is None:
+                    report.missing.append(expected["character_id"])
+                elif stored != expected:
+                    report.stale.append(expected["character_id"])
+            report.checked += len(batch)
+
+        report.orphaned = list((await self.session.execute(
+            select(summaries.c.character_id).where(self._orphans())
+        )).scalars())
+        return report
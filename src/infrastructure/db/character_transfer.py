@@ -0,0 +1,334 @@
+"""
+Exportación e importación masiva de personajes en NDJSON.
+
+Cada línea es la ficha completa de un personaje (ver
+CharacterAggregateRepository) codificada en JSON. La exportación recorre los
+IDs con un cursor del servidor y carga las fichas por lotes, de modo que la
+memoria no crece con el número de personajes. La importación lee el cuerpo
+de la petición por fragmentos, valida cada línea y guarda los personajes
+válidos en lotes, cada uno en su propia transacción y con una inserción de
+varias filas por tabla (CreateCharacterUseCase.execute_many).
+"""
+
+import json
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.character_use_cases import CreateCharacterRequest, CreateCharacterUseCase
+from src.infrastructure.db.character_aggregate import CharacterAggregateRepository
+from src.infrastructure.db.character_summaries import CharacterSummaryRepository
+from src.infrastructure.db.models import CharacterModel
+from src.infrastructure.db.repositories import ATTRIBUTE_NAMES, build_character_repositories
+
+logger = logging.getLogger(__name__)
+
+# Personajes por lote de exportación y de importación
+EXPORT_BATCH_SIZE = 500
+DEFAULT_IMPORT_BATCH_SIZE = 500
+MAX_IMPORT_BATCH_SIZE = 5000
+
+# Tamaño máximo de una línea y número de errores detallados en el informe
+MAX_LINE_BYTES = 1024 * 1024
+MAX_REPORTED_ERRORS = 100
+
+MAX_LEVEL = 20
+MAX_ATTRIBUTE_VALUE = 30
+
+# Campos de la ficha con una referencia y su campo en CreateCharacterRequest
+REFERENCE_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("race", "race_id"),
+    ("character_class", "class_id"),
+    ("background", "background_id"),
+    ("alignment", "alignment_id"),
+)
+COLLECTION_FIELDS = ("skills", "languages", "proficiencies", "spells", "items")
+
+
+def encode_line(record: Dict[str, Any]) -> bytes:
+    """
+    Codifica una ficha como una línea NDJSON.
+
+    Args:
+        record: Ficha del personaje (los UUID se escriben como texto)
+
+    Returns:
+        bytes: JSON compacto terminado en salto de línea
+    """
+    return json.dumps(
+        record, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8") + b"\n"
+
+
+async def export_ndjson(
+    session: AsyncSession,
+    user_id: Optional[uuid.UUID] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Genera las fichas de los personajes como líneas NDJSON.
+
+    Los IDs se leen con un cursor del servidor (`yield_per`) en orden de
+    creación y las fichas de cada lote se cargan con un número fijo de
+    consultas, así que en memoria solo hay un lote a la vez.
+
+    Args:
+        session: Sesión asíncrona
+        user_id: Limita la exportación a los personajes de un usuario (None: todos)
+        batch_size: Personajes por lote
+
+    Yields:
+        bytes: Fragmento NDJSON con las fichas de un lote
+    """
+    query = select(CharacterModel.id).order_by(CharacterModel.created_at, CharacterModel.id)
+    if user_id is not None:
+        query = query.where(CharacterModel.user_id == user_id)
+
+    aggregates = CharacterAggregateRepository(session)
+    result = await session.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        sheets = await aggregates.get_many([row.id for row in partition])
+        yield b"".join(encode_line(asdict(sheet)) for sheet in sheets)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, bytes]]:
+    """
+    Divide un flujo de bytes en líneas sin leerlo entero.
+
+    Args:
+        chunks: Fragmentos del cuerpo de la petición
+
+    Yields:
+        Tuple[int, bytes]: Número de línea (desde 1) y contenido sin el salto de línea
+
+    Raises:
+        ValueError: Si una línea supera MAX_LINE_BYTES
+    """
+    # bytearray crece en su sitio: una línea repartida en muchos fragmentos
+    # no se vuelve a copiar entera con cada fragmento
+    buffer = bytearray()
+    number = 0
+    async for chunk in chunks:
+        # Lo que queda del fragmento anterior ya no contiene saltos de línea
+        search_from = len(buffer)
+        buffer += chunk
+        start = 0
+        end = buffer.find(b"\n", search_from)
+        while end != -1:
+            number += 1
+            yield number, bytes(buffer[start:end])
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        del buffer[:start]
+        if len(buffer) > MAX_LINE_BYTES:
+            raise ValueError(f"La línea {number + 1} supera {MAX_LINE_BYTES} bytes")
+    if buffer:
+        yield number + 1, bytes(buffer)
+
+
+def _uuid(value: Any, name: str) -> uuid.UUID:
+    """Interpreta un ID como texto o como objeto con la clave "id"."""
+    if isinstance(value, dict):
+        value = value.get("id")
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        raise ValueError(f"'{name}' no es un UUID válido") from None
+
+
+def _integer(record: Dict[str, Any], name: str, default: int, low: int, high: int) -> int:
+    """Lee un entero del registro y comprueba su rango."""
+    value = record.get(name, default)
+    if value is None:
+        return default
+    if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+        raise ValueError(f"'{name}' debe ser un entero entre {low} y {high}")
+    return value
+
+
+def parse_record(record: Any) -> CreateCharacterRequest:
+    """
+    Valida una ficha exportada y la convierte en una petición de creación.
+
+    Acepta el formato de `export_ndjson`: las referencias y las colecciones
+    pueden ser objetos con la clave "id" o directamente el ID.
+
+    Args:
+        record: Objeto JSON de una línea
+
+    Returns:
+        CreateCharacterRequest: Petición de creación del personaje
+
+    Raises:
+        ValueError: Si algún campo no es válido
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Cada línea debe ser un objeto JSON")
+
+    name = record.get("name")
+    if not isinstance(name, str) or not name.strip() or len(name) > 100:
+        raise ValueError("'name' debe ser un texto de 1 a 100 caracteres")
+    player_name = record.get("player_name")
+    if player_name is not None and (not isinstance(player_name, str) or len(player_name) > 100):
+        raise ValueError("'player_name' debe ser un texto de hasta 100 caracteres")
+    description = record.get("description")
+    if description is not None and not isinstance(description, str):
+        raise ValueError("'description' debe ser un texto")
+
+    references = {
+        target: _uuid(record[source], source) if record.get(source) is not None else None
+        for source, target in REFERENCE_FIELDS
+    }
+
+    attributes = record.get("attributes") or {}
+    if not isinstance(attributes, dict):
+        raise ValueError("'attributes' debe ser un objeto")
+    for attribute, value in attributes.items():
+        if attribute not in ATTRIBUTE_NAMES:
+            raise ValueError(f"Atributo desconocido: '{attribute}'")
+        if value is None:
+            raise ValueError(f"El atributo '{attribute}' no puede ser null")
+        _integer(attributes, attribute, 0, 1, MAX_ATTRIBUTE_VALUE)
+
+    collections: Dict[str, List[uuid.UUID]] = {}
+    for collection in COLLECTION_FIELDS:
+        values = record.get(collection) or []
+        if not isinstance(values, list):
+            raise ValueError(f"'{collection}' debe ser una lista")
+        collections[collection] = list(
+            dict.fromkeys(_uuid(value, collection) for value in values)
+        )
+
+    item_quantities = {
+        _uuid(item, "items"): _integer(item, "quantity", 1, 1, 10 ** 6)
+        for item in record.get("items") or []
+        if isinstance(item, dict) and "quantity" in item
+    }
+
+    return CreateCharacterRequest(
+        name=name.strip(),
+        level=_integer(record, "level", 1, 1, MAX_LEVEL),
+        experience=_integer(record, "experience", 0, 0, 2 ** 62),
+        player_name=player_name,
+        description=description,
+        attributes=dict(attributes),
+        item_quantities=item_quantities,
+        **references,
+        **collections,
+    )
+
+
+@dataclass
+class ImportReport:
+    """Resultado de una importación, con el progreso de cada lote."""
+
+    imported: int = 0
+    failed: int = 0
+    batches: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add_error(self, line: int, message: str) -> None:
+        """Registra una línea rechazada; solo se detallan las primeras."""
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representación serializable del informe."""
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "batches": self.batches,
+            "errors": self.errors,
+        }
+
+
+async def import_ndjson(
+    session: AsyncSession,
+    chunks: AsyncIterator[bytes],
+    user_id: uuid.UUID,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    on_batch: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> ImportReport:
+    """
+    Importa personajes desde un flujo NDJSON, confirmando cada lote por separado.
+
+    Las líneas no válidas se registran en el informe y no detienen la
+    importación. Un error al guardar un lote deshace solo ese lote, que se
+    reintenta dividido en mitades hasta aislar las líneas que fallan, de
+    modo que el informe las nombra y el resto del lote se guarda. Los
+    personajes reciben IDs nuevos.
+
+    Args:
+        session: Sesión sin transacción abierta
+        chunks: Fragmentos del cuerpo NDJSON
+        user_id: Propietario de los personajes importados
+        batch_size: Personajes por transacción
+        on_batch: Función llamada con el progreso de cada lote (opcional)
+
+    Returns:
+        ImportReport: Personajes importados, rechazados y progreso por lote
+    """
+    report = ImportReport()
+    use_case = CreateCharacterUseCase(
+        **build_character_repositories(session, user_id),
+        summary_projection=CharacterSummaryRepository(session),
+    )
+    pending: List[Tuple[int, CreateCharacterRequest]] = []
+
+    async def save(entries: List[Tuple[int, CreateCharacterRequest]]) -> int:
+        """Guarda las líneas en una transacción; si falla, reintenta cada mitad."""
+        try:
+            await use_case.execute_many([request for _, request in entries])
+            return len(entries)
+        except Exception as error:
+            if len(entries) == 1:
+                line = entries[0][0]
+                logger.warning("Línea %s de la importación descartada: %s", line, error)
+                report.add_error(line, f"No se ha podido guardar: {error}")
+                return 0
+            logger.warning("Lote de importación fallido (líneas %s-%s), se reintenta "
+                           "por mitades: %s", entries[0][0], entries[-1][0], error)
+        middle = len(entries) // 2
+        return await save(entries[:middle]) + await save(entries[middle:])
+
+    async def flush() -> None:
+        start = time.perf_counter()
+        lines = [line for line, _ in pending]
+        imported = await save(list(pending))
+        report.imported += imported
+        progress = {
+            "batch": len(report.batches) + 1,
+            "lines": [lines[0], lines[-1]],
+            "imported": imported,
+            "total_imported": report.imported,
+            "total_failed": report.failed,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+        report.batches.append(progress)
+        logger.info("Importación: lote %(batch)s, %(total_imported)s personajes", progress)
+        if on_batch is not None:
+            on_batch(progress)
+        pending.clear()
+
+    try:
+        async for number, line in iter_lines(chunks):
+            if not line.strip():
+                continue
+            try:
+                pending.append((number, parse_record(json.loads(line))))
+            except (ValueError, UnicodeDecodeError) as error:
+                report.add_error(number, str(error))
+                continue
+            if len(pending) >= batch_size:
+                await flush()
+    except ValueError as error:
+        report.add_error(0, str(error))
+    if pending:
+        await flush()
+    return report
@@ -0,0 +1,239 @@
+"""
+Motor asíncrono de SQLAlchemy y fábrica de sesiones.
+
+Este módulo crea un único `AsyncEngine` por proceso con un pool de
+conexiones ajustado al modo de ejecución: en serverless (Vercel) cada
+instancia atiende pocas peticiones a la vez y se conecta a través del
+pooler de Supabase, así que el pool es pequeño y comprueba las conexiones
+antes de usarlas; en un worker de larga duración el pool es mayor y las
+conexiones se reciclan periódicamente. Sin ninguna URL configurada se usa
+una base de datos SQLite local.
+"""
+
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool, StaticPool
+
+from src.infrastructure.config import settings
+from src.infrastructure.db.models.base import Base
+from src.infrastructure.db.reference_seed import seed_reference_data
+
+SERVERLESS = "serverless"
+LONG_RUNNING = "long-running"
+
+# Parámetros del pool de cada modo de ejecución
+POOL_PROFILES: Dict[str, Dict[str, Any]] = {
+    SERVERLESS: {
+        "pool_size": 1,
+        "max_overflow": 2,
+        "pool_timeout": 10,
+        "pool_recycle": 300,
+        "pool_pre_ping": True,
+    },
+    LONG_RUNNING: {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": False,
+    },
+}
+
+DEFAULT_SQLITE_URL = "sqlite+aiosqlite:///" + os.path.join(
+    tempfile.gettempdir(), "roleplaying-characters.db"
+)
+
+
+def resolve_database_url(profile: str) -> str:
+    """
+    Elige la URL de conexión según el modo de ejecución.
+
+    `DATABASE_URL` tiene prioridad. En serverless se usa la URL del pooler
+    (`POSTGRES_PRISMA_URL`) y en larga duración la conexión directa
+    (`POSTGRES_URL_NON_POOLING`); en ambos casos `POSTGRES_URL` es la
+    alternativa.
+
+    Args:
+        profile: Modo de ejecución (ver POOL_PROFILES)
+
+    Returns:
+        str: URL de conexión para SQLAlchemy
+    """
+    if settings.database_url:
+        return to_async_url(settings.database_url)
+
+    if profile == SERVERLESS:
+        candidates = (settings.postgres_prisma_url, settings.postgres_url)
+    else:
+        candidates = (settings.postgres_url_non_pooling, settings.postgres_url)
+
+    for url in candidates:
+        if url:
+            return to_async_url(url)
+    return DEFAULT_SQLITE_URL
+
+
+def to_async_url(url: str) -> str:
+    """
+    Adapta una URL de Postgres al driver asíncrono `asyncpg`.
+
+    Args:
+        url: URL de conexión (`postgres://`, `postgresql://` u otra)
+
+    Returns:
+        str: URL con el driver `postgresql+asyncpg` y sus parámetros válidos
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("postgres", "postgresql"):
+        return url
+
+    query = []
+    for key, value in parse_qsl(parts.query):
+        if key == "sslmode":
+            query.append(("ssl", value))
+        elif key != "pgbouncer":
+            query.append((key, value))
+    return urlunsplit(parts._replace(scheme="postgresql+asyncpg", query=urlencode(query)))
+
+
+def create_engine_for(url: str, profile: str, pooled: bool = True) -> AsyncEngine:
+    """
+    Crea un motor asíncrono con el pool del modo de ejecución.
+
+    Args:
+        url: URL de conexión
+        profile: Modo de ejecución (ver POOL_PROFILES)
+        pooled: Si es False, abre una conexión nueva por sesión (NullPool)
+
+    Returns:
+        AsyncEngine: Motor configurado
+    """
+    options: Dict[str, Any] = {}
+    connect_args: Dict[str, Any] = {}
+
+    if url.startswith("sqlite") and (":memory:" in url or url.endswith("://")):
+        # Todas las sesiones deben compartir la única base de datos en memoria
+        options["poolclass"] = StaticPool
+    elif not pooled:
+        options["poolclass"] = NullPool
+    else:
+        options.update(POOL_PROFILES[profile])
+
+    if url.startswith("postgresql+asyncpg") and profile == SERVERLESS:
+        # El pooler en modo transacción no admite sentencias preparadas con nombre
+        connect_args["statement_cache_size"] = 0
+    if connect_args:
+        options["connect_args"] = connect_args
+
+    return create_async_engine(url, **options)
+
+
+class Database:
+    """Motor y fábrica de sesiones de la aplicación, creados bajo demanda."""
+
+    def __init__(self, url: Optional[str] = None, profile: Optional[str] = None):
+        self._url = url
+        self._profile = profile
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._ready = False
+
+    @property
+    def profile(self) -> str:
+        """Modo de ejecución del pool."""
+        return self._profile or settings.database_pool_profile
+
+    @property
+    def url(self) -> str:
+        """URL de conexión."""
+        return self._url or resolve_database_url(self.profile)
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Motor asíncrono; se crea en el primer uso."""
+        if self._engine is None:
+            self._engine = create_engine_for(self.url, self.profile)
+        return self._engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Fábrica de sesiones asociada al motor."""
+        if self._session_factory is None:
+            self._session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+        return self._session_factory
+
+    def configure(self, url: Optional[str] = None, profile: Optional[str] = None) -> None:
+        """
+        Cambia la URL o el modo de ejecución; el motor se recrea en el siguiente uso.
+
+        Debe llamarse antes de usar la base de datos o tras `dispose()`.
+
+        Args:
+            url: Nueva URL de conexión (None: la de la configuración)
+            profile: Nuevo modo de ejecución (None: el de la configuración)
+        """
+        self._url = url
+        self._profile = profile
+        self._engine = None
+        self._session_factory = None
+        self._ready = False
+
+    async def connect(self) -> None:
+        """
+        Crea el motor y, con SQLite, las tablas y los datos de referencia que falten.
+
+        No abre ninguna conexión con Postgres, cuyo esquema y datos de
+        referencia gestionan las migraciones, para no penalizar el arranque
+        en frío.
+        """
+        if self.engine.dialect.name == "sqlite":
+            async with self.engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+                await connection.run_sync(seed_reference_data)
+        self._ready = True
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Abre una sesión que se cierra al salir."""
+        if not self._ready:
+            await self.connect()
+        async with self.session_factory() as session:
+            yield session
+
+    async def dispose(self) -> None:
+        """Cierra todas las conexiones del pool."""
+        if self._engine is not None:
+            await self._engine.dispose()
+        self._engine = None
+        self._session_factory = None
+        self._ready = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Información de monitorización del pool.
+
+        Returns:
+            Dict[str, Any]: Dialecto, modo de ejecución y estado del pool
+        """
+        if self._engine is None:
+            return {"profile": self.profile, "connected": False}
+        return {
+            "profile": self.profile,
+            "connected": True,
+            "dialect": self._engine.dialect.name,
+            "pool": self._engine.pool.status(),
+        }
+
+
+# Instancia global de la base de datos
+database = Database()
@@ -6,10 +6,13 @@ from .characters import (
     CharacterProficiencyModel,
     CharacterItemModel,
     CharacterSpellModel,
+    CharacterSummaryModel,
+    CharacterDraftModel,
 )
 from .user import UserModel
 from .alignment import AlignmentModel
 from .race import RaceModel
+from .character_class import ClassModel
 from .background import BackgroundModel
 from .skill import SkillModel
 from .language import LanguageModel
@@ -21,6 +24,7 @@ __all__ = [
     "UserModel",
     "AlignmentModel",
     "RaceModel",
+    "ClassModel",
     "BackgroundModel",
     "SkillModel",
     "LanguageModel",
@@ -34,4 +38,6 @@ __all__ = [
     "CharacterProficiencyModel",
     "CharacterItemModel",
     "CharacterSpellModel",
+    "CharacterSummaryModel",
+    "CharacterDraftModel",
 ]
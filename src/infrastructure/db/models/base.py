@@ -1,3 +1,13 @@
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+
+@compiles(PG_UUID, "sqlite")
+def compile_uuid_sqlite(type_, compiler, **kw):
+    # Con el tipo UUID, SQLite aplica afinidad numérica y convierte en número
+    # los UUID cuyo hexadecimal parece uno (p. ej. "1234e5..."); CHAR(32) los
+    # guarda siempre como texto
+    return "CHAR(32)"
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Integer
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+import uuid
+from .base import Base
+
+
+class ClassModel(Base):
+    __tablename__ = "classes"
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name = Column(String(50), nullable=False)
+    hit_die = Column(Integer, nullable=False, default=8)
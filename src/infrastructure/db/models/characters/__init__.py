@@ -5,6 +5,8 @@ from .character_language import CharacterLanguageModel
 from .character_proficiency import CharacterProficiencyModel
 from .character_item import CharacterItemModel
 from .character_spell import CharacterSpellModel
+from .character_summary import CharacterSummaryModel
+from .character_draft import CharacterDraftModel
 
 __all__ = [
     "CharacterModel",
@@ -14,4 +16,6 @@ __all__ = [
     "CharacterProficiencyModel",
     "CharacterItemModel",
     "CharacterSpellModel",
+    "CharacterSummaryModel",
+    "CharacterDraftModel",
 ]
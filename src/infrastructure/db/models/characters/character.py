@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, BigInteger, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, ForeignKey, Index, Text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -8,6 +8,11 @@ from ..base import Base
 
 class CharacterModel(Base):
     __tablename__ = "characters"
+    __table_args__ = (
+        # Paginación por (created_at, id) del listado general y del de cada usuario
+        Index("ix_characters_created_at_id", "created_at", "id"),
+        Index("ix_characters_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(PG_UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     name = Column(String(100), nullable=False)
@@ -18,6 +23,7 @@ class CharacterModel(Base):
     class_id = Column(PG_UUID(as_uuid=True), ForeignKey("classes.id"))
     background_id = Column(PG_UUID(as_uuid=True), ForeignKey("backgrounds.id"))
     experience = Column(BigInteger, nullable=False, default=0)
+    description = Column(Text)
     created_at = Column(
         DateTime(timezone=True), default=datetime.utcnow, nullable=False
     )
@@ -28,3 +34,12 @@ class CharacterModel(Base):
     attributes = relationship(
         "AttributeModel", uselist=False, back_populates="character"
     )
+    race = relationship("RaceModel")
+    alignment = relationship("AlignmentModel")
+    background = relationship("BackgroundModel")
+    character_class = relationship("ClassModel")
+    skills = relationship("CharacterSkillModel")
+    languages = relationship("CharacterLanguageModel")
+    proficiencies = relationship("CharacterProficiencyModel")
+    spells = relationship("CharacterSpellModel")
+    items = relationship("CharacterItemModel")
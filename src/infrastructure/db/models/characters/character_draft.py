@@ -0,0 +1,18 @@
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from ..base import Base
+
+
+class CharacterDraftModel(Base):
+    # Borradores del formulario de creación, escritos por DraftBuffer
+    __tablename__ = "character_drafts"
+    __table_args__ = (
+        Index("ix_character_drafts_user_id_updated_at", "user_id", "updated_at"),
+    )
+    id = Column(PG_UUID(as_uuid=True), primary_key=True)
+    user_id = Column(
+        PG_UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    data = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
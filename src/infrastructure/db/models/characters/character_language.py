@@ -1,13 +1,16 @@
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, Index, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import relationship
 from ..base import Base
 
 
 class CharacterLanguageModel(Base):
     __tablename__ = "character_languages"
+    __table_args__ = (Index("ix_character_languages_language_id", "language_id"),)
     character_id = Column(
         PG_UUID(as_uuid=True), ForeignKey("characters.id"), primary_key=True
     )
     language_id = Column(
         PG_UUID(as_uuid=True), ForeignKey("languages.id"), primary_key=True
     )
+    language = relationship("LanguageModel")
@@ -1,13 +1,16 @@
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, Index, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import relationship
 from ..base import Base
 
 
 class CharacterProficiencyModel(Base):
     __tablename__ = "character_proficiencies"
+    __table_args__ = (Index("ix_character_proficiencies_proficiency_id", "proficiency_id"),)
     character_id = Column(
         PG_UUID(as_uuid=True), ForeignKey("characters.id"), primary_key=True
     )
     proficiency_id = Column(
         PG_UUID(as_uuid=True), ForeignKey("proficiencies.id"), primary_key=True
     )
+    proficiency = relationship("ProficiencyModel")
@@ -1,12 +1,15 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Index, Integer, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import relationship
 from ..base import Base
 
 
 class CharacterSkillModel(Base):
     __tablename__ = "character_skills"
+    __table_args__ = (Index("ix_character_skills_skill_id", "skill_id"),)
     character_id = Column(
         PG_UUID(as_uuid=True), ForeignKey("characters.id"), primary_key=True
     )
     skill_id = Column(PG_UUID(as_uuid=True), ForeignKey("skills.id"), primary_key=True)
     proficiency_bonus = Column(Integer, nullable=False)
+    skill = relationship("SkillModel")
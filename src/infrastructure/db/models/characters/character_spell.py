@@ -1,13 +1,16 @@
-from sqlalchemy import Column, Integer, Boolean, ForeignKey
+from sqlalchemy import Column, Index, Integer, Boolean, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import relationship
 from ..base import Base
 
 
 class CharacterSpellModel(Base):
     __tablename__ = "character_spells"
+    __table_args__ = (Index("ix_character_spells_spell_id", "spell_id"),)
     character_id = Column(
         PG_UUID(as_uuid=True), ForeignKey("characters.id"), primary_key=True
     )
     spell_id = Column(PG_UUID(as_uuid=True), ForeignKey("spells.id"), primary_key=True)
     level_slot = Column(Integer, nullable=False)
     prepared_flag = Column(Boolean, nullable=False, default=False)
+    spell = relationship("SpellModel")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from ..base import Base
+
+# En Postgres la búsqueda por prefijo compara por rango, lo que requiere el orden
+# de bytes de la intercalación "C"; en SQLite la intercalación BINARY ya lo es
+SEARCH_NAME_TYPE = String(100).with_variant(String(100, collation="C"), "postgresql")
+
+
+class CharacterSummaryModel(Base):
+    # Proyección desnormalizada de los listados, mantenida al escribir los personajes
+    __tablename__ = "character_summaries"
+    __table_args__ = (
+        Index("ix_character_summaries_created_at_id", "created_at", "character_id"),
+        Index(
+            "ix_character_summaries_user_id_created_at_id",
+            "user_id", "created_at", "character_id",
+        ),
+        Index("ix_character_summaries_search_name", "search_name"),
+    )
+    character_id = Column(
+        PG_UUID(as_uuid=True), ForeignKey("characters.id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id = Column(PG_UUID(as_uuid=True), nullable=False)
+    name = Column(String(100), nullable=False)
+    search_name = Column(SEARCH_NAME_TYPE, nullable=False)
+    player_name = Column(String(100))
+    level = Column(Integer, nullable=False)
+    race_name = Column(String(50))
+    class_name = Column(String(50))
+    background_name = Column(String(50))
+    alignment_name = Column(String(50))
+    created_at = Column(DateTime(timezone=True), nullable=False)
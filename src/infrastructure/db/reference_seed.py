@@ -0,0 +1,154 @@
+"""
+Siembra de los datos de referencia incorporados.
+
+Inserta en las tablas de referencia los elementos del catálogo que sirve la
+API (`reference_data`) con sus UUID fijos, de modo que los IDs que envía el
+formulario de creación existen en la base de datos. `Database.connect()` la
+ejecuta con SQLite y, en Postgres, la aplica su migración.
+"""
+
+import uuid
+from typing import Any, Dict, List, Mapping, Type
+
+from sqlalchemy import Insert, insert, select
+from sqlalchemy.engine import Connection
+
+from src.infrastructure.db.models import (
+    AlignmentModel,
+    BackgroundModel,
+    ClassModel,
+    ItemModel,
+    LanguageModel,
+    ProficiencyModel,
+    RaceModel,
+    SkillModel,
+    SpellModel,
+)
+from src.infrastructure.db.models.base import Base
+from src.infrastructure.db.repositories import UPSERT_INSERTS
+from src.infrastructure.reference_data import DEFAULT_REFERENCE_DATA, ReferenceItems
+
+# Tabla de cada colección de datos de referencia
+REFERENCE_TABLES: Dict[str, Type[Base]] = {
+    "races": RaceModel,
+    "backgrounds": BackgroundModel,
+    "alignments": AlignmentModel,
+    "skills": SkillModel,
+    "languages": LanguageModel,
+    "proficiencies": ProficiencyModel,
+    "spells": SpellModel,
+    "items": ItemModel,
+    "classes": ClassModel,
+}
+
+
+def build_seed_rows(
+    collections: Mapping[str, ReferenceItems] = DEFAULT_REFERENCE_DATA,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Convierte las colecciones del catálogo en filas de sus tablas.
+
+    Solo se guardan el ID, el nombre y, si la tabla tiene esa columna, la
+    descripción; el resto de campos del catálogo no existen en el esquema.
+    Las columnas con un valor por defecto fijo (p. ej. `classes.hit_die`) lo
+    llevan explícito, ya que las sentencias volcadas como SQL no lo aplican.
+
+    Args:
+        collections: Colecciones con los UUID de la base de datos
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Filas de cada colección
+    """
+    rows: Dict[str, List[Dict[str, Any]]] = {}
+    for name, model in REFERENCE_TABLES.items():
+        columns = model.__table__.c
+        defaults = {
+            column.name: column.default.arg
+            for column in columns
+            if column.default is not None and column.default.is_scalar
+        }
+        rows[name] = [
+            {
+                **defaults,
+                "id": uuid.UUID(item["id"]),
+                "name": item["name"],
+                **(
+                    {"description": item.get("description")}
+                    if "description" in columns
+                    else {}
+                ),
+            }
+            for item in collections.get(name, [])
+        ]
+    return rows
+
+
+def build_seed_statements(
+    dialect_name: str,
+    collections: Mapping[str, ReferenceItems] = DEFAULT_REFERENCE_DATA,
+) -> List[Insert]:
+    """
+    Genera un INSERT de varias filas por tabla de referencia.
+
+    En SQLite y Postgres las sentencias llevan `ON CONFLICT DO NOTHING`; en
+    otros dialectos solo sirven para una base de datos vacía. Al no depender
+    de una conexión, también pueden volcarse como SQL (`alembic upgrade --sql`).
+
+    Args:
+        dialect_name: Nombre del dialecto de la base de datos
+        collections: Colecciones con los UUID de la base de datos
+
+    Returns:
+        List[Insert]: Sentencias a ejecutar
+    """
+    dialect_insert = UPSERT_INSERTS.get(dialect_name)
+    statements: List[Insert] = []
+    for name, rows in build_seed_rows(collections).items():
+        if not rows:
+            continue
+        table = REFERENCE_TABLES[name].__table__
+        if dialect_insert is not None:
+            statements.append(dialect_insert(table).values(rows).on_conflict_do_nothing())
+        else:
+            statements.append(insert(table).values(rows))
+    return statements
+
+
+def seed_reference_data(
+    connection: Connection,
+    collections: Mapping[str, ReferenceItems] = DEFAULT_REFERENCE_DATA,
+) -> int:
+    """
+    Inserta los elementos del catálogo que todavía no existen.
+
+    No modifica las filas existentes. En SQLite y Postgres se usa
+    `INSERT ... ON CONFLICT DO NOTHING`, de modo que varios procesos pueden
+    sembrar a la vez sin error; en otros dialectos se consultan antes los IDs
+    existentes.
+
+    Args:
+        connection: Conexión síncrona con una transacción abierta
+        collections: Colecciones con los UUID de la base de datos
+
+    Returns:
+        int: Sentencias INSERT ejecutadas
+    """
+    if connection.dialect.name in UPSERT_INSERTS:
+        statements = build_seed_statements(connection.dialect.name, collections)
+        for statement in statements:
+            connection.execute(statement)
+        return len(statements)
+
+    executed = 0
+    for name, rows in build_seed_rows(collections).items():
+        table = REFERENCE_TABLES[name].__table__
+        existing = set(
+            connection.scalars(
+                select(table.c.id).where(table.c.id.in_([row["id"] for row in rows]))
+            )
+        )
+        missing = [row for row in rows if row["id"] not in existing]
+        if missing:
+            connection.execute(insert(table), missing)
+            executed += 1
+    return executed
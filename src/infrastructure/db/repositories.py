@@ -0,0 +1,426 @@
+"""
+Repositorios de personajes sobre SQLAlchemy asíncrono.
+
+Los repositorios de datos de referencia abren una sesión propia en cada
+lectura, ya que GetCharacterDataUseCase los consulta de forma concurrente y
+una sesión no admite operaciones simultáneas.
+
+Cada repositorio de escritura traduce las interfaces de la capa de aplicación a filas de
+su tabla. `create_many` inserta todas las entidades con una única sentencia
+`INSERT` ejecutada como executemany y ningún repositorio confirma por su cuenta:
+la transacción la abre y la cierra la unidad de trabajo, de forma que un
+personaje y todos sus datos asociados se guardan con un solo commit.
+"""
+
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from typing import (
+    Any, AsyncContextManager, AsyncIterator, Callable, Dict, Generic, List, Sequence, Set,
+    Tuple, Type, TypeVar,
+)
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces import (
+    AttributeInterface,
+    CharacterInterface,
+    CharacterItemInterface,
+    CharacterLanguageInterface,
+    CharacterProficiencyInterface,
+    CharacterSkillInterface,
+    CharacterSpellInterface,
+)
+from src.infrastructure.db.models import (
+    AlignmentModel,
+    AttributeModel,
+    BackgroundModel,
+    CharacterItemModel,
+    CharacterLanguageModel,
+    CharacterModel,
+    CharacterProficiencyModel,
+    CharacterSkillModel,
+    CharacterSpellModel,
+    ClassModel,
+    ItemModel,
+    LanguageModel,
+    ProficiencyModel,
+    RaceModel,
+    SkillModel,
+    SpellModel,
+    UserModel,
+)
+from src.infrastructure.db.models.base import Base
+
+T = TypeVar("T")
+
+# Función que abre una sesión nueva (p. ej. un `async_sessionmaker`)
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+# Valores por defecto de las columnas que no existen en las interfaces
+ATTRIBUTE_NAMES = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
+DEFAULT_ATTRIBUTE_VALUE = 10
+PROFICIENCY_BONUS = 2
+DEFAULT_LEVEL_SLOT = 0
+
+
+# Modelo de cada repositorio de datos de referencia de GetCharacterDataUseCase
+REFERENCE_MODELS: Dict[str, Type[Base]] = {
+    "race_repository": RaceModel,
+    "background_repository": BackgroundModel,
+    "alignment_repository": AlignmentModel,
+    "skill_repository": SkillModel,
+    "language_repository": LanguageModel,
+    "proficiency_repository": ProficiencyModel,
+    "spell_repository": SpellModel,
+    "item_repository": ItemModel,
+    "class_repository": ClassModel,
+}
+
+
+class SqlAlchemyUnitOfWork:
+    """Unidad de trabajo sobre una sesión asíncrona de SQLAlchemy."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """
+        Abre una transacción que se confirma al salir y se deshace si hay un error.
+
+        Si la sesión ya tiene una transacción abierta, se usa un savepoint.
+        """
+        if self.session.in_transaction():
+            async with self.session.begin_nested():
+                yield
+        else:
+            async with self.session.begin():
+                yield
+
+
+class SqlAlchemyRepository(ABC, Generic[T]):
+    """
+    Repositorio base con inserciones de varias filas por sentencia.
+
+    Cada repositorio define su tabla en `model` y cómo se convierten las
+    entidades en filas en `to_rows`.
+    """
+
+    model: Type[Base]
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @abstractmethod
+    def to_rows(self, entities: Sequence[T]) -> List[Dict[str, Any]]:
+        """
+        Convierte las entidades en filas de la tabla sin modificarlas.
+
+        Args:
+            entities: Entidades de la capa de aplicación
+
+        Returns:
+            List[Dict[str, Any]]: Valores de cada fila
+        """
+
+    async def create(self, entity: T) -> T:
+        """
+        Crea una entidad.
+
+        Args:
+            entity: Entidad a guardar
+
+        Returns:
+            T: La entidad guardada
+        """
+        return (await self.create_many([entity]))[0]
+
+    async def create_many(self, entities: Sequence[T]) -> List[T]:
+        """
+        Crea varias entidades con una sentencia INSERT ejecutada como executemany.
+
+        La sentencia compilada es la misma para cualquier número de filas y
+        queda en la caché de SQLAlchemy, mientras que un `INSERT ... VALUES`
+        de varias filas se compila de nuevo para cada tamaño de lote.
+
+        Args:
+            entities: Entidades a guardar
+
+        Returns:
+            List[T]: Las entidades guardadas
+        """
+        entities = list(entities)
+        rows = self.to_rows(entities)
+        if rows:
+            await self.session.execute(insert(self.model.__table__), rows)
+        return entities
+
+
+class CharacterRepository(SqlAlchemyRepository[CharacterInterface]):
+    """
+    Repositorio de personajes de un usuario.
+
+    El ID se genera en la aplicación para no necesitar un `RETURNING` ni una
+    consulta adicional antes de insertar los datos asociados.
+    """
+
+    model = CharacterModel
+
+    def __init__(self, session: AsyncSession, user_id: uuid.UUID):
+        super().__init__(session)
+        self.user_id = user_id
+
+    async def create_many(self, entities: Sequence[CharacterInterface]) -> List[CharacterInterface]:
+        """
+        Crea varios personajes, asignando un ID a los que no lo tienen.
+
+        Las entidades recibidas no se modifican: se devuelven copias con el ID.
+
+        Args:
+            entities: Personajes a guardar
+
+        Returns:
+            List[CharacterInterface]: Los personajes guardados, con su ID
+        """
+        return await super().create_many([
+            entity if entity.id is not None else replace(entity, id=uuid.uuid4())
+            for entity in entities
+        ])
+
+    def to_rows(self, entities: Sequence[CharacterInterface]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": entity.id,
+                "user_id": self.user_id,
+                "name": entity.name,
+                "level": entity.level,
+                "race_id": entity.race_id,
+                "background_id": entity.background_id,
+                "alignment_id": entity.alignment_id,
+                "class_id": entity.class_id,
+                "player_name": entity.player_name,
+                "experience": entity.experience,
+                "description": entity.description or None,
+            }
+            for entity in entities
+        ]
+
+
+class AttributeRepository(SqlAlchemyRepository[AttributeInterface]):
+    """
+    Repositorio de atributos.
+
+    La tabla guarda los seis atributos de un personaje en una sola fila, así
+    que las entidades se agrupan por personaje; los que falten toman el valor
+    por defecto.
+    """
+
+    model = AttributeModel
+
+    def to_rows(self, entities: Sequence[AttributeInterface]) -> List[Dict[str, Any]]:
+        rows: Dict[Any, Dict[str, Any]] = {}
+        for entity in entities:
+            if entity.name not in ATTRIBUTE_NAMES:
+                raise ValueError(f"Atributo desconocido: '{entity.name}'")
+            row = rows.setdefault(
+                entity.character_id,
+                {"character_id": entity.character_id,
+                 **dict.fromkeys(ATTRIBUTE_NAMES, DEFAULT_ATTRIBUTE_VALUE)},
+            )
+            row[entity.name] = entity.value
+        return list(rows.values())
+
+
+class CharacterSkillRepository(SqlAlchemyRepository[CharacterSkillInterface]):
+    """Repositorio de habilidades de los personajes."""
+
+    model = CharacterSkillModel
+
+    def to_rows(self, entities: Sequence[CharacterSkillInterface]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "character_id": entity.character_id,
+                "skill_id": entity.skill_id,
+                "proficiency_bonus": PROFICIENCY_BONUS if entity.proficiency else 0,
+            }
+            for entity in entities
+        ]
+
+
+class CharacterLanguageRepository(SqlAlchemyRepository[CharacterLanguageInterface]):
+    """Repositorio de idiomas de los personajes."""
+
+    model = CharacterLanguageModel
+
+    def to_rows(self, entities: Sequence[CharacterLanguageInterface]) -> List[Dict[str, Any]]:
+        return [
+            {"character_id": entity.character_id, "language_id": entity.language_id}
+            for entity in entities
+        ]
+
+
+class CharacterProficiencyRepository(SqlAlchemyRepository[CharacterProficiencyInterface]):
+    """Repositorio de competencias de los personajes."""
+
+    model = CharacterProficiencyModel
+
+    def to_rows(self, entities: Sequence[CharacterProficiencyInterface]) -> List[Dict[str, Any]]:
+        return [
+            {"character_id": entity.character_id, "proficiency_id": entity.proficiency_id}
+            for entity in entities
+        ]
+
+
+class CharacterSpellRepository(SqlAlchemyRepository[CharacterSpellInterface]):
+    """Repositorio de conjuros de los personajes."""
+
+    model = CharacterSpellModel
+
+    def to_rows(self, entities: Sequence[CharacterSpellInterface]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "character_id": entity.character_id,
+                "spell_id": entity.spell_id,
+                "level_slot": DEFAULT_LEVEL_SLOT,
+            }
+            for entity in entities
+        ]
+
+
+class CharacterItemRepository(SqlAlchemyRepository[CharacterItemInterface]):
+    """Repositorio de objetos de los personajes."""
+
+    model = CharacterItemModel
+
+    def to_rows(self, entities: Sequence[CharacterItemInterface]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "character_id": entity.character_id,
+                "item_id": entity.item_id,
+                "quantity": entity.quantity,
+            }
+            for entity in entities
+        ]
+
+
+# INSERT con ON CONFLICT de cada dialecto que lo admite
+UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+# Usuarios que ya se sabe que existen, por URL de la base de datos; con un
+# usuario por navegador (borradores) el conjunto se vacía al llegar al límite
+MAX_KNOWN_USERS = 10_000
+_known_users: Set[Tuple[str, uuid.UUID]] = set()
+
+
+async def ensure_user(session: AsyncSession, user_id: uuid.UUID, username: str) -> None:
+    """
+    Crea el usuario propietario si todavía no existe.
+
+    Solo consulta la base de datos la primera vez para cada usuario y proceso.
+    En SQLite y Postgres se usa `INSERT ... ON CONFLICT DO NOTHING`, de modo
+    que varias peticiones simultáneas pueden crear el mismo usuario sin error.
+
+    Args:
+        session: Sesión sin transacción abierta
+        user_id: ID del usuario
+        username: Nombre de usuario si hay que crearlo
+    """
+    key = (str(session.bind.url), user_id)
+    if key in _known_users:
+        return
+
+    values = {
+        "id": user_id, "username": username,
+        "email": f"{username}@localhost", "password_hash": "",
+    }
+    dialect_insert = UPSERT_INSERTS.get(session.bind.dialect.name)
+    if dialect_insert is not None:
+        async with session.begin():
+            await session.execute(
+                dialect_insert(UserModel).values(**values).on_conflict_do_nothing()
+            )
+    else:
+        try:
+            async with session.begin():
+                if await session.get(UserModel, user_id) is None:
+                    session.add(UserModel(**values))
+        except IntegrityError:
+            # Otra petición lo ha creado entre la consulta y la inserción
+            async with session.begin():
+                if await session.get(UserModel, user_id) is None:
+                    raise
+    if len(_known_users) >= MAX_KNOWN_USERS:
+        _known_users.clear()
+    _known_users.add(key)
+
+
+def build_character_repositories(
+    session: AsyncSession, user_id: uuid.UUID
+) -> Dict[str, Any]:
+    """
+    Crea los repositorios y la unidad de trabajo de `CreateCharacterUseCase`.
+
+    Args:
+        session: Sesión asíncrona compartida por todos los repositorios
+        user_id: Usuario propietario de los personajes creados
+
+    Returns:
+        Dict[str, Any]: Argumentos del constructor del caso de uso
+    """
+    return {
+        "character_repository": CharacterRepository(session, user_id),
+        "attribute_repository": AttributeRepository(session),
+        "character_skill_repository": CharacterSkillRepository(session),
+        "character_language_repository": CharacterLanguageRepository(session),
+        "character_proficiency_repository": CharacterProficiencyRepository(session),
+        "character_spell_repository": CharacterSpellRepository(session),
+        "character_item_repository": CharacterItemRepository(session),
+        "unit_of_work": SqlAlchemyUnitOfWork(session),
+    }
+
+
+class ReferenceRepository:
+    """Repositorio de lectura de una tabla de datos de referencia."""
+
+    def __init__(self, session_factory: SessionFactory, model: Type[Base]):
+        self.session_factory = session_factory
+        self.model = model
+
+    async def get_all(self) -> List[Dict[str, Any]]:
+        """
+        Obtiene todas las filas de la tabla ordenadas por nombre.
+
+        Lee las columnas directamente, sin construir objetos del ORM.
+
+        Returns:
+            List[Dict[str, Any]]: Filas como diccionarios
+        """
+        table = self.model.__table__
+        async with self.session_factory() as session:
+            result = await session.execute(select(table).order_by(table.c.name))
+            return [dict(row) for row in result.mappings()]
+
+
+def build_reference_repositories(
+    session_factory: SessionFactory,
+) -> Dict[str, ReferenceRepository]:
+    """
+    Crea los repositorios de `GetCharacterDataUseCase`.
+
+    Args:
+        session_factory: Fábrica de sesiones del motor de la aplicación, o
+            `Database.session` para conectar con la base de datos en el primer uso
+
+    Returns:
+        Dict[str, ReferenceRepository]: Argumentos del constructor del caso de uso
+    """
+    return {
+        name: ReferenceRepository(session_factory, model)
+        for name, model in REFERENCE_MODELS.items()
+    }
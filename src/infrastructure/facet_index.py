@@ -0,0 +1,253 @@
+"""
+Índice de facetas sobre los atributos de los datos de referencia.
+
+Este módulo precalcula, para cada valor de cada faceta (nivel y escuela de
+los conjuros, tipo y rareza de los objetos...), un bitset con las posiciones
+de los documentos que lo tienen. Los filtros combinados se resuelven con
+intersecciones de bitsets y los recuentos por faceta con `int.bit_count`,
+sin recorrer la colección.
+"""
+
+import operator
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import unquote_plus
+
+from src.infrastructure.reference_data import ReferenceDataStore, reference_data
+
+# Facetas filtrables de cada colección de datos de referencia
+FACETS: Dict[str, Tuple[str, ...]] = {
+    "spells": ("level", "school"),
+    "items": ("type", "rarity"),
+    "proficiencies": ("type",),
+    "skills": ("attribute",),
+}
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+CONDITION_PATTERN = re.compile(r"^(?P<facet>\w+)(?P<operator><=|>=|!=|=|<|>)(?P<value>.*)$")
+
+
+@dataclass(frozen=True)
+class FacetCondition:
+    """Condición sobre una faceta; varios valores separados por comas se combinan con O."""
+
+    facet: str
+    operator: str
+    values: Tuple[str, ...]
+
+
+def parse_conditions(query: str, allowed: Iterable[str]) -> List[FacetCondition]:
+    """
+    Interpreta un filtro combinado del tipo `level<=3&school=Evocation,Abjuration`.
+
+    Args:
+        query: Query string sin decodificar
+        allowed: Facetas válidas; el resto de parámetros se ignoran
+
+    Returns:
+        List[FacetCondition]: Condiciones a aplicar
+
+    Raises:
+        ValueError: Si una condición sobre una faceta válida está mal formada
+    """
+    allowed = set(allowed)
+    conditions = []
+    for part in query.split("&"):
+        match = CONDITION_PATTERN.match(unquote_plus(part))
+        if match is None or match["facet"] not in allowed:
+            continue
+        values = tuple(value.strip() for value in match["value"].split(",") if value.strip())
+        if not values:
+            raise ValueError(f"Falta el valor de la faceta '{match['facet']}'")
+        conditions.append(FacetCondition(match["facet"], match["operator"], values))
+    return conditions
+
+
+def bitset_positions(bitset: int) -> List[int]:
+    """
+    Obtiene las posiciones activas de un bitset en orden ascendente.
+
+    Recorre la representación binaria una sola vez en lugar de ir apagando
+    bits, que en enteros grandes copia el número entero en cada paso.
+
+    Args:
+        bitset: Entero usado como bitset
+
+    Returns:
+        List[int]: Posiciones de los bits a 1
+    """
+    bits = bin(bitset)[:1:-1]
+    return [position for position, bit in enumerate(bits) if bit == "1"]
+
+
+@dataclass(frozen=True)
+class FacetResult:
+    """Documentos que cumplen un filtro y recuentos por valor de cada faceta."""
+
+    ids: List[Any]
+    total: int
+    counts: Dict[str, Dict[str, int]]
+
+
+class FacetIndex:
+    """Bitsets por valor de faceta de una colección de documentos."""
+
+    def __init__(self, documents: Iterable[Mapping[str, Any]], facets: Iterable[str]):
+        self._documents: List[Mapping[str, Any]] = list(documents)
+        self._facets: Tuple[str, ...] = tuple(facets)
+        self._all = (1 << len(self._documents)) - 1
+        self._bitsets: Dict[str, Dict[Any, int]] = {facet: {} for facet in self._facets}
+        self._keys: Dict[str, Dict[str, Any]] = {facet: {} for facet in self._facets}
+
+        for position, document in enumerate(self._documents):
+            bit = 1 << position
+            for facet in self._facets:
+                value = document.get(facet)
+                if value is None:
+                    continue
+                bitsets = self._bitsets[facet]
+                bitsets[value] = bitsets.get(value, 0) | bit
+
+        self._ordered: Dict[str, List[Tuple[Any, int]]] = {}
+        for facet, bitsets in self._bitsets.items():
+            self._keys[facet] = {str(value).casefold(): value for value in bitsets}
+            try:
+                self._ordered[facet] = sorted(bitsets.items())
+            except TypeError:
+                self._ordered[facet] = sorted(bitsets.items(), key=lambda item: str(item[0]))
+
+    @property
+    def facets(self) -> Tuple[str, ...]:
+        """Facetas indexadas."""
+        return self._facets
+
+    def __len__(self) -> int:
+        """Número de documentos indexados."""
+        return len(self._documents)
+
+    def _coerce(self, facet: str, raw: str) -> Any:
+        """Convierte el valor de un filtro al tipo de los valores de la faceta."""
+        key = raw.casefold()
+        if key in self._keys[facet]:
+            return self._keys[facet][key]
+        if any(isinstance(value, (int, float)) for value in self._bitsets[facet]):
+            try:
+                return float(raw)
+            except ValueError:
+                raise ValueError(f"La faceta '{facet}' es numérica: '{raw}'") from None
+        return raw
+
+    def _match(self, condition: FacetCondition) -> int:
+        """Bitset de los documentos que cumplen una condición."""
+        if condition.facet not in self._bitsets:
+            raise ValueError(f"Faceta desconocida: '{condition.facet}'")
+
+        compare = OPERATORS[condition.operator]
+        targets = [self._coerce(condition.facet, raw) for raw in condition.values]
+        matched = 0
+        for value, bitset in self._bitsets[condition.facet].items():
+            try:
+                if any(compare(value, target) for target in targets):
+                    matched |= bitset
+            except TypeError:
+                raise ValueError(
+                    f"Operador '{condition.operator}' no válido para '{condition.facet}'"
+                ) from None
+        return matched
+
+    def filter(self, conditions: Iterable[FacetCondition]) -> FacetResult:
+        """
+        Aplica un filtro combinado (Y entre condiciones) y calcula los recuentos.
+
+        Args:
+            conditions: Condiciones a aplicar
+
+        Returns:
+            FacetResult: IDs de los documentos, total y recuentos por faceta
+        """
+        matched = self._all
+        for condition in conditions:
+            matched &= self._match(condition)
+            if not matched:
+                break
+
+        counts = {
+            facet: {
+                str(value): count
+                for value, bitset in self._ordered[facet]
+                if (count := (bitset & matched).bit_count())
+            }
+            for facet in self._facets
+        }
+        return FacetResult(
+            ids=[self._documents[position].get("id") for position in bitset_positions(matched)],
+            total=matched.bit_count(),
+            counts=counts,
+        )
+
+
+class FacetService:
+    """Índices de facetas por colección, regenerados al cambiar los datos."""
+
+    def __init__(self, store: Optional[ReferenceDataStore] = None):
+        self._store = store or reference_data
+        self._indexes: Dict[str, FacetIndex] = {}
+        self._version = self._store.version
+        self._lock = threading.Lock()
+
+    def get_index(self, collection: str) -> FacetIndex:
+        """
+        Obtiene el índice de facetas de una colección, construyéndolo si hace falta.
+
+        Args:
+            collection: Nombre de la colección (ver FACETS)
+
+        Returns:
+            FacetIndex: Índice de la colección
+
+        Raises:
+            KeyError: Si la colección no tiene facetas
+        """
+        facets = FACETS[collection]
+        with self._lock:
+            if self._version != self._store.version:
+                self._indexes = {}
+                self._version = self._store.version
+
+            index = self._indexes.get(collection)
+            if index is None:
+                index = FacetIndex(self._store.get_items(collection), facets)
+                self._indexes[collection] = index
+            return index
+
+    def filter(self, collection: str, query: str) -> FacetResult:
+        """
+        Filtra una colección a partir de un query string con condiciones.
+
+        Args:
+            collection: Nombre de la colección
+            query: Query string sin decodificar (p. ej. `level<=3&school=Evocation`)
+
+        Returns:
+            FacetResult: IDs, total y recuentos por faceta
+
+        Raises:
+            KeyError: Si la colección no tiene facetas
+            ValueError: Si algún filtro no es válido
+        """
+        index = self.get_index(collection)
+        return index.filter(parse_conditions(query, index.facets))
+
+
+# Instancia global del servicio de facetas
+facet_service = FacetService()
@@ -0,0 +1,204 @@
+"""
+Caché de respuestas HTTP ya renderizadas.
+
+Este módulo guarda cuerpos de respuesta como bytes junto a un ETag fuerte,
+de forma que las peticiones repetidas se sirven sin volver a generarlos y
+las revalidaciones con `If-None-Match` se contestan con 304.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Mapping, Optional
+
+from starlette.responses import Response
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Respuesta ya generada, lista para enviarse tal cual."""
+
+    body: bytes
+    etag: str
+    media_type: str
+    version: Hashable
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Calcula un ETag fuerte a partir del contenido de la respuesta.
+
+    Args:
+        body: Cuerpo de la respuesta
+
+    Returns:
+        str: ETag entre comillas
+    """
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Comprueba si un header If-None-Match coincide con un ETag.
+
+    Admite listas de ETags, ETags débiles (`W/`) y el comodín `*`.
+
+    Args:
+        if_none_match: Valor del header If-None-Match
+        etag: ETag actual del recurso
+
+    Returns:
+        bool: True si el cliente ya tiene la versión actual
+    """
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def build_cached_response(
+    cached: CachedResponse,
+    if_none_match: Optional[str],
+    headers: Optional[Mapping[str, str]] = None,
+    status_code: int = 200,
+) -> Response:
+    """
+    Construye la respuesta HTTP de una entrada cacheada, o un 304 si el cliente la tiene.
+
+    Las respuestas de error no se revalidan: If-None-Match solo se evalúa
+    cuando el estado es 200.
+
+    Args:
+        cached: Entrada de la caché
+        if_none_match: Valor del header If-None-Match de la petición
+        headers: Headers adicionales (p. ej. Cache-Control o Vary)
+        status_code: Código de estado de la respuesta completa
+
+    Returns:
+        Response: Respuesta completa o 304 Not Modified
+    """
+    response_headers = {"ETag": cached.etag, **(headers or {})}
+
+    if status_code == 200 and etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=response_headers)
+
+    return Response(
+        content=cached.body,
+        status_code=status_code,
+        media_type=cached.media_type,
+        headers=response_headers,
+    )
+
+
+class ResponseCache:
+    """Caché LRU acotada de respuestas renderizadas, versionada por entrada."""
+
+    def __init__(self, max_entries: int = 256, enabled: bool = True):
+        self._max_entries = max_entries
+        self._enabled = enabled
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si la caché está activa."""
+        return self._enabled
+
+    def configure(self, enabled: bool, max_entries: Optional[int] = None) -> None:
+        """
+        Activa o desactiva la caché y vacía su contenido.
+
+        Args:
+            enabled: Si la caché debe usarse
+            max_entries: Nuevo número máximo de entradas (opcional)
+        """
+        with self._lock:
+            self._enabled = enabled
+            if max_entries is not None:
+                self._max_entries = max_entries
+            self._entries.clear()
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[CachedResponse]:
+        """
+        Obtiene una entrada si existe y corresponde a la versión indicada.
+
+        Args:
+            key: Clave de la respuesta
+            version: Versión actual de los datos de los que depende
+
+        Returns:
+            Optional[CachedResponse]: Entrada vigente o None
+        """
+        if not self._enabled:
+            return None
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None or cached.version != version:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return cached
+
+    def put(
+        self, key: Hashable, version: Hashable, body: bytes, media_type: str
+    ) -> CachedResponse:
+        """
+        Guarda una respuesta renderizada y calcula su ETag.
+
+        Args:
+            key: Clave de la respuesta
+            version: Versión de los datos con los que se generó
+            body: Cuerpo de la respuesta
+            media_type: Tipo de contenido
+
+        Returns:
+            CachedResponse: Entrada creada
+        """
+        cached = CachedResponse(
+            body=body, etag=make_etag(body), media_type=media_type, version=version
+        )
+        if not self._enabled:
+            return cached
+
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+    def clear(self) -> None:
+        """Invalida todas las entradas."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Información de monitorización de la caché.
+
+        Returns:
+            Dict[str, Any]: Entradas, aciertos, fallos y tamaño en bytes
+        """
+        with self._lock:
+            return {
+                "enabled": self._enabled,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "bytes": sum(len(cached.body) for cached in self._entries.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
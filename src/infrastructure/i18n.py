@@ -17,6 +17,7 @@ class I18nConfig:
     SUPPORTED_LANGUAGES: List[str] = ["es", "en"]
     LANGUAGE_COOKIE_NAME: str = "preferred_language"
     LANGUAGE_COOKIE_MAX_AGE: int = 60 * 60 * 24 * 30  # 30 días
+    SNAPSHOT_FILE_NAME: str = "catalogs.snapshot.json"
 
     @classmethod
     def get_translations_dir(cls) -> Path:
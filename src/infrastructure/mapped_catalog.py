@@ -0,0 +1,198 @@
+"""
+Lector perezoso de catálogos .mo mapeados en memoria.
+
+Este módulo permite consultar un archivo .mo sin cargarlo completo en un
+diccionario de Python. El archivo se mapea con `mmap`, de forma que la caché
+de páginas del sistema operativo se comparte entre procesos, y las cadenas
+solo se decodifican la primera vez que se consultan.
+"""
+
+import gettext
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Optional
+
+LE_MAGIC = 0x950412DE
+BE_MAGIC = 0xDE120495
+HASH_WORD_BITS = 32
+
+
+def hashpjw(data: bytes) -> int:
+    """
+    Calcula el hash usado por la tabla hash del formato GNU .mo.
+
+    Args:
+        data: Cadena original codificada
+
+    Returns:
+        int: Valor hash de 32 bits
+    """
+    hval = 0
+    for byte in data:
+        hval = ((hval << 4) + byte) & 0xFFFFFFFF
+        g = hval & (0xF << (HASH_WORD_BITS - 4))
+        if g:
+            hval ^= g >> (HASH_WORD_BITS - 8)
+            hval ^= g
+    return hval
+
+
+class MappedTranslations(gettext.NullTranslations):
+    """
+    Catálogo de gettext que resuelve las claves directamente sobre el .mo mapeado.
+
+    Usa la tabla hash del archivo si existe y, si no (Babel no la genera),
+    una búsqueda binaria sobre la tabla de cadenas originales, que el formato
+    garantiza ordenada.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__()
+        with open(path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic = struct.unpack_from("<I", self._buffer, 0)[0]
+        if magic == LE_MAGIC:
+            self._endian = "<"
+        elif magic == BE_MAGIC:
+            self._endian = ">"
+        else:
+            self._buffer.close()
+            raise OSError(0, "Bad magic number", str(path))
+
+        (
+            _revision,
+            self._count,
+            self._originals_offset,
+            self._translations_offset,
+            self._hash_size,
+            self._hash_offset,
+        ) = struct.unpack_from(f"{self._endian}6I", self._buffer, 4)
+        self._entry_format = f"{self._endian}2I"
+        self._decoded: Dict[str, Optional[str]] = {}
+        self._charset = self._read_charset()
+
+    def _entry(self, table_offset: int, index: int) -> bytes:
+        """Devuelve los bytes de la entrada `index` de una tabla de cadenas."""
+        length, offset = struct.unpack_from(
+            self._entry_format, self._buffer, table_offset + index * 8
+        )
+        return self._buffer[offset : offset + length]
+
+    def _read_charset(self) -> str:
+        """Obtiene el juego de caracteres declarado en la cabecera del catálogo."""
+        index = self._find(b"")
+        if index is None:
+            return "utf-8"
+
+        header = self._entry(self._translations_offset, index).decode("ascii", "replace")
+        for line in header.splitlines():
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-type" and "charset=" in value:
+                return value.split("charset=")[1].strip() or "utf-8"
+        return "utf-8"
+
+    def _find_in_hash_table(self, original: bytes) -> Optional[int]:
+        """Busca una cadena original usando la tabla hash del .mo."""
+        hash_value = hashpjw(original)
+        index = hash_value % self._hash_size
+        increment = 1 + hash_value % (self._hash_size - 2)
+        word_format = f"{self._endian}I"
+
+        while True:
+            string_number = struct.unpack_from(
+                word_format, self._buffer, self._hash_offset + index * 4
+            )[0]
+            if string_number == 0:
+                return None
+
+            string_number -= 1
+            if (
+                string_number < self._count
+                and self._entry(self._originals_offset, string_number) == original
+            ):
+                return string_number
+
+            if index >= self._hash_size - increment:
+                index -= self._hash_size - increment
+            else:
+                index += increment
+
+    def _find_sorted(self, original: bytes) -> Optional[int]:
+        """Busca una cadena original por búsqueda binaria sobre la tabla ordenada."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self._entry(self._originals_offset, middle)
+            if candidate < original:
+                low = middle + 1
+            elif candidate > original:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def _find(self, original: bytes) -> Optional[int]:
+        """Localiza el índice de una cadena original en el catálogo."""
+        if self._hash_size > 2:
+            return self._find_in_hash_table(original)
+        return self._find_sorted(original)
+
+    def lookup(self, message: str) -> Optional[str]:
+        """
+        Busca un mensaje en el catálogo decodificándolo solo la primera vez.
+
+        A diferencia de `gettext`, distingue una clave ausente de una cuya
+        traducción coincide con la propia clave.
+
+        Args:
+            message: Clave a buscar
+
+        Returns:
+            Optional[str]: Traducción o None si el catálogo no contiene la clave
+        """
+        if message in self._decoded:
+            return self._decoded[message]
+        if self._buffer.closed:
+            return None
+
+        index = self._find(message.encode(self._charset))
+        translated = None
+        if index is not None:
+            translated = self._entry(self._translations_offset, index).decode(
+                self._charset
+            )
+
+        self._decoded[message] = translated
+        return translated
+
+    def gettext(self, message: str) -> str:
+        """
+        Traduce un mensaje decodificándolo solo la primera vez que se consulta.
+
+        Args:
+            message: Clave a traducir
+
+        Returns:
+            str: Traducción o el propio mensaje si no existe
+        """
+        translated = self.lookup(message)
+        if translated is not None:
+            return translated
+        if self._fallback:
+            return self._fallback.gettext(message)
+        return message
+
+    def close(self) -> None:
+        """
+        Libera el mapeo del archivo.
+
+        Las consultas posteriores solo resuelven las claves ya decodificadas;
+        el resto se tratan como ausentes.
+        """
+        self._buffer.close()
+
+    def __len__(self) -> int:
+        """Número de entradas del catálogo, incluida la cabecera."""
+        return self._count
@@ -0,0 +1,368 @@
+"""
+Datos de referencia del creador de personajes.
+
+Este módulo guarda cada colección de datos de referencia (razas, clases,
+conjuros...) junto a su representación JSON ya codificada, su ETag y una
+versión de contenido. Las respuestas de la API se sirven directamente desde
+esos bytes y solo se vuelven a codificar cuando cambian los datos.
+
+Cada elemento del catálogo incorporado tiene un UUID fijo derivado de su
+colección y su número, el mismo con el que se siembra en la base de datos;
+así los IDs que envía el formulario existen en las tablas de referencia.
+"""
+
+import hashlib
+import json
+import threading
+import uuid
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from starlette.responses import Response
+
+from src.infrastructure.config import settings
+from src.infrastructure.http_cache import CachedResponse, build_cached_response, make_etag
+
+ReferenceItems = List[Dict[str, Any]]
+
+# Espacio de nombres de los UUID de los datos de referencia incorporados
+REFERENCE_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "roleplaying-characters:reference-data")
+
+# Catálogo incorporado; "id" es el número del elemento dentro de su colección
+BUILTIN_REFERENCE_DATA: Dict[str, ReferenceItems] = {
+    # Simulamos datos de razas para la interfaz
+    "races": [
+        {"id": 1, "name": "Human", "description": "Versatile and adaptable"},
+        {"id": 2, "name": "Elf", "description": "Graceful and long-lived"},
+        {"id": 3, "name": "Dwarf", "description": "Strong and sturdy"},
+        {"id": 4, "name": "Halfling", "description": "Small and nimble"},
+        {"id": 5, "name": "Gnome", "description": "Curious and inventive"}
+    ],
+    # Simulamos datos de trasfondos para la interfaz
+    "backgrounds": [
+        {"id": 1, "name": "Noble", "description": "Born to wealth and privilege"},
+        {"id": 2, "name": "Acolyte", "description": "Served in a temple"},
+        {"id": 3, "name": "Criminal", "description": "Has a criminal past"},
+        {"id": 4, "name": "Soldier", "description": "Trained in military"},
+        {"id": 5, "name": "Sage", "description": "Scholar and researcher"}
+    ],
+    # Simulamos datos de alineamientos para la interfaz
+    "alignments": [
+        {"id": 1, "name": "Lawful Good", "description": "Honor and compassion"},
+        {"id": 2, "name": "Neutral Good", "description": "Do the best good"},
+        {"id": 3, "name": "Chaotic Good", "description": "Freedom and kindness"},
+        {"id": 4, "name": "Lawful Neutral", "description": "Order above all"},
+        {"id": 5, "name": "True Neutral", "description": "Balance in all things"},
+        {"id": 6, "name": "Chaotic Neutral", "description": "Freedom above all"},
+        {"id": 7, "name": "Lawful Evil", "description": "Methodical conquest"},
+        {"id": 8, "name": "Neutral Evil", "description": "Selfish interest"},
+        {"id": 9, "name": "Chaotic Evil", "description": "Destruction and chaos"}
+    ],
+    # Simulamos datos de habilidades para la interfaz
+    "skills": [
+        {"id": 1, "name": "Acrobatics", "attribute": "dexterity"},
+        {"id": 2, "name": "Animal Handling", "attribute": "wisdom"},
+        {"id": 3, "name": "Arcana", "attribute": "intelligence"},
+        {"id": 4, "name": "Athletics", "attribute": "strength"},
+        {"id": 5, "name": "Deception", "attribute": "charisma"},
+        {"id": 6, "name": "History", "attribute": "intelligence"},
+        {"id": 7, "name": "Insight", "attribute": "wisdom"},
+        {"id": 8, "name": "Intimidation", "attribute": "charisma"},
+        {"id": 9, "name": "Investigation", "attribute": "intelligence"},
+        {"id": 10, "name": "Medicine", "attribute": "wisdom"},
+        {"id": 11, "name": "Nature", "attribute": "intelligence"},
+        {"id": 12, "name": "Perception", "attribute": "wisdom"},
+        {"id": 13, "name": "Performance", "attribute": "charisma"},
+        {"id": 14, "name": "Persuasion", "attribute": "charisma"},
+        {"id": 15, "name": "Religion", "attribute": "intelligence"},
+        {"id": 16, "name": "Sleight of Hand", "attribute": "dexterity"},
+        {"id": 17, "name": "Stealth", "attribute": "dexterity"},
+        {"id": 18, "name": "Survival", "attribute": "wisdom"}
+    ],
+    # Simulamos datos de idiomas para la interfaz
+    "languages": [
+        {"id": 1, "name": "Common", "description": "The common tongue of humans"},
+        {"id": 2, "name": "Elvish", "description": "The language of elves"},
+        {"id": 3, "name": "Dwarvish", "description": "The language of dwarves"},
+        {"id": 4, "name": "Giant", "description": "The language of giants"},
+        {"id": 5, "name": "Gnomish", "description": "The language of gnomes"},
+        {"id": 6, "name": "Goblin", "description": "The language of goblins"},
+        {"id": 7, "name": "Halfling", "description": "The language of halflings"},
+        {"id": 8, "name": "Orc", "description": "The language of orcs"},
+        {"id": 9, "name": "Abyssal", "description": "The language of demons"},
+        {"id": 10, "name": "Celestial", "description": "The language of celestials"}
+    ],
+    # Simulamos datos de competencias para la interfaz
+    "proficiencies": [
+        {"id": 1, "name": "Light Armor", "type": "armor"},
+        {"id": 2, "name": "Medium Armor", "type": "armor"},
+        {"id": 3, "name": "Heavy Armor", "type": "armor"},
+        {"id": 4, "name": "Shields", "type": "armor"},
+        {"id": 5, "name": "Simple Weapons", "type": "weapon"},
+        {"id": 6, "name": "Martial Weapons", "type": "weapon"},
+        {"id": 7, "name": "Alchemist's Supplies", "type": "tool"},
+        {"id": 8, "name": "Brewer's Supplies", "type": "tool"},
+        {"id": 9, "name": "Carpenter's Tools", "type": "tool"},
+        {"id": 10, "name": "Cook's Utensils", "type": "tool"}
+    ],
+    # Simulamos datos de hechizos para la interfaz
+    "spells": [
+        {"id": 1, "name": "Acid Splash", "level": 0, "school": "Conjuration"},
+        {"id": 2, "name": "Chill Touch", "level": 0, "school": "Necromancy"},
+        {"id": 3, "name": "Magic Missile", "level": 1, "school": "Evocation"},
+        {"id": 4, "name": "Burning Hands", "level": 1, "school": "Evocation"},
+        {"id": 5, "name": "Cure Wounds", "level": 1, "school": "Evocation"},
+        {"id": 6, "name": "Detect Magic", "level": 1, "school": "Divination"},
+        {"id": 7, "name": "Fireball", "level": 3, "school": "Evocation"},
+        {"id": 8, "name": "Fly", "level": 3, "school": "Transmutation"}
+    ],
+    # Simulamos datos de objetos para la interfaz
+    "items": [
+        {"id": 1, "name": "Potion of Healing", "type": "consumable", "rarity": "common"},
+        {"id": 2, "name": "Longsword", "type": "weapon", "rarity": "common"},
+        {"id": 3, "name": "Shield", "type": "armor", "rarity": "common"},
+        {"id": 4, "name": "Rope", "type": "gear", "rarity": "common"},
+        {"id": 5, "name": "Lantern", "type": "gear", "rarity": "common"},
+        {"id": 6, "name": "Spellbook", "type": "gear", "rarity": "uncommon"},
+        {"id": 7, "name": "Studded Leather", "type": "armor", "rarity": "common"},
+        {"id": 8, "name": "Wand of Magic Missiles", "type": "magic", "rarity": "uncommon"},
+        {"id": 9, "name": "Amulet of Health", "type": "magic", "rarity": "rare"},
+        {"id": 10, "name": "Bag of Holding", "type": "magic", "rarity": "uncommon"}
+    ],
+    # Simulamos datos de clases para la interfaz; los elementos sin game_type
+    # son comunes a todos los tipos de juego
+    "classes": [
+        {"id": 1, "name": "Fighter", "description": "Master of weapons and armor"},
+        {"id": 2, "name": "Wizard", "description": "Scholar of magical arts"},
+        {"id": 3, "name": "Rogue", "description": "Expert in stealth and trickery"},
+        {"id": 4, "name": "Cleric", "description": "Divine spellcaster and healer"},
+        {"id": 5, "name": "Ranger", "description": "Hunter and tracker"},
+        {"id": 6, "name": "Barbarian", "description": "Fierce warrior of the wilds"},
+        {"id": 7, "name": "Bard", "description": "Master of song and story"},
+        {"id": 8, "name": "Druid", "description": "Guardian of nature"},
+        {"id": 9, "name": "Monk", "description": "Master of martial arts"},
+        {"id": 10, "name": "Paladin", "description": "Holy warrior"},
+        {"id": 11, "name": "Sorcerer", "description": "Innate magical power"},
+        {"id": 12, "name": "Warlock", "description": "Pact-bound spellcaster", "game_type": "dnd5e"},
+        {"id": 13, "name": "Alchemist", "description": "Brewer of bombs and elixirs", "game_type": "pathfinder"}
+    ],
+}
+
+
+def reference_id(collection: str, number: int) -> uuid.UUID:
+    """
+    Calcula el UUID fijo de un elemento del catálogo incorporado.
+
+    Args:
+        collection: Nombre de la colección (p. ej. "races")
+        number: Número del elemento dentro de la colección
+
+    Returns:
+        uuid.UUID: ID del elemento en la base de datos
+    """
+    return uuid.uuid5(REFERENCE_ID_NAMESPACE, f"{collection}:{number}")
+
+
+def assign_reference_ids(
+    collections: Mapping[str, ReferenceItems],
+) -> Dict[str, ReferenceItems]:
+    """
+    Sustituye el número de cada elemento por su UUID de la base de datos.
+
+    Args:
+        collections: Colecciones con elementos numerados
+
+    Returns:
+        Dict[str, ReferenceItems]: Copia de las colecciones con los UUID como texto
+    """
+    return {
+        name: [{**item, "id": str(reference_id(name, item["id"]))} for item in items]
+        for name, items in collections.items()
+    }
+
+
+# Datos de referencia servidos por la API, con los mismos IDs que la base de datos
+DEFAULT_REFERENCE_DATA = assign_reference_ids(BUILTIN_REFERENCE_DATA)
+
+
+def encode_json(payload: Any) -> bytes:
+    """
+    Codifica un valor a JSON compacto en UTF-8.
+
+    Args:
+        payload: Valor serializable
+
+    Returns:
+        bytes: JSON codificado
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def merge_reference_rows(
+    items: Sequence[Mapping[str, Any]], rows: Iterable[Mapping[str, Any]]
+) -> ReferenceItems:
+    """
+    Combina las filas de la base de datos con los campos del catálogo incorporado.
+
+    La base de datos decide qué elementos existen y su nombre; el catálogo
+    aporta los campos que no están en el esquema (tipo de juego, rareza,
+    nivel del conjuro...). Los elementos conocidos conservan el orden del
+    catálogo y los demás se añaden después, en el orden de las filas.
+
+    Args:
+        items: Elementos del catálogo incorporado, con su UUID como "id"
+        rows: Filas de la tabla de referencia
+
+    Returns:
+        ReferenceItems: Elementos que se sirven en la API
+    """
+    known = {item["id"]: position for position, item in enumerate(items)}
+    merged: List[Tuple[float, Dict[str, Any]]] = []
+    for order, row in enumerate(rows):
+        item_id = str(row["id"])
+        position = known.get(item_id)
+        item = dict(items[position]) if position is not None else {}
+        item.update(id=item_id, name=row["name"])
+        if row.get("description") is not None:
+            item["description"] = row["description"]
+        merged.append((position if position is not None else len(items) + order, item))
+    merged.sort(key=lambda entry: entry[0])
+    return [item for _, item in merged]
+
+
+class ReferenceDataStore:
+    """
+    Colecciones de datos de referencia con su JSON precodificado.
+
+    Cada colección se codifica una vez al registrarla; la versión global
+    cambia cuando se modifica cualquiera de ellas, lo que permite invalidar
+    cachés derivadas (p. ej. el catálogo agregado). Las colecciones iniciales
+    se sirven hasta que `sync_collection` las sustituye por las filas de la
+    base de datos.
+    """
+
+    def __init__(self, collections: Optional[Mapping[str, ReferenceItems]] = None):
+        self._items: Dict[str, ReferenceItems] = {}
+        self._encoded: Dict[str, CachedResponse] = {}
+        self._defaults: Dict[str, ReferenceItems] = {}
+        self._sources: Dict[str, Any] = {}
+        self._version = ""
+        self._lock = threading.Lock()
+        for name, items in (collections or {}).items():
+            self.set_collection(name, items)
+            self._defaults[name] = self._items[name]
+
+    @property
+    def version(self) -> str:
+        """Versión de contenido del conjunto de colecciones."""
+        return self._version
+
+    def names(self) -> Tuple[str, ...]:
+        """Nombres de las colecciones registradas."""
+        return tuple(self._items)
+
+    def get_items(self, name: str) -> ReferenceItems:
+        """
+        Obtiene los elementos de una colección.
+
+        Args:
+            name: Nombre de la colección
+
+        Returns:
+            ReferenceItems: Elementos de la colección (no deben modificarse)
+        """
+        return self._items[name]
+
+    def get_encoded(self, name: str) -> CachedResponse:
+        """
+        Obtiene la colección ya codificada en JSON con su ETag.
+
+        Args:
+            name: Nombre de la colección
+
+        Returns:
+            CachedResponse: Cuerpo JSON, ETag y versión de la colección
+        """
+        return self._encoded[name]
+
+    def set_collection(self, name: str, items: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Registra o sustituye una colección, codificándola solo si su contenido cambia.
+
+        Args:
+            name: Nombre de la colección
+            items: Elementos de la colección
+
+        Returns:
+            bool: True si el contenido ha cambiado
+        """
+        items = [dict(item) for item in items]
+        body = encode_json(items)
+        etag = make_etag(body)
+
+        with self._lock:
+            current = self._encoded.get(name)
+            if current is not None and current.etag == etag:
+                return False
+
+            self._items[name] = items
+            self._encoded[name] = CachedResponse(
+                body=body, etag=etag, media_type="application/json", version=etag
+            )
+            self._version = hashlib.sha1(
+                "".join(cached.etag for cached in self._encoded.values()).encode()
+            ).hexdigest()
+        return True
+
+    def sync_collection(self, name: str, rows: Sequence[Mapping[str, Any]]) -> bool:
+        """
+        Sustituye una colección por las filas de su tabla de referencia.
+
+        Las filas llegan de la caché de `GetCharacterDataUseCase`, que
+        devuelve el mismo objeto mientras no cambian; si es el último
+        sincronizado no se hace nada.
+
+        Args:
+            name: Nombre de la colección
+            rows: Filas de la base de datos (inmutables)
+
+        Returns:
+            bool: True si el contenido servido ha cambiado
+        """
+        if self._sources.get(name) is rows:
+            return False
+        changed = self.set_collection(
+            name, merge_reference_rows(self._defaults.get(name, []), rows)
+        )
+        self._sources[name] = rows
+        return changed
+
+    def build_response(self, name: str, if_none_match: Optional[str]) -> Response:
+        """
+        Construye la respuesta HTTP de una colección, o un 304 si el cliente la tiene.
+
+        Args:
+            name: Nombre de la colección
+            if_none_match: Valor del header If-None-Match de la petición
+
+        Returns:
+            Response: JSON precodificado o 304 Not Modified
+        """
+        return build_cached_response(
+            self.get_encoded(name),
+            if_none_match,
+            headers={"Cache-Control": get_cache_control()},
+        )
+
+
+def get_cache_control() -> str:
+    """
+    Valor de Cache-Control para los datos de referencia.
+
+    Returns:
+        str: Directivas de caché con el tiempo configurado
+    """
+    return f"public, max-age={settings.api_cache_max_age}, must-revalidate"
+
+
+# Instancia global con los datos de referencia por defecto
+reference_data = ReferenceDataStore(DEFAULT_REFERENCE_DATA)
@@ -0,0 +1,362 @@
+"""
+Índice de búsqueda en memoria para los datos de referencia.
+
+Este módulo construye un índice invertido sobre el nombre y la descripción
+de las entidades del catálogo (conjuros, objetos, razas...) con búsqueda por
+prefijo, sin distinguir acentos y tolerante a erratas de una letra. Los
+índices se construyen por tipo de entidad e idioma y se regeneran cuando
+cambian los datos de referencia.
+"""
+
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+from src.infrastructure.i18n import I18nConfig
+from src.infrastructure.reference_data import ReferenceDataStore, reference_data
+
+# Tipo de entidad buscable y colección de datos de referencia que lo contiene
+SEARCH_TYPES: Dict[str, str] = {
+    "spell": "spells",
+    "item": "items",
+    "race": "races",
+    "class": "classes",
+    "background": "backgrounds",
+    "skill": "skills",
+    "language": "languages",
+    "proficiency": "proficiencies",
+}
+
+# Peso de cada campo indexado
+FIELD_WEIGHTS: Dict[str, float] = {"name": 3.0, "description": 1.0}
+
+# Factor de puntuación según cómo coincide el término
+EXACT_MATCH = 1.0
+PREFIX_MATCH = 0.7
+FUZZY_MATCH = 0.5
+
+# Longitud mínima de un término para buscar por prefijo y con erratas
+MIN_PREFIX_LENGTH = 2
+MIN_FUZZY_LENGTH = 4
+
+STOPWORDS: Dict[str, FrozenSet[str]] = {
+    "es": frozenset(
+        "a al con de del el en la las lo los o para por se sin su sus un una y".split()
+    ),
+    "en": frozenset(
+        "a an and as at by for from in into is it of on or the to with".split()
+    ),
+}
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """
+    Pasa un texto a minúsculas y elimina los acentos.
+
+    Args:
+        text: Texto original
+
+    Returns:
+        str: Texto normalizado
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def stem(token: str, language: str) -> str:
+    """
+    Reduce los plurales regulares a singular según el idioma.
+
+    Args:
+        token: Término normalizado
+        language: Código de idioma
+
+    Returns:
+        str: Término sin la terminación de plural
+    """
+    if language == "es":
+        if len(token) > 4 and token.endswith("es") and token[-3] not in "aeiou":
+            return token[:-2]
+        if len(token) > 3 and token.endswith("s") and token[-2] in "aeiou":
+            return token[:-1]
+        return token
+
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str, language: str = I18nConfig.DEFAULT_LANGUAGE) -> List[str]:
+    """
+    Divide un texto en términos normalizados sin palabras vacías del idioma.
+
+    Args:
+        text: Texto a dividir
+        language: Código de idioma
+
+    Returns:
+        List[str]: Términos del texto
+    """
+    stopwords = STOPWORDS.get(language, frozenset())
+    return [
+        stem(token, language)
+        for token in TOKEN_PATTERN.findall(normalize(text))
+        if token not in stopwords
+    ]
+
+
+def deletion_variants(token: str) -> Set[str]:
+    """
+    Genera las variantes de un término con una letra eliminada.
+
+    Dos términos a distancia de edición 1 comparten al menos una variante
+    (o uno es variante del otro), lo que permite encontrar candidatos sin
+    comparar con todo el vocabulario.
+
+    Args:
+        token: Término normalizado
+
+    Returns:
+        Set[str]: Variantes del término
+    """
+    return {token[:index] + token[index + 1:] for index in range(len(token))}
+
+
+def within_one_edit(first: str, second: str) -> bool:
+    """
+    Comprueba si dos términos están a distancia de edición como mucho 1.
+
+    Cuenta como una edición una inserción, un borrado, una sustitución o la
+    transposición de dos letras contiguas.
+
+    Args:
+        first: Primer término
+        second: Segundo término
+
+    Returns:
+        bool: True si los términos difieren como mucho en una edición
+    """
+    if abs(len(first) - len(second)) > 1:
+        return False
+    if len(first) > len(second):
+        first, second = second, first
+
+    index = 0
+    while index < len(first) and first[index] == second[index]:
+        index += 1
+
+    if len(first) == len(second):
+        if first[index + 1:] == second[index + 1:]:
+            return True
+        return (
+            index + 1 < len(first)
+            and first[index] == second[index + 1]
+            and first[index + 1] == second[index]
+            and first[index + 2:] == second[index + 2:]
+        )
+    return first[index:] == second[index + 1:]
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """Documento encontrado con su puntuación."""
+
+    document: Mapping[str, Any]
+    score: float
+    matched_terms: int
+
+
+class SearchIndex:
+    """Índice invertido de una colección de documentos en un idioma."""
+
+    def __init__(
+        self,
+        documents: Iterable[Mapping[str, Any]],
+        language: str = I18nConfig.DEFAULT_LANGUAGE,
+    ):
+        self._language = language
+        self._documents: List[Mapping[str, Any]] = list(documents)
+        postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+
+        for doc_id, document in enumerate(self._documents):
+            for field, weight in FIELD_WEIGHTS.items():
+                value = document.get(field)
+                if not value:
+                    continue
+                for token in tokenize(str(value), language):
+                    postings[token][doc_id] = postings[token].get(doc_id, 0.0) + weight
+
+        total = max(len(self._documents), 1)
+        self._postings: Dict[str, Dict[int, float]] = dict(postings)
+        self._idf: Dict[str, float] = {
+            token: math.log(1 + total / len(docs)) for token, docs in self._postings.items()
+        }
+        self._vocabulary: List[str] = sorted(self._postings)
+        self._deletions: Dict[str, List[str]] = defaultdict(list)
+        for token in self._vocabulary:
+            if len(token) >= MIN_FUZZY_LENGTH:
+                for variant in deletion_variants(token):
+                    self._deletions[variant].append(token)
+
+    def __len__(self) -> int:
+        """Número de documentos indexados."""
+        return len(self._documents)
+
+    def _prefix_matches(self, term: str) -> List[str]:
+        """Términos del vocabulario que empiezan por `term`."""
+        matches = []
+        index = bisect_left(self._vocabulary, term)
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(term):
+            matches.append(self._vocabulary[index])
+            index += 1
+        return matches
+
+    def _fuzzy_matches(self, term: str) -> Set[str]:
+        """Términos del vocabulario a una edición de `term`."""
+        candidates: Set[str] = set(self._deletions.get(term, ()))
+        for variant in deletion_variants(term):
+            if variant in self._postings:
+                candidates.add(variant)
+            candidates.update(self._deletions.get(variant, ()))
+        return {candidate for candidate in candidates if within_one_edit(term, candidate)}
+
+    def _expand(self, term: str, is_last: bool) -> Dict[str, float]:
+        """
+        Obtiene los términos del índice que coinciden con un término de la consulta.
+
+        La búsqueda por prefijo solo se aplica al último término, que es el que
+        el usuario está escribiendo.
+
+        Returns:
+            Dict[str, float]: Término del índice y factor de coincidencia
+        """
+        matches: Dict[str, float] = {}
+        if term in self._postings:
+            matches[term] = EXACT_MATCH
+        if is_last and len(term) >= MIN_PREFIX_LENGTH:
+            for token in self._prefix_matches(term):
+                matches.setdefault(token, PREFIX_MATCH)
+        if not matches and len(term) >= MIN_FUZZY_LENGTH:
+            for token in self._fuzzy_matches(term):
+                matches.setdefault(token, FUZZY_MATCH)
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+        """
+        Busca los documentos que mejor coinciden con la consulta.
+
+        Los documentos que coinciden con más términos de la consulta van
+        primero; a igualdad, los de mayor puntuación TF-IDF ponderada por campo.
+
+        Args:
+            query: Texto de búsqueda
+            limit: Número máximo de resultados
+
+        Returns:
+            List[SearchResult]: Resultados ordenados por relevancia
+        """
+        terms = list(dict.fromkeys(tokenize(query, self._language)))
+        if not terms:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        matched: Dict[int, int] = defaultdict(int)
+        for position, term in enumerate(terms):
+            best: Dict[int, float] = {}
+            for token, factor in self._expand(term, position == len(terms) - 1).items():
+                idf = self._idf[token]
+                for doc_id, weight in self._postings[token].items():
+                    score = weight * idf * factor
+                    if score > best.get(doc_id, 0.0):
+                        best[doc_id] = score
+            for doc_id, score in best.items():
+                scores[doc_id] += score
+                matched[doc_id] += 1
+
+        top = heapq.nlargest(
+            limit, scores, key=lambda doc_id: (matched[doc_id], scores[doc_id], -doc_id)
+        )
+        return [
+            SearchResult(self._documents[doc_id], round(scores[doc_id], 4), matched[doc_id])
+            for doc_id in top
+        ]
+
+
+class SearchService:
+    """Índices de búsqueda por (tipo, idioma), regenerados al cambiar los datos."""
+
+    def __init__(self, store: Optional[ReferenceDataStore] = None):
+        self._store = store or reference_data
+        self._indexes: Dict[Tuple[str, str], SearchIndex] = {}
+        self._version = self._store.version
+        self._lock = threading.Lock()
+
+    def build_all(self) -> int:
+        """
+        Construye por adelantado todos los índices de todos los idiomas.
+
+        Returns:
+            int: Número de índices construidos
+        """
+        for search_type in SEARCH_TYPES:
+            for language in I18nConfig.SUPPORTED_LANGUAGES:
+                self.get_index(search_type, language)
+        return len(self._indexes)
+
+    def get_index(self, search_type: str, language: str) -> SearchIndex:
+        """
+        Obtiene el índice de un tipo de entidad, construyéndolo si hace falta.
+
+        Args:
+            search_type: Tipo de entidad (ver SEARCH_TYPES)
+            language: Código de idioma para la tokenización
+
+        Returns:
+            SearchIndex: Índice de la colección
+
+        Raises:
+            KeyError: Si el tipo de entidad no existe
+        """
+        collection = SEARCH_TYPES[search_type]
+        key = (search_type, language)
+        with self._lock:
+            if self._version != self._store.version:
+                self._indexes = {}
+                self._version = self._store.version
+
+            index = self._indexes.get(key)
+            if index is None:
+                index = SearchIndex(self._store.get_items(collection), language)
+                self._indexes[key] = index
+            return index
+
+    def search(
+        self, search_type: str, query: str, language: str, limit: int = 10
+    ) -> List[SearchResult]:
+        """
+        Busca entidades de un tipo.
+
+        Args:
+            search_type: Tipo de entidad (ver SEARCH_TYPES)
+            query: Texto de búsqueda
+            language: Código de idioma de la consulta
+            limit: Número máximo de resultados
+
+        Returns:
+            List[SearchResult]: Resultados ordenados por relevancia
+        """
+        return self.get_index(search_type, language).search(query, limit)
+
+
+# Instancia global del servicio de búsqueda
+search_service = SearchService()
@@ -5,15 +5,118 @@ Este módulo contiene funciones auxiliares que se pueden usar
 en los templates de Jinja2 para simplificar tareas comunes.
 """
 
-import os
-from typing import Callable
-from functools import wraps
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Tuple
+from functools import lru_cache, wraps
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
+from starlette.responses import Response
+from src.infrastructure.config import settings
+from src.infrastructure.http_cache import ResponseCache, build_cached_response
+from src.infrastructure.templating import TEMPLATES_DIR, specialized_templates
 from src.infrastructure.translation_service import translation_service
 from src.infrastructure.i18n import I18nConfig
 
 
+class TemplateWatcher:
+    """Detecta cambios en los templates HTML para invalidar las páginas cacheadas."""
+
+    def __init__(self, templates_dir: Path, enabled: bool, interval: float):
+        self._templates_dir = templates_dir
+        self._enabled = enabled
+        self._interval = interval
+        self._last_check = time.monotonic()
+        self._signature = self._compute_signature() if enabled else ()
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Versión de los templates; se incrementa cuando alguno cambia."""
+        return self._version
+
+    def _compute_signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Calcula la firma (ruta, mtime, tamaño) de todos los templates."""
+        signature = []
+        for path in sorted(self._templates_dir.rglob("*.html")):
+            stat = path.stat()
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def check(self) -> int:
+        """
+        Comprueba si algún template ha cambiado, como mucho una vez por intervalo.
+
+        Returns:
+            int: Versión actual de los templates
+        """
+        if not self._enabled:
+            return self._version
+
+        now = time.monotonic()
+        if now - self._last_check < self._interval or not self._lock.acquire(blocking=False):
+            return self._version
+
+        try:
+            self._last_check = now
+            signature = self._compute_signature()
+            if signature != self._signature:
+                self._signature = signature
+                self._version += 1
+        finally:
+            self._lock.release()
+        return self._version
+
+
+template_watcher = TemplateWatcher(
+    TEMPLATES_DIR, settings.templates_reload, settings.templates_reload_interval
+)
+page_cache = ResponseCache(
+    max_entries=settings.page_cache_max_entries, enabled=settings.page_cache
+)
+
+
+# Mapeo de nombres de ruta a paths
+ROUTE_MAP: Mapping[str, str] = MappingProxyType({
+    "home": "/",
+    "create_character": "/create-character",
+    "character_detail": "/character/{character_id}",
+    "browse_characters": "/browse",
+    "user_characters": "/characters",
+    "help": "/help",
+    "contact": "/contact",
+    "feedback": "/feedback",
+    "privacy": "/privacy",
+    "terms": "/terms",
+})
+
+
+def url_for(name: str, **path_params) -> str:
+    """
+    Genera URLs para rutas nombradas.
+
+    Args:
+        name: Nombre de la ruta
+        **path_params: Parámetros de la ruta
+
+    Returns:
+        str: URL generada
+    """
+    if name not in ROUTE_MAP:
+        return f"/{name}"  # Fallback
+
+    url = ROUTE_MAP[name]
+
+    # Reemplazar parámetros de path
+    for param, value in path_params.items():
+        url = url.replace(f"{{{param}}}", str(value))
+
+    return url
+
+
 def create_translation_function(language: str, domain: str = "home") -> Callable[[str, str | None], str]:
     """
     Crea una función de traducción para un idioma y dominio específico.
@@ -25,7 +128,6 @@ def create_translation_function(language: str, domain: str = "home") -> Callable
     Returns:
         Callable: Función que traduce claves con dominio opcional
     """
-
     def translate(key: str, forced_domain: str | None = None) -> str:
         """
         Traduce una clave usando el idioma y dominio especificados.
@@ -37,75 +139,55 @@ def create_translation_function(language: str, domain: str = "home") -> Callable
         Returns:
             str: Texto traducido
         """
-        # Asegurarnos de que translation_service esté completamente inicializado
-        if not hasattr(translation_service, '_translations') or not translation_service._translations:
-            translation_service.reload_translations()
-            
-        result = translation_service.get_translation(key, language, forced_domain or domain)
-        # Si la traducción falló (devolvió la misma clave), registrar para debug
-        if result == key:
-            print(f"❌ Traducción fallida para '{key}' en {language}/{forced_domain or domain}")
-        return result
+        return translation_service.get_translation(key, language, forced_domain or domain)
 
     return translate
 
 
-def get_translation_context(language: str, domain: str = "home") -> dict:
+@lru_cache(maxsize=64)
+def _build_translation_context(
+    language: str, domain: str, catalog_version: int
+) -> Mapping[str, Any]:
     """
-    Obtiene el contexto de traducción para usar en templates.
+    Construye el contexto inmutable de un idioma y dominio para una versión de los catálogos.
 
     Args:
         language: Código de idioma
         domain: Dominio de traducción por defecto
+        catalog_version: Versión de los catálogos (forma parte de la clave de caché)
 
     Returns:
-        dict: Contexto con funciones de traducción
+        Mapping[str, Any]: Contexto de solo lectura
     """
-    def url_for(name: str, **path_params) -> str:
-        """
-        Genera URLs para rutas nombradas.
-        
-        Args:
-            name: Nombre de la ruta
-            **path_params: Parámetros de la ruta
-            
-        Returns:
-            str: URL generada
-        """
-        # Mapeo de nombres de ruta a paths
-        route_map = {
-            "home": "/",
-            "create_character": "/create-character",
-            "character_detail": "/character/{character_id}",
-            "browse_characters": "/browse",
-            "user_characters": "/characters",
-            "help": "/help",
-            "contact": "/contact",
-            "feedback": "/feedback",
-            "privacy": "/privacy",
-            "terms": "/terms",
-        }
-        
-        if name not in route_map:
-            return f"/{name}"  # Fallback
-            
-        url = route_map[name]
-        
-        # Reemplazar parámetros de path
-        for param, value in path_params.items():
-            url = url.replace(f"{{{param}}}", str(value))
-            
-        return url
-    
-    return {
+    return MappingProxyType({
         "_": create_translation_function(language, domain),
         "_header": create_translation_function(language, "header"),
         "_footer": create_translation_function(language, "footer"),
         "language": language,
-        "available_domains": translation_service.get_available_domains(),
+        "current_lang": language,
+        "available_domains": tuple(translation_service.get_available_domains()),
         "get_locale": lambda: language,
         "url_for": url_for,
-    }
+    })
+
+
+def get_translation_context(language: str, domain: str = "home") -> Mapping[str, Any]:
+    """
+    Obtiene el contexto de traducción para usar en templates.
+
+    El contexto se crea una sola vez por idioma y dominio y se reutiliza entre
+    peticiones hasta que cambian los catálogos de traducción.
+
+    Args:
+        language: Código de idioma
+        domain: Dominio de traducción por defecto
+
+    Returns:
+        Mapping[str, Any]: Contexto de solo lectura con funciones de traducción
+    """
+    return _build_translation_context(
+        language, domain, translation_service.catalog_version
+    )
 
 
 def get_lang_query(request: Request, default: str = I18nConfig.DEFAULT_LANGUAGE) -> str:
@@ -145,9 +227,8 @@ def render_template_with_translations(
     Returns:
         TemplateResponse con traducciones automáticamente incluidas
     """
-    # Recargar traducciones en desarrollo
-    if not os.getenv("VERCEL"):
-        translation_service.reload_translations()
+    # Recargar solo los catálogos modificados (desactivado en Vercel)
+    translation_service.reload_if_changed()
 
     # Detectar idioma
     language = translation_service.get_language_from_request(request)
@@ -156,18 +237,72 @@ def render_template_with_translations(
     # Guardar el parámetro lang para enlaces
     lang_query = get_lang_query(request)
     # Preparar contexto base
-    base_context = {"request": request, **get_translation_context(language, domain), "lang_query": lang_query, "current_lang": language}
+    base_context = {**get_translation_context(language, domain), "request": request, "lang_query": lang_query}
 
     # Combinar con el contexto adicional
     if context:
         base_context.update(context)
 
+    # Usar la versión del template con las traducciones ya incrustadas
+    if settings.templates_inline_translations:
+        templates = specialized_templates.get(templates, language, domain)
+
     # Generar la respuesta con el template
     response = templates.TemplateResponse(template_name, base_context)
 
     return response
 
 
+def render_cached_page(
+    templates: Jinja2Templates,
+    template_name: str,
+    request: Request,
+    context: dict | None = None,
+    status_code: int = 200,
+) -> Response:
+    """
+    Renderiza una página que solo depende del idioma, sirviéndola desde la caché.
+
+    La clave incluye template, ruta, idioma, `lang_query` y dominio; la versión
+    combina la de los catálogos de traducción y la de los templates, por lo que
+    cualquier recarga invalida las entradas. Si el cliente envía un
+    `If-None-Match` que coincide con el ETag se responde con 304.
+
+    Args:
+        templates: Instancia de Jinja2Templates
+        template_name: Nombre del template a renderizar
+        request: Request de FastAPI
+        context: Contexto adicional estático para el template
+        status_code: Código de estado de la respuesta
+
+    Returns:
+        Response: HTML cacheado con ETag o 304 Not Modified
+    """
+    translation_service.reload_if_changed()
+
+    language = translation_service.get_language_from_request(request)
+    domain = context.get("_domain", "home") if context else "home"
+    key = (template_name, request.url.path, language, get_lang_query(request), domain)
+    version = (translation_service.catalog_version, template_watcher.check())
+
+    cached = page_cache.get(key, version)
+    if cached is None:
+        response = render_template_with_translations(
+            templates=templates,
+            template_name=template_name,
+            request=request,
+            context=context,
+        )
+        cached = page_cache.put(key, version, bytes(response.body), response.media_type)
+
+    return build_cached_response(
+        cached,
+        request.headers.get("if-none-match"),
+        headers={"Cache-Control": "no-cache", "Vary": "Accept-Language, Cookie"},
+        status_code=status_code,
+    )
+
+
 def with_translations(templates: Jinja2Templates, template_name: str):
     """
     Decorador que automatiza la inyección de traducciones en endpoints.
@@ -0,0 +1,277 @@
+"""
+Entorno de Jinja2 compartido por toda la aplicación.
+
+Este módulo crea un único entorno de templates para todos los controladores,
+de forma que cada template (incluidos `objects/header.html` y
+`objects/footer.html`) se parsea una sola vez por proceso. El entorno usa una
+caché de bytecode persistente entre arranques y, en producción, puede cargar
+los templates precompilados a módulos de Python durante el build.
+
+También permite especializar los templates por idioma: las llamadas de
+traducción con claves literales se sustituyen por el texto traducido al
+compilar, y el renderizado no hace ninguna búsqueda de traducciones.
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+)
+from jinja2.ext import Extension
+from jinja2.lexer import Token, TokenStream
+
+from src.infrastructure.config import settings
+from src.infrastructure.translation_service import translation_service
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates" / "html"
+COMPILED_TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates" / "compiled"
+
+
+def has_compiled_templates(compiled_dir: Path) -> bool:
+    """
+    Comprueba si existe una versión precompilada de los templates.
+
+    Args:
+        compiled_dir: Directorio con los módulos generados
+
+    Returns:
+        bool: True si el directorio contiene módulos de templates
+    """
+    return compiled_dir.is_dir() and any(compiled_dir.glob("tmpl_*.py"))
+
+
+def create_environment(
+    templates_dir: Optional[Path] = None,
+    compiled_dir: Optional[Path] = None,
+    bytecode_cache_dir: Optional[str] = None,
+    auto_reload: Optional[bool] = None,
+) -> Environment:
+    """
+    Crea el entorno de Jinja2 de la aplicación.
+
+    Los templates precompilados solo se usan con la recarga desactivada, ya que
+    `ModuleLoader` no comprueba si el template original ha cambiado. Cualquier
+    template que no esté precompilado se carga desde su fuente.
+
+    Args:
+        templates_dir: Directorio de templates (por defecto `templates/html`)
+        compiled_dir: Directorio de templates precompilados
+        bytecode_cache_dir: Directorio de la caché de bytecode ("" la desactiva)
+        auto_reload: Si se comprueban cambios en los templates fuente
+
+    Returns:
+        Environment: Entorno de Jinja2 configurado
+    """
+    templates_dir = templates_dir or TEMPLATES_DIR
+    compiled_dir = compiled_dir or COMPILED_TEMPLATES_DIR
+    if bytecode_cache_dir is None:
+        bytecode_cache_dir = settings.templates_bytecode_cache_dir
+    if auto_reload is None:
+        auto_reload = settings.templates_reload
+
+    loaders: List[BaseLoader] = [FileSystemLoader(str(templates_dir))]
+    if not auto_reload and has_compiled_templates(compiled_dir):
+        loaders.insert(0, ModuleLoader(str(compiled_dir)))
+
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+    return Environment(
+        loader=ChoiceLoader(loaders) if len(loaders) > 1 else loaders[0],
+        autoescape=True,
+        bytecode_cache=bytecode_cache,
+        auto_reload=auto_reload,
+    )
+
+
+def compile_templates(
+    output: Optional[Path] = None, templates_dir: Optional[Path] = None
+) -> int:
+    """
+    Precompila todos los templates a módulos de Python para producción.
+
+    Args:
+        output: Directorio de salida (por defecto `templates/compiled`)
+        templates_dir: Directorio de templates fuente
+
+    Returns:
+        int: Número de templates compilados
+    """
+    output = output or COMPILED_TEMPLATES_DIR
+    output.mkdir(parents=True, exist_ok=True)
+    for stale in output.glob("tmpl_*.py"):
+        stale.unlink()
+
+    environment = create_environment(
+        templates_dir=templates_dir, bytecode_cache_dir="", auto_reload=True
+    )
+    environment.compile_templates(str(output), zip=None, ignore_errors=False)
+    return len(list(output.glob("tmpl_*.py")))
+
+
+# Funciones de traducción de los templates y el dominio fijo de cada una
+# (None: dominio de la página que se renderiza)
+TRANSLATION_FUNCTIONS: Dict[str, Optional[str]] = {
+    "_": None,
+    "_header": "header",
+    "_footer": "footer",
+}
+
+
+class InlineTranslations(Extension):
+    """
+    Extensión que sustituye `_('clave')`, `_header(...)` y `_footer(...)` por su traducción.
+
+    Solo se sustituyen las llamadas cuyos argumentos son cadenas literales; el
+    resto se siguen resolviendo al renderizar con las funciones del contexto.
+    El texto se inserta como cadena literal, por lo que se escapa igual que antes.
+    """
+
+    def __init__(self, environment: Environment):
+        super().__init__(environment)
+        environment.extend(inline_language=None, inline_domain="home")
+
+    def _translate(self, function: str, arguments: List[str]) -> str:
+        """Resuelve una llamada de traducción con argumentos literales."""
+        key = arguments[0]
+        domain = arguments[1] if len(arguments) > 1 else None
+        domain = domain or TRANSLATION_FUNCTIONS[function] or self.environment.inline_domain
+        return translation_service.get_translation(
+            key, self.environment.inline_language, domain
+        )
+
+    def filter_stream(self, stream: TokenStream) -> Iterable[Token]:
+        """
+        Reescribe el flujo de tokens sustituyendo las llamadas de traducción literales.
+
+        Args:
+            stream: Flujo de tokens del template
+
+        Returns:
+            Iterable[Token]: Flujo de tokens con las traducciones insertadas
+        """
+        tokens = list(stream)
+        return self._inline(tokens)
+
+    def _inline(self, tokens: List[Token]) -> Iterator[Token]:
+        """Recorre los tokens buscando el patrón `nombre ( 'cadena' [, 'cadena'] )`."""
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            call = self._match_call(tokens, index)
+            if call is None:
+                yield token
+                index += 1
+                continue
+
+            arguments, end = call
+            yield Token(token.lineno, "string", self._translate(token.value, arguments))
+            index = end
+
+    @staticmethod
+    def _match_call(tokens: List[Token], index: int) -> Optional[Tuple[List[str], int]]:
+        """
+        Comprueba si en `index` empieza una llamada de traducción con argumentos literales.
+
+        Returns:
+            Optional[Tuple[List[str], int]]: Argumentos y posición siguiente a la llamada
+        """
+        token = tokens[index]
+        if token.type != "name" or token.value not in TRANSLATION_FUNCTIONS:
+            return None
+        if index > 0 and tokens[index - 1].type == "dot":
+            return None
+        if index + 1 >= len(tokens) or tokens[index + 1].type != "lparen":
+            return None
+
+        arguments: List[str] = []
+        position = index + 2
+        while position < len(tokens) and tokens[position].type == "string":
+            arguments.append(tokens[position].value)
+            position += 1
+            if position < len(tokens) and tokens[position].type == "comma":
+                position += 1
+
+        if not 1 <= len(arguments) <= 2:
+            return None
+        if position >= len(tokens) or tokens[position].type != "rparen":
+            return None
+        return arguments, position + 1
+
+
+class SpecializedTemplates:
+    """
+    Templates especializados por (entorno, idioma, dominio) con las traducciones incrustadas.
+
+    Cada especialización es un entorno derivado del original que comparte
+    loader y globals pero tiene su propia caché de templates. Se descartan
+    todas cuando cambia la versión de los catálogos de traducción. No usan la
+    caché de bytecode, cuya clave no distingue idiomas.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[Environment, str, str], Jinja2Templates] = {}
+        self._catalog_version = translation_service.catalog_version
+        self._lock = threading.Lock()
+
+    def get(self, base: Jinja2Templates, language: str, domain: str) -> Jinja2Templates:
+        """
+        Obtiene los templates especializados para un idioma y dominio.
+
+        Args:
+            base: Templates de los que se deriva la especialización
+            language: Código de idioma
+            domain: Dominio de traducción de la página
+
+        Returns:
+            Jinja2Templates: Templates que renderizan sin buscar traducciones
+        """
+        key = (base.env, language, domain)
+        with self._lock:
+            if self._catalog_version != translation_service.catalog_version:
+                self._entries = {}
+                self._catalog_version = translation_service.catalog_version
+
+            specialized = self._entries.get(key)
+            if specialized is None:
+                specialized = Jinja2Templates(env=self._specialize(base.env, language, domain))
+                self._entries[key] = specialized
+            return specialized
+
+    @staticmethod
+    def _specialize(base: Environment, language: str, domain: str) -> Environment:
+        """Crea el entorno derivado que incrusta las traducciones de un idioma."""
+        loader = base.loader
+        # Los templates precompilados no llevan las traducciones incrustadas
+        if isinstance(loader, ChoiceLoader):
+            loader = loader.loaders[-1]
+
+        environment = base.overlay(
+            loader=loader,
+            extensions=[InlineTranslations],
+            bytecode_cache=None,
+            cache_size=base.cache.capacity if base.cache is not None else 400,
+        )
+        environment.inline_language = language
+        environment.inline_domain = domain
+        return environment
+
+    def clear(self) -> None:
+        """Descarta todas las especializaciones."""
+        with self._lock:
+            self._entries = {}
+
+
+# Instancia compartida por todos los controladores
+templates = Jinja2Templates(env=create_environment())
+specialized_templates = SpecializedTemplates()
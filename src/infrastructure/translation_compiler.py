@@ -0,0 +1,308 @@
+"""
+Compilación de catálogos de traducción.
+
+Este módulo contiene el único pipeline de compilación de archivos .po a .mo,
+compartido por `run.py`, la línea de órdenes y el servicio de traducción.
+Decide qué catálogos recompilar comparando el hash del contenido del .po con
+un manifiesto guardado junto a `LC_MESSAGES`, y compila en paralelo con un
+pool de procesos.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from src.infrastructure.i18n import I18nConfig
+
+MANIFEST_FILE_NAME = ".compile-manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+
+
+def discover_po_files(translations_dir: Optional[Path] = None) -> Dict[str, List[Path]]:
+    """
+    Descubre dinámicamente todos los archivos .po organizados por idioma.
+    Solo usado en desarrollo local para compilación.
+
+    Args:
+        translations_dir: Directorio de traducciones (por defecto el del proyecto)
+
+    Returns:
+        Dict[str, List[Path]]: Diccionario con idioma -> lista de archivos .po
+    """
+    po_files_by_lang = {}
+    translations_dir = translations_dir or I18nConfig.get_translations_dir()
+
+    if not translations_dir.exists():
+        return po_files_by_lang
+
+    for lang_dir in translations_dir.iterdir():
+        if lang_dir.is_dir() and lang_dir.name in I18nConfig.SUPPORTED_LANGUAGES:
+            lang_code = lang_dir.name
+            po_files = list(lang_dir.glob("*.po"))
+
+            if po_files:
+                po_files_by_lang[lang_code] = po_files
+
+    return po_files_by_lang
+
+
+def get_mo_path_for_po(po_file: Path) -> Path:
+    """
+    Obtiene la ruta del archivo .mo correspondiente a un archivo .po.
+
+    Args:
+        po_file: Ruta al archivo .po
+
+    Returns:
+        Path: Ruta donde debe estar el archivo .mo compilado
+    """
+    lang_dir = po_file.parent
+    lc_messages_dir = lang_dir / "LC_MESSAGES"
+    mo_filename = po_file.stem + ".mo"
+    return lc_messages_dir / mo_filename
+
+
+def compile_po_to_mo(po_file: Path, mo_file: Path) -> bool:
+    """
+    Compila un archivo .po a .mo usando Babel.
+    Solo funciona en desarrollo local.
+
+    Args:
+        po_file: Ruta al archivo .po
+        mo_file: Ruta al archivo .mo de destino
+
+    Returns:
+        bool: True si la compilación fue exitosa
+    """
+    from babel.messages.pofile import read_po
+    from babel.messages.mofile import write_mo
+
+    # Crear directorio si no existe
+    if not mo_file.parent.exists():
+        mo_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Usar Babel para leer y escribir
+    with open(po_file, "rb") as f:
+        catalog = read_po(f)
+
+    # Escribir en un temporal y sustituir el destino de una vez: truncar el
+    # .mo en su sitio invalidaría los catálogos que lo tienen mapeado (SIGBUS)
+    temporary_path = mo_file.with_name(mo_file.name + ".tmp")
+    with open(temporary_path, "wb") as f:
+        write_mo(f, catalog)
+    os.replace(temporary_path, mo_file)
+
+    print(
+        f"✓ Compilado {po_file.parent.name}/{po_file.stem}: {po_file.name} -> {mo_file.name}"
+    )
+    return True
+
+
+def get_content_digest(path: Path) -> str:
+    """
+    Calcula el hash SHA-1 del contenido de un fichero.
+
+    Args:
+        path: Ruta al fichero
+
+    Returns:
+        str: Hash hexadecimal del contenido
+    """
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def get_manifest_path(lang_dir: Path) -> Path:
+    """
+    Obtiene la ruta del manifiesto de compilación de un idioma.
+
+    Args:
+        lang_dir: Directorio del idioma
+
+    Returns:
+        Path: Ruta del manifiesto, junto a `LC_MESSAGES`
+    """
+    return lang_dir / MANIFEST_FILE_NAME
+
+
+def load_manifest(lang_dir: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Lee el manifiesto de compilación de un idioma.
+
+    Args:
+        lang_dir: Directorio del idioma
+
+    Returns:
+        Dict[str, Dict[str, str]]: Nombre del .po -> hashes de origen y compilado
+    """
+    try:
+        manifest = json.loads(get_manifest_path(lang_dir).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+    if manifest.get("format") != MANIFEST_FORMAT_VERSION:
+        return {}
+    return manifest.get("catalogs", {})
+
+
+def save_manifest(lang_dir: Path, catalogs: Dict[str, Dict[str, str]]) -> None:
+    """
+    Guarda el manifiesto de compilación de un idioma de forma atómica.
+
+    Args:
+        lang_dir: Directorio del idioma
+        catalogs: Nombre del .po -> hashes de origen y compilado
+    """
+    manifest_path = get_manifest_path(lang_dir)
+    temporary_path = manifest_path.with_suffix(".tmp")
+    temporary_path.write_text(
+        json.dumps(
+            {"format": MANIFEST_FORMAT_VERSION, "catalogs": catalogs},
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    os.replace(temporary_path, manifest_path)
+
+
+@dataclass
+class CompilationReport:
+    """Resultado de una ejecución del pipeline de compilación."""
+
+    compiled: List[Path] = field(default_factory=list)
+    skipped: List[Path] = field(default_factory=list)
+    failed: Dict[Path, str] = field(default_factory=dict)
+    workers: int = 1
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        """Resumen legible de la compilación."""
+        summary = (
+            f"{len(self.compiled)} compilados, {len(self.skipped)} sin cambios"
+            f" en {self.elapsed * 1000:.1f} ms ({self.workers} procesos)"
+        )
+        if self.failed:
+            summary += f", {len(self.failed)} con errores"
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representación serializable del informe."""
+        return {
+            "compiled": [str(path) for path in self.compiled],
+            "skipped": len(self.skipped),
+            "failed": {str(path): error for path, error in self.failed.items()},
+            "workers": self.workers,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+        }
+
+
+def _compile_job(po_file: str, mo_file: str) -> Tuple[str, str]:
+    """
+    Compila un catálogo en un proceso del pool.
+
+    Args:
+        po_file: Ruta al archivo .po
+        mo_file: Ruta al archivo .mo de destino
+
+    Returns:
+        Tuple[str, str]: Ruta del .po y hash del .mo generado
+    """
+    compile_po_to_mo(Path(po_file), Path(mo_file))
+    return po_file, get_content_digest(Path(mo_file))
+
+
+def compile_catalogs(
+    po_files: Optional[List[Path]] = None,
+    translations_dir: Optional[Path] = None,
+    workers: int = 0,
+    force: bool = False,
+) -> CompilationReport:
+    """
+    Compila los catálogos .po cuyo contenido ha cambiado desde la última compilación.
+
+    Un catálogo se omite si el hash de su .po coincide con el del manifiesto y
+    el .mo existente es el que se generó, independientemente de los mtime.
+
+    Args:
+        po_files: Archivos .po a considerar (por defecto todos los descubiertos)
+        translations_dir: Directorio de traducciones (por defecto el del proyecto)
+        workers: Procesos a usar; 0 para usar todos los CPU disponibles
+        force: Recompilar aunque el contenido no haya cambiado
+
+    Returns:
+        CompilationReport: Catálogos compilados, omitidos, con errores y tiempo
+    """
+    start = time.perf_counter()
+    if po_files is None:
+        po_files = [
+            po_file
+            for lang_files in discover_po_files(translations_dir).values()
+            for po_file in lang_files
+        ]
+
+    report = CompilationReport()
+    manifests: Dict[Path, Dict[str, Dict[str, str]]] = {}
+    source_digests: Dict[Path, str] = {}
+    pending: List[Path] = []
+
+    for po_file in sorted(po_files):
+        lang_dir = po_file.parent
+        if lang_dir not in manifests:
+            manifests[lang_dir] = load_manifest(lang_dir)
+
+        source_digest = get_content_digest(po_file)
+        source_digests[po_file] = source_digest
+        entry = manifests[lang_dir].get(po_file.name)
+        mo_file = get_mo_path_for_po(po_file)
+
+        if (
+            not force
+            and entry is not None
+            and entry.get("source") == source_digest
+            and mo_file.exists()
+            and get_content_digest(mo_file) == entry.get("compiled")
+        ):
+            report.skipped.append(po_file)
+        else:
+            pending.append(po_file)
+
+    report.workers = min(workers or os.cpu_count() or 1, max(len(pending), 1))
+    jobs = [(str(po_file), str(get_mo_path_for_po(po_file))) for po_file in pending]
+
+    if report.workers > 1:
+        with ProcessPoolExecutor(max_workers=report.workers) as executor:
+            futures = {executor.submit(_compile_job, *job): Path(job[0]) for job in jobs}
+            results = []
+            for future, po_file in futures.items():
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    report.failed[po_file] = str(e)
+    else:
+        results = []
+        for job in jobs:
+            try:
+                results.append(_compile_job(*job))
+            except Exception as e:
+                report.failed[Path(job[0])] = str(e)
+
+    updated_dirs = set()
+    for po_path, compiled_digest in results:
+        po_file = Path(po_path)
+        manifests[po_file.parent][po_file.name] = {
+            "source": source_digests[po_file],
+            "compiled": compiled_digest,
+        }
+        updated_dirs.add(po_file.parent)
+        report.compiled.append(po_file)
+
+    for lang_dir in updated_dirs:
+        save_manifest(lang_dir, manifests[lang_dir])
+
+    report.elapsed = time.perf_counter() - start
+    return report
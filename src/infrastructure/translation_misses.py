@@ -0,0 +1,116 @@
+"""
+Registro de traducciones no encontradas.
+
+Este módulo contabiliza en memoria las claves que no tienen traducción,
+sirve de caché negativa para no repetir su resolución y registra cada
+fallo distinto una sola vez en el log.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Miss = Tuple[str, str, str]
+
+
+class TranslationMissTracker:
+    """Contador acotado de fallos de traducción por (idioma, dominio, clave)."""
+
+    def __init__(self, max_entries: int = 1000):
+        self._max_entries = max_entries
+        self._counts: Dict[Miss, int] = {}
+        self._negative_cache: Set[Miss] = set()
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    def record_known(self, language: str, domain: str, key: str) -> bool:
+        """
+        Contabiliza un fallo si ya está en la caché negativa.
+
+        Args:
+            language: Código de idioma
+            domain: Dominio de traducción
+            key: Clave de traducción
+
+        Returns:
+            bool: True si el fallo ya era conocido y no hace falta resolverlo
+        """
+        miss = (language, domain, key)
+        if miss not in self._negative_cache:
+            return False
+
+        self._counts[miss] = self._counts.get(miss, 0) + 1
+        return True
+
+    def record(self, language: str, domain: str, key: str) -> None:
+        """
+        Registra un fallo nuevo, lo añade a la caché negativa y lo escribe en el log una vez.
+
+        Cuando se alcanza el límite de entradas, los fallos nuevos solo se cuentan
+        como descartados.
+
+        Args:
+            language: Código de idioma
+            domain: Dominio de traducción
+            key: Clave de traducción
+        """
+        miss = (language, domain, key)
+        with self._lock:
+            count = self._counts.get(miss)
+            if count is None and len(self._counts) >= self._max_entries:
+                self._dropped += 1
+                return
+
+            self._counts[miss] = (count or 0) + 1
+            self._negative_cache.add(miss)
+
+        if count is None:
+            logger.warning("Traducción no encontrada: '%s' en %s/%s", key, language, domain)
+
+    def invalidate(self) -> None:
+        """Vacía la caché negativa manteniendo los contadores, p. ej. tras recargar catálogos."""
+        with self._lock:
+            self._negative_cache = set()
+
+    def clear(self) -> None:
+        """Elimina todos los fallos registrados."""
+        with self._lock:
+            self._counts = {}
+            self._negative_cache = set()
+            self._dropped = 0
+
+    def top(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Obtiene las claves que más fallan.
+
+        Args:
+            limit: Número máximo de resultados
+
+        Returns:
+            List[Dict[str, Any]]: Fallos ordenados por número de apariciones
+        """
+        counts = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        return [
+            {"language": language, "domain": domain, "key": key, "count": count}
+            for (language, domain, key), count in counts[:limit]
+        ]
+
+    def get_stats(self, limit: int = 20) -> Dict[str, Any]:
+        """
+        Resumen de los fallos registrados.
+
+        Args:
+            limit: Número máximo de claves en el ranking
+
+        Returns:
+            Dict[str, Any]: Fallos distintos, totales, descartados y ranking
+        """
+        return {
+            "distinct": len(self._counts),
+            "total": sum(self._counts.values()),
+            "dropped": self._dropped,
+            "max_entries": self._max_entries,
+            "top": self.top(limit),
+        }
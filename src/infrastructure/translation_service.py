@@ -4,13 +4,169 @@ Servicio de traducción para la aplicación.
 Este módulo carga los archivos .mo precompilados para proporcionar
 traducciones dinámicas según el idioma del usuario.
 En desarrollo local, compila automáticamente los archivos .po a .mo.
+En producción, carga una instantánea JSON generada en tiempo de build.
+Los catálogos modificados se recargan de forma individual detectando
+cambios por mtime, tamaño y hash de contenido.
 """
 
 import gettext
+import hashlib
+import json
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Union, List
+from typing import Any, Dict, Optional, Set, Tuple, Union, List
 from fastapi import Request
+from src.infrastructure.config import settings
 from src.infrastructure.i18n import I18nConfig
+from src.infrastructure.mapped_catalog import MappedTranslations
+from src.infrastructure.translation_compiler import compile_catalogs, discover_po_files
+from src.infrastructure.translation_misses import TranslationMissTracker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FileSignature:
+    """Firma de un fichero de traducción usada para detectar cambios reales."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+def get_file_signature(
+    path: Path, previous: Optional[FileSignature] = None
+) -> Optional[FileSignature]:
+    """
+    Calcula la firma de un fichero reutilizando la anterior si mtime y tamaño no cambian.
+
+    El hash de contenido solo se calcula cuando mtime o tamaño difieren, de forma
+    que un checkout que solo toca el mtime no se considera un cambio.
+
+    Args:
+        path: Ruta al fichero
+        previous: Firma registrada previamente para el fichero (opcional)
+
+    Returns:
+        Optional[FileSignature]: Firma del fichero o None si no existe
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    if (
+        previous is not None
+        and previous.mtime_ns == stat.st_mtime_ns
+        and previous.size == stat.st_size
+    ):
+        return previous
+
+    digest = hashlib.sha1(path.read_bytes()).hexdigest()
+    return FileSignature(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=digest)
+
+
+Catalog = Union[gettext.GNUTranslations, gettext.NullTranslations]
+CATALOG_LOADERS = ("gettext", "mmap")
+LookupTable = Dict[Tuple[str, str], str]
+
+# Claves resueltas bajo demanda (catálogos mmap) que se conservan por versión
+RESOLVED_CACHE_LIMIT = 4096
+
+
+def get_catalog_messages(catalog: Catalog) -> Dict[str, str]:
+    """
+    Extrae los mensajes traducidos de un catálogo cargado.
+
+    Se omiten la cabecera y las formas plurales. Las entradas cuya traducción
+    coincide con la clave se conservan: están traducidas, no son fallos.
+
+    Args:
+        catalog: Catálogo de gettext
+
+    Returns:
+        Dict[str, str]: Diccionario clave -> traducción
+    """
+    messages = getattr(catalog, "_catalog", {})
+    return {
+        key: value
+        for key, value in messages.items()
+        if isinstance(key, str) and key
+    }
+
+
+def find_message(catalog: Catalog, key: str) -> Optional[str]:
+    """
+    Busca una clave en un catálogo sin recurrir a sus catálogos de fallback.
+
+    Args:
+        catalog: Catálogo de gettext
+        key: Clave de traducción
+
+    Returns:
+        Optional[str]: Traducción o None si el catálogo no contiene la clave
+    """
+    if isinstance(catalog, MappedTranslations):
+        return catalog.lookup(key)
+    return getattr(catalog, "_catalog", {}).get(key)
+
+
+def build_lookup_tables(
+    translations: Dict[str, Dict[str, Catalog]],
+    default_language: str = I18nConfig.DEFAULT_LANGUAGE,
+    fallback_domain: str = "home",
+) -> Dict[str, LookupTable]:
+    """
+    Construye una tabla plana por idioma que resuelve (dominio, clave) en una sola consulta.
+
+    Para cada entrada se aplican, por orden de prioridad: el dominio del idioma,
+    el dominio de fallback del idioma, el dominio del idioma por defecto y el
+    dominio de fallback del idioma por defecto.
+
+    Args:
+        translations: Catálogos cargados por idioma y dominio
+        default_language: Idioma usado como último recurso
+        fallback_domain: Dominio usado cuando la clave no está en el solicitado
+
+    Returns:
+        Dict[str, LookupTable]: Tabla de traducciones resueltas por idioma
+    """
+    messages = {
+        lang_code: {
+            domain: get_catalog_messages(catalog) for domain, catalog in domains.items()
+        }
+        for lang_code, domains in translations.items()
+    }
+    default_messages = messages.get(default_language, {})
+    all_domains = {domain for domains in messages.values() for domain in domains}
+
+    tables: Dict[str, LookupTable] = {}
+    for lang_code, by_domain in messages.items():
+        table: LookupTable = {}
+        for domain in all_domains:
+            sources = [
+                by_domain.get(domain),
+                by_domain.get(fallback_domain),
+                default_messages.get(domain),
+                default_messages.get(fallback_domain),
+            ]
+            merged: Dict[str, str] = {}
+            for source in reversed(sources):
+                if source:
+                    merged.update(source)
+
+            interned_domain = sys.intern(domain)
+            for key, value in merged.items():
+                table[(interned_domain, sys.intern(key))] = sys.intern(value)
+
+        tables[lang_code] = table
+
+    return tables
 
 
 def get_absolute_translations_dir() -> Path:
@@ -40,193 +196,543 @@ def get_absolute_translations_dir() -> Path:
     return translations_dir
 
 
-def discover_po_files() -> Dict[str, List[Path]]:
+def discover_mo_files(translations_dir: Optional[Path] = None) -> Dict[str, List[Path]]:
     """
-    Descubre dinámicamente todos los archivos .po organizados por idioma.
-    Solo usado en desarrollo local para compilación.
+    Descubre dinámicamente todos los archivos .mo organizados por idioma.
+
+    Args:
+        translations_dir: Directorio de traducciones (por defecto el del proyecto)
 
     Returns:
-        Dict[str, List[Path]]: Diccionario con idioma -> lista de archivos .po
+        Dict[str, List[Path]]: Diccionario con idioma -> lista de archivos .mo
     """
-    po_files_by_lang = {}
-    translations_dir = get_absolute_translations_dir()
+    mo_files_by_lang = {}
+    translations_dir = translations_dir or get_absolute_translations_dir()
 
     if not translations_dir.exists():
-        return po_files_by_lang
+        print(f"⚠️  Directorio de traducciones no encontrado: {translations_dir}")
+        return mo_files_by_lang
 
     for lang_dir in translations_dir.iterdir():
         if lang_dir.is_dir() and lang_dir.name in I18nConfig.SUPPORTED_LANGUAGES:
             lang_code = lang_dir.name
-            po_files = list(lang_dir.glob("*.po"))
+            lc_messages_dir = lang_dir / "LC_MESSAGES"
+
+            if lc_messages_dir.exists():
+                mo_files = list(lc_messages_dir.glob("*.mo"))
+                if mo_files:
+                    mo_files_by_lang[lang_code] = mo_files
+
+    return mo_files_by_lang
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+
 
-            if po_files:
-                po_files_by_lang[lang_code] = po_files
+class SnapshotTranslations(gettext.NullTranslations):
+    """Catálogo de gettext respaldado por un diccionario cargado de la instantánea."""
 
-    return po_files_by_lang
+    def __init__(self, messages: Dict[str, str]):
+        super().__init__()
+        self._catalog = messages
 
+    def gettext(self, message: str) -> str:
+        """Devuelve la traducción de un mensaje o el propio mensaje si no existe."""
+        return self._catalog.get(message, message)
 
-def get_mo_path_for_po(po_file: Path) -> Path:
+
+def get_snapshot_path(translations_dir: Optional[Path] = None) -> Path:
     """
-    Obtiene la ruta del archivo .mo correspondiente a un archivo .po.
+    Obtiene la ruta de la instantánea de traducciones.
 
     Args:
-        po_file: Ruta al archivo .po
+        translations_dir: Directorio de traducciones (por defecto el del proyecto)
 
     Returns:
-        Path: Ruta donde debe estar el archivo .mo compilado
+        Path: Ruta al fichero de instantánea
     """
-    lang_dir = po_file.parent
-    lc_messages_dir = lang_dir / "LC_MESSAGES"
-    mo_filename = po_file.stem + ".mo"
-    return lc_messages_dir / mo_filename
+    translations_dir = translations_dir or get_absolute_translations_dir()
+    return translations_dir / I18nConfig.SNAPSHOT_FILE_NAME
 
 
-def compile_po_to_mo(po_file: Path, mo_file: Path) -> bool:
+def read_po_messages(po_file: Path) -> Dict[str, str]:
     """
-    Compila un archivo .po a .mo usando Babel.
-    Solo funciona en desarrollo local.
+    Lee los mensajes traducidos de un archivo .po usando Babel.
 
     Args:
         po_file: Ruta al archivo .po
-        mo_file: Ruta al archivo .mo de destino
 
     Returns:
-        bool: True si la compilación fue exitosa
+        Dict[str, str]: Diccionario clave -> traducción sin entradas fuzzy ni plurales
     """
     from babel.messages.pofile import read_po
-    from babel.messages.mofile import write_mo
-
-    # Crear directorio si no existe
-    if not mo_file.parent.exists():
-        mo_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Usar Babel para leer y escribir
     with open(po_file, "rb") as f:
         catalog = read_po(f)
 
-    with open(mo_file, "wb") as f:
-        write_mo(f, catalog)
+    return {
+        message.id: message.string
+        for message in catalog
+        if isinstance(message.id, str)
+        and message.id
+        and isinstance(message.string, str)
+        and message.string
+        and not message.fuzzy
+    }
 
-    print(
-        f"✓ Compilado {po_file.parent.name}/{po_file.stem}: {po_file.name} -> {mo_file.name}"
+
+def build_translation_snapshot(
+    translations_dir: Optional[Path] = None, output: Optional[Path] = None
+) -> Path:
+    """
+    Compila todos los catálogos .po en un único fichero de instantánea versionado.
+
+    Pensado para ejecutarse en tiempo de build; en producción el servicio
+    lo carga con una sola lectura sin importar `babel.messages`.
+
+    Args:
+        translations_dir: Directorio de traducciones (por defecto el del proyecto)
+        output: Ruta del fichero generado (por defecto dentro de translations_dir)
+
+    Returns:
+        Path: Ruta del fichero de instantánea generado
+    """
+    translations_dir = translations_dir or get_absolute_translations_dir()
+    output = output or get_snapshot_path(translations_dir)
+
+    catalogs: Dict[str, Dict[str, Dict[str, str]]] = {}
+    digest = hashlib.sha1()
+    po_files_by_lang = discover_po_files(translations_dir)
+
+    for lang_code in sorted(po_files_by_lang):
+        for po_file in sorted(po_files_by_lang[lang_code]):
+            digest.update(f"{lang_code}/{po_file.name}".encode("utf-8"))
+            digest.update(po_file.read_bytes())
+            catalogs.setdefault(lang_code, {})[po_file.stem] = read_po_messages(po_file)
+
+    snapshot = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "version": digest.hexdigest(),
+        "catalogs": catalogs,
+    }
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(snapshot, ensure_ascii=False, sort_keys=True, indent=1),
+        encoding="utf-8",
     )
-    return True
+    print(f"✓ Instantánea de traducciones generada: {output} ({snapshot['version'][:12]})")
+    return output
 
 
-def discover_mo_files() -> Dict[str, List[Path]]:
+@lru_cache(maxsize=256)
+def negotiate_accept_language(accept_language: str) -> Optional[str]:
     """
-    Descubre dinámicamente todos los archivos .mo organizados por idioma.
+    Elige el idioma soportado preferido según un header Accept-Language.
+
+    Respeta los pesos q (q=0 excluye el idioma) y las subetiquetas de región:
+    primero busca la etiqueta completa (`pt-BR`), después su idioma base (`pt`)
+    y por último cualquier variante regional soportada del mismo idioma.
+    El resultado se cachea por el valor literal del header, ya que los
+    navegadores envían un conjunto pequeño de valores distintos.
+
+    Args:
+        accept_language: Valor del header Accept-Language
 
     Returns:
-        Dict[str, List[Path]]: Diccionario con idioma -> lista de archivos .mo
+        Optional[str]: Código de idioma soportado o None si ninguno coincide
     """
-    mo_files_by_lang = {}
-    translations_dir = get_absolute_translations_dir()
-
-    if not translations_dir.exists():
-        print(f"⚠️  Directorio de traducciones no encontrado: {translations_dir}")
-        return mo_files_by_lang
+    supported = {lang.lower(): lang for lang in I18nConfig.SUPPORTED_LANGUAGES}
+    supported_by_base: Dict[str, str] = {}
+    for lang in I18nConfig.SUPPORTED_LANGUAGES:
+        supported_by_base.setdefault(lang.lower().split("-")[0], lang)
+
+    ranges: List[Tuple[float, int, str]] = []
+    for position, part in enumerate(accept_language.split(",")):
+        tag, _, params = part.partition(";")
+        tag = tag.strip().lower().replace("_", "-")
+        if not tag:
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
 
-    for lang_dir in translations_dir.iterdir():
-        if lang_dir.is_dir() and lang_dir.name in I18nConfig.SUPPORTED_LANGUAGES:
-            lang_code = lang_dir.name
-            lc_messages_dir = lang_dir / "LC_MESSAGES"
+        if quality > 0:
+            ranges.append((-quality, position, tag))
 
-            if lc_messages_dir.exists():
-                mo_files = list(lc_messages_dir.glob("*.mo"))
-                if mo_files:
-                    mo_files_by_lang[lang_code] = mo_files
+    for _, _, tag in sorted(ranges):
+        if tag == "*":
+            return I18nConfig.DEFAULT_LANGUAGE
+        if tag in supported:
+            return supported[tag]
+        base = tag.split("-")[0]
+        if base in supported:
+            return supported[base]
+        if base in supported_by_base:
+            return supported_by_base[base]
 
-    return mo_files_by_lang
+    return None
 
 
 class TranslationService:
     """Servicio para manejar las traducciones de la aplicación."""
 
-    def __init__(self):
-        self._translations: Dict[
-            str, Dict[str, Union[gettext.GNUTranslations, gettext.NullTranslations]]
-        ] = {}
+    def __init__(
+        self,
+        translations_dir: Optional[Path] = None,
+        reload_enabled: Optional[bool] = None,
+        reload_interval: Optional[float] = None,
+        dev_mode: Optional[bool] = None,
+        catalog_loader: Optional[str] = None,
+        miss_limit: Optional[int] = None,
+    ):
+        self._translations: Dict[str, Dict[str, Catalog]] = {}
         self._domains: Dict[str, List[str]] = {}  # domain -> list of languages
-        self._translations_dir = get_absolute_translations_dir()
+        self._translations_dir = translations_dir or get_absolute_translations_dir()
+        self._reload_enabled = (
+            settings.translations_reload if reload_enabled is None else reload_enabled
+        )
+        self._reload_interval = (
+            settings.translations_reload_interval
+            if reload_interval is None
+            else reload_interval
+        )
+        self._file_signatures: Dict[Path, FileSignature] = {}
+        self._last_reload_check = 0.0
+        self._reload_lock = threading.Lock()
+        self._catalog_version = 0
+        self._lookup_tables: Dict[str, LookupTable] = {}
+        self._resolved: Dict[Tuple[str, str, str], str] = {}
+        self._lookup_build_seconds = 0.0
+        self._dev_mode = settings.translations_dev_mode if dev_mode is None else dev_mode
+        self._snapshot_version: Optional[str] = None
+        self._misses = TranslationMissTracker(
+            settings.translations_miss_limit if miss_limit is None else miss_limit
+        )
+        self._unknown_domains: Set[str] = set()
+        self._catalog_loader = catalog_loader or settings.translations_catalog_loader
+        if self._catalog_loader not in CATALOG_LOADERS:
+            raise ValueError(f"Cargador de catálogos no soportado: {self._catalog_loader}")
         self._load_translations()
 
+    @property
+    def catalog_version(self) -> int:
+        """Versión de los catálogos cargados; se incrementa en cada recarga efectiva."""
+        return self._catalog_version
+
+    @property
+    def _lazy_lookup(self) -> bool:
+        """Indica si las claves se resuelven bajo demanda sobre los catálogos mmap."""
+        return self._catalog_loader == "mmap" and self._snapshot_version is None
+
+    @property
+    def snapshot_version(self) -> Optional[str]:
+        """Versión de la instantánea cargada o None si se usan los .mo."""
+        return self._snapshot_version
+
+    def _publish(self, translations: Dict[str, Dict[str, Catalog]]) -> None:
+        """
+        Publica un nuevo conjunto de catálogos junto con sus tablas de consulta.
+
+        Args:
+            translations: Catálogos cargados por idioma y dominio
+        """
+        start = time.perf_counter()
+        lookup_tables = build_lookup_tables(translations)
+        self._lookup_build_seconds = time.perf_counter() - start
+
+        self._lookup_tables = lookup_tables
+        self._resolved = {}
+        self._translations = translations
+        self._catalog_version += 1
+        self._misses.invalidate()
+
+    def _register_domain(self, domain: str, lang_code: str) -> None:
+        """Registra que un dominio está disponible para un idioma."""
+        if domain not in self._domains:
+            self._domains[domain] = []
+        if lang_code not in self._domains[domain]:
+            self._domains[domain].append(lang_code)
+
     def _discover_and_compile_translations(self) -> None:
         """Descubre y compila automáticamente todas las traducciones en desarrollo local."""
-        po_files_by_lang = discover_po_files()
+        po_files_by_lang = discover_po_files(self._translations_dir)
 
         for lang_code, po_files in po_files_by_lang.items():
             for po_file in po_files:
-                domain = po_file.stem
-                mo_file = get_mo_path_for_po(po_file)
-
-                # Registrar dominio
-                if domain not in self._domains:
-                    self._domains[domain] = []
-                if lang_code not in self._domains[domain]:
-                    self._domains[domain].append(lang_code)
+                self._register_domain(po_file.stem, lang_code)
 
-                # Verificar si necesita compilación
-                should_compile = True
-                if mo_file.exists():
-                    po_mtime = po_file.stat().st_mtime
-                    mo_mtime = mo_file.stat().st_mtime
-                    should_compile = po_mtime > mo_mtime
-
-                if should_compile:
-                    compile_po_to_mo(po_file, mo_file)
+        report = compile_catalogs(
+            [po_file for po_files in po_files_by_lang.values() for po_file in po_files],
+            workers=settings.translations_compile_workers,
+        )
+        print(f"🔄 Compilación de traducciones: {report.summary()}")
 
     def _discover_translations(self) -> None:
         """Descubre automáticamente todas las traducciones disponibles."""
-        mo_files_by_lang = discover_mo_files()
+        mo_files_by_lang = discover_mo_files(self._translations_dir)
 
         for lang_code, mo_files in mo_files_by_lang.items():
             for mo_file in mo_files:
-                domain = mo_file.stem
+                self._register_domain(mo_file.stem, lang_code)
 
-                # Registrar dominio
-                if domain not in self._domains:
-                    self._domains[domain] = []
-                if lang_code not in self._domains[domain]:
-                    self._domains[domain].append(lang_code)
+    def _load_catalog(
+        self, lang_code: str, domain: str
+    ) -> Catalog:
+        """
+        Carga el catálogo compilado de un idioma y dominio.
+
+        Args:
+            lang_code: Código de idioma
+            domain: Dominio de traducción
+
+        Returns:
+            Catálogo cargado o NullTranslations si no se puede leer
+        """
+        mo_file = self._translations_dir / lang_code / "LC_MESSAGES" / f"{domain}.mo"
+
+        try:
+            if mo_file.exists():
+                if self._catalog_loader == "mmap":
+                    return MappedTranslations(mo_file)
+                with open(mo_file, "rb") as f:
+                    return gettext.GNUTranslations(f)
+
+            print(f"⚠️  Archivo .mo no encontrado: {mo_file}")
+        except Exception as e:
+            print(f"✗ Error cargando traducción {lang_code}/{domain}: {e}")
+
+        return gettext.NullTranslations()
+
+    def _load_snapshot(self) -> bool:
+        """
+        Carga los catálogos desde la instantánea generada en tiempo de build.
+
+        Returns:
+            bool: True si la instantánea existe, es válida y se ha cargado
+        """
+        snapshot_path = get_snapshot_path(self._translations_dir)
+
+        try:
+            snapshot = json.loads(snapshot_path.read_bytes())
+        except FileNotFoundError:
+            return False
+        except ValueError as e:
+            print(f"⚠️  Instantánea de traducciones inválida {snapshot_path}: {e}")
+            return False
+
+        if snapshot.get("format") != SNAPSHOT_FORMAT_VERSION:
+            print(f"⚠️  Formato de instantánea no soportado: {snapshot.get('format')}")
+            return False
+
+        print(f"📚 Cargando instantánea de traducciones: {snapshot_path}")
+
+        self._domains = {}
+        translations: Dict[str, Dict[str, Catalog]] = {}
+        for lang_code, domains in snapshot["catalogs"].items():
+            if lang_code not in I18nConfig.SUPPORTED_LANGUAGES:
+                continue
+            for domain, messages in domains.items():
+                translations.setdefault(lang_code, {})[domain] = SnapshotTranslations(
+                    messages
+                )
+                self._register_domain(domain, lang_code)
+
+        self._snapshot_version = snapshot["version"]
+        self._publish(translations)
+        return True
 
     def _load_translations(self) -> None:
         """Carga todas las traducciones disponibles."""
-        # Compilar traducciones siempre, para asegurar que estén actualizadas
-        # Esto es crítico tanto en desarrollo como en producción
-        self._discover_and_compile_translations()
-        
+        if not self._dev_mode and self._load_snapshot():
+            if self._reload_enabled:
+                self._last_reload_check = time.monotonic()
+                self._file_signatures = {}
+                self._has_changed(get_snapshot_path(self._translations_dir))
+            return
+
+        # Compilar los .po solo en desarrollo; en producción se usa la instantánea
+        if self._dev_mode:
+            self._discover_and_compile_translations()
+        else:
+            print("⚠️  Instantánea de traducciones no disponible, usando archivos .mo")
+
         print(f"📚 Cargando traducciones desde: {self._translations_dir}")
+        self._snapshot_version = None
 
         # En Vercel/producción solo descubrir y cargar .mo existentes
         self._discover_translations()
 
-        # Limpiar traducciones existentes
-        self._translations.clear()
-
-        # Cargar traducciones para cada dominio y idioma
+        # Construir los catálogos aparte y sustituirlos de una vez
+        translations: Dict[str, Dict[str, Catalog]] = {}
         for domain, languages in self._domains.items():
             for lang_code in languages:
-                if lang_code not in self._translations:
-                    self._translations[lang_code] = {}
-
-                mo_file = (
-                    self._translations_dir / lang_code / "LC_MESSAGES" / f"{domain}.mo"
+                translations.setdefault(lang_code, {})[domain] = self._load_catalog(
+                    lang_code, domain
                 )
 
-                try:
-                    if mo_file.exists():
-                        with open(mo_file, "rb") as f:
-                            translation = gettext.GNUTranslations(f)
-                    else:
-                        print(f"⚠️  Archivo .mo no encontrado: {mo_file}")
-                        translation = gettext.NullTranslations()
+        self._publish(translations)
+
+        if self._reload_enabled:
+            self._last_reload_check = time.monotonic()
+            self._file_signatures = {
+                path: signature
+                for path in self._iter_catalog_files()
+                if (signature := get_file_signature(path)) is not None
+            }
+
+    def _iter_catalog_files(self) -> List[Path]:
+        """
+        Lista los ficheros .po y .mo de los idiomas soportados.
+
+        Returns:
+            List[Path]: Rutas de los ficheros de traducción
+        """
+        files: List[Path] = []
+        for lang_code in I18nConfig.SUPPORTED_LANGUAGES:
+            lang_dir = self._translations_dir / lang_code
+            if not lang_dir.is_dir():
+                continue
+            files.extend(lang_dir.glob("*.po"))
+            lc_messages_dir = lang_dir / "LC_MESSAGES"
+            if lc_messages_dir.is_dir():
+                files.extend(lc_messages_dir.glob("*.mo"))
+        return files
+
+    def _has_changed(self, path: Path) -> bool:
+        """
+        Comprueba si un fichero ha cambiado de contenido y actualiza su firma.
+
+        Args:
+            path: Ruta al fichero
+
+        Returns:
+            bool: True si el contenido es nuevo o distinto al registrado
+        """
+        previous = self._file_signatures.get(path)
+        signature = get_file_signature(path, previous)
+
+        if signature is None:
+            self._file_signatures.pop(path, None)
+            return False
+
+        self._file_signatures[path] = signature
+        return previous is None or previous.digest != signature.digest
+
+    def _collect_changed_catalogs(self) -> Set[Tuple[str, str]]:
+        """
+        Detecta los catálogos (idioma, dominio) cuyo contenido ha cambiado.
+
+        Los .po modificados se recompilan antes de comprobar su .mo.
+
+        Returns:
+            Set[Tuple[str, str]]: Catálogos que deben recargarse
+        """
+        changed: Set[Tuple[str, str]] = set()
+        changed_po_files = [
+            path
+            for path in self._iter_catalog_files()
+            if path.suffix == ".po" and self._has_changed(path)
+        ]
+
+        if changed_po_files and self._dev_mode:
+            compile_catalogs(changed_po_files, workers=1)
+
+        for mo_file in self._iter_catalog_files():
+            if mo_file.suffix == ".mo" and self._has_changed(mo_file):
+                changed.add((mo_file.parent.parent.name, mo_file.stem))
+
+        return changed
+
+    def _swap_catalogs(self, changed: Set[Tuple[str, str]]) -> None:
+        """
+        Recarga los catálogos indicados y los publica de forma atómica.
+
+        Args:
+            changed: Catálogos (idioma, dominio) a recargar
+        """
+        translations = {
+            lang_code: dict(domains)
+            for lang_code, domains in self._translations.items()
+        }
+
+        superseded: List[Catalog] = []
+        for lang_code, domain in sorted(changed):
+            previous = translations.get(lang_code, {}).get(domain)
+            if previous is not None:
+                superseded.append(previous)
+            translations.setdefault(lang_code, {})[domain] = self._load_catalog(
+                lang_code, domain
+            )
+            self._register_domain(domain, lang_code)
+            print(f"🔄 Traducción recargada: {lang_code}/{domain}")
+
+        self._publish(translations)
+
+        # Liberar los mapeos sustituidos una vez publicados los nuevos
+        for catalog in superseded:
+            if isinstance(catalog, MappedTranslations):
+                catalog.close()
+
+    def configure_reload(self, enabled: bool, interval: float = 0.0) -> None:
+        """
+        Configura la recarga automática de traducciones.
 
-                    self._translations[lang_code][domain] = translation
+        Args:
+            enabled: Si se deben vigilar los cambios de los catálogos
+            interval: Segundos mínimos entre dos comprobaciones
+        """
+        with self._reload_lock:
+            self._reload_enabled = enabled
+            self._reload_interval = interval
+            self._last_reload_check = 0.0
+            if enabled and not self._file_signatures:
+                for path in self._iter_catalog_files():
+                    self._has_changed(path)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Recarga solo los catálogos que han cambiado desde la última comprobación.
+
+        No hace nada si la recarga está desactivada, si no ha pasado el intervalo
+        de sondeo o si otra petición ya está comprobando los cambios.
+
+        Returns:
+            bool: True si se ha recargado algún catálogo
+        """
+        if not self._reload_enabled:
+            return False
 
-                except Exception as e:
-                    print(f"✗ Error cargando traducción {lang_code}/{domain}: {e}")
-                    self._translations[lang_code][domain] = gettext.NullTranslations()
+        now = time.monotonic()
+        if now - self._last_reload_check < self._reload_interval:
+            return False
+
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+
+        try:
+            self._last_reload_check = now
+            if self._snapshot_version is not None:
+                if self._has_changed(get_snapshot_path(self._translations_dir)):
+                    self._load_translations()
+                    return True
+                return False
+
+            changed = self._collect_changed_catalogs()
+            if changed:
+                self._swap_catalogs(changed)
+            return bool(changed)
+        except Exception as e:
+            print(f"[WARN] Error comprobando cambios en traducciones: {e}")
+            return False
+        finally:
+            self._reload_lock.release()
 
     def reload_translations(self) -> None:
         """Recarga todas las traducciones. Útil durante el desarrollo."""
@@ -244,6 +750,10 @@ class TranslationService:
         """
         Obtiene una traducción para una clave específica.
 
+        Las tablas de consulta no se modifican al traducir. Con catálogos mmap
+        las claves resueltas bajo demanda se guardan en una caché aparte,
+        limitada a RESOLVED_CACHE_LIMIT entradas y renovada en cada recarga.
+
         Args:
             key: Clave de traducción
             language: Código de idioma
@@ -252,39 +762,107 @@ class TranslationService:
         Returns:
             str: Texto traducido
         """
-        try:
-            if language not in self._translations:
-                language = I18nConfig.DEFAULT_LANGUAGE
-
-            if language not in self._translations:
-                print(f"⚠️ No hay traducciones cargadas para el idioma: {language}")
-                return key
-
-            if domain not in self._translations[language]:
-                # Intentar con el dominio 'home' como fallback
-                print(f"⚠️ Dominio '{domain}' no disponible para {language}, usando 'home'")
-                domain = "home"
-                if domain not in self._translations[language]:
-                    print(f"⚠️ Dominio fallback 'home' no disponible para {language}")
-                    return key
-
-            translation = self._translations[language][domain]
-            translated = translation.gettext(key)
-            
-            # Si la traducción es igual a la clave, intentar con dominio fallback
-            if translated == key and domain != "home":
-                fallback_translation = self._translations[language].get("home")
-                if fallback_translation:
-                    fallback_result = fallback_translation.gettext(key)
-                    if fallback_result != key:
-                        return fallback_result
-            
-            # Devolver la traducción obtenida (puede ser la clave si no existe traducción)
+        lookup_tables, resolved = self._lookup_tables, self._resolved
+        table = lookup_tables.get(language)
+        if table is None:
+            language = I18nConfig.DEFAULT_LANGUAGE
+            table = lookup_tables.get(language)
+
+        if table is None:
+            return key
+
+        translated = table.get((domain, key))
+        if translated is not None:
             return translated
-        except Exception as e:
-            print(f"🚨 Error al traducir '{key}': {e}")
+
+        if self._misses.record_known(language, domain, key):
             return key
 
+        lookup_domain = domain
+        if domain not in self._domains:
+            if domain not in self._unknown_domains:
+                self._unknown_domains.add(domain)
+                logger.warning("Dominio '%s' no disponible, usando 'home'", domain)
+            lookup_domain = "home"
+            translated = table.get((lookup_domain, key))
+
+        if translated is None and self._lazy_lookup:
+            cache_key = (language, lookup_domain, key)
+            translated = resolved.get(cache_key)
+            if translated is None:
+                translated = self._resolve_translation(key, language, lookup_domain)
+                if translated is not None and len(resolved) < RESOLVED_CACHE_LIMIT:
+                    resolved[cache_key] = translated
+
+        if translated is None:
+            self._misses.record(language, domain, key)
+            return key
+
+        return translated
+
+    def get_missing_translations(self, limit: int = 20) -> Dict[str, Any]:
+        """
+        Informe de las traducciones no encontradas desde el arranque.
+
+        Args:
+            limit: Número máximo de claves en el ranking
+
+        Returns:
+            Dict[str, Any]: Resumen y ranking de claves que más fallan
+        """
+        return self._misses.get_stats(limit)
+
+    def _resolve_translation(self, key: str, language: str, domain: str) -> Optional[str]:
+        """
+        Resuelve una clave recorriendo los catálogos con la misma prioridad que la tabla.
+
+        Se usa con catálogos perezosos, cuyas tablas están vacías.
+
+        Args:
+            key: Clave de traducción
+            language: Código de idioma
+            domain: Dominio de traducción
+
+        Returns:
+            Optional[str]: Texto traducido o None si ningún catálogo contiene la clave
+        """
+        candidates = (
+            (language, domain),
+            (language, "home"),
+            (I18nConfig.DEFAULT_LANGUAGE, domain),
+            (I18nConfig.DEFAULT_LANGUAGE, "home"),
+        )
+        for lang_code, catalog_domain in candidates:
+            catalog = self._translations.get(lang_code, {}).get(catalog_domain)
+            if catalog is None:
+                continue
+            translated = find_message(catalog, key)
+            if translated is not None:
+                return sys.intern(translated)
+        return None
+
+    def get_lookup_stats(self) -> Dict[str, Any]:
+        """
+        Información de monitorización de las tablas de traducción precompiladas.
+
+        Returns:
+            Dict[str, Any]: Entradas por idioma, total, claves resueltas bajo
+            demanda, tiempo de construcción y versión
+        """
+        entries = {
+            lang_code: len(table) for lang_code, table in self._lookup_tables.items()
+        }
+        return {
+            "entries": entries,
+            "total_entries": sum(entries.values()),
+            "resolved_entries": len(self._resolved),
+            "build_time_ms": round(self._lookup_build_seconds * 1000, 3),
+            "catalog_version": self._catalog_version,
+            "snapshot_version": self._snapshot_version,
+            "catalog_loader": self._catalog_loader,
+            "lazy": self._lazy_lookup,
+        }
+
     def get_available_domains(self) -> List[str]:
         """
         Obtiene la lista de dominios de traducción disponibles.
@@ -295,6 +873,25 @@ class TranslationService:
         return list(self._domains.keys())
 
     def get_language_from_request(self, request: Request) -> str:
+        """
+        Obtiene el idioma de la petición, negociándolo solo la primera vez.
+
+        El resultado se guarda en `request.state.language`, compartido por el
+        middleware, los controladores y los helpers de templates.
+
+        Args:
+            request: Objeto Request de FastAPI
+
+        Returns:
+            str: Código de idioma detectado
+        """
+        language = getattr(request.state, "language", None)
+        if language is None:
+            language = self.detect_language(request)
+            request.state.language = language
+        return language
+
+    def detect_language(self, request: Request) -> str:
         """
         Detecta el idioma preferido del usuario basado en la petición HTTP.
 
@@ -317,13 +914,9 @@ class TranslationService:
         # Verificar el header Accept-Language
         accept_language = request.headers.get("accept-language")
         if accept_language:
-            # Parsear el header Accept-Language básico
-            languages = [
-                lang.split(";")[0].strip()[:2] for lang in accept_language.split(",")
-            ]
-            for lang in languages:
-                if lang in I18nConfig.SUPPORTED_LANGUAGES:
-                    return lang
+            lang = negotiate_accept_language(accept_language)
+            if lang:
+                return lang
 
         return I18nConfig.DEFAULT_LANGUAGE
 
@@ -5,18 +5,78 @@ Este módulo contiene los endpoints HTTP para la gestión de personajes,
 incluyendo creación, edición y visualización de personajes.
 """
 
-from pathlib import Path
-from fastapi import APIRouter, Request, Body, HTTPException
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from src.infrastructure.template_helpers import render_template_with_translations
-from typing import Dict, List, Any
+import uuid
+from dataclasses import asdict
+from datetime import datetime, timezone
+from fastapi import APIRouter, Request, Body, HTTPException, Query
+from fastapi.responses import HTMLResponse, StreamingResponse
+from starlette.responses import Response
+from src.application.character_use_cases import (
+    CreateCharacterRequest,
+    CreateCharacterUseCase,
+    GetCharacterDataUseCase,
+)
+from src.infrastructure.db.character_aggregate import CharacterAggregateRepository
+from src.infrastructure.db.character_listing import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    CharacterListRepository,
+    page_to_dict,
+)
+from src.infrastructure.db.character_summaries import CharacterSummaryRepository
+from src.infrastructure.db.character_transfer import (
+    DEFAULT_IMPORT_BATCH_SIZE,
+    MAX_IMPORT_BATCH_SIZE,
+    export_ndjson,
+    import_ndjson,
+)
+from src.infrastructure.db.engine import database
+from src.infrastructure.db.repositories import (
+    ATTRIBUTE_NAMES,
+    build_character_repositories,
+    build_reference_repositories,
+    ensure_user,
+)
+from src.infrastructure.http_cache import ResponseCache, build_cached_response
+from src.infrastructure.reference_data import encode_json, reference_data
+from src.infrastructure.templating import templates
+from src.infrastructure.template_helpers import render_cached_page
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 
 router = APIRouter()
 
-# Configurar el directorio de templates
-templates_dir = Path(__file__).parent.parent.parent.parent / "templates" / "html"
-templates = Jinja2Templates(directory=str(templates_dir))
+# Datos de referencia de la base de datos, leídos a través de la caché compartida
+character_data = GetCharacterDataUseCase(**build_reference_repositories(database.session))
+
+
+async def sync_reference_data(names: Iterable[str]) -> None:
+    """
+    Actualiza las colecciones servidas con las filas de sus tablas.
+
+    GetCharacterDataUseCase lee cada tabla una sola vez y sirve el resto de
+    peticiones desde su caché; una colección solo se vuelve a codificar
+    cuando cambian sus filas.
+
+    Args:
+        names: Colecciones a actualizar
+    """
+    for name in names:
+        reference_data.sync_collection(name, await character_data.get_collection(name))
+
+
+async def reference_response(name: str, request: Request) -> Response:
+    """
+    Construye la respuesta de una colección de datos de referencia.
+
+    Args:
+        name: Nombre de la colección
+        request: Objeto Request de FastAPI para validar el ETag
+
+    Returns:
+        Response: Colección en JSON precodificado o 304 Not Modified
+    """
+    await sync_reference_data((name,))
+    return reference_data.build_response(name, request.headers.get("if-none-match"))
 
 
 @router.get("/create-character", response_class=HTMLResponse, tags=["Characters"])
@@ -30,221 +90,363 @@ async def get_create_character_page(request: Request) -> HTMLResponse:
     Returns:
         HTMLResponse: HTML con la página de creación de personajes traducida
     """
-    return render_template_with_translations(
+    return render_cached_page(
         templates=templates, template_name="create-character.html", request=request,
         context={"_domain": "create-character"}
     )
 
 
 @router.get("/api/races", tags=["Characters API"])
-async def get_races() -> List[Dict[str, Any]]:
+async def get_races(request: Request) -> Response:
     """
     Endpoint para obtener todas las razas disponibles.
 
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+
     Returns:
-        List[Dict[str, Any]]: Lista de razas
+        Response: Lista de razas en JSON precodificado (o 304 Not Modified)
     """
-    # Simulamos datos de razas para la interfaz
-    return [
-        {"id": 1, "name": "Human", "description": "Versatile and adaptable"},
-        {"id": 2, "name": "Elf", "description": "Graceful and long-lived"},
-        {"id": 3, "name": "Dwarf", "description": "Strong and sturdy"},
-        {"id": 4, "name": "Halfling", "description": "Small and nimble"},
-        {"id": 5, "name": "Gnome", "description": "Curious and inventive"}
-    ]
+    return await reference_response("races", request)
 
 
 @router.get("/api/backgrounds", tags=["Characters API"])
-async def get_backgrounds() -> List[Dict[str, Any]]:
+async def get_backgrounds(request: Request) -> Response:
     """
     Endpoint para obtener todos los trasfondos disponibles.
 
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+
     Returns:
-        List[Dict[str, Any]]: Lista de trasfondos
+        Response: Lista de trasfondos en JSON precodificado (o 304 Not Modified)
     """
-    # Simulamos datos de trasfondos para la interfaz
-    return [
-        {"id": 1, "name": "Noble", "description": "Born to wealth and privilege"},
-        {"id": 2, "name": "Acolyte", "description": "Served in a temple"},
-        {"id": 3, "name": "Criminal", "description": "Has a criminal past"},
-        {"id": 4, "name": "Soldier", "description": "Trained in military"},
-        {"id": 5, "name": "Sage", "description": "Scholar and researcher"}
-    ]
+    return await reference_response("backgrounds", request)
 
 
 @router.get("/api/alignments", tags=["Characters API"])
-async def get_alignments() -> List[Dict[str, Any]]:
+async def get_alignments(request: Request) -> Response:
     """
     Endpoint para obtener todos los alineamientos disponibles.
 
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+
     Returns:
-        List[Dict[str, Any]]: Lista de alineamientos
+        Response: Lista de alineamientos en JSON precodificado (o 304 Not Modified)
     """
-    # Simulamos datos de alineamientos para la interfaz
-    return [
-        {"id": 1, "name": "Lawful Good", "description": "Honor and compassion"},
-        {"id": 2, "name": "Neutral Good", "description": "Do the best good"},
-        {"id": 3, "name": "Chaotic Good", "description": "Freedom and kindness"},
-        {"id": 4, "name": "Lawful Neutral", "description": "Order above all"},
-        {"id": 5, "name": "True Neutral", "description": "Balance in all things"},
-        {"id": 6, "name": "Chaotic Neutral", "description": "Freedom above all"},
-        {"id": 7, "name": "Lawful Evil", "description": "Methodical conquest"},
-        {"id": 8, "name": "Neutral Evil", "description": "Selfish interest"},
-        {"id": 9, "name": "Chaotic Evil", "description": "Destruction and chaos"}
-    ]
+    return await reference_response("alignments", request)
 
 
 @router.get("/api/skills", tags=["Characters API"])
-async def get_skills() -> List[Dict[str, Any]]:
+async def get_skills(request: Request) -> Response:
     """
     Endpoint para obtener todas las habilidades disponibles.
 
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+
     Returns:
-        List[Dict[str, Any]]: Lista de habilidades
+        Response: Lista de habilidades en JSON precodificado (o 304 Not Modified)
     """
-    # Simulamos datos de habilidades para la interfaz
-    return [
-        {"id": 1, "name": "Acrobatics", "attribute": "dexterity"},
-        {"id": 2, "name": "Animal Handling", "attribute": "wisdom"},
-        {"id": 3, "name": "Arcana", "attribute": "intelligence"},
-        {"id": 4, "name": "Athletics", "attribute": "strength"},
-        {"id": 5, "name": "Deception", "attribute": "charisma"},
-        {"id": 6, "name": "History", "attribute": "intelligence"},
-        {"id": 7, "name": "Insight", "attribute": "wisdom"},
-        {"id": 8, "name": "Intimidation", "attribute": "charisma"},
-        {"id": 9, "name": "Investigation", "attribute": "intelligence"},
-        {"id": 10, "name": "Medicine", "attribute": "wisdom"},
-        {"id": 11, "name": "Nature", "attribute": "intelligence"},
-        {"id": 12, "name": "Perception", "attribute": "wisdom"},
-        {"id": 13, "name": "Performance", "attribute": "charisma"},
-        {"id": 14, "name": "Persuasion", "attribute": "charisma"},
-        {"id": 15, "name": "Religion", "attribute": "intelligence"},
-        {"id": 16, "name": "Sleight of Hand", "attribute": "dexterity"},
-        {"id": 17, "name": "Stealth", "attribute": "dexterity"},
-        {"id": 18, "name": "Survival", "attribute": "wisdom"}
-    ]
+    return await reference_response("skills", request)
 
 
 @router.get("/api/languages", tags=["Characters API"])
-async def get_languages() -> List[Dict[str, Any]]:
+async def get_languages(request: Request) -> Response:
     """
     Endpoint para obtener todos los idiomas disponibles.
 
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+
     Returns:
-        List[Dict[str, Any]]: Lista de idiomas
+        Response: Lista de idiomas en JSON precodificado (o 304 Not Modified)
     """
-    # Simulamos datos de idiomas para la interfaz
-    return [
-        {"id": 1, "name": "Common", "description": "The common tongue of humans"},
-        {"id": 2, "name": "Elvish", "description": "The language of elves"},
-        {"id": 3, "name": "Dwarvish", "description": "The language of dwarves"},
-        {"id": 4, "name": "Giant", "description": "The language of giants"},
-        {"id": 5, "name": "Gnomish", "description": "The language of gnomes"},
-        {"id": 6, "name": "Goblin", "description": "The language of goblins"},
-        {"id": 7, "name": "Halfling", "description": "The language of halflings"},
-        {"id": 8, "name": "Orc", "description": "The language of orcs"},
-        {"id": 9, "name": "Abyssal", "description": "The language of demons"},
-        {"id": 10, "name": "Celestial", "description": "The language of celestials"}
-    ]
+    return await reference_response("languages", request)
 
 
 @router.get("/api/proficiencies", tags=["Characters API"])
-async def get_proficiencies() -> List[Dict[str, Any]]:
+async def get_proficiencies(request: Request) -> Response:
     """
     Endpoint para obtener todas las competencias disponibles.
 
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+
     Returns:
-        List[Dict[str, Any]]: Lista de competencias
+        Response: Lista de competencias en JSON precodificado (o 304 Not Modified)
     """
-    # Simulamos datos de competencias para la interfaz
-    return [
-        {"id": 1, "name": "Light Armor", "type": "armor"},
-        {"id": 2, "name": "Medium Armor", "type": "armor"},
-        {"id": 3, "name": "Heavy Armor", "type": "armor"},
-        {"id": 4, "name": "Shields", "type": "armor"},
-        {"id": 5, "name": "Simple Weapons", "type": "weapon"},
-        {"id": 6, "name": "Martial Weapons", "type": "weapon"},
-        {"id": 7, "name": "Alchemist's Supplies", "type": "tool"},
-        {"id": 8, "name": "Brewer's Supplies", "type": "tool"},
-        {"id": 9, "name": "Carpenter's Tools", "type": "tool"},
-        {"id": 10, "name": "Cook's Utensils", "type": "tool"}
-    ]
+    return await reference_response("proficiencies", request)
 
 
 @router.get("/api/spells", tags=["Characters API"])
-async def get_spells() -> List[Dict[str, Any]]:
+async def get_spells(request: Request) -> Response:
     """
     Endpoint para obtener todos los hechizos disponibles.
 
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+
     Returns:
-        List[Dict[str, Any]]: Lista de hechizos
+        Response: Lista de hechizos en JSON precodificado (o 304 Not Modified)
     """
-    # Simulamos datos de hechizos para la interfaz
-    return [
-        {"id": 1, "name": "Acid Splash", "level": 0, "school": "Conjuration"},
-        {"id": 2, "name": "Chill Touch", "level": 0, "school": "Necromancy"},
-        {"id": 3, "name": "Magic Missile", "level": 1, "school": "Evocation"},
-        {"id": 4, "name": "Burning Hands", "level": 1, "school": "Evocation"},
-        {"id": 5, "name": "Cure Wounds", "level": 1, "school": "Evocation"},
-        {"id": 6, "name": "Detect Magic", "level": 1, "school": "Divination"},
-        {"id": 7, "name": "Fireball", "level": 3, "school": "Evocation"},
-        {"id": 8, "name": "Fly", "level": 3, "school": "Transmutation"}
-    ]
+    return await reference_response("spells", request)
 
 
 @router.get("/api/items", tags=["Characters API"])
-async def get_items() -> List[Dict[str, Any]]:
+async def get_items(request: Request) -> Response:
     """
     Endpoint para obtener todos los objetos disponibles.
 
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+
     Returns:
-        List[Dict[str, Any]]: Lista de objetos
+        Response: Lista de objetos en JSON precodificado (o 304 Not Modified)
     """
-    # Simulamos datos de objetos para la interfaz
-    return [
-        {"id": 1, "name": "Potion of Healing", "type": "consumable", "rarity": "common"},
-        {"id": 2, "name": "Longsword", "type": "weapon", "rarity": "common"},
-        {"id": 3, "name": "Shield", "type": "armor", "rarity": "common"},
-        {"id": 4, "name": "Rope", "type": "gear", "rarity": "common"},
-        {"id": 5, "name": "Lantern", "type": "gear", "rarity": "common"},
-        {"id": 6, "name": "Spellbook", "type": "gear", "rarity": "uncommon"},
-        {"id": 7, "name": "Studded Leather", "type": "armor", "rarity": "common"},
-        {"id": 8, "name": "Wand of Magic Missiles", "type": "magic", "rarity": "uncommon"},
-        {"id": 9, "name": "Amulet of Health", "type": "magic", "rarity": "rare"},
-        {"id": 10, "name": "Bag of Holding", "type": "magic", "rarity": "uncommon"}
-    ]
+    return await reference_response("items", request)
 
 
 @router.get("/api/classes", tags=["Characters API"])
-async def get_classes() -> List[Dict[str, Any]]:
+async def get_classes(request: Request) -> Response:
     """
     Endpoint para obtener todas las clases disponibles.
 
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+
+    Returns:
+        Response: Lista de clases en JSON precodificado (o 304 Not Modified)
+    """
+    return await reference_response("classes", request)
+
+
+# Colecciones del catálogo del creador de personajes
+CATALOG_COLLECTIONS: Tuple[str, ...] = reference_data.names()
+
+catalog_cache = ResponseCache(max_entries=128)
+
+
+def parse_catalog_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """
+    Valida la lista de colecciones pedidas en el parámetro `fields`.
+
+    Args:
+        fields: Colecciones separadas por comas (None: todas)
+
     Returns:
-        List[Dict[str, Any]]: Lista de clases
+        Tuple[str, ...]: Colecciones pedidas, en el orden del catálogo
+
+    Raises:
+        HTTPException: Si se pide alguna colección desconocida
+    """
+    if not fields:
+        return tuple(CATALOG_COLLECTIONS)
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(CATALOG_COLLECTIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Colecciones desconocidas: {', '.join(sorted(unknown))}",
+        )
+    return tuple(name for name in CATALOG_COLLECTIONS if name in requested)
+
+
+def filter_by_game_type(
+    collection: List[Dict[str, Any]], game_type: Optional[str]
+) -> List[Dict[str, Any]]:
+    """
+    Filtra una colección por tipo de juego; los elementos sin tipo son comunes.
+
+    Args:
+        collection: Elementos de la colección
+        game_type: Tipo de juego (None o "custom": sin filtrar)
+
+    Returns:
+        List[Dict[str, Any]]: Elementos disponibles para el tipo de juego
     """
-    # Simulamos datos de clases para la interfaz
+    if not game_type or game_type == "custom":
+        return collection
     return [
-        {"id": 1, "name": "Fighter", "description": "Master of weapons and armor"},
-        {"id": 2, "name": "Wizard", "description": "Scholar of magical arts"},
-        {"id": 3, "name": "Rogue", "description": "Expert in stealth and trickery"},
-        {"id": 4, "name": "Cleric", "description": "Divine spellcaster and healer"},
-        {"id": 5, "name": "Ranger", "description": "Hunter and tracker"},
-        {"id": 6, "name": "Barbarian", "description": "Fierce warrior of the wilds"},
-        {"id": 7, "name": "Bard", "description": "Master of song and story"},
-        {"id": 8, "name": "Druid", "description": "Guardian of nature"},
-        {"id": 9, "name": "Monk", "description": "Master of martial arts"},
-        {"id": 10, "name": "Paladin", "description": "Holy warrior"},
-        {"id": 11, "name": "Sorcerer", "description": "Innate magical power"},
-        {"id": 12, "name": "Warlock", "description": "Pact-bound spellcaster"}
+        item for item in collection
+        if not item.get("game_type") or item["game_type"] == game_type
     ]
 
 
+def build_catalog(game_type: Optional[str], fields: Tuple[str, ...]) -> bytes:
+    """
+    Genera el catálogo filtrado y lo codifica a JSON una sola vez.
+
+    Args:
+        game_type: Tipo de juego por el que filtrar
+        fields: Colecciones a incluir
+
+    Returns:
+        bytes: Catálogo codificado en JSON
+    """
+    payload: Dict[str, Any] = {"game_type": game_type or "custom"}
+    for name in fields:
+        payload[name] = filter_by_game_type(reference_data.get_items(name), game_type)
+    return encode_json(payload)
+
+
+@router.get("/api/catalog", tags=["Characters API"])
+async def get_catalog(
+    request: Request,
+    game_type: Optional[str] = Query(None, description="Tipo de juego (dnd5e, pathfinder, wod, custom)"),
+    fields: Optional[str] = Query(None, description="Colecciones separadas por comas"),
+) -> Response:
+    """
+    Endpoint que devuelve todas las colecciones del creador de personajes en una respuesta.
+
+    La respuesta se codifica una vez por combinación de parámetros y se sirve
+    desde caché con ETag. Los nombres de los datos de referencia no se
+    traducen, así que la respuesta no depende del idioma de la petición.
+
+    Args:
+        request: Objeto Request de FastAPI para validar el ETag
+        game_type: Tipo de juego por el que filtrar
+        fields: Colecciones a incluir (por defecto todas)
+
+    Returns:
+        Response: Catálogo en JSON o 304 Not Modified
+    """
+    selected_fields = parse_catalog_fields(fields)
+    await sync_reference_data(selected_fields)
+    key = (game_type or "custom", selected_fields)
+
+    version = reference_data.version
+    cached = catalog_cache.get(key, version)
+    if cached is None:
+        body = build_catalog(game_type, selected_fields)
+        cached = catalog_cache.put(key, version, body, "application/json")
+
+    return build_cached_response(
+        cached,
+        request.headers.get("if-none-match"),
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+# Propietario de los personajes creados mientras no hay autenticación
+ANONYMOUS_USER_ID = uuid.uuid5(uuid.NAMESPACE_URL, "roleplaying-characters:anonymous")
+ANONYMOUS_USERNAME = "anonymous"
+
+
+def parse_uuid(value: Any) -> Optional[uuid.UUID]:
+    """
+    Interpreta un ID de la base de datos.
+
+    Args:
+        value: ID como texto, o un diccionario con la clave "id"
+
+    Returns:
+        Optional[uuid.UUID]: UUID o None si el valor no es un UUID
+    """
+    if isinstance(value, dict):
+        value = value.get("id")
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def parse_reference_id(value: Any, field: str) -> Optional[uuid.UUID]:
+    """
+    Interpreta el ID de un dato de referencia enviado por el formulario.
+
+    El catálogo (/api/catalog) sirve los mismos UUID con los que se siembran
+    las tablas de referencia; cualquier otro valor se rechaza en lugar de
+    guardar el personaje sin él.
+
+    Args:
+        value: ID como texto, o un diccionario con la clave "id"
+        field: Campo del formulario, para el mensaje de error
+
+    Returns:
+        Optional[uuid.UUID]: UUID, o None si el campo está vacío
+
+    Raises:
+        ValueError: Si el valor no es un UUID
+    """
+    if value in (None, ""):
+        return None
+    parsed = parse_uuid(value)
+    if parsed is None:
+        raise ValueError(f"'{field}' no es un ID de la base de datos: {value!r}")
+    return parsed
+
+
+def parse_reference_ids(values: Any, field: str) -> List[uuid.UUID]:
+    """
+    Interpreta una lista de IDs de datos de referencia del formulario.
+
+    Args:
+        values: Lista de IDs como texto o diccionarios con la clave "id"
+        field: Campo del formulario, para el mensaje de error
+
+    Returns:
+        List[uuid.UUID]: UUIDs de la lista, sin los valores vacíos
+
+    Raises:
+        ValueError: Si no es una lista o algún valor no es un UUID
+    """
+    if values in (None, ""):
+        return []
+    if not isinstance(values, list):
+        raise ValueError(f"'{field}' debe ser una lista")
+    return [parse_reference_id(value, field) for value in values if value not in (None, "")]
+
+
+def build_create_request(data: Dict[str, Any]) -> CreateCharacterRequest:
+    """
+    Convierte los datos del formulario en la petición del caso de uso.
+
+    Args:
+        data: Campos del formulario y listas de la vista previa
+
+    Returns:
+        CreateCharacterRequest: Petición de creación
+
+    Raises:
+        ValueError: Si falta el nombre, algún valor numérico no es válido o
+            algún ID no es un UUID de la base de datos
+    """
+    name = str(data.get("character_name") or data.get("name") or "").strip()
+    if not name:
+        raise ValueError("Falta el nombre del personaje")
+
+    return CreateCharacterRequest(
+        name=name,
+        race_id=parse_reference_id(data.get("race_id"), "race_id"),
+        class_id=parse_reference_id(data.get("class_id"), "class_id"),
+        background_id=parse_reference_id(data.get("background_id"), "background_id"),
+        alignment_id=parse_reference_id(data.get("alignment_id"), "alignment_id"),
+        level=int(data.get("level") or 1),
+        description=data.get("description") or None,
+        attributes={
+            attribute: int(data[attribute])
+            for attribute in ATTRIBUTE_NAMES
+            if data.get(attribute) not in (None, "")
+        },
+        skills=parse_reference_ids(data.get("skills"), "skills"),
+        languages=parse_reference_ids(data.get("languages"), "languages"),
+        proficiencies=parse_reference_ids(data.get("proficiencies"), "proficiencies"),
+        spells=parse_reference_ids(data.get("spells"), "spells"),
+        items=parse_reference_ids(data.get("items") or data.get("equipment"), "items"),
+    )
+
+
 @router.post("/api/characters", tags=["Characters API"])
 async def create_character(character_data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     """
     Endpoint para crear un nuevo personaje.
 
+    El personaje, sus datos asociados y su resumen de los listados se
+    guardan en una única transacción con CreateCharacterUseCase.
+
     Args:
         character_data: Datos del personaje a crear
 
@@ -252,20 +454,189 @@ async def create_character(character_data: Dict[str, Any] = Body(...)) -> Dict[s
         Dict[str, Any]: El personaje creado con su ID
     """
     try:
-        # Simulamos la creación de un personaje
-        # En una implementación real, usaríamos los casos de uso y repositorios
-        character_id = 123  # En un caso real, este ID vendría de la base de datos
-        
-        return {
+        create_request = build_create_request(character_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return await save_character(create_request, character_data)
+
+
+async def save_character(
+    create_request: CreateCharacterRequest, character_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Crea un personaje del usuario y construye la respuesta de la API.
+
+    Args:
+        create_request: Petición de creación ya validada
+        character_data: Datos enviados por el formulario
+
+    Returns:
+        Dict[str, Any]: El personaje creado con su ID
+    """
+    async with database.session() as session:
+        await ensure_user(session, ANONYMOUS_USER_ID, ANONYMOUS_USERNAME)
+        use_case = CreateCharacterUseCase(
+            **build_character_repositories(session, ANONYMOUS_USER_ID),
+            summary_projection=CharacterSummaryRepository(session),
+        )
+        character = await use_case.execute(create_request)
+
+    character_id = str(character.id)
+    created_at = datetime.now(timezone.utc).isoformat()
+    return {
+        "id": character_id,
+        "status": "success",
+        "message": "Character created successfully",
+        "character": {
+            **character_data,
             "id": character_id,
-            "status": "success",
-            "message": "Character created successfully",
-            "character": {
-                **character_data,
-                "id": character_id,
-                "created_at": "2025-07-13T12:00:00Z",
-                "updated_at": "2025-07-13T12:00:00Z"
-            }
+            "created_at": created_at,
+            "updated_at": created_at
         }
-    except Exception as e:
+    }
+
+
+async def list_characters(
+    user_id: Optional[uuid.UUID], cursor: Optional[str], limit: int, search: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Obtiene una página de un listado de personajes.
+
+    Args:
+        user_id: Usuario cuyos personajes se listan (None: todos)
+        cursor: Cursor de la página anterior
+        limit: Personajes por página
+        search: Prefijo del nombre de los personajes
+
+    Returns:
+        Dict[str, Any]: Personajes y cursor de la siguiente página
+    """
+    try:
+        async with database.session() as session:
+            page = await CharacterListRepository(session).list_page(
+                user_id, cursor, limit, search
+            )
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    return page_to_dict(page)
+
+
+@router.get("/api/browse", tags=["Characters API"])
+async def browse_characters(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    q: Optional[str] = Query(None, description="Prefijo del nombre"),
+) -> Dict[str, Any]:
+    """
+    Endpoint del listado de todos los personajes (`/browse`), paginado por cursor.
+
+    Args:
+        cursor: Cursor devuelto por la página anterior
+        limit: Personajes por página
+        q: Prefijo del nombre de los personajes
+
+    Returns:
+        Dict[str, Any]: Personajes y cursor de la siguiente página
+    """
+    return await list_characters(None, cursor, limit, q)
+
+
+@router.get("/api/characters", tags=["Characters API"])
+async def user_characters(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    q: Optional[str] = Query(None, description="Prefijo del nombre"),
+) -> Dict[str, Any]:
+    """
+    Endpoint del listado de personajes del usuario (`/characters`), paginado por cursor.
+
+    Args:
+        cursor: Cursor devuelto por la página anterior
+        limit: Personajes por página
+        q: Prefijo del nombre de los personajes
+
+    Returns:
+        Dict[str, Any]: Personajes y cursor de la siguiente página
+    """
+    return await list_characters(ANONYMOUS_USER_ID, cursor, limit, q)
+
+
+@router.get("/api/characters/export", tags=["Characters API"])
+async def export_characters(
+    scope: str = Query("user", pattern="^(user|all)$", description="user: los del usuario; all: todos"),
+) -> StreamingResponse:
+    """
+    Endpoint que exporta personajes con todos sus datos asociados en NDJSON.
+
+    La respuesta se genera por lotes mientras se recorre un cursor del
+    servidor, sin cargar todos los personajes en memoria.
+
+    Args:
+        scope: Personajes a exportar (los del usuario o todos, para administración)
+
+    Returns:
+        StreamingResponse: Una ficha por línea
+    """
+    user_id = ANONYMOUS_USER_ID if scope == "user" else None
+
+    async def generate():
+        async with database.session() as session:
+            async for chunk in export_ndjson(session, user_id):
+                yield chunk
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="characters.ndjson"'},
+    )
+
+
+@router.post("/api/characters/import", tags=["Characters API"])
+async def import_characters(
+    request: Request,
+    batch_size: int = Query(DEFAULT_IMPORT_BATCH_SIZE, ge=1, le=MAX_IMPORT_BATCH_SIZE),
+) -> Dict[str, Any]:
+    """
+    Endpoint que importa personajes desde un cuerpo NDJSON.
+
+    El cuerpo se lee por fragmentos; cada línea se valida y los personajes
+    válidos se guardan en lotes de `batch_size`, cada uno en su transacción.
+
+    Args:
+        request: Objeto Request de FastAPI con el cuerpo NDJSON
+        batch_size: Personajes por transacción
+
+    Returns:
+        Dict[str, Any]: Personajes importados, rechazados, progreso por lote y errores
+    """
+    async with database.session() as session:
+        await ensure_user(session, ANONYMOUS_USER_ID, ANONYMOUS_USERNAME)
+        report = await import_ndjson(session, request.stream(), ANONYMOUS_USER_ID, batch_size)
+    return report.to_dict()
+
+
+@router.get("/api/characters/{character_id}", tags=["Characters API"])
+async def get_character(character_id: str) -> Dict[str, Any]:
+    """
+    Endpoint que devuelve la ficha completa de un personaje.
+
+    La ficha se carga en un número fijo de consultas (ver
+    CharacterAggregateRepository).
+
+    Args:
+        character_id: ID del personaje
+
+    Returns:
+        Dict[str, Any]: Personaje con sus atributos, habilidades, idiomas,
+        competencias, conjuros y objetos
+    """
+    parsed_id = parse_uuid(character_id)
+    if parsed_id is None:
+        raise HTTPException(status_code=404, detail="Personaje no encontrado")
+
+    async with database.session() as session:
+        aggregate = await CharacterAggregateRepository(session).get(parsed_id)
+    if aggregate is None:
+        raise HTTPException(status_code=404, detail="Personaje no encontrado")
+    return asdict(aggregate)
@@ -0,0 +1,296 @@
+"""
+Controlador de los borradores de personajes.
+
+Este módulo contiene los endpoints HTTP con los que el formulario de
+creación guarda en el servidor el personaje en curso: cada cambio se envía
+como un parche JSON parcial y las ediciones se agrupan en memoria en
+`draft_buffer` antes de escribirse en la base de datos.
+
+Mientras no hay autenticación, cada navegador es el propietario de sus
+borradores: recibe un ID aleatorio en una cookie HttpOnly firmada con
+`settings.secret_key` y solo puede ver y editar los borradores de ese ID.
+"""
+
+import hashlib
+import hmac
+import uuid
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+
+from src.application.interfaces import DraftInterface
+from src.infrastructure.config import settings
+from src.infrastructure.db.character_drafts import draft_buffer
+from src.infrastructure.db.engine import database
+from src.infrastructure.db.repositories import ensure_user
+from src.infrastructure.web.character_controller import build_create_request, save_character
+
+router = APIRouter()
+
+DRAFT_OWNER_COOKIE = "draft_owner"
+DRAFT_OWNER_MAX_AGE = 60 * 60 * 24 * 365  # 1 año
+
+
+def sign_owner(owner_id: uuid.UUID) -> str:
+    """
+    Valor de la cookie de propietario: el ID y su firma HMAC-SHA256.
+
+    Args:
+        owner_id: ID del propietario
+
+    Returns:
+        str: ID en hexadecimal y firma separados por un punto
+    """
+    signature = hmac.new(
+        settings.secret_key.encode("utf-8"), owner_id.hex.encode("ascii"), hashlib.sha256
+    ).hexdigest()
+    return f"{owner_id.hex}.{signature}"
+
+
+def read_owner(value: Optional[str]) -> Optional[uuid.UUID]:
+    """
+    Comprueba la firma de la cookie de propietario.
+
+    Args:
+        value: Valor de la cookie (puede no existir)
+
+    Returns:
+        Optional[uuid.UUID]: ID del propietario, o None si falta o la firma no es válida
+    """
+    if not value or "." not in value:
+        return None
+    owner_hex = value.split(".", 1)[0]
+    try:
+        owner_id = uuid.UUID(hex=owner_hex)
+    except ValueError:
+        return None
+    if not hmac.compare_digest(sign_owner(owner_id), value):
+        return None
+    return owner_id
+
+
+def owner_username(owner_id: uuid.UUID) -> str:
+    """Nombre del usuario que representa a un navegador sin autenticar."""
+    return f"guest-{owner_id.hex}"
+
+
+def draft_owner(request: Request, response: Response) -> uuid.UUID:
+    """
+    Dependencia con el propietario de los borradores de la petición.
+
+    Si el navegador no tiene una cookie válida se le asigna un ID nuevo.
+
+    Args:
+        request: Petición con la cookie de propietario
+        response: Respuesta en la que se guarda la cookie si hace falta
+
+    Returns:
+        uuid.UUID: ID del propietario
+    """
+    owner_id = read_owner(request.cookies.get(DRAFT_OWNER_COOKIE))
+    if owner_id is None:
+        owner_id = uuid.uuid4()
+        response.set_cookie(
+            DRAFT_OWNER_COOKIE,
+            sign_owner(owner_id),
+            max_age=DRAFT_OWNER_MAX_AGE,
+            httponly=True,
+            samesite="lax",
+            secure=request.url.scheme == "https",
+        )
+    return owner_id
+
+
+def draft_to_dict(draft: DraftInterface) -> Dict[str, Any]:
+    """
+    Representación de un borrador para la API.
+
+    Args:
+        draft: Borrador
+
+    Returns:
+        Dict[str, Any]: ID, contenido y fechas en ISO 8601
+    """
+    return {
+        "id": str(draft.id),
+        "data": draft.data,
+        "created_at": draft.created_at.isoformat(),
+        "updated_at": draft.updated_at.isoformat(),
+    }
+
+
+def not_found() -> HTTPException:
+    """Error de borrador inexistente o de otro usuario."""
+    return HTTPException(status_code=404, detail="Borrador no encontrado")
+
+
+def parse_draft_id(draft_id: str) -> uuid.UUID:
+    """
+    Interpreta el ID de un borrador de la ruta.
+
+    Args:
+        draft_id: ID como texto
+
+    Returns:
+        uuid.UUID: ID del borrador
+
+    Raises:
+        HTTPException: 404 si el ID no es un UUID
+    """
+    try:
+        return uuid.UUID(draft_id)
+    except ValueError:
+        raise not_found()
+
+
+@router.post("/api/drafts", tags=["Characters API"])
+async def create_draft(
+    data: Optional[Dict[str, Any]] = Body(None),
+    owner_id: uuid.UUID = Depends(draft_owner),
+) -> Dict[str, Any]:
+    """
+    Endpoint que crea un borrador con el contenido inicial del formulario.
+
+    Args:
+        data: Contenido inicial del borrador
+        owner_id: Propietario del borrador (cookie del navegador)
+
+    Returns:
+        Dict[str, Any]: El borrador creado con su ID
+    """
+    async with database.session() as session:
+        await ensure_user(session, owner_id, owner_username(owner_id))
+    try:
+        draft = await draft_buffer.create(owner_id, data or {})
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    return draft_to_dict(draft)
+
+
+@router.get("/api/drafts", tags=["Characters API"])
+async def list_drafts(
+    limit: int = Query(10, ge=1, le=50),
+    owner_id: uuid.UUID = Depends(draft_owner),
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Endpoint con los borradores más recientes del navegador, incluidos los no guardados aún.
+
+    Args:
+        limit: Número máximo de borradores
+        owner_id: Propietario de los borradores (cookie del navegador)
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Borradores del más reciente al más antiguo
+    """
+    drafts = await draft_buffer.list_by_user(owner_id, limit)
+    return {"items": [draft_to_dict(draft) for draft in drafts]}
+
+
+@router.get("/api/drafts/{draft_id}", tags=["Characters API"])
+async def get_draft(
+    draft_id: str, owner_id: uuid.UUID = Depends(draft_owner)
+) -> Dict[str, Any]:
+    """
+    Endpoint que devuelve la versión más reciente de un borrador.
+
+    Args:
+        draft_id: ID del borrador
+        owner_id: Propietario del borrador (cookie del navegador)
+
+    Returns:
+        Dict[str, Any]: El borrador
+    """
+    draft = await draft_buffer.get(parse_draft_id(draft_id), owner_id)
+    if draft is None:
+        raise not_found()
+    return draft_to_dict(draft)
+
+
+@router.patch("/api/drafts/{draft_id}", tags=["Characters API"])
+async def patch_draft(
+    draft_id: str,
+    changes: Dict[str, Any] = Body(...),
+    owner_id: uuid.UUID = Depends(draft_owner),
+) -> Dict[str, Any]:
+    """
+    Endpoint que aplica un parche parcial (JSON Merge Patch) a un borrador.
+
+    El cambio se guarda en el siguiente vaciado del búfer, junto con el
+    resto de ediciones del borrador.
+
+    Args:
+        draft_id: ID del borrador
+        changes: Campos modificados; null elimina el campo
+        owner_id: Propietario del borrador (cookie del navegador)
+
+    Returns:
+        Dict[str, Any]: El borrador actualizado
+    """
+    try:
+        draft = await draft_buffer.patch(parse_draft_id(draft_id), owner_id, changes)
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    if draft is None:
+        raise not_found()
+    return draft_to_dict(draft)
+
+
+@router.delete("/api/drafts/{draft_id}", tags=["Characters API"])
+async def delete_draft(
+    draft_id: str, owner_id: uuid.UUID = Depends(draft_owner)
+) -> Dict[str, str]:
+    """
+    Endpoint que descarta un borrador.
+
+    Args:
+        draft_id: ID del borrador
+        owner_id: Propietario del borrador (cookie del navegador)
+
+    Returns:
+        Dict[str, str]: Estado de la operación
+    """
+    if not await draft_buffer.remove(parse_draft_id(draft_id), owner_id):
+        raise not_found()
+    return {"status": "success"}
+
+
+@router.post("/api/drafts/{draft_id}/submit", tags=["Characters API"])
+async def submit_draft(
+    draft_id: str,
+    changes: Optional[Dict[str, Any]] = Body(None),
+    owner_id: uuid.UUID = Depends(draft_owner),
+) -> Dict[str, Any]:
+    """
+    Endpoint que crea el personaje de un borrador y elimina el borrador.
+
+    Las ediciones pendientes se guardan antes de crear el personaje, de modo
+    que si la creación falla el borrador se conserva completo.
+
+    Args:
+        draft_id: ID del borrador
+        changes: Últimos cambios del formulario (opcional)
+        owner_id: Propietario del borrador (cookie del navegador)
+
+    Returns:
+        Dict[str, Any]: El personaje creado con su ID
+    """
+    parsed_id = parse_draft_id(draft_id)
+    try:
+        if changes:
+            draft = await draft_buffer.patch(parsed_id, owner_id, changes)
+        else:
+            draft = await draft_buffer.get(parsed_id, owner_id)
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    if draft is None:
+        raise not_found()
+
+    await draft_buffer.flush([parsed_id])
+    try:
+        create_request = build_create_request(draft.data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response = await save_character(create_request, draft.data)
+    await draft_buffer.remove(parsed_id, owner_id)
+    return response
@@ -1,16 +1,41 @@
-from pathlib import Path
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from src.infrastructure.template_helpers import render_template_with_translations
+from starlette.responses import Response
+from src.infrastructure.templating import templates
+from src.infrastructure.template_helpers import render_cached_page
 
 router = APIRouter()
 
-# Configurar el directorio de templates
-templates_dir = Path(__file__).parent.parent.parent.parent / "templates" / "html"
-templates = Jinja2Templates(directory=str(templates_dir))
+NOT_FOUND_PATH = "/404"
 
-@router.get("/404", response_class=HTMLResponse, tags=["NotFound"])
+
+def render_not_found_page(request: Request) -> Response:
+    """
+    Devuelve la página 404 traducida con estado 404 para cualquier ruta desconocida.
+
+    La página se renderiza como si se hubiera pedido `/404`, de modo que su
+    contenido no depende de la URL y se sirve de la caché de páginas con una
+    sola entrada por idioma.
+
+    Args:
+        request: Petición a una ruta inexistente
+
+    Returns:
+        Response: HTML de la página 404 con estado 404
+    """
+    not_found_request = Request(
+        {**request.scope, "path": NOT_FOUND_PATH, "raw_path": NOT_FOUND_PATH.encode()}
+    )
+    return render_cached_page(
+        templates=templates,
+        template_name="404.html",
+        request=not_found_request,
+        context={"_domain": "404"},
+        status_code=404,
+    )
+
+
+@router.get(NOT_FOUND_PATH, response_class=HTMLResponse, tags=["NotFound"])
 async def not_found(request: Request) -> HTMLResponse:
     """
     Endpoint para la página 404 personalizada.
@@ -22,6 +47,6 @@ async def not_found(request: Request) -> HTMLResponse:
         HTMLResponse: HTML con la página 404 traducida
     """
     # Forzar el dominio de traducción a '404'
-    return render_template_with_translations(
+    return render_cached_page(
         templates=templates, template_name="404.html", request=request, context={"_domain": "404"}
     )
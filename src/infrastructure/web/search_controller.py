@@ -0,0 +1,89 @@
+"""
+Controlador para la búsqueda en los datos de referencia.
+
+Este módulo contiene los endpoints HTTP de búsqueda de texto y de filtrado
+por facetas sobre conjuros, objetos y el resto de entidades del catálogo del
+creador de personajes.
+"""
+
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from src.infrastructure.facet_index import FACETS, facet_service
+from src.infrastructure.i18n import I18nConfig
+from src.infrastructure.search_index import SEARCH_TYPES, search_service
+from src.infrastructure.translation_service import translation_service
+
+router = APIRouter()
+
+
+@router.get("/api/search", tags=["Characters API"])
+async def search(
+    request: Request,
+    type: str = Query(..., description="Tipo de entidad (spell, item, race, class...)"),
+    q: str = Query(..., min_length=1, max_length=100, description="Texto de búsqueda"),
+    limit: int = Query(10, ge=1, le=50, description="Número máximo de resultados"),
+    lang: Optional[str] = Query(None, description="Idioma de la consulta"),
+) -> Dict[str, Any]:
+    """
+    Endpoint de búsqueda por prefijo, sin acentos y tolerante a erratas.
+
+    Args:
+        request: Objeto Request de FastAPI para detectar el idioma
+        type: Tipo de entidad a buscar
+        q: Texto de búsqueda
+        limit: Número máximo de resultados
+        lang: Idioma de la consulta (por defecto el de la petición)
+
+    Returns:
+        Dict[str, Any]: Resultados ordenados por relevancia con su puntuación
+    """
+    if type not in SEARCH_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Tipo desconocido: {type}. Tipos válidos: {', '.join(SEARCH_TYPES)}",
+        )
+    if lang not in I18nConfig.SUPPORTED_LANGUAGES:
+        lang = translation_service.get_language_from_request(request)
+
+    results = search_service.search(type, q, lang, limit)
+    return {
+        "type": type,
+        "query": q,
+        "lang": lang,
+        "results": [{**result.document, "score": result.score} for result in results],
+    }
+
+
+@router.get("/api/{collection}/filter", tags=["Characters API"])
+async def filter_collection(collection: str, request: Request) -> Dict[str, Any]:
+    """
+    Endpoint de filtrado combinado por facetas de una colección del catálogo.
+
+    Las condiciones se pasan en el query string y se combinan con Y, por
+    ejemplo `/api/spells/filter?level<=3&school=Evocation,Abjuration`.
+    Operadores admitidos: `=`, `!=`, `<`, `<=`, `>` y `>=`.
+
+    Args:
+        collection: Colección a filtrar (spells, items, proficiencies, skills)
+        request: Objeto Request de FastAPI con el query string sin decodificar
+
+    Returns:
+        Dict[str, Any]: IDs que cumplen el filtro, total y recuentos por faceta
+    """
+    if collection not in FACETS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"La colección '{collection}' no admite filtros por facetas",
+        )
+
+    try:
+        result = facet_service.filter(collection, request.url.query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "collection": collection,
+        "total": result.total,
+        "ids": result.ids,
+        "facets": result.counts,
+    }
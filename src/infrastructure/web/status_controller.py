@@ -1,13 +1,13 @@
-from pathlib import Path
-from fastapi import APIRouter
-from fastapi.templating import Jinja2Templates
+from typing import Any, Dict
+from fastapi import APIRouter, Query
+from src.application.reference_data_cache import reference_data_cache
+from src.infrastructure.db.character_drafts import draft_buffer
+from src.infrastructure.db.engine import database
+from src.infrastructure.template_helpers import page_cache
+from src.infrastructure.translation_service import translation_service
 
 router = APIRouter()
 
-# Configurar el directorio de templates
-templates_dir = Path(__file__).parent.parent.parent.parent / "templates" / "html"
-templates = Jinja2Templates(directory=str(templates_dir))
-
 
 @router.get("/health", tags=["Health"])
 async def health_check() -> dict[str, str]:
@@ -18,3 +18,72 @@ async def health_check() -> dict[str, str]:
         dict[str, str]: Estado de la aplicación
     """
     return {"status": "healthy", "message": "Roleplaying Characters Manager is running"}
+
+
+@router.get("/health/translations", tags=["Health"])
+async def translations_status() -> Dict[str, Any]:
+    """
+    Endpoint de monitorización de las tablas de traducción precompiladas.
+
+    Returns:
+        Dict[str, Any]: Tamaño de las tablas y tiempo de construcción
+    """
+    return translation_service.get_lookup_stats()
+
+
+@router.get("/health/translations/misses", tags=["Health"])
+async def translation_misses(limit: int = Query(20, ge=1, le=500)) -> Dict[str, Any]:
+    """
+    Endpoint con el ranking de claves de traducción no encontradas.
+
+    Args:
+        limit: Número máximo de claves a devolver
+
+    Returns:
+        Dict[str, Any]: Resumen y ranking de fallos de traducción
+    """
+    return translation_service.get_missing_translations(limit)
+
+
+@router.get("/health/page-cache", tags=["Health"])
+async def page_cache_status() -> Dict[str, Any]:
+    """
+    Endpoint de monitorización de la caché de páginas renderizadas.
+
+    Returns:
+        Dict[str, Any]: Entradas, aciertos, fallos y tamaño de la caché
+    """
+    return page_cache.get_stats()
+
+
+@router.get("/health/reference-cache", tags=["Health"])
+async def reference_cache_status() -> Dict[str, Any]:
+    """
+    Endpoint de monitorización de la caché de datos de referencia.
+
+    Returns:
+        Dict[str, Any]: Versión, entradas, aciertos, fallos y tiempos de carga
+    """
+    return reference_data_cache.get_stats()
+
+
+@router.get("/health/database", tags=["Health"])
+async def database_status() -> Dict[str, Any]:
+    """
+    Endpoint de monitorización del pool de conexiones.
+
+    Returns:
+        Dict[str, Any]: Modo de ejecución, dialecto y estado del pool
+    """
+    return database.get_stats()
+
+
+@router.get("/health/drafts", tags=["Health"])
+async def drafts_status() -> Dict[str, Any]:
+    """
+    Endpoint de monitorización del búfer de escritura de los borradores.
+
+    Returns:
+        Dict[str, Any]: Pendientes, ediciones por escritura y latencia de vaciado
+    """
+    return draft_buffer.get_stats()
@@ -43,8 +43,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // Manejo de eventos de nivel y experiencia
     setupLevelExperienceControls();
     
-    // Cargar borrador si existe
+    // Cargar borrador si existe y guardar los cambios en el servidor
     attemptLoadDraft();
+    setupDraftAutosave();
 });
 
 function setupLevelExperienceControls() {
@@ -170,18 +171,107 @@ function getExperienceForLevel(level) {
     return expTable[adjustedLevel];
 }
 
-function saveDraft() {
-    // Obtener todos los datos del formulario
+/**
+ * Sincronización del borrador con el servidor.
+ * Cada cambio del formulario se envía como un parche parcial a /api/drafts;
+ * el servidor agrupa las ediciones antes de guardarlas. localStorage se
+ * mantiene como copia local por si el servidor no está disponible.
+ */
+const draftSync = {
+    draftId: localStorage.getItem('characterDraftId'),
+    pendingChanges: {},
+    timer: null,
+    delay: 500,
+
+    async request(url, method, body) {
+        const response = await fetch(url, {
+            method,
+            headers: { 'Content-Type': 'application/json' },
+            body: body === undefined ? undefined : JSON.stringify(body)
+        });
+        if (!response.ok) {
+            const error = new Error(`Error ${response.status} en ${url}`);
+            error.status = response.status;
+            throw error;
+        }
+        return response.json();
+    },
+
+    async save(changes) {
+        if (this.draftId) {
+            try {
+                return await this.request(`/api/drafts/${this.draftId}`, 'PATCH', changes);
+            } catch (e) {
+                // Solo si el borrador ya no existe se crea uno nuevo; con otros
+                // errores (red, 413, 5xx) se conserva para el siguiente intento
+                if (e.status !== 404) throw e;
+                this.draftId = null;
+            }
+        }
+        const draft = await this.request('/api/drafts', 'POST', collectDraftData());
+        this.draftId = draft.id;
+        localStorage.setItem('characterDraftId', draft.id);
+        return draft;
+    },
+
+    queue(changes) {
+        Object.assign(this.pendingChanges, changes);
+        clearTimeout(this.timer);
+        this.timer = setTimeout(() => this.flush(), this.delay);
+    },
+
+    async flush() {
+        clearTimeout(this.timer);
+        const changes = this.pendingChanges;
+        this.pendingChanges = {};
+        if (Object.keys(changes).length === 0) return null;
+        try {
+            return await this.save(changes);
+        } catch (e) {
+            console.error('Error saving draft on the server:', e);
+            // Los cambios se envían de nuevo con la siguiente edición
+            this.pendingChanges = { ...changes, ...this.pendingChanges };
+            return null;
+        }
+    },
+
+    async loadLatest() {
+        try {
+            const { items } = await this.request('/api/drafts?limit=1', 'GET');
+            if (items.length === 0) return null;
+            this.draftId = items[0].id;
+            localStorage.setItem('characterDraftId', this.draftId);
+            return { ...items[0].data, savedAt: items[0].updated_at };
+        } catch (e) {
+            console.error('Error loading draft from the server:', e);
+            return null;
+        }
+    },
+
+    discardPending() {
+        clearTimeout(this.timer);
+        this.pendingChanges = {};
+    },
+
+    forget() {
+        this.discardPending();
+        this.draftId = null;
+        localStorage.removeItem('characterDraftId');
+        localStorage.removeItem('characterDraft');
+    }
+};
+
+window.draftSync = draftSync;
+
+function collectDraftData() {
     const form = document.getElementById('character-form');
-    if (!form) return;
-    
-    const formData = new FormData(form);
+    const formData = form ? new FormData(form) : new FormData();
     
     // Obtener personaje de la vista previa
     const character = window.previewManager?.getCharacter();
     
     // Combinar datos
-    const draftData = {
+    return {
         ...Object.fromEntries(formData),
         skills: character?.skills || [],
         equipment: character?.equipment || [],
@@ -189,14 +279,54 @@ function saveDraft() {
         isDraft: true,
         savedAt: new Date().toISOString()
     };
+}
+
+function setupDraftAutosave() {
+    const form = document.getElementById('character-form');
+    if (!form) return;
+    
+    // Cada cambio se envía como un parche con solo el campo modificado
+    const onFieldChange = function(e) {
+        if (!e.target.name) return;
+        localStorage.setItem('characterDraft', JSON.stringify(collectDraftData()));
+        draftSync.queue({ [e.target.name]: e.target.value, savedAt: new Date().toISOString() });
+    };
+    form.addEventListener('input', onFieldChange);
+    form.addEventListener('change', onFieldChange);
     
-    // Guardar en localStorage
+    // Guardar lo pendiente al salir de la página
+    window.addEventListener('pagehide', function() {
+        if (draftSync.draftId && Object.keys(draftSync.pendingChanges).length > 0) {
+            fetch(`/api/drafts/${draftSync.draftId}`, {
+                method: 'PATCH',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(draftSync.pendingChanges),
+                keepalive: true
+            });
+        }
+    });
+}
+
+async function saveDraft() {
+    if (!document.getElementById('character-form')) return;
+    
+    const draftData = collectDraftData();
+    
+    // Guardar en localStorage como copia local
     try {
         localStorage.setItem('characterDraft', JSON.stringify(draftData));
-        alert('Draft saved successfully.');
     } catch (e) {
         console.error('Error saving draft:', e);
-        alert('Error saving draft. Your browser might have local storage disabled.');
+    }
+    
+    // Guardar el borrador completo en el servidor
+    draftSync.discardPending();
+    try {
+        await draftSync.save(draftData);
+        alert('Draft saved successfully.');
+    } catch (e) {
+        console.error('Error saving draft on the server:', e);
+        alert('The draft was only saved in this browser. Please try again later.');
     }
 }
 
@@ -212,8 +342,9 @@ function loadDraft() {
     }
 }
 
-function attemptLoadDraft() {
-    const draft = loadDraft();
+async function attemptLoadDraft() {
+    // El borrador del servidor tiene prioridad: puede venir de otro dispositivo
+    const draft = await draftSync.loadLatest() || loadDraft();
     if (!draft) return;
     
     // Verificar si el borrador es reciente (menos de 7 días)
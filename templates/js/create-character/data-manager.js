@@ -4,6 +4,8 @@
 class DataManager {
     constructor() {
         this.allData = null;
+        this.catalogs = new Map();
+        this.populateToken = 0;
         this.selects = {};
         this.containers = {};
         this.dataPopulated = false;
@@ -55,30 +57,27 @@ class DataManager {
         });
     }
     
+    async fetchCatalog(gameType) {
+        const gameTypeValue = gameType || 'custom';
+        
+        // Cada tipo de juego se pide una sola vez; el servidor ya lo devuelve filtrado
+        if (!this.catalogs.has(gameTypeValue)) {
+            const params = new URLSearchParams({ game_type: gameTypeValue });
+            const request = fetch(`/api/catalog?${params}`).then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.json();
+            });
+            this.catalogs.set(gameTypeValue, request);
+            request.catch(() => this.catalogs.delete(gameTypeValue));
+        }
+        
+        return this.catalogs.get(gameTypeValue);
+    }
+    
     async loadAllData() {
         try {
-            const endpoints = {
-                races: '/api/races',
-                classes: '/api/classes',
-                backgrounds: '/api/backgrounds',
-                alignments: '/api/alignments',
-                skills: '/api/skills',
-                languages: '/api/languages',
-                proficiencies: '/api/proficiencies',
-                spells: '/api/spells',
-                items: '/api/items'
-            };
-            
-            const data = {};
-            const promises = Object.entries(endpoints).map(async ([key, url]) => {
-                const response = await fetch(url);
-                data[key] = await response.json();
-            });
-            
-            await Promise.all(promises);
-            
-            // Guardar los datos completos
-            this.allData = data;
+            // Una sola petición con todas las colecciones
+            this.allData = await this.fetchCatalog('custom');
             
             // Notificar que los datos se han cargado
             document.dispatchEvent(new CustomEvent('dataLoaded', {
@@ -92,38 +91,25 @@ class DataManager {
         }
     }
     
-    filterDataByGameType(gameType) {
-        if (!this.allData) return null;
-        
-        const gameTypeValue = gameType || 'custom';
-        const filteredData = {};
-        
-        // Si es personalizado, mostrar todo
-        if (gameTypeValue === 'custom') {
-            Object.keys(this.allData).forEach(key => {
-                filteredData[key] = this.allData[key];
-            });
-        } else {
-            // Filtrar por tipo de juego
-            Object.keys(this.allData).forEach(key => {
-                if (Array.isArray(this.allData[key])) {
-                    filteredData[key] = this.allData[key].filter(item => 
-                        !item.game_type || item.game_type === gameTypeValue);
-                } else {
-                    filteredData[key] = this.allData[key];
-                }
-            });
+    async filterDataByGameType(gameType) {
+        try {
+            return await this.fetchCatalog(gameType);
+        } catch (err) {
+            console.error('Error loading catalog:', err);
+            return null;
         }
-        
-        return filteredData;
     }
     
-    populateFormWithFilteredData(gameType) {
+    async populateFormWithFilteredData(gameType) {
+        // Obtener datos filtrados en el servidor
+        const token = ++this.populateToken;
+        const filteredData = await this.filterDataByGameType(gameType);
+        
+        // Si se ha elegido otro tipo de juego mientras tanto, ignorar esta respuesta
+        if (token !== this.populateToken) return;
+        
         // Limpiar datos existentes
         this.clearAll();
-        
-        // Obtener datos filtrados
-        const filteredData = this.filterDataByGameType(gameType);
         if (!filteredData) return;
         
         // Poblar selects
@@ -224,8 +224,13 @@ class NavigationManager {
         // Mostrar cargando
         this.showLoading();
         
+        // Con un borrador en el servidor, enviarlo con los últimos cambios
+        window.draftSync?.discardPending();
+        const draftId = window.draftSync?.draftId;
+        const url = draftId ? `/api/drafts/${draftId}/submit` : '/api/characters';
+        
         // Enviar datos al servidor
-        fetch('/api/characters', {
+        fetch(url, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -239,6 +244,7 @@ class NavigationManager {
             return response.json();
         })
         .then((data) => {
+            window.draftSync?.forget();
             // Redirigir a la página del personaje creado
             window.location.href = `/characters/${data.id}`;
         })
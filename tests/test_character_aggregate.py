@@ -0,0 +1,201 @@
+"""
+Pruebas unitarias para la lectura de fichas completas de personajes.
+
+Este módulo contiene pruebas para verificar que CharacterAggregateRepository
+carga uno o muchos personajes con todos sus datos asociados en un número
+fijo de consultas, sin cargas perezosas por fila.
+"""
+
+import asyncio
+import uuid
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.index import app
+from src.infrastructure.db import character_aggregate
+from src.infrastructure.db.character_aggregate import CharacterAggregateRepository
+from src.infrastructure.db.engine import LONG_RUNNING
+from src.infrastructure.db.engine import database as app_database
+from src.infrastructure.db.models import (
+    AttributeModel,
+    CharacterItemModel,
+    CharacterModel,
+    CharacterSkillModel,
+    CharacterSpellModel,
+    ItemModel,
+    RaceModel,
+    SkillModel,
+    SpellModel,
+    UserModel,
+)
+from src.infrastructure.db.models.base import Base
+
+# Consultas esperadas: personajes (con JOIN de raza, clase, trasfondo y
+# alineamiento), atributos y una por cada tabla de relación
+EXPECTED_QUERIES = 7
+
+
+async def seed(connection: Any, characters: int) -> List[uuid.UUID]:
+    """Crea personajes con atributos, habilidades, conjuros y objetos."""
+    user_id = uuid.uuid4()
+    race_id = uuid.uuid4()
+    skills = [{"id": uuid.uuid4(), "name": f"skill-{index}"} for index in range(3)]
+    spells = [{"id": uuid.uuid4(), "name": f"spell-{index}"} for index in range(2)]
+    items = [{"id": uuid.uuid4(), "name": f"item-{index}"} for index in range(2)]
+    await connection.execute(insert(UserModel), [{
+        "id": user_id, "username": "u", "email": "u@localhost", "password_hash": "",
+    }])
+    await connection.execute(insert(RaceModel), [{"id": race_id, "name": "Elfo"}])
+    await connection.execute(insert(SkillModel), skills)
+    await connection.execute(insert(SpellModel), spells)
+    await connection.execute(insert(ItemModel), items)
+
+    ids = [uuid.uuid4() for _ in range(characters)]
+    await connection.execute(insert(CharacterModel), [
+        {"id": character_id, "user_id": user_id, "name": f"pj-{index}", "level": 1 + index % 20,
+         "race_id": race_id}
+        for index, character_id in enumerate(ids)
+    ])
+    await connection.execute(insert(AttributeModel), [
+        {"character_id": character_id, "strength": 15, "dexterity": 14, "constitution": 13,
+         "intelligence": 12, "wisdom": 10, "charisma": 8}
+        for character_id in ids
+    ])
+    await connection.execute(insert(CharacterSkillModel), [
+        {"character_id": character_id, "skill_id": skill["id"], "proficiency_bonus": 2}
+        for character_id in ids for skill in skills
+    ])
+    await connection.execute(insert(CharacterSpellModel), [
+        {"character_id": character_id, "spell_id": spell["id"], "level_slot": 1}
+        for character_id in ids for spell in spells
+    ])
+    await connection.execute(insert(CharacterItemModel), [
+        {"character_id": character_id, "item_id": item["id"], "quantity": 2,
+         "equipped_flag": index == 0}
+        for character_id in ids for index, item in enumerate(items)
+    ])
+    return ids
+
+
+def load(characters: int, requested: int) -> Tuple[List[Any], int, List[uuid.UUID]]:
+    """
+    Carga las fichas de `requested` personajes de `characters` creados.
+
+    Returns:
+        Tuple[List[Any], int, List[uuid.UUID]]: Fichas, consultas ejecutadas e IDs
+    """
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            ids = await seed(connection, characters)
+
+        statements: List[str] = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        async with AsyncSession(engine) as session:
+            aggregates = await CharacterAggregateRepository(session).get_many(ids[:requested])
+        await engine.dispose()
+        return aggregates, len(statements), ids
+
+    return asyncio.run(scenario())
+
+
+class TestCharacterAggregate:
+    """Pruebas para la carga de fichas de personajes."""
+
+    @pytest.mark.parametrize("requested", [1, 40])
+    def test_fixed_number_of_queries(self, requested: int) -> None:
+        """
+        Prueba que el número de consultas no depende del número de personajes.
+        """
+        aggregates, queries, _ = load(characters=40, requested=requested)
+
+        assert len(aggregates) == requested
+        assert queries == EXPECTED_QUERIES
+
+    def test_large_batches_are_chunked(self, monkeypatch) -> None:
+        """
+        Prueba que los lotes grandes se dividen y cada parte usa las mismas consultas.
+        """
+        monkeypatch.setattr(character_aggregate, "MAX_IDS_PER_QUERY", 15)
+        aggregates, queries, ids = load(characters=40, requested=40)
+
+        assert [aggregate.id for aggregate in aggregates] == ids
+        assert queries == EXPECTED_QUERIES * 3
+
+    def test_aggregate_contents(self) -> None:
+        """
+        Prueba que la ficha incluye todos los datos asociados resueltos.
+        """
+        aggregates, _, ids = load(characters=3, requested=3)
+        aggregate = aggregates[1]
+
+        assert aggregate.id == ids[1]
+        assert aggregate.race["name"] == "Elfo"
+        assert aggregate.character_class is None
+        assert aggregate.attributes["strength"] == 15
+        assert sorted(skill["name"] for skill in aggregate.skills) == [
+            "skill-0", "skill-1", "skill-2"
+        ]
+        assert {spell["level_slot"] for spell in aggregate.spells} == {1}
+        assert sum(item["equipped"] for item in aggregate.items) == 1
+        assert aggregate.languages == []
+
+    def test_order_and_missing_ids(self) -> None:
+        """
+        Prueba que las fichas siguen el orden pedido y omiten los IDs inexistentes.
+        """
+        async def scenario():
+            engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+                ids = await seed(connection, 3)
+            async with AsyncSession(engine) as session:
+                repository = CharacterAggregateRepository(session)
+                aggregates = await repository.get_many([ids[2], uuid.uuid4(), ids[0]])
+                missing = await repository.get(uuid.uuid4())
+            await engine.dispose()
+            return [aggregate.id for aggregate in aggregates], ids, missing
+
+        loaded, ids, missing = asyncio.run(scenario())
+
+        assert loaded == [ids[2], ids[0]]
+        assert missing is None
+
+
+class TestCharacterEndpoint:
+    """Pruebas para el endpoint GET /api/characters/{character_id}."""
+
+    def setup_method(self) -> None:
+        app_database.configure(url="sqlite+aiosqlite://", profile=LONG_RUNNING)
+
+    def teardown_method(self) -> None:
+        app_database.configure()
+
+    def test_created_character_can_be_read(self) -> None:
+        """
+        Prueba que un personaje creado por la API se puede leer con su ficha.
+        """
+        with TestClient(app) as client:
+            created = client.post("/api/characters", json={
+                "character_name": "Aria", "strength": "15",
+            }).json()
+            response = client.get(f"/api/characters/{created['id']}")
+            missing = client.get(f"/api/characters/{uuid.uuid4()}")
+            invalid = client.get("/api/characters/123")
+
+        body: Dict[str, Any] = response.json()
+        assert response.status_code == 200
+        assert body["name"] == "Aria"
+        assert body["attributes"]["strength"] == 15
+        assert missing.status_code == 404
+        assert invalid.status_code == 404
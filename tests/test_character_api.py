@@ -0,0 +1,193 @@
+"""
+Pruebas unitarias para la API de datos del creador de personajes.
+
+Este módulo contiene pruebas para verificar el catálogo agregado, sus
+filtros en el servidor y las respuestas precodificadas.
+"""
+
+import uuid
+from types import MappingProxyType
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from src.application.reference_data_cache import reference_data_cache
+from src.index import app
+from src.infrastructure.db.engine import LONG_RUNNING
+from src.infrastructure.db.engine import database as app_database
+from src.infrastructure.db.models import RaceModel
+from src.infrastructure.reference_data import ReferenceDataStore, reference_data
+from src.infrastructure.web.character_controller import (
+    CATALOG_COLLECTIONS,
+    filter_by_game_type,
+)
+
+client = TestClient(app)
+
+
+class TestCatalogEndpoint:
+    """Pruebas para el endpoint /api/catalog."""
+
+    def test_catalog_contains_every_collection(self) -> None:
+        """
+        Prueba que el catálogo devuelve las mismas colecciones que los endpoints sueltos.
+        """
+        catalog = client.get("/api/catalog").json()
+
+        for name in CATALOG_COLLECTIONS:
+            assert catalog[name] == client.get(f"/api/{name}").json()
+
+    def test_fields_parameter(self) -> None:
+        """
+        Prueba que `fields` limita las colecciones.
+        """
+        catalog = client.get("/api/catalog?fields=spells,races").json()
+
+        assert set(catalog) == {"game_type", "races", "spells"}
+
+    def test_catalog_does_not_depend_on_language(self) -> None:
+        """
+        Prueba que el catálogo es el mismo en todos los idiomas y se cachea una vez.
+        """
+        english = client.get("/api/catalog?fields=races", headers={"Accept-Language": "en"})
+        spanish = client.get("/api/catalog?fields=races", headers={"Accept-Language": "es"})
+
+        assert english.content == spanish.content
+        assert english.headers["etag"] == spanish.headers["etag"]
+        assert "vary" not in english.headers
+
+    def test_unknown_field_rejected(self) -> None:
+        """
+        Prueba que se rechaza una colección desconocida.
+        """
+        response = client.get("/api/catalog?fields=races,dragons")
+
+        assert response.status_code == 400
+
+    def test_cached_response_revalidates(self) -> None:
+        """
+        Prueba que el catálogo cacheado responde 304 si el ETag coincide.
+        """
+        etag = client.get("/api/catalog?game_type=dnd5e").headers["etag"]
+
+        response = client.get("/api/catalog?game_type=dnd5e", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    def test_game_type_narrows_catalog(self) -> None:
+        """
+        Prueba que game_type excluye los elementos de otros tipos de juego.
+        """
+        def class_names(game_type: str) -> set:
+            catalog = client.get(f"/api/catalog?game_type={game_type}&fields=classes").json()
+            return {item["name"] for item in catalog["classes"]}
+
+        everything = class_names("custom")
+        dnd5e = class_names("dnd5e")
+        pathfinder = class_names("pathfinder")
+
+        assert {"Warlock", "Alchemist", "Fighter"} <= everything
+        assert "Warlock" in dnd5e and "Alchemist" not in dnd5e
+        assert "Alchemist" in pathfinder and "Warlock" not in pathfinder
+        assert dnd5e < everything and pathfinder < everything
+
+    def test_filter_by_game_type(self) -> None:
+        """
+        Prueba que el filtro conserva los elementos comunes y los del tipo de juego.
+        """
+        items = [{"id": 1}, {"id": 2, "game_type": "dnd5e"}, {"id": 3, "game_type": "wod"}]
+
+        assert [item["id"] for item in filter_by_game_type(items, "dnd5e")] == [1, 2]
+        assert filter_by_game_type(items, "custom") == items
+
+
+class TestReferenceData:
+    """Pruebas para los datos de referencia precodificados."""
+
+    def test_reference_endpoint_revalidates(self) -> None:
+        """
+        Prueba que los endpoints de datos de referencia devuelven ETag, Cache-Control y 304.
+        """
+        response = client.get("/api/spells")
+
+        assert response.json() == reference_data.get_items("spells")
+        assert "max-age" in response.headers["cache-control"]
+
+        revalidated = client.get(
+            "/api/spells", headers={"If-None-Match": response.headers["etag"]}
+        )
+        assert revalidated.status_code == 304
+
+    def test_encoded_only_when_content_changes(self) -> None:
+        """
+        Prueba que la colección solo se recodifica y cambia de versión si cambia su contenido.
+        """
+        store = ReferenceDataStore({"races": [{"id": 1, "name": "Human"}]})
+        encoded = store.get_encoded("races")
+        version = store.version
+
+        assert store.set_collection("races", [{"id": 1, "name": "Human"}]) is False
+        assert store.get_encoded("races") is encoded
+
+        assert store.set_collection("races", [{"id": 1, "name": "Elf"}]) is True
+        assert store.get_encoded("races").etag != encoded.etag
+        assert store.version != version
+
+    def test_sync_merges_database_rows(self) -> None:
+        """
+        Prueba que la base de datos decide los elementos y el catálogo aporta sus campos.
+        """
+        human, elf, orc = (str(uuid.uuid4()) for _ in range(3))
+        store = ReferenceDataStore({"races": [
+            {"id": human, "name": "Human"},
+            {"id": elf, "name": "Elf", "game_type": "dnd5e"},
+        ]})
+        rows = (
+            MappingProxyType({"id": uuid.UUID(orc), "name": "Orc", "description": "Fuerte"}),
+            MappingProxyType({"id": uuid.UUID(elf), "name": "Elfo", "description": None}),
+        )
+
+        assert store.sync_collection("races", rows) is True
+        assert store.get_items("races") == [
+            {"id": elf, "name": "Elfo", "game_type": "dnd5e"},
+            {"id": orc, "name": "Orc", "description": "Fuerte"},
+        ]
+        assert store.sync_collection("races", rows) is False
+
+
+class TestReferenceDataFromDatabase:
+    """Pruebas para los endpoints de datos de referencia leídos de la base de datos."""
+
+    def setup_method(self) -> None:
+        app_database.configure(url="sqlite+aiosqlite://", profile=LONG_RUNNING)
+        reference_data_cache.invalidate()
+
+    def teardown_method(self) -> None:
+        app_database.configure()
+        reference_data_cache.invalidate()
+
+    def test_endpoints_go_through_the_use_case(self) -> None:
+        """
+        Prueba que el arranque precarga la caché y que las filas nuevas se sirven al invalidarla.
+        """
+        race_id = uuid.uuid4()
+
+        async def add_race():
+            async with app_database.session() as session, session.begin():
+                await session.execute(insert(RaceModel).values(id=race_id, name="Orc"))
+
+        with TestClient(app) as lifespan_client:
+            warmed = reference_data_cache.get_stats()
+            before = lifespan_client.get("/api/races").json()
+            misses = reference_data_cache.get_stats()["misses"]
+            lifespan_client.portal.call(add_race)
+            cached = lifespan_client.get("/api/races").json()
+            reference_data_cache.invalidate("races")
+            races = lifespan_client.get("/api/races").json()
+            catalog = lifespan_client.get("/api/catalog?fields=races").json()
+
+        assert set(warmed["entries"]) == set(CATALOG_COLLECTIONS)
+        assert misses == warmed["misses"]
+        assert before == cached == reference_data.get_items("races")[:-1]
+        assert races[-1] == {"id": str(race_id), "name": "Orc"}
+        assert catalog["races"] == races
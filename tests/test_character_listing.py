@@ -0,0 +1,266 @@
+"""
+Pruebas unitarias para los listados paginados de personajes.
+
+Este módulo contiene pruebas para verificar la paginación por cursor sobre
+(created_at, id), el uso de los índices compuestos, los endpoints de
+listado y las migraciones de Alembic.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, List, Optional
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.index import app
+from src.infrastructure.db.character_listing import (
+    CharacterListRepository,
+    decode_cursor,
+    encode_cursor,
+)
+from src.infrastructure.db.character_summaries import CharacterSummaryRepository
+from src.infrastructure.db.engine import LONG_RUNNING
+from src.infrastructure.db.engine import database as app_database
+from src.infrastructure.db.models import CharacterModel
+from src.infrastructure.db.models.base import Base
+
+ROOT = Path(__file__).parent.parent
+START = datetime(2025, 7, 1, 12, 0, 0)
+
+
+async def seed(connection: Any, users: List[uuid.UUID], count: int) -> None:
+    """Crea personajes alternando usuarios, con fechas de creación repetidas de dos en dos."""
+    await connection.execute(insert(CharacterModel), [
+        {"id": uuid.uuid4(), "user_id": users[index % len(users)], "name": f"pj-{index}",
+         "level": 1, "created_at": START + timedelta(minutes=index // 2)}
+        for index in range(count)
+    ])
+
+
+def walk(count: int, limit: int, user: Optional[int] = None) -> List[List[dict]]:
+    """Recorre todas las páginas de un listado y devuelve sus personajes."""
+    users = [uuid.uuid4(), uuid.uuid4()]
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await seed(connection, users, count)
+
+        pages, cursor = [], None
+        async with AsyncSession(engine) as session:
+            await CharacterSummaryRepository(session).rebuild()
+            repository = CharacterListRepository(session)
+            while True:
+                page = await repository.list_page(
+                    users[user] if user is not None else None, cursor, limit
+                )
+                pages.append(page.items)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+        await engine.dispose()
+        return pages
+
+    return asyncio.run(scenario())
+
+
+class TestKeysetPagination:
+    """Pruebas para la paginación por cursor."""
+
+    def test_cursor_roundtrip(self) -> None:
+        """
+        Prueba que el cursor codifica la fecha y el ID de la última fila.
+        """
+        character_id = uuid.uuid4()
+        cursor = encode_cursor(START, character_id)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (START, character_id)
+
+    def test_invalid_cursor(self) -> None:
+        """
+        Prueba que un cursor manipulado produce un error de validación.
+        """
+        with pytest.raises(ValueError):
+            decode_cursor("no-es-un-cursor")
+
+    def test_walks_every_row_once_in_order(self) -> None:
+        """
+        Prueba que las páginas cubren todas las filas sin repetir, aunque haya fechas iguales.
+        """
+        pages = walk(count=45, limit=10)
+        rows = [row for page in pages for row in page]
+
+        assert [len(page) for page in pages] == [10, 10, 10, 10, 5]
+        assert len({row["id"] for row in rows}) == 45
+        keys = [(row["created_at"], row["id"]) for row in rows]
+        assert keys == sorted(keys, reverse=True)
+        assert set(rows[0]) == {
+            "id", "name", "player_name", "level", "race_name", "class_name",
+            "background_name", "alignment_name", "created_at",
+        }
+
+    def test_user_filter(self) -> None:
+        """
+        Prueba que el listado de un usuario solo contiene sus personajes.
+        """
+        pages = walk(count=30, limit=4, user=1)
+
+        assert sum(len(page) for page in pages) == 15
+
+    def test_exact_last_page_has_no_cursor(self) -> None:
+        """
+        Prueba que no se devuelve cursor cuando no quedan más filas.
+        """
+        pages = walk(count=20, limit=10)
+
+        assert [len(page) for page in pages] == [10, 10]
+
+    def test_keyset_query_uses_index(self) -> None:
+        """
+        Prueba que la consulta de una página recorre el índice compuesto.
+        """
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.connect() as connection:
+            plan = connection.execute(text(
+                "EXPLAIN QUERY PLAN SELECT character_id, name FROM character_summaries "
+                "WHERE (created_at, character_id) < ('2025-07-01', 'x') "
+                "ORDER BY created_at DESC, character_id DESC LIMIT 21"
+            )).fetchall()
+
+        details = " ".join(str(row[-1]) for row in plan)
+        assert "ix_character_summaries_created_at_id" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestListingEndpoints:
+    """Pruebas para los endpoints /api/browse y /api/characters."""
+
+    def setup_method(self) -> None:
+        app_database.configure(url="sqlite+aiosqlite://", profile=LONG_RUNNING)
+
+    def teardown_method(self) -> None:
+        app_database.configure()
+
+    def test_created_characters_are_listed(self) -> None:
+        """
+        Prueba que los personajes creados aparecen en los dos listados, por páginas.
+        """
+        with TestClient(app) as client:
+            for index in range(3):
+                client.post("/api/characters", json={"character_name": f"pj-{index}"})
+            first = client.get("/api/browse?limit=2").json()
+            second = client.get(f"/api/browse?limit=2&cursor={first['next_cursor']}").json()
+            mine = client.get("/api/characters").json()
+            invalid = client.get("/api/browse?cursor=roto")
+
+        assert len(first["items"]) == 2
+        assert len(second["items"]) == 1
+        assert second["next_cursor"] is None
+        assert len(mine["items"]) == 3
+        assert invalid.status_code == 400
+
+
+# Revisión que crea el esquema anterior a las migraciones de los listados
+INITIAL_REVISION = "1f0c6b3a8e25"
+
+
+class TestListingMigration:
+    """Pruebas para las migraciones de los listados."""
+
+    def test_upgrade_and_downgrade(self, tmp_path, monkeypatch) -> None:
+        """
+        Prueba que las migraciones crean y eliminan los índices, la proyección, los borradores y la descripción.
+        """
+        database = tmp_path / "migration.db"
+        engine = create_engine(f"sqlite:///{database}")
+        Base.metadata.create_all(engine)
+        created_by_migrations = ("character_summaries", "character_drafts")
+        with engine.begin() as connection:
+            for name in created_by_migrations:
+                Base.metadata.tables[name].drop(connection)
+            for table in Base.metadata.sorted_tables:
+                if table.name not in created_by_migrations:
+                    for index in table.indexes:
+                        index.drop(connection)
+            connection.execute(text("ALTER TABLE characters DROP COLUMN description"))
+
+        monkeypatch.chdir(ROOT)
+        config = Config(str(ROOT / "alembic.ini"))
+        config.set_main_option("sqlalchemy.url", f"sqlite+aiosqlite:///{database}")
+
+        def character_columns() -> set:
+            return {column["name"] for column in inspect(engine).get_columns("characters")}
+
+        command.upgrade(config, "head")
+        upgraded = {index["name"] for index in inspect(engine).get_indexes("characters")}
+        upgraded_columns = character_columns()
+        summary_indexes = {
+            index["name"] for index in inspect(engine).get_indexes("character_summaries")
+        }
+        draft_indexes = {
+            index["name"] for index in inspect(engine).get_indexes("character_drafts")
+        }
+        command.downgrade(config, INITIAL_REVISION)
+        downgraded = inspect(engine).get_indexes("characters")
+        downgraded_columns = character_columns()
+
+        assert upgraded == {"ix_characters_created_at_id", "ix_characters_user_id_created_at_id"}
+        assert summary_indexes == {
+            "ix_character_summaries_created_at_id",
+            "ix_character_summaries_user_id_created_at_id",
+            "ix_character_summaries_search_name",
+        }
+        assert draft_indexes == {"ix_character_drafts_user_id_updated_at"}
+        assert downgraded == []
+        assert "description" in upgraded_columns
+        assert "description" not in downgraded_columns
+        assert not inspect(engine).has_table("character_summaries")
+        assert not inspect(engine).has_table("character_drafts")
+
+    def test_upgrade_empty_database(self, tmp_path, monkeypatch) -> None:
+        """
+        Prueba que las migraciones crean el esquema completo de los modelos en una base de datos vacía.
+        """
+        database = tmp_path / "empty.db"
+        engine = create_engine(f"sqlite:///{database}")
+        monkeypatch.chdir(ROOT)
+        config = Config(str(ROOT / "alembic.ini"))
+        config.set_main_option("sqlalchemy.url", f"sqlite+aiosqlite:///{database}")
+
+        def schema() -> dict:
+            inspector = inspect(engine)
+            return {
+                name: (
+                    {column["name"] for column in inspector.get_columns(name)},
+                    {index["name"] for index in inspector.get_indexes(name)},
+                )
+                for name in inspector.get_table_names()
+                if name != "alembic_version"
+            }
+
+        command.upgrade(config, "head")
+        upgraded = schema()
+        with engine.connect() as connection:
+            races = connection.execute(text("SELECT COUNT(*) FROM races")).scalar()
+        command.downgrade(config, "base")
+
+        assert upgraded == {
+            table.name: (
+                {column.name for column in table.columns},
+                {index.name for index in table.indexes},
+            )
+            for table in Base.metadata.sorted_tables
+        }
+        assert races > 0
+        assert schema() == {}
@@ -0,0 +1,222 @@
+"""
+Pruebas unitarias para la creación de personajes en lote.
+
+Este módulo contiene pruebas para verificar que CreateCharacterUseCase guarda
+el personaje y sus datos asociados en una única transacción, con una sola
+sentencia INSERT por tabla, sobre una base de datos SQLite en memoria.
+"""
+
+import asyncio
+import uuid
+from typing import Any, List
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.application.character_use_cases import (
+    CreateCharacterRequest,
+    CreateCharacterUseCase,
+)
+from src.application.interfaces import CharacterInterface
+from src.infrastructure.db.models import (
+    AttributeModel,
+    CharacterItemModel,
+    CharacterModel,
+    CharacterSkillModel,
+    CharacterSpellModel,
+)
+from src.infrastructure.db.models.base import Base
+from src.infrastructure.db.repositories import (
+    CharacterRepository,
+    SqlAlchemyRepository,
+    build_character_repositories,
+)
+
+
+def build_request() -> CreateCharacterRequest:
+    """Petición de un personaje con datos asociados en todas las tablas."""
+    return CreateCharacterRequest(
+        name="Aria",
+        race_id=uuid.uuid4(),
+        background_id=uuid.uuid4(),
+        alignment_id=uuid.uuid4(),
+        level=3,
+        attributes={"strength": 8, "dexterity": 16, "wisdom": 14},
+        skills=[uuid.uuid4() for _ in range(4)],
+        languages=[uuid.uuid4() for _ in range(2)],
+        proficiencies=[uuid.uuid4() for _ in range(3)],
+        spells=[uuid.uuid4() for _ in range(5)],
+        items=[uuid.uuid4() for _ in range(6)],
+    )
+
+
+async def create_character(request: CreateCharacterRequest, fail_on: str = "") -> Any:
+    """
+    Crea un personaje en una base de datos nueva y devuelve el resultado.
+
+    Args:
+        request: Datos del personaje
+        fail_on: Repositorio cuyo `create_many` falla (vacío: ninguno)
+
+    Returns:
+        Any: Sentencias INSERT ejecutadas, personaje creado (o excepción) y sesión
+    """
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    inserts: List[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(statement)
+
+    session = AsyncSession(engine)
+    repositories = build_character_repositories(session, user_id=uuid.uuid4())
+    if fail_on:
+        async def failing_create_many(entities):
+            raise RuntimeError("fallo de escritura")
+        repositories[fail_on].create_many = failing_create_many
+
+    try:
+        result = await CreateCharacterUseCase(**repositories).execute(request)
+    except RuntimeError as error:
+        result = error
+    return inserts, result, session
+
+
+async def count(session: AsyncSession, model: Any) -> int:
+    """Número de filas de una tabla."""
+    return await session.scalar(select(func.count()).select_from(model))
+
+
+class TestCreateCharacterBatch:
+    """Pruebas para la creación de personajes con inserciones en lote."""
+
+    def test_one_insert_per_table(self) -> None:
+        """
+        Prueba que se ejecuta una sola sentencia INSERT por tabla.
+        """
+        async def scenario():
+            inserts, character, session = await create_character(build_request())
+            await session.close()
+            return inserts, character
+
+        inserts, character = asyncio.run(scenario())
+
+        assert character.id is not None
+        assert len(inserts) == 7
+
+    def test_rows_are_persisted(self) -> None:
+        """
+        Prueba que el personaje y todos sus datos asociados quedan guardados.
+        """
+        request = build_request()
+
+        async def scenario():
+            _, character, session = await create_character(request)
+            attributes = await session.get(AttributeModel, character.id)
+            skill_bonus = await session.scalar(select(CharacterSkillModel.proficiency_bonus))
+            counts = [
+                await count(session, model)
+                for model in (CharacterModel, CharacterSkillModel,
+                              CharacterSpellModel, CharacterItemModel)
+            ]
+            await session.close()
+            return attributes, skill_bonus, counts
+
+        attributes, skill_bonus, counts = asyncio.run(scenario())
+
+        assert counts == [1, 4, 5, 6]
+        assert (attributes.strength, attributes.dexterity, attributes.wisdom) == (8, 16, 14)
+        assert attributes.charisma == 10
+        assert skill_bonus == 2
+
+    def test_failure_rolls_back_everything(self) -> None:
+        """
+        Prueba que un fallo en una tabla deshace también el personaje.
+        """
+        async def scenario():
+            _, result, session = await create_character(
+                build_request(), fail_on="character_spell_repository"
+            )
+            counts = [
+                await count(session, model)
+                for model in (CharacterModel, AttributeModel, CharacterSkillModel)
+            ]
+            await session.close()
+            return result, counts
+
+        result, counts = asyncio.run(scenario())
+
+        assert isinstance(result, RuntimeError)
+        assert counts == [0, 0, 0]
+
+    def test_unknown_attribute_is_rejected(self) -> None:
+        """
+        Prueba que un atributo sin columna en la tabla produce un error.
+        """
+        request = build_request()
+        request.attributes = {"luck": 12}
+
+        async def scenario():
+            with pytest.raises(ValueError):
+                await create_character(request)
+
+        asyncio.run(scenario())
+
+    def test_description_is_persisted(self) -> None:
+        """
+        Prueba que la descripción del formulario se guarda con el personaje.
+        """
+        request = build_request()
+        request.description = "Exploradora del norte"
+
+        async def scenario():
+            _, character, session = await create_character(request)
+            description = await session.scalar(select(CharacterModel.description))
+            await session.close()
+            return description
+
+        assert asyncio.run(scenario()) == "Exploradora del norte"
+
+
+class TestCharacterRepository:
+    """Pruebas para la conversión de personajes en filas."""
+
+    def test_ids_are_assigned_without_mutating_entities(self) -> None:
+        """
+        Prueba que create_many devuelve copias con ID y no modifica las entidades recibidas.
+        """
+        entity = CharacterInterface(
+            id=None, name="Aria", race_id=None, background_id=None,
+            alignment_id=None, level=1, description="",
+        )
+
+        async def scenario():
+            engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+            async with AsyncSession(engine) as session:
+                created = await CharacterRepository(session, uuid.uuid4()).create_many([entity])
+            await engine.dispose()
+            return created
+
+        created = asyncio.run(scenario())
+
+        assert entity.id is None
+        assert isinstance(created[0].id, uuid.UUID)
+        assert created[0].name == "Aria"
+
+    def test_base_repository_requires_to_rows(self) -> None:
+        """
+        Prueba que un repositorio sin `to_rows` no se puede instanciar.
+        """
+        class IncompleteRepository(SqlAlchemyRepository[Any]):
+            model = CharacterModel
+
+        with pytest.raises(TypeError):
+            IncompleteRepository(None)
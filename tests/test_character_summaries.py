@@ -0,0 +1,259 @@
+"""
+Pruebas unitarias para la proyección de resúmenes de personajes.
+
+Este módulo contiene pruebas para verificar que el resumen de los listados
+se escribe en la misma transacción que el personaje, que la comprobación de
+consistencia detecta resúmenes ausentes, desactualizados y huérfanos, que la
+regeneración los corrige y que la búsqueda por nombre lee la proyección.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Any, Dict
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from src.application.character_use_cases import (
+    CreateCharacterRequest,
+    CreateCharacterUseCase,
+)
+from src.index import app
+from src.infrastructure.cli import main as cli_main
+from src.infrastructure.db.character_summaries import CharacterSummaryRepository
+from src.infrastructure.db.engine import LONG_RUNNING
+from src.infrastructure.db.engine import database as app_database
+from src.infrastructure.db.models import (
+    AlignmentModel,
+    BackgroundModel,
+    CharacterModel,
+    CharacterSummaryModel,
+    RaceModel,
+)
+from src.infrastructure.db.models.base import Base
+from src.infrastructure.db.repositories import build_character_repositories
+
+REFERENCES = {"race": uuid.uuid4(), "background": uuid.uuid4(), "alignment": uuid.uuid4()}
+
+
+async def create_database() -> Any:
+    """Crea una base de datos en memoria con una raza, un trasfondo y un alineamiento."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(insert(RaceModel).values(id=REFERENCES["race"], name="Elfo"))
+        await connection.execute(
+            insert(BackgroundModel).values(id=REFERENCES["background"], name="Sabio")
+        )
+        await connection.execute(
+            insert(AlignmentModel).values(id=REFERENCES["alignment"], name="Neutral")
+        )
+    return engine
+
+
+async def create_character(session: AsyncSession, name: str, **overrides: Any) -> Any:
+    """Crea un personaje con la proyección de resúmenes activada."""
+    request = CreateCharacterRequest(
+        name=name,
+        race_id=REFERENCES["race"],
+        background_id=REFERENCES["background"],
+        alignment_id=REFERENCES["alignment"],
+        level=4,
+        **overrides,
+    )
+    use_case = CreateCharacterUseCase(
+        **build_character_repositories(session, user_id=uuid.uuid4()),
+        summary_projection=CharacterSummaryRepository(session),
+    )
+    return await use_case.execute(request)
+
+
+async def summary_rows(session: AsyncSession) -> Dict[Any, Dict[str, Any]]:
+    """Filas de la proyección indexadas por personaje."""
+    result = await session.execute(select(CharacterSummaryModel.__table__))
+    return {row["character_id"]: dict(row) for row in result.mappings()}
+
+
+class TestSummaryProjection:
+    """Pruebas para el mantenimiento de la proyección al escribir."""
+
+    def test_create_writes_prejoined_summary(self) -> None:
+        """
+        Prueba que crear un personaje escribe su resumen con los nombres de sus referencias.
+        """
+        async def scenario():
+            engine = await create_database()
+            async with AsyncSession(engine) as session:
+                character = await create_character(session, "Ñandú Ágil")
+                rows = await summary_rows(session)
+            await engine.dispose()
+            return character, rows
+
+        character, rows = asyncio.run(scenario())
+        summary = rows[character.id]
+
+        assert summary["name"] == "Ñandú Ágil"
+        assert summary["search_name"] == "nandu agil"
+        assert summary["level"] == 4
+        assert (summary["race_name"], summary["background_name"], summary["alignment_name"]) == (
+            "Elfo", "Sabio", "Neutral"
+        )
+        assert summary["class_name"] is None
+
+    def test_failed_create_leaves_no_summary(self) -> None:
+        """
+        Prueba que si la creación falla no queda ni el personaje ni su resumen.
+        """
+        async def scenario():
+            engine = await create_database()
+            async with AsyncSession(engine) as session:
+                with pytest.raises(ValueError):
+                    await create_character(session, "Roto", attributes={"suerte": 3})
+                characters = await session.scalar(select(func.count()).select_from(CharacterModel))
+                rows = await summary_rows(session)
+            await engine.dispose()
+            return characters, rows
+
+        characters, rows = asyncio.run(scenario())
+
+        assert characters == 0
+        assert rows == {}
+
+    def test_refresh_and_remove(self) -> None:
+        """
+        Prueba que refresh recoge los cambios del personaje y remove borra su resumen.
+        """
+        async def scenario():
+            engine = await create_database()
+            async with AsyncSession(engine) as session:
+                character = await create_character(session, "Aria")
+                projection = CharacterSummaryRepository(session)
+                async with session.begin():
+                    await session.execute(
+                        update(CharacterModel).where(CharacterModel.id == character.id)
+                        .values(level=9)
+                    )
+                    await projection.refresh([character.id])
+                refreshed = (await summary_rows(session))[character.id]["level"]
+                await session.commit()
+                async with session.begin():
+                    removed = await projection.remove([character.id])
+                rows = await summary_rows(session)
+            await engine.dispose()
+            return refreshed, removed, rows
+
+        refreshed, removed, rows = asyncio.run(scenario())
+
+        assert refreshed == 9
+        assert removed == 1
+        assert rows == {}
+
+
+class TestSummaryMaintenance:
+    """Pruebas para la comprobación de consistencia y la regeneración."""
+
+    def test_check_detects_drift_and_rebuild_fixes_it(self) -> None:
+        """
+        Prueba que check encuentra resúmenes ausentes, desactualizados y huérfanos y rebuild los corrige.
+        """
+        async def scenario():
+            engine = await create_database()
+            async with AsyncSession(engine) as session:
+                created = [await create_character(session, f"pj-{index}") for index in range(5)]
+                orphan = uuid.uuid4()
+                async with session.begin():
+                    table = CharacterSummaryModel.__table__
+                    await session.execute(
+                        delete(table).where(table.c.character_id == created[0].id)
+                    )
+                    await session.execute(
+                        update(RaceModel).where(RaceModel.id == REFERENCES["race"])
+                        .values(name="Alto elfo")
+                    )
+                    await session.execute(insert(table).values(
+                        character_id=orphan, user_id=uuid.uuid4(), name="x", search_name="x",
+                        level=1, created_at=datetime(2025, 1, 1),
+                    ))
+                projection = CharacterSummaryRepository(session)
+                before = await projection.check(batch_size=2)
+                await session.commit()
+                written = await projection.rebuild(batch_size=2)
+                after = await projection.check()
+            await engine.dispose()
+            return created, orphan, before, written, after
+
+        created, orphan, before, written, after = asyncio.run(scenario())
+
+        assert before.checked == 5
+        assert before.missing == [created[0].id]
+        assert sorted(before.stale) == sorted(character.id for character in created[1:])
+        assert before.orphaned == [orphan]
+        assert not before.consistent
+        assert written == 5
+        assert after.consistent
+        assert after.to_dict()["checked"] == 5
+
+
+class TestSummaryCommands:
+    """Pruebas para los comandos rebuild-summaries y check-summaries y la búsqueda."""
+
+    def setup_method(self) -> None:
+        app_database.configure(url="sqlite+aiosqlite://", profile=LONG_RUNNING)
+
+    def teardown_method(self) -> None:
+        app_database.configure()
+
+    def test_search_reads_projection(self) -> None:
+        """
+        Prueba que la búsqueda por prefijo no distingue mayúsculas ni acentos.
+        """
+        with TestClient(app) as client:
+            for name in ("Ángela", "angus", "Bruno"):
+                client.post("/api/characters", json={"character_name": name})
+            found = client.get("/api/browse?q=ANG").json()
+            mine = client.get("/api/characters?q=bru").json()
+
+        assert sorted(item["name"] for item in found["items"]) == ["angus", "Ángela"]
+        assert [item["name"] for item in mine["items"]] == ["Bruno"]
+
+    def test_search_name_sorts_by_code_point(self) -> None:
+        """
+        Prueba que en Postgres search_name usa la intercalación "C" que requiere la búsqueda por rango.
+        """
+        table = CharacterSummaryModel.__table__
+
+        postgres_ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+        sqlite_ddl = str(CreateTable(table).compile(dialect=sqlite.dialect()))
+
+        assert 'search_name VARCHAR(100) COLLATE "C" NOT NULL' in postgres_ddl
+        assert "COLLATE" not in sqlite_ddl
+
+    def test_cli_commands(self, tmp_path, capsys) -> None:
+        """
+        Prueba que check-summaries falla con resúmenes ausentes y rebuild-summaries los corrige.
+        """
+        app_database.configure(url=f"sqlite+aiosqlite:///{tmp_path / 'cli.db'}")
+
+        async def seed():
+            async with app_database.session() as session:
+                async with session.begin():
+                    await session.execute(insert(CharacterModel), [
+                        {"id": uuid.uuid4(), "user_id": uuid.uuid4(), "name": f"pj-{index}"}
+                        for index in range(3)
+                    ])
+            await app_database.dispose()
+
+        asyncio.run(seed())
+
+        assert cli_main(["check-summaries"]) == 1
+        assert cli_main(["rebuild-summaries", "--batch-size", "2"]) == 0
+        assert cli_main(["check-summaries"]) == 0
+        output = capsys.readouterr().out
+        assert "✗ Sin resumen" in output
+        assert "3 resúmenes de personajes regenerados" in output
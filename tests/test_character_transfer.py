@@ -0,0 +1,253 @@
+"""
+Pruebas unitarias para la exportación e importación de personajes en NDJSON.
+
+Este módulo contiene pruebas para verificar la división del flujo en
+líneas, la validación de cada registro, la exportación por lotes con un
+cursor del servidor, la importación por lotes con su progreso y los
+endpoints /api/characters/export y /api/characters/import.
+"""
+
+import asyncio
+import json
+import uuid
+from typing import Any, AsyncIterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.index import app
+from src.infrastructure.db import character_transfer
+from src.infrastructure.db.character_transfer import (
+    export_ndjson,
+    import_ndjson,
+    iter_lines,
+    parse_record,
+)
+from src.infrastructure.db.engine import LONG_RUNNING
+from src.infrastructure.db.engine import database as app_database
+from src.infrastructure.db.models import CharacterModel, ItemModel, RaceModel, SkillModel
+from src.infrastructure.db.models.base import Base
+
+RACE_ID = uuid.uuid4()
+SKILL_IDS = [uuid.uuid4() for _ in range(2)]
+ITEM_ID = uuid.uuid4()
+
+
+def record(name: str = "Aria", **overrides: Any) -> dict:
+    """Ficha en el formato de la exportación."""
+    return {
+        "name": name,
+        "level": 3,
+        "experience": 900,
+        "player_name": "Ana",
+        "race": {"id": str(RACE_ID), "name": "Elfo"},
+        "attributes": {"strength": 8, "dexterity": 16},
+        "skills": [{"id": str(skill_id)} for skill_id in SKILL_IDS],
+        "items": [{"id": str(ITEM_ID), "quantity": 3}],
+        **overrides,
+    }
+
+
+async def chunked(data: bytes, size: int) -> AsyncIterator[bytes]:
+    """Entrega los datos en fragmentos de tamaño fijo."""
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def create_database() -> Any:
+    """Base de datos en memoria con la raza, las habilidades y el objeto de las fichas."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(insert(RaceModel).values(id=RACE_ID, name="Elfo"))
+        await connection.execute(insert(SkillModel), [
+            {"id": skill_id, "name": f"skill-{index}"}
+            for index, skill_id in enumerate(SKILL_IDS)
+        ])
+        await connection.execute(insert(ItemModel).values(id=ITEM_ID, name="Cuerda"))
+    return engine
+
+
+class TestNdjsonParsing:
+    """Pruebas para la lectura y validación de líneas."""
+
+    def test_lines_split_across_chunks(self) -> None:
+        """
+        Prueba que las líneas partidas entre fragmentos se reconstruyen.
+        """
+        async def scenario():
+            data = b'{"a":1}\n{"b":2}\n\n{"c":3}'
+            return [line async for line in iter_lines(chunked(data, 3))]
+
+        lines = asyncio.run(scenario())
+
+        assert lines == [(1, b'{"a":1}'), (2, b'{"b":2}'), (3, b""), (4, b'{"c":3}')]
+
+    def test_line_too_long(self, monkeypatch) -> None:
+        """
+        Prueba que una línea sin fin mayor que el límite produce un error.
+        """
+        monkeypatch.setattr(character_transfer, "MAX_LINE_BYTES", 8)
+
+        async def scenario():
+            return [line async for line in iter_lines(chunked(b"x" * 20, 4))]
+
+        with pytest.raises(ValueError):
+            asyncio.run(scenario())
+
+    def test_long_line_in_many_chunks(self) -> None:
+        """
+        Prueba que una línea repartida en muchos fragmentos pequeños se reconstruye entera.
+        """
+        data = b"a" * 10_000 + b"\n" + b"b" * 5
+
+        async def scenario():
+            return [line async for line in iter_lines(chunked(data, 7))]
+
+        assert asyncio.run(scenario()) == [(1, b"a" * 10_000), (2, b"b" * 5)]
+
+    def test_parse_exported_record(self) -> None:
+        """
+        Prueba que una ficha exportada se convierte en una petición de creación.
+        """
+        request = parse_record(record())
+
+        assert request.name == "Aria"
+        assert (request.level, request.experience, request.player_name) == (3, 900, "Ana")
+        assert request.race_id == RACE_ID
+        assert request.class_id is None
+        assert request.skills == SKILL_IDS
+        assert request.item_quantities == {ITEM_ID: 3}
+
+    @pytest.mark.parametrize("overrides", [
+        {"name": ""},
+        {"level": 0},
+        {"level": "3"},
+        {"race": {"id": "no-es-uuid"}},
+        {"attributes": {"suerte": 12}},
+        {"attributes": {"strength": None}},
+        {"skills": "todas"},
+    ])
+    def test_invalid_records(self, overrides) -> None:
+        """
+        Prueba que los registros con campos no válidos se rechazan.
+        """
+        with pytest.raises(ValueError):
+            parse_record(record(**overrides))
+
+
+class TestTransfer:
+    """Pruebas para la exportación y la importación sobre la base de datos."""
+
+    def test_import_in_batches_then_export_roundtrip(self) -> None:
+        """
+        Prueba que la importación guarda por lotes y que la exportación devuelve las mismas fichas.
+        """
+        lines = [record(f"pj-{index}") for index in range(5)]
+        body = b"\n".join(json.dumps(line).encode() for line in lines)
+        body += b"\n{roto}\n" + json.dumps(record(level=99)).encode() + b"\n"
+        progress: List[dict] = []
+
+        async def scenario():
+            engine = await create_database()
+            async with AsyncSession(engine) as session:
+                report = await import_ndjson(
+                    session, chunked(body, 64), uuid.uuid4(), batch_size=2,
+                    on_batch=progress.append,
+                )
+                await session.commit()
+                chunks = [chunk async for chunk in export_ndjson(session, batch_size=2)]
+            await engine.dispose()
+            return report, chunks
+
+        report, chunks = asyncio.run(scenario())
+        exported = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+
+        assert (report.imported, report.failed) == (5, 2)
+        assert [batch["imported"] for batch in report.batches] == [2, 2, 1]
+        assert progress == report.batches
+        assert [error["line"] for error in report.errors] == [6, 7]
+        assert len(chunks) == 3
+        assert sorted(sheet["name"] for sheet in exported) == [f"pj-{index}" for index in range(5)]
+        sheet = exported[0]
+        assert sheet["race"] == {"id": str(RACE_ID), "name": "Elfo"}
+        assert sheet["attributes"]["dexterity"] == 16
+        assert len(sheet["skills"]) == 2
+        assert sheet["items"][0]["quantity"] == 3
+        assert (sheet["experience"], sheet["player_name"]) == (900, "Ana")
+
+    def test_failed_batch_is_retried_to_find_bad_line(self, monkeypatch) -> None:
+        """
+        Prueba que un lote fallido se reintenta por mitades y el informe nombra la línea que falla.
+        """
+        original = character_transfer.CharacterSummaryRepository.refresh
+        transactions = []
+
+        async def flaky(self, character_ids):
+            names = (await self.session.scalars(
+                select(CharacterModel.name).where(CharacterModel.id.in_(character_ids))
+            )).all()
+            transactions.append(len(names))
+            if "pj-3" in names:
+                raise RuntimeError("fallo de escritura")
+            return await original(self, character_ids)
+
+        monkeypatch.setattr(character_transfer.CharacterSummaryRepository, "refresh", flaky)
+        body = b"\n".join(json.dumps(record(f"pj-{index}")).encode() for index in range(6))
+
+        async def scenario():
+            engine = await create_database()
+            async with AsyncSession(engine) as session:
+                report = await import_ndjson(session, chunked(body, 1024), uuid.uuid4(), 4)
+                await session.commit()
+                chunks = [chunk async for chunk in export_ndjson(session)]
+            await engine.dispose()
+            return report, chunks
+
+        report, chunks = asyncio.run(scenario())
+        names = [json.loads(line)["name"] for chunk in chunks for line in chunk.splitlines()]
+
+        assert (report.imported, report.failed) == (5, 1)
+        assert [error["line"] for error in report.errors] == [4]
+        assert [batch["imported"] for batch in report.batches] == [3, 2]
+        assert transactions == [4, 2, 2, 1, 1, 2]
+        assert sorted(names) == ["pj-0", "pj-1", "pj-2", "pj-4", "pj-5"]
+
+
+class TestTransferEndpoints:
+    """Pruebas para los endpoints de exportación e importación."""
+
+    def setup_method(self) -> None:
+        app_database.configure(url="sqlite+aiosqlite://", profile=LONG_RUNNING)
+
+    def teardown_method(self) -> None:
+        app_database.configure()
+
+    def test_import_and_export(self) -> None:
+        """
+        Prueba que lo importado por la API se exporta como NDJSON.
+        """
+        body = "\n".join(
+            json.dumps(record(f"pj-{index}", race=None, skills=[], items=[]))
+            for index in range(3)
+        )
+
+        with TestClient(app) as client:
+            imported = client.post(
+                "/api/characters/import?batch_size=2", content=body,
+                headers={"Content-Type": "application/x-ndjson"},
+            ).json()
+            exported = client.get("/api/characters/export")
+            everything = client.get("/api/characters/export?scope=all")
+            invalid = client.get("/api/characters/export?scope=otro")
+
+        lines = exported.text.splitlines()
+        assert imported["imported"] == 3
+        assert len(imported["batches"]) == 2
+        assert exported.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line)["name"] for line in lines] == ["pj-0", "pj-1", "pj-2"]
+        assert len(everything.text.splitlines()) == 3
+        assert invalid.status_code == 422
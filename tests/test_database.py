@@ -0,0 +1,306 @@
+"""
+Pruebas unitarias para el motor de base de datos y los repositorios.
+
+Este módulo contiene pruebas para verificar la elección de la URL y del pool
+según el modo de ejecución, los repositorios de datos de referencia y el
+endpoint de creación de personajes sobre SQLite en memoria.
+"""
+
+import asyncio
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, select
+from sqlalchemy.pool import NullPool, StaticPool
+
+from src.application.character_use_cases import (
+    GetCharacterDataRequest,
+    GetCharacterDataUseCase,
+)
+from src.application.reference_data_cache import ReferenceDataCache
+from src.index import app
+from src.infrastructure.config import settings
+from src.infrastructure.db.engine import (
+    LONG_RUNNING,
+    SERVERLESS,
+    Database,
+    create_engine_for,
+    resolve_database_url,
+    to_async_url,
+)
+from src.infrastructure.db.engine import database as app_database
+from src.infrastructure.db import repositories
+from src.infrastructure.db.models import (
+    CharacterModel,
+    CharacterSkillModel,
+    ClassModel,
+    RaceModel,
+    SpellModel,
+    UserModel,
+)
+from src.infrastructure.db.repositories import build_reference_repositories, ensure_user
+from src.infrastructure.reference_data import DEFAULT_REFERENCE_DATA
+
+
+class TestDatabaseUrl:
+    """Pruebas para la elección de la URL de conexión."""
+
+    def test_postgres_url_uses_asyncpg(self) -> None:
+        """
+        Prueba que las URLs de Postgres se adaptan al driver asíncrono.
+        """
+        url = to_async_url("postgres://user:pw@host:6543/db?sslmode=require&pgbouncer=true")
+
+        assert url == "postgresql+asyncpg://user:pw@host:6543/db?ssl=require"
+        assert to_async_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+
+    def test_profile_selects_pooler_or_direct_url(self, monkeypatch) -> None:
+        """
+        Prueba que serverless usa el pooler y larga duración la conexión directa.
+        """
+        monkeypatch.setattr(settings, "database_url", None)
+        monkeypatch.setattr(settings, "postgres_prisma_url", "postgres://pooler/db")
+        monkeypatch.setattr(settings, "postgres_url_non_pooling", "postgres://direct/db")
+
+        assert resolve_database_url(SERVERLESS) == "postgresql+asyncpg://pooler/db"
+        assert resolve_database_url(LONG_RUNNING) == "postgresql+asyncpg://direct/db"
+
+        monkeypatch.setattr(settings, "database_url", "sqlite+aiosqlite://")
+        assert resolve_database_url(SERVERLESS) == "sqlite+aiosqlite://"
+
+    def test_sqlite_fallback(self, monkeypatch) -> None:
+        """
+        Prueba que sin URLs configuradas se usa SQLite local.
+        """
+        for name in ("database_url", "postgres_url", "postgres_prisma_url",
+                     "postgres_url_non_pooling"):
+            monkeypatch.setattr(settings, name, None)
+
+        assert resolve_database_url(LONG_RUNNING).startswith("sqlite+aiosqlite:///")
+
+
+class TestPoolProfiles:
+    """Pruebas para los perfiles del pool de conexiones."""
+
+    def test_profiles_size_the_pool(self, tmp_path) -> None:
+        """
+        Prueba que cada modo de ejecución configura su propio pool.
+        """
+        url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+        serverless = create_engine_for(url, SERVERLESS)
+        long_running = create_engine_for(url, LONG_RUNNING)
+
+        assert serverless.pool.size() == 1
+        assert serverless.pool._pre_ping
+        assert long_running.pool.size() == 10
+        assert not long_running.pool._pre_ping
+        assert isinstance(create_engine_for(url, SERVERLESS, pooled=False).pool, NullPool)
+
+    def test_memory_database_is_shared(self) -> None:
+        """
+        Prueba que SQLite en memoria usa una sola conexión compartida.
+        """
+        assert isinstance(create_engine_for("sqlite+aiosqlite://", LONG_RUNNING).pool, StaticPool)
+
+
+class TestReferenceRepositories:
+    """Pruebas para los repositorios de datos de referencia."""
+
+    def test_get_character_data_reads_tables(self) -> None:
+        """
+        Prueba que GetCharacterDataUseCase lee cada tabla con su repositorio.
+        """
+        database = Database(url="sqlite+aiosqlite://", profile=LONG_RUNNING)
+
+        async def scenario():
+            await database.connect()
+            async with database.engine.begin() as connection:
+                await connection.execute(insert(RaceModel), [
+                    {"id": uuid.uuid4(), "name": "Elfo"},
+                    {"id": uuid.uuid4(), "name": "Enano"},
+                ])
+                await connection.execute(insert(SpellModel), [
+                    {"id": uuid.uuid4(), "name": "Fireball", "description": "Boom"},
+                ])
+            use_case = GetCharacterDataUseCase(
+                **build_reference_repositories(database.session_factory),
+                cache=ReferenceDataCache(),
+            )
+            data = await use_case.execute(GetCharacterDataRequest())
+            await database.dispose()
+            return data
+
+        data = asyncio.run(scenario())
+
+        names = [race["name"] for race in data["races"]]
+        assert names == sorted(names)
+        assert {"Elfo", "Enano", "Elf"} <= set(names)
+        assert "Boom" in [spell["description"] for spell in data["spells"]]
+        assert len(data["items"]) == len(DEFAULT_REFERENCE_DATA["items"])
+
+    def test_connect_seeds_catalog_ids(self) -> None:
+        """
+        Prueba que las tablas de referencia contienen los IDs que sirve el catálogo.
+        """
+        database = Database(url="sqlite+aiosqlite://", profile=LONG_RUNNING)
+
+        async def scenario():
+            await database.connect()
+            # Una segunda siembra no duplica ni falla
+            await database.connect()
+            async with database.session() as session:
+                races = {
+                    str(row.id): row.name
+                    for row in await session.execute(select(RaceModel.id, RaceModel.name))
+                }
+                classes = await session.scalar(select(func.count()).select_from(ClassModel))
+            await database.dispose()
+            return races, classes
+
+        races, classes = asyncio.run(scenario())
+
+        assert races == {race["id"]: race["name"] for race in DEFAULT_REFERENCE_DATA["races"]}
+        assert classes == len(DEFAULT_REFERENCE_DATA["classes"])
+
+
+class TestEnsureUser:
+    """Pruebas para la creación del usuario propietario."""
+
+    def test_concurrent_first_requests(self, tmp_path, monkeypatch) -> None:
+        """
+        Prueba que varias peticiones simultáneas crean el usuario una sola vez y sin error.
+        """
+        monkeypatch.setattr(repositories, "_known_users", set())
+        database = Database(url=f"sqlite+aiosqlite:///{tmp_path / 'users.db'}", profile=LONG_RUNNING)
+        user_id = uuid.uuid4()
+
+        async def first_request():
+            async with database.session() as session:
+                await ensure_user(session, user_id, "anonymous")
+
+        async def scenario():
+            await database.connect()
+            await asyncio.gather(*(first_request() for _ in range(5)))
+            async with database.session() as session:
+                users = await session.scalar(select(func.count()).select_from(UserModel))
+            await database.dispose()
+            return users
+
+        assert asyncio.run(scenario()) == 1
+
+
+class TestCreateCharacterEndpoint:
+    """Pruebas para el endpoint POST /api/characters."""
+
+    def setup_method(self) -> None:
+        app_database.configure(url="sqlite+aiosqlite://", profile=LONG_RUNNING)
+
+    def teardown_method(self) -> None:
+        app_database.configure()
+
+    def test_character_is_persisted(self) -> None:
+        """
+        Prueba que el personaje y sus habilidades se guardan en la base de datos.
+        """
+        skills = [str(uuid.uuid4()), {"id": str(uuid.uuid4())}]
+
+        with TestClient(app) as client:
+            response = client.post("/api/characters", json={
+                "character_name": "Aria", "level": "3", "strength": "15",
+                "race_id": "", "skills": skills,
+            })
+            body = response.json()
+
+            async def count():
+                async with app_database.session() as session:
+                    return (
+                        await session.scalar(select(func.count()).select_from(CharacterModel)),
+                        await session.scalar(select(func.count()).select_from(CharacterSkillModel)),
+                    )
+
+            counts = client.portal.call(count)
+
+        assert response.status_code == 200
+        assert uuid.UUID(body["id"])
+        assert body["character"]["character_name"] == "Aria"
+        assert counts == (1, 2)
+
+    def test_form_payload_is_saved(self) -> None:
+        """
+        Prueba que el formulario de creación, con los IDs de /api/catalog, guarda el personaje.
+
+        El cuerpo reproduce el que envía `navigation-manager.js`: los campos
+        del formulario como texto y las listas de la vista previa como objetos.
+        """
+        with TestClient(app) as client:
+            catalog = client.get("/api/catalog", params={"game_type": "dnd5e"}).json()
+            race, character_class, background, alignment = (
+                catalog[name][1] for name in ("races", "classes", "backgrounds", "alignments")
+            )
+            skill, spell, item = catalog["skills"][2], catalog["spells"][6], catalog["items"][1]
+            payload = {
+                "game_type": "dnd5e", "character_name": "Aria", "player_name": "Ana",
+                "race_id": race["id"], "class_id": character_class["id"],
+                "background_id": background["id"], "alignment_id": alignment["id"],
+                "level": "3", "experience": "900", "strength": "15", "dexterity": "12",
+                "constitution": "14", "intelligence": "10", "wisdom": "8", "charisma": "13",
+                "skills": [{"id": skill["id"], "name": skill["name"], "selected": True}],
+                "equipment": [{
+                    "id": item["id"], "name": item["name"], "type": item["type"],
+                    "rarity": item["rarity"], "selected": True, "isStarting": True,
+                }],
+                "spells": [{
+                    "id": spell["id"], "name": spell["name"], "level": spell["level"],
+                    "selected": True,
+                }],
+            }
+
+            created = client.post("/api/characters", json=payload)
+            character = client.get(f"/api/characters/{created.json()['id']}").json()
+
+            draft = client.post("/api/drafts", json={**payload, "isDraft": True}).json()
+            submitted = client.post(f"/api/drafts/{draft['id']}/submit", json={})
+
+        assert created.status_code == 200
+        assert character["race"]["name"] == race["name"]
+        assert character["character_class"]["name"] == character_class["name"]
+        assert character["background"]["name"] == background["name"]
+        assert character["alignment"]["name"] == alignment["name"]
+        assert character["attributes"]["strength"] == 15
+        assert [entry["name"] for entry in character["skills"]] == [skill["name"]]
+        assert [entry["name"] for entry in character["spells"]] == [spell["name"]]
+        assert [entry["name"] for entry in character["items"]] == [item["name"]]
+        assert submitted.status_code == 200
+
+    def test_missing_name_is_rejected(self) -> None:
+        """
+        Prueba que un personaje sin nombre devuelve 400.
+        """
+        with TestClient(app) as client:
+            response = client.post("/api/characters", json={"level": 1})
+
+        assert response.status_code == 400
+
+    def test_invalid_ids_are_rejected(self) -> None:
+        """
+        Prueba que un ID que no es un UUID de la base de datos devuelve 400 y no guarda nada.
+        """
+        with TestClient(app) as client:
+            race = client.post("/api/characters", json={
+                "character_name": "Aria", "race_id": "1",
+            })
+            skill = client.post("/api/characters", json={
+                "character_name": "Aria", "skills": [str(uuid.uuid4()), 7],
+            })
+
+            async def count():
+                async with app_database.session() as session:
+                    return await session.scalar(select(func.count()).select_from(CharacterModel))
+
+            characters = client.portal.call(count)
+
+        assert race.status_code == 400
+        assert "race_id" in race.json()["detail"]
+        assert skill.status_code == 400
+        assert "skills" in skill.json()["detail"]
+        assert characters == 0
@@ -0,0 +1,336 @@
+"""
+Pruebas unitarias para los borradores de personajes.
+
+Este módulo contiene pruebas para verificar la aplicación de parches JSON
+Merge Patch, la agrupación de ediciones en el búfer de escritura diferida,
+los vaciados periódicos, forzados y al cerrar, la recuperación de un vaciado
+fallido, los endpoints /api/drafts y /health/drafts y la separación de los
+borradores de cada navegador.
+"""
+
+import asyncio
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.draft_buffer import DraftBuffer, merge_patch
+from src.application.interfaces import DraftInterface
+from src.index import app
+from src.infrastructure.db.engine import LONG_RUNNING
+from src.infrastructure.db.engine import database as app_database
+from src.infrastructure.web.draft_controller import DRAFT_OWNER_COOKIE, read_owner
+
+USER = uuid.uuid4()
+OTHER_USER = uuid.uuid4()
+
+
+class FakeStore:
+    """Almacenamiento en memoria que cuenta las escrituras y puede fallar o tardar."""
+
+    def __init__(self, delay: float = 0.0, failures: int = 0):
+        self.rows: Dict[Any, DraftInterface] = {}
+        self.saves: List[int] = []
+        self.delay = delay
+        self.failures = failures
+
+    async def get(self, draft_id: Any) -> Optional[DraftInterface]:
+        return self.rows.get(draft_id)
+
+    async def list_by_user(self, user_id: Any, limit: int) -> List[DraftInterface]:
+        drafts = [draft for draft in self.rows.values() if draft.user_id == user_id]
+        return sorted(drafts, key=lambda draft: draft.updated_at, reverse=True)[:limit]
+
+    async def save_many(self, drafts: Sequence[DraftInterface]) -> int:
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("base de datos no disponible")
+        self.saves.append(len(drafts))
+        self.rows.update({draft.id: draft for draft in drafts})
+        return len(drafts)
+
+    async def delete(self, draft_id: Any) -> bool:
+        return self.rows.pop(draft_id, None) is not None
+
+
+class TestMergePatch:
+    """Pruebas para la aplicación de parches parciales."""
+
+    def test_merge_patch(self) -> None:
+        """
+        Prueba que null elimina campos, los objetos se combinan y el resto se reemplaza.
+        """
+        document = {"name": "Aria", "level": 1, "attributes": {"strength": 8, "dexterity": 14}}
+
+        merged = merge_patch(document, {
+            "level": 2,
+            "name": None,
+            "attributes": {"strength": 10, "dexterity": None},
+            "skills": ["a", "b"],
+        })
+
+        assert merged == {"level": 2, "attributes": {"strength": 10}, "skills": ["a", "b"]}
+        assert document["attributes"] == {"strength": 8, "dexterity": 14}
+
+
+class TestDraftBuffer:
+    """Pruebas para el búfer de escritura diferida."""
+
+    def test_edits_are_coalesced_into_one_write(self) -> None:
+        """
+        Prueba que muchas ediciones de un borrador se guardan con una sola escritura.
+        """
+        store = FakeStore()
+        buffer = DraftBuffer(store, flush_interval=60)
+
+        async def scenario():
+            draft = await buffer.create(USER, {"name": "A"})
+            for level in range(1, 21):
+                await buffer.patch(draft.id, USER, {"level": level})
+            before = list(store.saves)
+            written = await buffer.flush()
+            return draft, before, written
+
+        draft, before, written = asyncio.run(scenario())
+        stats = buffer.get_stats()
+
+        assert before == []
+        assert written == 1
+        assert store.saves == [1]
+        assert store.rows[draft.id].data == {"name": "A", "level": 20}
+        assert stats["edits"] == 21
+        assert stats["coalescing_ratio"] == 21.0
+        assert stats["flushes"] == 1
+        assert stats["flush_ms"]["last"] is not None
+
+    def test_reads_see_pending_edits(self) -> None:
+        """
+        Prueba que la lectura y el listado devuelven las ediciones aún no guardadas.
+        """
+        store = FakeStore()
+        buffer = DraftBuffer(store, flush_interval=60)
+
+        async def scenario():
+            saved = await buffer.create(USER, {"name": "guardado"})
+            await buffer.flush()
+            pending = await buffer.create(USER, {"name": "pendiente"})
+            await buffer.patch(saved.id, USER, {"level": 3})
+            return (
+                saved, pending,
+                await buffer.get(saved.id, USER),
+                await buffer.get(saved.id, OTHER_USER),
+                await buffer.list_by_user(USER, 10),
+            )
+
+        saved, pending, current, foreign, listed = asyncio.run(scenario())
+
+        assert current.data == {"name": "guardado", "level": 3}
+        assert store.rows[saved.id].data == {"name": "guardado"}
+        assert foreign is None
+        assert [draft.id for draft in listed] == [saved.id, pending.id]
+
+    def test_edit_during_flush_is_not_lost(self) -> None:
+        """
+        Prueba que una edición recibida mientras se guarda el borrador se guarda en el siguiente vaciado.
+        """
+        store = FakeStore(delay=0.05)
+        buffer = DraftBuffer(store, flush_interval=60)
+
+        async def scenario():
+            draft = await buffer.create(USER, {"name": "A"})
+            flushing = asyncio.create_task(buffer.flush())
+            await asyncio.sleep(0.01)
+            during = await buffer.patch(draft.id, USER, {"level": 5})
+            await flushing
+            first = store.rows[draft.id].data
+            await buffer.flush()
+            return draft, during, first
+
+        draft, during, first = asyncio.run(scenario())
+
+        assert during.data == {"name": "A", "level": 5}
+        assert first == {"name": "A"}
+        assert store.rows[draft.id].data == {"name": "A", "level": 5}
+
+    def test_failed_flush_keeps_drafts(self) -> None:
+        """
+        Prueba que un vaciado fallido devuelve los borradores al búfer.
+        """
+        store = FakeStore(failures=1)
+        buffer = DraftBuffer(store, flush_interval=60)
+
+        async def scenario():
+            draft = await buffer.create(USER, {"name": "A"})
+            with pytest.raises(RuntimeError):
+                await buffer.flush()
+            pending = buffer.get_stats()["pending"]
+            await buffer.flush()
+            return draft, pending
+
+        draft, pending = asyncio.run(scenario())
+
+        assert pending == 1
+        assert draft.id in store.rows
+        assert buffer.get_stats()["errors"] == 1
+
+    def test_limits(self) -> None:
+        """
+        Prueba que max_pending fuerza un vaciado, que el intervalo 0 guarda al momento y el límite de tamaño.
+        """
+        limited = DraftBuffer(FakeStore(), flush_interval=60, max_pending=3, max_draft_bytes=32)
+        immediate = DraftBuffer(FakeStore(), flush_interval=0)
+
+        async def scenario():
+            for index in range(3):
+                await limited.create(USER, {"name": f"pj-{index}"})
+            draft = await immediate.create(USER, {"name": "A"})
+            await immediate.patch(draft.id, USER, {"level": 2})
+            with pytest.raises(ValueError):
+                await limited.create(USER, {"name": "x" * 64})
+
+        asyncio.run(scenario())
+
+        assert limited.store.saves == [3]
+        assert limited.get_stats()["forced_flushes"] == 1
+        assert immediate.store.saves == [1, 1]
+
+    def test_periodic_flush_and_close(self) -> None:
+        """
+        Prueba que start vacía el búfer periódicamente y close guarda lo pendiente.
+        """
+        store = FakeStore()
+        buffer = DraftBuffer(store, flush_interval=0.02)
+
+        async def scenario():
+            buffer.start()
+            draft = await buffer.create(USER, {"name": "A"})
+            await asyncio.sleep(0.1)
+            periodic = list(store.saves)
+            await buffer.patch(draft.id, USER, {"level": 2})
+            await buffer.close()
+            return draft, periodic
+
+        draft, periodic = asyncio.run(scenario())
+
+        assert periodic == [1]
+        assert store.rows[draft.id].data == {"name": "A", "level": 2}
+        assert buffer.get_stats()["pending"] == 0
+
+    def test_remove(self) -> None:
+        """
+        Prueba que remove elimina el borrador del búfer y del almacenamiento.
+        """
+        store = FakeStore()
+        buffer = DraftBuffer(store, flush_interval=60)
+
+        async def scenario():
+            saved = await buffer.create(USER, {"name": "A"})
+            await buffer.flush()
+            pending = await buffer.create(USER, {"name": "B"})
+            results = (
+                await buffer.remove(saved.id, OTHER_USER),
+                await buffer.remove(saved.id, USER),
+                await buffer.remove(pending.id, USER),
+            )
+            await buffer.flush()
+            return results
+
+        assert asyncio.run(scenario()) == (False, True, True)
+        assert store.rows == {}
+
+
+class TestDraftEndpoints:
+    """Pruebas para los endpoints de borradores."""
+
+    def setup_method(self) -> None:
+        app_database.configure(url="sqlite+aiosqlite://", profile=LONG_RUNNING)
+
+    def teardown_method(self) -> None:
+        app_database.configure()
+
+    def test_draft_lifecycle(self, tmp_path) -> None:
+        """
+        Prueba que los parches se guardan al apagar y que enviar el borrador crea el personaje.
+        """
+        app_database.configure(url=f"sqlite+aiosqlite:///{tmp_path / 'drafts.db'}")
+        client = TestClient(app)
+
+        with client:
+            draft = client.post("/api/drafts", json={"character_name": "Aria"}).json()
+            for level in range(1, 6):
+                client.patch(f"/api/drafts/{draft['id']}", json={"level": str(level)})
+            patched = client.patch(f"/api/drafts/{draft['id']}", json={"player_name": "Ana"})
+            stats = client.get("/health/drafts").json()
+            missing = client.patch(f"/api/drafts/{uuid.uuid4()}", json={"level": "2"})
+            invalid = client.get("/api/drafts/no-es-uuid")
+
+        # Tras apagar la aplicación el borrador está guardado; la cookie se conserva
+        with client:
+            listed = client.get("/api/drafts").json()["items"]
+            submitted = client.post(
+                f"/api/drafts/{draft['id']}/submit", json={"level": "7"}
+            ).json()
+            character = client.get(f"/api/characters/{submitted['id']}").json()
+            gone = client.get(f"/api/drafts/{draft['id']}")
+
+        assert patched.json()["data"] == {
+            "character_name": "Aria", "level": "5", "player_name": "Ana",
+        }
+        assert stats["pending"] >= 1
+        assert stats["edits"] >= 7
+        assert missing.status_code == 404
+        assert invalid.status_code == 404
+        assert [item["id"] for item in listed] == [draft["id"]]
+        assert listed[0]["data"]["player_name"] == "Ana"
+        assert (character["name"], character["level"]) == ("Aria", 7)
+        assert gone.status_code == 404
+
+    def test_drafts_are_private_to_each_browser(self) -> None:
+        """
+        Prueba que cada navegador solo ve sus borradores y que una cookie falsificada no sirve.
+        """
+        with TestClient(app) as client:
+            draft = client.post("/api/drafts", json={"character_name": "Aria"})
+            cookie = client.cookies[DRAFT_OWNER_COOKIE]
+            owner_hex = cookie.split(".")[0]
+            draft_id = draft.json()["id"]
+            own = client.get(f"/api/drafts/{draft_id}")
+
+            # Otro navegador, sin la cookie del propietario
+            client.cookies.clear()
+            foreign = client.get(f"/api/drafts/{draft_id}")
+            foreign_list = client.get("/api/drafts").json()["items"]
+            foreign_patch = client.patch(f"/api/drafts/{draft_id}", json={"level": "2"})
+
+            # El ID del propietario con una firma falsa
+            client.cookies.set(DRAFT_OWNER_COOKIE, f"{owner_hex}.{'0' * 64}")
+            forged_list = client.get("/api/drafts").json()["items"]
+
+            client.cookies.set(DRAFT_OWNER_COOKIE, cookie)
+            deleted = client.delete(f"/api/drafts/{draft_id}")
+
+        assert "httponly" in draft.headers["set-cookie"].lower()
+        assert own.status_code == 200
+        assert foreign.status_code == 404
+        assert foreign_list == []
+        assert foreign_patch.status_code == 404
+        assert forged_list == []
+        assert read_owner(cookie) == uuid.UUID(hex=owner_hex)
+        assert read_owner(f"{owner_hex}.{'0' * 64}") is None
+        assert deleted.status_code == 200
+
+    def test_draft_too_large(self) -> None:
+        """
+        Prueba que un borrador mayor que el límite se rechaza con 413.
+        """
+        with TestClient(app) as client:
+            draft = client.post("/api/drafts", json={}).json()
+            response = client.patch(
+                f"/api/drafts/{draft['id']}", json={"description": "x" * 70_000}
+            )
+            deleted = client.delete(f"/api/drafts/{draft['id']}")
+
+        assert response.status_code == 413
+        assert deleted.status_code == 200
@@ -0,0 +1,100 @@
+"""
+Pruebas unitarias para el índice de facetas.
+
+Este módulo contiene pruebas para verificar los filtros combinados, los
+recuentos por faceta y el endpoint de filtrado.
+"""
+
+from fastapi.testclient import TestClient
+
+from src.index import app
+from src.infrastructure.facet_index import (
+    FacetIndex,
+    bitset_positions,
+    parse_conditions,
+)
+
+client = TestClient(app)
+
+SPELLS = [
+    {"id": 10, "level": 0, "school": "Evocation"},
+    {"id": 11, "level": 1, "school": "Evocation"},
+    {"id": 12, "level": 3, "school": "Evocation"},
+    {"id": 13, "level": 3, "school": "Abjuration"},
+    {"id": 14, "level": 5, "school": "Evocation"},
+    {"id": 15, "level": 2},
+]
+
+
+def filter_spells(query: str):
+    """Filtra los conjuros de prueba con un query string."""
+    index = FacetIndex(SPELLS, ("level", "school"))
+    return index.filter(parse_conditions(query, index.facets))
+
+
+class TestFacetIndex:
+    """Pruebas para el índice de facetas con bitsets."""
+
+    def test_combined_range_and_equality(self) -> None:
+        """
+        Prueba que las condiciones se combinan con Y.
+        """
+        result = filter_spells("level<=3&school=Evocation")
+
+        assert result.ids == [10, 11, 12]
+        assert result.total == 3
+
+    def test_multiple_values_and_case_insensitive(self) -> None:
+        """
+        Prueba que varios valores se combinan con O y sin distinguir mayúsculas.
+        """
+        result = filter_spells("school=abjuration,EVOCATION&level>1")
+
+        assert result.ids == [12, 13, 14]
+
+    def test_counts_per_facet(self) -> None:
+        """
+        Prueba los recuentos por valor de cada faceta sobre el resultado.
+        """
+        result = filter_spells("level>=2")
+
+        assert result.counts == {
+            "level": {"2": 1, "3": 2, "5": 1},
+            "school": {"Abjuration": 1, "Evocation": 2},
+        }
+
+    def test_no_conditions_returns_everything(self) -> None:
+        """
+        Prueba que sin condiciones se devuelven todos los documentos.
+        """
+        assert filter_spells("lang=es").total == len(SPELLS)
+
+    def test_bitset_positions(self) -> None:
+        """
+        Prueba la conversión de bitset a posiciones.
+        """
+        assert bitset_positions(0b101001) == [0, 3, 5]
+        assert bitset_positions(0) == []
+
+
+class TestFilterEndpoint:
+    """Pruebas para el endpoint /api/{collection}/filter."""
+
+    def test_filter_spells(self) -> None:
+        """
+        Prueba el filtrado de conjuros con un rango y una escuela.
+        """
+        data = client.get("/api/spells/filter?level<=1&school=Evocation").json()
+        spells = {spell["id"]: spell for spell in client.get("/api/spells").json()}
+
+        assert data["total"] == len(data["ids"])
+        for spell_id in data["ids"]:
+            assert spells[spell_id]["level"] <= 1
+            assert spells[spell_id]["school"] == "Evocation"
+
+    def test_invalid_filters(self) -> None:
+        """
+        Prueba que se rechazan valores no numéricos y colecciones sin facetas.
+        """
+        assert client.get("/api/spells/filter?level<=alto").status_code == 400
+        assert client.get("/api/races/filter").status_code == 404
@@ -0,0 +1,137 @@
+"""
+Pruebas unitarias para la caché de respuestas HTTP.
+
+Este módulo contiene pruebas para verificar los ETags, las respuestas 304
+y la invalidación de la caché de páginas renderizadas.
+"""
+
+from fastapi.testclient import TestClient
+
+from src.index import app
+from src.infrastructure.http_cache import ResponseCache, etag_matches, make_etag
+from src.infrastructure.template_helpers import page_cache
+from src.infrastructure.translation_service import translation_service
+
+client = TestClient(app)
+
+
+class TestResponseCache:
+    """Pruebas para la caché LRU versionada."""
+
+    def test_entry_invalidated_by_version(self) -> None:
+        """
+        Prueba que una entrada no se sirve si cambia la versión de sus datos.
+        """
+        cache = ResponseCache()
+        cache.put("home", 1, b"<html>", "text/html")
+
+        assert cache.get("home", 1) is not None
+        assert cache.get("home", 2) is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """
+        Prueba que se descarta la entrada menos usada al superar el límite.
+        """
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", 1, b"a", "text/plain")
+        cache.put("b", 1, b"b", "text/plain")
+        cache.get("a", 1)
+        cache.put("c", 1, b"c", "text/plain")
+
+        assert cache.get("b", 1) is None
+        assert cache.get("a", 1) is not None
+
+    def test_etag_matches_lists_and_weak_tags(self) -> None:
+        """
+        Prueba la comparación de If-None-Match con listas, ETags débiles y comodín.
+        """
+        etag = make_etag(b"body")
+
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestPageCache:
+    """Pruebas para la caché de páginas HTML."""
+
+    def test_page_has_etag_and_revalidates(self) -> None:
+        """
+        Prueba que una página cacheada devuelve 304 si el ETag coincide.
+        """
+        response = client.get("/")
+        etag = response.headers["etag"]
+
+        revalidated = client.get("/", headers={"If-None-Match": etag})
+
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == etag
+        assert revalidated.content == b""
+
+    def test_languages_cached_separately(self) -> None:
+        """
+        Prueba que cada idioma tiene su propia entrada y su propio ETag.
+        """
+        spanish = TestClient(app).get("/", headers={"Accept-Language": "es"})
+        english = TestClient(app).get("/", headers={"Accept-Language": "en"})
+
+        assert spanish.headers["etag"] != english.headers["etag"]
+        assert 'lang="es"' in spanish.text
+        assert 'lang="en"' in english.text
+
+    def test_catalog_reload_invalidates_page(self) -> None:
+        """
+        Prueba que una recarga de traducciones invalida las páginas cacheadas.
+        """
+        client.get("/404")
+        hits = page_cache.get_stats()["hits"]
+        client.get("/404")
+        assert page_cache.get_stats()["hits"] == hits + 1
+
+        translation_service.reload_translations()
+        misses = page_cache.get_stats()["misses"]
+        client.get("/404")
+
+        assert page_cache.get_stats()["misses"] == misses + 1
+
+
+class TestNotFoundPage:
+    """Pruebas para la página 404 servida sin redirección."""
+
+    def test_unknown_path_renders_404_in_place(self) -> None:
+        """
+        Prueba que una ruta desconocida devuelve 404 con la página traducida.
+        """
+        response = client.get("/no-existe/xyz", follow_redirects=False)
+
+        assert response.status_code == 404
+        assert "text/html" in response.headers["content-type"]
+        assert response.content == client.get("/404").content
+
+    def test_api_not_found_returns_json(self) -> None:
+        """
+        Prueba que los 404 de la API siguen respondiendo JSON con su detalle.
+        """
+        unsupported = client.get("/api/races/filter")
+        unknown = client.get("/api/no-existe")
+
+        assert unsupported.status_code == 404
+        assert unsupported.headers["content-type"] == "application/json"
+        assert unsupported.json() == {
+            "detail": "La colección 'races' no admite filtros por facetas"
+        }
+        assert unknown.status_code == 404
+        assert unknown.json() == {"detail": "Not Found"}
+
+    def test_unknown_paths_share_cache_entry(self) -> None:
+        """
+        Prueba que todas las rutas desconocidas usan la misma entrada por idioma.
+        """
+        client.get("/no-existe/a")
+        entries = page_cache.get_stats()["entries"]
+
+        client.get("/no-existe/b")
+        client.get("/otra/ruta")
+
+        assert page_cache.get_stats()["entries"] == entries
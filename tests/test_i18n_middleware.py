@@ -0,0 +1,47 @@
+"""
+Pruebas unitarias para el middleware de internacionalización.
+
+Este módulo contiene pruebas para verificar que la cookie de idioma solo
+se envía cuando el idioma cambia.
+"""
+
+from fastapi.testclient import TestClient
+
+from src.index import app
+from src.infrastructure.i18n import I18nConfig
+
+COOKIE = I18nConfig.LANGUAGE_COOKIE_NAME
+
+
+class TestI18nMiddleware:
+    """Pruebas para la cookie de idioma."""
+
+    def test_cookie_set_on_first_visit(self) -> None:
+        """
+        Prueba que se envía la cookie con el idioma negociado si no existe.
+        """
+        response = TestClient(app).get("/health", headers={"Accept-Language": "en"})
+
+        assert response.cookies.get(COOKIE) == "en"
+
+    def test_cookie_not_repeated_when_unchanged(self) -> None:
+        """
+        Prueba que no se reenvía la cookie si ya contiene el idioma seleccionado.
+        """
+        client = TestClient(app, cookies={COOKIE: "es"})
+
+        response = client.get("/api/races")
+
+        assert "set-cookie" not in response.headers
+
+    def test_cookie_updated_when_language_changes(self) -> None:
+        """
+        Prueba que `?lang` actualiza la cookie una sola vez.
+        """
+        client = TestClient(app, cookies={COOKIE: "es"})
+
+        response = client.get("/?lang=en")
+
+        cookies = response.headers.get_list("set-cookie")
+        assert len(cookies) == 1
+        assert cookies[0].startswith(f"{COOKIE}=en;")
@@ -0,0 +1,134 @@
+"""
+Pruebas unitarias para el lector de catálogos .mo mapeados en memoria.
+
+Este módulo verifica que `MappedTranslations` devuelve las mismas traducciones
+que `gettext.GNUTranslations`, tanto con búsqueda binaria como con tabla hash.
+"""
+
+import gettext
+import struct
+from pathlib import Path
+from typing import Dict
+
+from src.infrastructure.mapped_catalog import LE_MAGIC, MappedTranslations, hashpjw
+from src.infrastructure.translation_compiler import compile_po_to_mo
+from src.infrastructure.translation_service import TranslationService, discover_mo_files
+from tests.test_translation_service import PO_HEADER, write_po
+
+
+def write_hashed_mo(path: Path, messages: Dict[str, str], hash_size: int = 11) -> None:
+    """Escribe un .mo con tabla hash, como hace `msgfmt` de GNU."""
+    entries = sorted(
+        (key.encode("utf-8"), value.encode("utf-8")) for key, value in messages.items()
+    )
+    count = len(entries)
+    originals_offset = 28
+    translations_offset = originals_offset + count * 8
+    hash_offset = translations_offset + count * 8
+    strings_offset = hash_offset + hash_size * 4
+
+    hash_table = [0] * hash_size
+    for number, (original, _) in enumerate(entries):
+        hash_value = hashpjw(original)
+        index = hash_value % hash_size
+        increment = 1 + hash_value % (hash_size - 2)
+        while hash_table[index]:
+            index = (index + increment) % hash_size
+        hash_table[index] = number + 1
+
+    strings = b""
+    originals = []
+    translations = []
+    for original, _ in entries:
+        originals.append((len(original), strings_offset + len(strings)))
+        strings += original + b"\0"
+    for _, translation in entries:
+        translations.append((len(translation), strings_offset + len(strings)))
+        strings += translation + b"\0"
+
+    data = struct.pack(
+        "<7I", LE_MAGIC, 0, count, originals_offset, translations_offset, hash_size, hash_offset
+    )
+    data += b"".join(struct.pack("<2I", *entry) for entry in originals + translations)
+    data += struct.pack(f"<{hash_size}I", *hash_table)
+    path.write_bytes(data + strings)
+
+
+class TestMappedTranslations:
+    """Pruebas para el lector de catálogos mapeados."""
+
+    def test_matches_gnu_translations(self) -> None:
+        """
+        Prueba que todas las claves de los catálogos del proyecto coinciden con gettext.
+        """
+        for mo_files in discover_mo_files().values():
+            for mo_file in mo_files:
+                with open(mo_file, "rb") as f:
+                    expected = gettext.GNUTranslations(f)
+                mapped = MappedTranslations(mo_file)
+
+                for key in expected._catalog:
+                    if isinstance(key, str) and key:
+                        assert mapped.gettext(key) == expected.gettext(key)
+                assert mapped.gettext("missing.key") == "missing.key"
+
+    def test_hash_table_lookup(self, tmp_path: Path) -> None:
+        """
+        Prueba la búsqueda mediante la tabla hash del formato GNU.
+        """
+        mo_file = tmp_path / "home.mo"
+        messages = {
+            "": "Content-Type: text/plain; charset=UTF-8\n",
+            "home.title": "Hola",
+            "home.subtitle": "Crea personajes épicos",
+            "home.cta": "Empezar",
+        }
+        write_hashed_mo(mo_file, messages)
+
+        mapped = MappedTranslations(mo_file)
+
+        assert mapped.gettext("home.subtitle") == "Crea personajes épicos"
+        assert mapped.gettext("home.cta") == "Empezar"
+        assert mapped.gettext("home.missing") == "home.missing"
+
+    def test_recompile_keeps_live_catalog_readable(self, tmp_path: Path) -> None:
+        """
+        Prueba que recompilar el .mo no trunca el archivo que sigue mapeado.
+
+        Si el compilador escribiera sobre el mismo archivo, leer el mapeo
+        antiguo terminaría el proceso con SIGBUS.
+        """
+        po_file = tmp_path / "home.po"
+        mo_file = tmp_path / "LC_MESSAGES" / "home.mo"
+        po_file.write_text(
+            PO_HEADER + '\nmsgid "home.title"\nmsgstr "Un título bastante largo"\n',
+            encoding="utf-8",
+        )
+        compile_po_to_mo(po_file, mo_file)
+        mapped = MappedTranslations(mo_file)
+
+        po_file.write_text(PO_HEADER, encoding="utf-8")
+        compile_po_to_mo(po_file, mo_file)
+
+        assert mapped.gettext("home.title") == "Un título bastante largo"
+        assert MappedTranslations(mo_file).gettext("home.title") == "home.title"
+        assert not mo_file.with_name("home.mo.tmp").exists()
+
+    def test_reload_closes_superseded_catalog(self, tmp_path: Path) -> None:
+        """
+        Prueba que la recarga libera el mapeo del catálogo sustituido.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        service = TranslationService(
+            tmp_path, reload_enabled=True, reload_interval=0.0, catalog_loader="mmap"
+        )
+        previous = service._translations["es"]["home"]
+        assert service.get_translation("home.title", "es") == "Hola"
+
+        write_po(tmp_path, "es", "home", "Buenas")
+
+        assert service.reload_if_changed() is True
+        assert service.get_translation("home.title", "es") == "Buenas"
+        assert previous._buffer.closed
+        assert previous.gettext("home.title") == "Hola"
+        assert previous.gettext("home.other") == "home.other"
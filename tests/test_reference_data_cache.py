@@ -0,0 +1,199 @@
+"""
+Pruebas unitarias para la caché de datos de referencia.
+
+Este módulo contiene pruebas para verificar la carga concurrente de
+GetCharacterDataUseCase, la lectura desde la caché, la invalidación por
+versión y la agrupación de cargas simultáneas.
+"""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from src.application.character_use_cases import (
+    GetCharacterDataRequest,
+    GetCharacterDataUseCase,
+)
+from src.application.reference_data_cache import ReferenceDataCache
+
+COLLECTIONS = [
+    "races", "backgrounds", "alignments", "skills",
+    "languages", "proficiencies", "spells", "items",
+]
+
+
+class FakeRepository:
+    """Repositorio en memoria que cuenta las lecturas y simula latencia."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        self.name = name
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def get_all(self) -> List[Any]:
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return [f"{self.name}-{self.calls}"]
+
+
+def build_use_case(cache: ReferenceDataCache, delay: float = 0.0):
+    """Crea el caso de uso con un repositorio falso por colección."""
+    repositories = [FakeRepository(name, delay) for name in COLLECTIONS]
+    return GetCharacterDataUseCase(*repositories, cache=cache), repositories
+
+
+class TestReferenceDataCache:
+    """Pruebas para la caché de lectura de datos de referencia."""
+
+    def test_cold_call_loads_concurrently(self) -> None:
+        """
+        Prueba que las ocho colecciones se cargan a la vez y no una tras otra.
+        """
+        use_case, _ = build_use_case(ReferenceDataCache(), delay=0.05)
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            data = await use_case.execute(GetCharacterDataRequest())
+            return data, loop.time() - start
+
+        data, elapsed = asyncio.run(scenario())
+
+        assert list(data) == COLLECTIONS
+        assert data["spells"] == ("spells-1",)
+        assert elapsed < 0.05 * 4
+
+    def test_warm_call_does_not_touch_repositories(self) -> None:
+        """
+        Prueba que una segunda llamada se sirve desde la caché.
+        """
+        cache = ReferenceDataCache()
+        use_case, repositories = build_use_case(cache)
+
+        async def scenario():
+            await use_case.execute(GetCharacterDataRequest())
+            return await use_case.execute(GetCharacterDataRequest())
+
+        data = asyncio.run(scenario())
+
+        assert data["races"] == ("races-1",)
+        assert all(repository.calls == 1 for repository in repositories)
+        assert cache.get_stats()["hits"] == len(COLLECTIONS)
+
+    def test_returned_rows_are_read_only(self) -> None:
+        """
+        Prueba que las colecciones cacheadas se comparten y no pueden modificarse.
+        """
+        cache = ReferenceDataCache()
+
+        async def load():
+            return [{"id": 1, "name": "Elf", "traits": ["darkvision"]}]
+
+        async def scenario():
+            return (
+                await cache.get_or_load("races", load),
+                await cache.get_or_load("races", load),
+            )
+
+        first, second = asyncio.run(scenario())
+
+        assert first is second
+        assert first[0]["traits"] == ("darkvision",)
+        with pytest.raises(TypeError):
+            first[0]["name"] = "Orc"
+        with pytest.raises(AttributeError):
+            first.append({"id": 2})
+
+    def test_invalidate_reloads(self) -> None:
+        """
+        Prueba que la invalidación global y por colección fuerzan una recarga.
+        """
+        cache = ReferenceDataCache()
+        use_case, repositories = build_use_case(cache)
+
+        async def scenario():
+            await use_case.execute(GetCharacterDataRequest())
+            cache.invalidate("spells")
+            partial = await use_case.execute(GetCharacterDataRequest())
+            cache.invalidate()
+            full = await use_case.execute(GetCharacterDataRequest())
+            return partial, full
+
+        partial, full = asyncio.run(scenario())
+
+        assert partial["spells"] == ("spells-2",)
+        assert partial["races"] == ("races-1",)
+        assert full["races"] == ("races-2",)
+        assert full["spells"] == ("spells-3",)
+        assert cache.version == 1
+
+    def test_concurrent_callers_share_one_load(self) -> None:
+        """
+        Prueba que las peticiones simultáneas esperan a la misma carga.
+        """
+        cache = ReferenceDataCache()
+        use_case, repositories = build_use_case(cache, delay=0.02)
+
+        async def scenario():
+            return await asyncio.gather(
+                *(use_case.execute(GetCharacterDataRequest()) for _ in range(5))
+            )
+
+        results = asyncio.run(scenario())
+
+        assert all(result == results[0] for result in results)
+        assert all(repository.calls == 1 for repository in repositories)
+        assert cache.get_stats()["coalesced"] == 4 * len(COLLECTIONS)
+
+    def test_invalidation_during_load_discards_result(self) -> None:
+        """
+        Prueba que una carga iniciada antes de invalidar no queda cacheada.
+        """
+        cache = ReferenceDataCache()
+        repository = FakeRepository("races", delay=0.02)
+
+        async def scenario():
+            load = asyncio.ensure_future(cache.get_or_load("races", repository.get_all))
+            await asyncio.sleep(0)
+            cache.invalidate()
+            await load
+            return await cache.get_or_load("races", repository.get_all)
+
+        assert asyncio.run(scenario()) == ("races-2",)
+
+    def test_errors_are_not_cached(self) -> None:
+        """
+        Prueba que un fallo de carga se propaga y la siguiente llamada reintenta.
+        """
+        cache = ReferenceDataCache()
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("base de datos no disponible")
+            return ["ok"]
+
+        async def scenario():
+            with pytest.raises(RuntimeError):
+                await cache.get_or_load("races", flaky)
+            return await cache.get_or_load("races", flaky)
+
+        assert asyncio.run(scenario()) == ("ok",)
+        assert cache.get_stats()["errors"] == 1
+
+    def test_warm_up(self) -> None:
+        """
+        Prueba que el precalentamiento carga todas las colecciones.
+        """
+        cache = ReferenceDataCache()
+        use_case, repositories = build_use_case(cache)
+
+        assert asyncio.run(use_case.warm_up()) == len(COLLECTIONS)
+        assert set(cache.get_stats()["entries"]) == set(COLLECTIONS)
@@ -0,0 +1,115 @@
+"""
+Pruebas unitarias para el índice de búsqueda en memoria.
+
+Este módulo contiene pruebas para verificar la tokenización por idioma,
+la búsqueda por prefijo, sin acentos y con erratas, y el endpoint de búsqueda.
+"""
+
+from fastapi.testclient import TestClient
+
+from src.index import app
+from src.infrastructure.reference_data import ReferenceDataStore
+from src.infrastructure.search_index import (
+    SearchIndex,
+    SearchService,
+    tokenize,
+    within_one_edit,
+)
+
+client = TestClient(app)
+
+SPELLS = [
+    {"id": 1, "name": "Bola de fuego", "description": "Una explosión de llamas"},
+    {"id": 2, "name": "Curar heridas", "description": "Cura a una criatura"},
+    {"id": 3, "name": "Rayo de escarcha", "description": "Un rayo helado"},
+    {"id": 4, "name": "Fireball", "description": "A bright streak of fire"},
+]
+
+
+def names(results) -> list:
+    """Nombres de los documentos encontrados."""
+    return [result.document["name"] for result in results]
+
+
+class TestTokenizer:
+    """Pruebas para la tokenización por idioma."""
+
+    def test_accents_stopwords_and_plurals(self) -> None:
+        """
+        Prueba que se eliminan acentos, palabras vacías y plurales regulares.
+        """
+        assert tokenize("Explosión de las llamas", "es") == ["explosion", "llama"]
+        assert tokenize("The Wounds of Spiders", "en") == ["wound", "spider"]
+
+    def test_within_one_edit(self) -> None:
+        """
+        Prueba la distancia de edición con sustituciones, borrados y transposiciones.
+        """
+        assert within_one_edit("fuego", "fuega")
+        assert within_one_edit("fuego", "fugo")
+        assert within_one_edit("fuego", "fuego")
+        assert within_one_edit("fuego", "fueog")
+        assert not within_one_edit("fuego", "fiega")
+
+
+class TestSearchIndex:
+    """Pruebas para la búsqueda sobre el índice invertido."""
+
+    def test_prefix_and_accent_insensitive(self) -> None:
+        """
+        Prueba que se encuentran documentos por prefijo y sin acentos.
+        """
+        index = SearchIndex(SPELLS, "es")
+
+        assert names(index.search("bola de fu")) == ["Bola de fuego"]
+        assert names(index.search("explosion")) == ["Bola de fuego"]
+
+    def test_typo_tolerance(self) -> None:
+        """
+        Prueba que una errata de una letra sigue encontrando el documento.
+        """
+        index = SearchIndex(SPELLS, "es")
+
+        assert names(index.search("escracha")) == ["Rayo de escarcha"]
+
+    def test_name_ranked_above_description(self) -> None:
+        """
+        Prueba que coincidir en el nombre puntúa más que en la descripción.
+        """
+        index = SearchIndex(SPELLS, "en")
+
+        assert names(index.search("fire"))[0] == "Fireball"
+
+    def test_rebuilt_when_data_changes(self) -> None:
+        """
+        Prueba que los índices se regeneran al cambiar los datos de referencia.
+        """
+        store = ReferenceDataStore({"spells": SPELLS})
+        service = SearchService(store)
+        assert service.search("spell", "bola", "es")
+
+        store.set_collection("spells", [{"id": 9, "name": "Luz"}])
+
+        assert service.search("spell", "bola", "es") == []
+        assert names(service.search("spell", "luz", "es")) == ["Luz"]
+
+
+class TestSearchEndpoint:
+    """Pruebas para el endpoint /api/search."""
+
+    def test_search_spells(self) -> None:
+        """
+        Prueba que el endpoint devuelve resultados ordenados con puntuación.
+        """
+        data = client.get("/api/search", params={"type": "spell", "q": "acid spl"}).json()
+
+        assert data["results"][0]["name"] == "Acid Splash"
+        assert data["results"][0]["score"] > 0
+
+    def test_unknown_type_rejected(self) -> None:
+        """
+        Prueba que se rechaza un tipo de entidad desconocido.
+        """
+        response = client.get("/api/search", params={"type": "dragon", "q": "red"})
+
+        assert response.status_code == 400
@@ -0,0 +1,170 @@
+"""
+Pruebas unitarias para el entorno de templates compartido.
+
+Este módulo contiene pruebas para verificar la caché de bytecode, la
+carga de templates precompilados y la especialización por idioma.
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi.templating import Jinja2Templates
+from jinja2 import ModuleLoader
+
+from src.infrastructure.template_helpers import get_translation_context
+from src.infrastructure.templating import (
+    SpecializedTemplates,
+    compile_templates,
+    create_environment,
+    templates,
+)
+from src.infrastructure.translation_service import translation_service
+from src.infrastructure.web import character_controller, home_controller, not_found_controller
+
+
+def write_template(templates_dir: Path, name: str, source: str) -> None:
+    """Escribe un template de prueba."""
+    templates_dir.mkdir(parents=True, exist_ok=True)
+    (templates_dir / name).write_text(source, encoding="utf-8")
+
+
+class TestTemplateEnvironment:
+    """Pruebas para el entorno de Jinja2 de la aplicación."""
+
+    def test_controllers_share_environment(self) -> None:
+        """
+        Prueba que todos los controladores usan la misma instancia de templates.
+        """
+        assert home_controller.templates is templates
+        assert character_controller.templates is templates
+        assert not_found_controller.templates is templates
+
+    def test_bytecode_cache_is_persisted(self, tmp_path: Path) -> None:
+        """
+        Prueba que al cargar un template se guarda su bytecode en disco.
+        """
+        write_template(tmp_path / "html", "page.html", "Hola {{ name }}")
+        cache_dir = tmp_path / "cache"
+        environment = create_environment(
+            templates_dir=tmp_path / "html",
+            compiled_dir=tmp_path / "compiled",
+            bytecode_cache_dir=str(cache_dir),
+            auto_reload=True,
+        )
+
+        assert environment.get_template("page.html").render(name="Ana") == "Hola Ana"
+        assert any(cache_dir.iterdir())
+
+    def test_precompiled_templates_used_without_reload(self, tmp_path: Path) -> None:
+        """
+        Prueba que los templates precompilados se cargan cuando la recarga está desactivada.
+        """
+        write_template(tmp_path / "html", "page.html", "{% include 'part.html' %}!")
+        write_template(tmp_path / "html", "part.html", "Hola")
+        compiled_dir = tmp_path / "compiled"
+
+        assert compile_templates(output=compiled_dir, templates_dir=tmp_path / "html") == 2
+
+        environment = create_environment(
+            templates_dir=tmp_path / "html",
+            compiled_dir=compiled_dir,
+            bytecode_cache_dir="",
+            auto_reload=False,
+        )
+        (tmp_path / "html" / "part.html").write_text("Adiós", encoding="utf-8")
+
+        assert isinstance(environment.loader.loaders[0], ModuleLoader)
+        assert environment.get_template("page.html").render() == "Hola!"
+
+
+class TestSpecializedTemplates:
+    """Pruebas para los templates con traducciones incrustadas."""
+
+    @staticmethod
+    def create_base(tmp_path: Path, source: str) -> Jinja2Templates:
+        """Crea unos templates base con un único template `page.html`."""
+        write_template(tmp_path, "page.html", source)
+        return Jinja2Templates(
+            env=create_environment(
+                templates_dir=tmp_path, bytecode_cache_dir="", auto_reload=True
+            )
+        )
+
+    def test_render_does_no_lookups(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Prueba que las claves literales se traducen al compilar y no al renderizar.
+        """
+        base = self.create_base(tmp_path, "{{ _('home.page.title') }}")
+        expected = translation_service.get_translation("home.page.title", "en", "home")
+        specialized = SpecializedTemplates().get(base, "en", "home")
+        template = specialized.get_template("page.html")
+
+        lookups = []
+        monkeypatch.setattr(
+            translation_service, "get_translation", lambda *args: lookups.append(args)
+        )
+        rendered = template.render()
+
+        assert rendered == expected != "home.page.title"
+        assert lookups == []
+
+    def test_dynamic_keys_resolved_at_render(self, tmp_path: Path) -> None:
+        """
+        Prueba que las llamadas con argumentos no literales se mantienen.
+        """
+        base = self.create_base(tmp_path, "{{ _(key) }}")
+        specialized = SpecializedTemplates().get(base, "es", "home")
+
+        rendered = specialized.get_template("page.html").render(_=str.upper, key="abc")
+
+        assert rendered == "ABC"
+
+    def test_rebuilt_when_catalogs_change(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Prueba que las especializaciones se descartan al cambiar la versión de los catálogos.
+        """
+        base = self.create_base(tmp_path, "{{ _('home.page.title') }}")
+        cache = SpecializedTemplates()
+        first = cache.get(base, "es", "home")
+
+        assert cache.get(base, "es", "home") is first
+        assert cache.get(base, "en", "home") is not first
+
+        monkeypatch.setattr(
+            translation_service, "_catalog_version", translation_service.catalog_version + 1
+        )
+
+        assert cache.get(base, "es", "home") is not first
+
+
+class TestTranslationContext:
+    """Pruebas para el contexto de traducción inmutable por idioma."""
+
+    def test_context_reused_between_requests(self) -> None:
+        """
+        Prueba que el contexto de un idioma se crea una vez y no se puede modificar.
+        """
+        context = get_translation_context("es", "home")
+
+        assert get_translation_context("es", "home") is context
+        assert get_translation_context("en", "home") is not context
+        with pytest.raises(TypeError):
+            context["language"] = "en"  # type: ignore[index]
+
+    def test_context_rebuilt_when_catalogs_change(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Prueba que el contexto se reconstruye al cambiar la versión de los catálogos.
+        """
+        context = get_translation_context("es", "home")
+
+        monkeypatch.setattr(
+            translation_service, "_catalog_version", translation_service.catalog_version + 1
+        )
+
+        assert get_translation_context("es", "home") is not context
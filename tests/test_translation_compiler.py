@@ -0,0 +1,77 @@
+"""
+Pruebas unitarias para el pipeline de compilación de traducciones.
+
+Este módulo verifica que los catálogos se recompilan solo cuando cambia
+el contenido de su .po, independientemente de los mtime.
+"""
+
+import os
+from pathlib import Path
+
+from src.infrastructure.translation_compiler import compile_catalogs, get_mo_path_for_po
+
+PO_CONTENT = """msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgid "home.title"
+msgstr "{title}"
+"""
+
+
+def write_po(translations_dir: Path, lang: str, domain: str, title: str) -> Path:
+    """Escribe un fichero .po mínimo con una única clave."""
+    lang_dir = translations_dir / lang
+    lang_dir.mkdir(parents=True, exist_ok=True)
+    po_file = lang_dir / f"{domain}.po"
+    po_file.write_text(PO_CONTENT.format(title=title), encoding="utf-8")
+    return po_file
+
+
+class TestCompileCatalogs:
+    """Pruebas para la compilación incremental por hash de contenido."""
+
+    def test_compiles_then_skips_unchanged(self, tmp_path: Path) -> None:
+        """
+        Prueba que una segunda ejecución sin cambios no recompila nada.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        write_po(tmp_path, "en", "home", "Hello")
+
+        first = compile_catalogs(translations_dir=tmp_path, workers=1)
+        second = compile_catalogs(translations_dir=tmp_path, workers=1)
+
+        assert len(first.compiled) == 2
+        assert len(second.compiled) == 0
+        assert len(second.skipped) == 2
+
+    def test_mtime_change_without_content_change_is_skipped(self, tmp_path: Path) -> None:
+        """
+        Prueba que un .po más reciente que su .mo pero con el mismo contenido se omite.
+        """
+        po_file = write_po(tmp_path, "es", "home", "Hola")
+        compile_catalogs(translations_dir=tmp_path, workers=1)
+
+        mo_mtime = get_mo_path_for_po(po_file).stat().st_mtime_ns
+        os.utime(po_file, ns=(mo_mtime + 10**9, mo_mtime + 10**9))
+
+        report = compile_catalogs(translations_dir=tmp_path, workers=1)
+
+        assert report.compiled == []
+        assert report.skipped == [po_file]
+
+    def test_content_change_and_missing_mo_are_recompiled(self, tmp_path: Path) -> None:
+        """
+        Prueba que se recompila si cambia el .po o si falta el .mo generado.
+        """
+        changed = write_po(tmp_path, "es", "home", "Hola")
+        removed = write_po(tmp_path, "es", "header", "Cabecera")
+        compile_catalogs(translations_dir=tmp_path, workers=1)
+
+        write_po(tmp_path, "es", "home", "Buenas")
+        get_mo_path_for_po(removed).unlink()
+
+        report = compile_catalogs(translations_dir=tmp_path, workers=1)
+
+        assert sorted(report.compiled) == sorted([changed, removed])
+        assert get_mo_path_for_po(removed).exists()
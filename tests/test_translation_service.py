@@ -0,0 +1,277 @@
+"""
+Pruebas unitarias para el servicio de traducción.
+
+Este módulo contiene pruebas para verificar la carga y la recarga
+de los catálogos de traducción.
+"""
+
+import os
+from pathlib import Path
+
+from starlette.requests import Request
+
+from src.infrastructure.translation_service import (
+    TranslationService,
+    build_translation_snapshot,
+    negotiate_accept_language,
+    translation_service,
+)
+
+PO_HEADER = """msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+"""
+
+
+def write_po(
+    translations_dir: Path, lang: str, domain: str, title: str, **messages: str
+) -> Path:
+    """Escribe un fichero .po mínimo con la clave `home.title` y mensajes extra."""
+    lang_dir = translations_dir / lang
+    lang_dir.mkdir(parents=True, exist_ok=True)
+    po_file = lang_dir / f"{domain}.po"
+    entries = {"home.title": title, **messages}
+    body = "".join(
+        f'\nmsgid "{key}"\nmsgstr "{value}"\n' for key, value in entries.items()
+    )
+    po_file.write_text(PO_HEADER + body, encoding="utf-8")
+    return po_file
+
+
+class TestTranslationReload:
+    """Pruebas para la recarga de traducciones por cambios."""
+
+    def test_reload_disabled_does_nothing(self, tmp_path: Path) -> None:
+        """
+        Prueba que con la recarga desactivada no se detectan cambios.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        service = TranslationService(tmp_path, reload_enabled=False)
+
+        write_po(tmp_path, "es", "home", "Adiós")
+
+        assert service.reload_if_changed() is False
+        assert service.get_translation("home.title", "es") == "Hola"
+
+    def test_reload_only_changed_catalog(self, tmp_path: Path) -> None:
+        """
+        Prueba que solo se recarga el catálogo cuyo contenido ha cambiado.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        write_po(tmp_path, "en", "home", "Hello")
+        service = TranslationService(tmp_path, reload_enabled=True, reload_interval=0.0)
+        english_catalog = service._translations["en"]["home"]
+        version = service.catalog_version
+
+        write_po(tmp_path, "es", "home", "Buenas")
+
+        assert service.reload_if_changed() is True
+        assert service.get_translation("home.title", "es") == "Buenas"
+        assert service._translations["en"]["home"] is english_catalog
+        assert service.catalog_version == version + 1
+
+    def test_touch_without_content_change_is_ignored(self, tmp_path: Path) -> None:
+        """
+        Prueba que cambiar solo el mtime (p. ej. tras un checkout) no recarga.
+        """
+        po_file = write_po(tmp_path, "es", "home", "Hola")
+        service = TranslationService(tmp_path, reload_enabled=True, reload_interval=0.0)
+
+        stat = po_file.stat()
+        os.utime(po_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert service.reload_if_changed() is False
+
+    def test_polling_interval_skips_checks(self, tmp_path: Path) -> None:
+        """
+        Prueba que dentro del intervalo de sondeo no se comprueban cambios.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        service = TranslationService(tmp_path, reload_enabled=True, reload_interval=3600)
+
+        write_po(tmp_path, "es", "home", "Buenas")
+
+        assert service.reload_if_changed() is False
+        assert service.get_translation("home.title", "es") == "Hola"
+
+
+class TestTranslationLookup:
+    """Pruebas para la tabla de traducciones precompilada."""
+
+    def test_fallbacks_are_resolved_in_table(self, tmp_path: Path) -> None:
+        """
+        Prueba que la tabla resuelve el dominio 'home' y el idioma por defecto.
+        """
+        write_po(tmp_path, "es", "home", "Hola", **{"home.only_es": "Solo es"})
+        write_po(tmp_path, "es", "header", "Cabecera")
+        write_po(tmp_path, "en", "home", "Hello")
+        write_po(tmp_path, "en", "header", "Header")
+        service = TranslationService(tmp_path, reload_enabled=False)
+
+        assert service.get_translation("home.title", "en", "header") == "Header"
+        assert service.get_translation("home.title", "es", "header") == "Cabecera"
+        assert service.get_translation("home.only_es", "en", "header") == "Solo es"
+        assert service.get_translation("home.title", "fr", "home") == "Hola"
+        assert service.get_translation("missing.key", "en", "header") == "missing.key"
+
+    def test_mmap_loader_resolves_on_demand(self, tmp_path: Path) -> None:
+        """
+        Prueba que con catálogos mmap las claves usadas se resuelven sin tocar las tablas.
+        """
+        write_po(tmp_path, "es", "home", "Hola", **{"home.only_es": "Solo es"})
+        write_po(tmp_path, "en", "header", "Header")
+        service = TranslationService(
+            tmp_path, reload_enabled=False, catalog_loader="mmap"
+        )
+
+        assert service.get_lookup_stats()["total_entries"] == 0
+        assert service.get_translation("home.title", "en", "header") == "Header"
+        assert service.get_translation("home.only_es", "en", "header") == "Solo es"
+        stats = service.get_lookup_stats()
+        assert stats["total_entries"] == 0
+        assert stats["resolved_entries"] == 2
+
+    def test_identity_translations_are_not_misses(self, tmp_path: Path) -> None:
+        """
+        Prueba que una traducción igual a la clave se encuentra y no cuenta como fallo.
+        """
+        write_po(tmp_path, "es", "home", "Hola", OK="OK")
+        write_po(tmp_path, "en", "home", "Hello", OK="OK")
+        eager = TranslationService(tmp_path, reload_enabled=False)
+        lazy = TranslationService(tmp_path, reload_enabled=False, catalog_loader="mmap")
+
+        for service in (eager, lazy):
+            assert service.get_translation("OK", "es") == "OK"
+            assert service.get_translation("OK", "en", "header") == "OK"
+            assert service.get_missing_translations()["distinct"] == 0
+        assert ("home", "OK") in eager._lookup_tables["es"]
+
+    def test_lookup_stats(self, tmp_path: Path) -> None:
+        """
+        Prueba que se exponen el tamaño de las tablas y el tiempo de construcción.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        write_po(tmp_path, "en", "home", "Hello")
+        service = TranslationService(tmp_path, reload_enabled=False)
+
+        stats = service.get_lookup_stats()
+
+        assert stats["entries"] == {"es": 1, "en": 1}
+        assert stats["total_entries"] == 2
+        assert stats["build_time_ms"] >= 0
+
+
+class TestTranslationSnapshot:
+    """Pruebas para la instantánea de traducciones de producción."""
+
+    def test_production_loads_snapshot_without_mo_files(self, tmp_path: Path) -> None:
+        """
+        Prueba que fuera de desarrollo se carga la instantánea sin compilar .mo.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        write_po(tmp_path, "en", "home", "Hello")
+        build_translation_snapshot(tmp_path)
+
+        service = TranslationService(tmp_path, reload_enabled=False, dev_mode=False)
+
+        assert service.snapshot_version is not None
+        assert service.get_translation("home.title", "en") == "Hello"
+        assert not (tmp_path / "en" / "LC_MESSAGES").exists()
+
+    def test_snapshot_version_depends_on_content(self, tmp_path: Path) -> None:
+        """
+        Prueba que la versión de la instantánea cambia solo si cambia el contenido.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        first = build_translation_snapshot(tmp_path).read_bytes()
+        second = build_translation_snapshot(tmp_path).read_bytes()
+        write_po(tmp_path, "es", "home", "Buenas")
+        third = build_translation_snapshot(tmp_path).read_bytes()
+
+        assert first == second
+        assert first != third
+
+
+class TestTranslationMisses:
+    """Pruebas para el registro de traducciones no encontradas."""
+
+    def test_misses_are_counted_and_logged_once(self, tmp_path: Path, caplog) -> None:
+        """
+        Prueba que cada fallo se cuenta siempre pero se registra en el log una vez.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        service = TranslationService(tmp_path, reload_enabled=False)
+
+        with caplog.at_level("WARNING"):
+            for _ in range(3):
+                assert service.get_translation("missing.key", "es") == "missing.key"
+
+        report = service.get_missing_translations()
+        assert report["distinct"] == 1
+        assert report["top"] == [
+            {"language": "es", "domain": "home", "key": "missing.key", "count": 3}
+        ]
+        assert len([r for r in caplog.records if "missing.key" in r.getMessage()]) == 1
+
+    def test_miss_tracker_is_bounded(self, tmp_path: Path) -> None:
+        """
+        Prueba que al superar el límite los fallos nuevos solo se cuentan como descartados.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        service = TranslationService(tmp_path, reload_enabled=False, miss_limit=2)
+
+        for index in range(5):
+            service.get_translation(f"missing.{index}", "es")
+
+        report = service.get_missing_translations()
+        assert report["distinct"] == 2
+        assert report["dropped"] == 3
+
+    def test_reload_invalidates_negative_cache(self, tmp_path: Path) -> None:
+        """
+        Prueba que una clave que faltaba se encuentra tras recargar el catálogo.
+        """
+        write_po(tmp_path, "es", "home", "Hola")
+        service = TranslationService(tmp_path, reload_enabled=True, reload_interval=0.0)
+        assert service.get_translation("home.new", "es") == "home.new"
+
+        write_po(tmp_path, "es", "home", "Hola", **{"home.new": "Nuevo"})
+        service.reload_if_changed()
+
+        assert service.get_translation("home.new", "es") == "Nuevo"
+
+
+class TestLanguageNegotiation:
+    """Pruebas para la negociación del idioma de la petición."""
+
+    def test_quality_values_are_respected(self) -> None:
+        """
+        Prueba que se elige el idioma soportado con mayor peso q.
+        """
+        assert negotiate_accept_language("fr-FR,fr;q=0.9,es;q=0.5,en;q=0.7") == "en"
+        assert negotiate_accept_language("es;q=0,en") == "en"
+        assert negotiate_accept_language("de-DE,de;q=0.9") is None
+
+    def test_region_subtags_match_base_language(self) -> None:
+        """
+        Prueba que una etiqueta con región coincide con su idioma base.
+        """
+        assert negotiate_accept_language("es-419,en;q=0.5") == "es"
+        assert negotiate_accept_language("en_GB") == "en"
+
+    def test_language_is_negotiated_once_per_request(self) -> None:
+        """
+        Prueba que el idioma se guarda en el estado de la petición.
+        """
+        request = Request(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/",
+                "query_string": b"",
+                "headers": [(b"accept-language", b"en-US,en;q=0.9")],
+            }
+        )
+
+        assert translation_service.get_language_from_request(request) == "en"
+        assert request.state.language == "en"